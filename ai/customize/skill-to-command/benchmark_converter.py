@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Skill-to-Command Converter Benchmarks
+
+Performance checks for the hot paths of skill_to_command_converter.py. Each
+benchmark generates its own synthetic input, so results do not depend on the
+skills currently checked in.
+
+Benchmarks:
+- path-rewrite: PathUpdater.update_paths_in_markdown() on markdown documents
+  of doubling size (up to 5 MB by default). The time per MB should stay flat
+  as the input grows; a rising ratio means the rewriter is no longer linear.
+- conversion: SkillConverter.run() on a generated skill tree, once cold
+  (empty output directory) and once warm (rerun over the previous output).
+  Each run happens in a fresh interpreter so peak RSS is measured per run.
+  Reports skills/s, MB/s, peak RSS and the converter's per-phase totals
+  (discover, merge, copy_subdirs, ...).
+
+Usage:
+    python benchmark_converter.py [--suite NAME] [--json] [path-rewrite options]
+                                  [conversion options]
+
+Options:
+    --suite NAME    path-rewrite, conversion or all (default: all)
+    --repeat N      Runs per measurement; the fastest run is reported (default: 3)
+    --json          Print results as JSON instead of tables
+
+Path-rewrite options:
+    --max-mb N      Size of the largest generated document in MB (default: 5)
+    --steps N       Number of document sizes, halving from --max-mb (default: 5)
+
+Conversion options:
+    --skills N      Number of generated skills (default: 50)
+    --md-files N    Markdown files per skill, including SKILL.md (default: 3)
+    --depth N       Nesting depth of each skill's asset subdirectory (default: 2)
+    --scripts N     Root-level scripts per skill (default: 2)
+    --file-kb N     Approximate size of each generated file in KB (default: 16)
+    --jobs N        Worker threads passed to SkillConverter (default: 1)
+    --force         Make the warm run reconvert everything (ignore the manifest)
+
+Author: Skill-to-Command Converter Development Team
+Version: 1.0
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# Import the converter from the same directory
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from skill_to_command_converter import PathUpdater  # noqa: E402
+
+
+# Script names referenced by the generated markdown (mix of prefixes and
+# names that are prefixes of each other)
+BENCHMARK_SCRIPTS = [
+    "find-polluter.sh",
+    "setup.py",
+    "run.sh",
+    "run.sh.in",
+    "render.js",
+    "validate.rb",
+]
+
+# Skill name used for rewritten paths
+BENCHMARK_SKILL = "benchmark-skill"
+
+# Converter run executed in a fresh interpreter by bench_conversion(). The
+# converter's progress output is discarded; one JSON line is printed with
+# the timing, peak RSS (ru_maxrss, KB on Linux) and the report totals.
+CONVERSION_WORKER = """
+import io, json, sys, time, resource, contextlib
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+import skill_to_command_converter as converter
+jobs, force = int(sys.argv[4]), sys.argv[5] == '1'
+with contextlib.redirect_stdout(io.StringIO()):
+    started = time.perf_counter()
+    report = converter.SkillConverter(Path(sys.argv[2]), Path(sys.argv[3]),
+                                      jobs=jobs, force=force).run()
+    seconds = time.perf_counter() - started
+print(json.dumps({
+    'seconds': seconds,
+    'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'skills': report.total_skills,
+    'converted': report.successful + report.partial_success,
+    'up_to_date': report.up_to_date,
+    'failed': report.failed,
+    'phase_totals': report.phase_totals,
+}))
+"""
+
+
+# ============================================================================
+# Input Generation
+# ============================================================================
+
+def generate_markdown(size_bytes: int, seed: int = 0) -> str:
+    """Generate a markdown document of roughly size_bytes characters.
+
+    The document mixes prose, script references (./x, ../x and bare names)
+    and fenced code blocks whose references must be left untouched, in about
+    the proportions of a large merged command file.
+
+    Args:
+        size_bytes: Target document size in characters
+        seed: Random seed, so every run sees the same document
+
+    Returns:
+        Generated markdown content
+    """
+    rng = random.Random(seed)
+    prefixes = ["./", "../", ""]
+    words = ["the", "skill", "runs", "script", "output", "before", "after",
+             "check", "with", "file", "and", "then", "use", "for", "each"]
+
+    parts = []
+    total = 0
+    section = 0
+
+    while total < size_bytes:
+        section += 1
+        if section % 7 == 0:
+            # Fenced example: references inside must not be rewritten
+            script = rng.choice(BENCHMARK_SCRIPTS)
+            block = (f"```bash\n"
+                     f"{rng.choice(prefixes)}{script} --example {section}\n"
+                     f"```\n\n")
+        else:
+            sentence = " ".join(rng.choice(words) for _ in range(rng.randint(8, 20)))
+            script = rng.choice(BENCHMARK_SCRIPTS)
+            block = (f"## Step {section}\n\n"
+                     f"Run `{rng.choice(prefixes)}{script}` so {sentence}.\n\n")
+
+        parts.append(block)
+        total += len(block)
+
+    return "".join(parts)[:size_bytes]
+
+
+def _filler_text(rng: random.Random, size_bytes: int) -> str:
+    """Return roughly size_bytes of prose lines."""
+    words = ["skill", "command", "output", "merge", "asset", "script", "tree",
+             "file", "section", "example", "convert", "check", "data", "run"]
+    lines = []
+    total = 0
+    while total < size_bytes:
+        line = " ".join(rng.choice(words) for _ in range(12)) + "\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines)
+
+
+def generate_skill_tree(root: Path, skills: int = 50, md_files: int = 3,
+                        depth: int = 2, scripts: int = 2, file_kb: int = 16,
+                        seed: int = 0) -> Dict[str, int]:
+    """Write a synthetic skills/ directory for the conversion benchmark.
+
+    Every skill gets a SKILL.md with frontmatter plus md_files - 1 secondary
+    markdown files. When both depth and scripts are non-zero, even-numbered
+    skills get an asset subdirectory (DIRECTORY_WITH_SUBDIRS mode) and
+    odd-numbered skills get root-level scripts (DIRECTORY_WITH_SCRIPTS
+    mode), so both processors are exercised; with both zero every skill is
+    SINGLE_FILE.
+
+    The asset subdirectory is a chain of depth nested directories, each
+    holding two data files and one script.
+
+    Args:
+        root: Directory to create the skills in (created if missing)
+        skills: Number of skill directories
+        md_files: Markdown files per skill, including SKILL.md
+        depth: Nesting depth of the asset subdirectory (0 = none)
+        scripts: Root-level scripts per skill (0 = none)
+        file_kb: Approximate size of each generated file in KB
+        seed: Random seed, so every run sees the same tree
+
+    Returns:
+        {'skills': int, 'files': int, 'bytes': int} describing the tree
+    """
+    rng = random.Random(seed)
+    file_bytes = max(1, file_kb) * 1024
+    totals = {'skills': skills, 'files': 0, 'bytes': 0}
+
+    def write(path: Path, text: str, executable: bool = False) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        if executable:
+            path.chmod(0o755)
+        totals['files'] += 1
+        totals['bytes'] += len(text.encode('utf-8'))
+
+    for index in range(skills):
+        skill_dir = root / f"bench-skill-{index:04d}"
+        with_subdirs = depth > 0 and (scripts == 0 or index % 2 == 0)
+        with_scripts = scripts > 0 and not with_subdirs
+        script_names = [f"tool-{n}.sh" for n in range(scripts)] if with_scripts else []
+
+        references = "".join(f"Run `./{name}` when needed.\n\n" for name in script_names)
+        write(skill_dir / "SKILL.md",
+              f"---\nname: bench-skill-{index:04d}\n"
+              f"description: Synthetic benchmark skill number {index}\n---\n\n"
+              f"# Bench Skill {index}\n\n{references}"
+              f"{_filler_text(rng, file_bytes)}")
+
+        for n in range(1, max(1, md_files)):
+            write(skill_dir / f"guide-{n}.md",
+                  f"# Guide {n}\n\n{references}{_filler_text(rng, file_bytes)}")
+
+        for name in script_names:
+            write(skill_dir / name, "#!/bin/sh\n" + "# " +
+                  _filler_text(rng, file_bytes).replace("\n", "\n# "), executable=True)
+
+        if with_subdirs:
+            level_dir = skill_dir / "assets"
+            for level in range(depth):
+                write(level_dir / f"data-{level}.txt", _filler_text(rng, file_bytes))
+                write(level_dir / f"notes-{level}.json",
+                      json.dumps({'level': level, 'text': _filler_text(rng, file_bytes)}))
+                write(level_dir / f"helper-{level}.py", "# " +
+                      _filler_text(rng, file_bytes).replace("\n", "\n# "))
+                level_dir = level_dir / f"level-{level + 1}"
+
+    return totals
+
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+def bench_path_rewrite(max_mb: float = 5.0, steps: int = 5,
+                       repeat: int = 3) -> List[Dict[str, Any]]:
+    """Time PathUpdater.update_paths_in_markdown() on growing documents.
+
+    Args:
+        max_mb: Size of the largest document in MB
+        steps: Number of sizes; each is half the next one
+        repeat: Runs per size (the fastest is kept)
+
+    Returns:
+        List of result dictionaries, smallest size first:
+        {
+            'size_bytes': int,       # Document size
+            'updates': int,          # Paths rewritten
+            'seconds': float,        # Fastest run
+            'mb_per_s': float,       # Throughput
+            'ms_per_mb': float,      # Cost per MB (flat if linear)
+        }
+    """
+    updater = PathUpdater()
+    max_bytes = int(max_mb * 1024 * 1024)
+    sizes = [max_bytes >> shift for shift in range(steps - 1, -1, -1)]
+
+    results = []
+    for size in sizes:
+        content = generate_markdown(size)
+        best = None
+        updates = 0
+
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            _, updates = updater.update_paths_in_markdown(content, BENCHMARK_SKILL,
+                                                          BENCHMARK_SCRIPTS)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        megabytes = size / (1024 * 1024)
+        results.append({
+            'size_bytes': size,
+            'updates': updates,
+            'seconds': best,
+            'mb_per_s': megabytes / best if best else float('inf'),
+            'ms_per_mb': best * 1000 / megabytes if megabytes else 0.0,
+        })
+
+    return results
+
+
+def format_path_rewrite(results: List[Dict[str, Any]]) -> str:
+    """Format path-rewrite results as a table with a scaling verdict.
+
+    Args:
+        results: Output of bench_path_rewrite()
+
+    Returns:
+        Formatted multi-line string
+    """
+    lines = []
+    lines.append("=" * 60)
+    lines.append("PATH REWRITE BENCHMARK (PathUpdater.update_paths_in_markdown)")
+    lines.append("=" * 60)
+    lines.append(f"{'Size':>10}  {'Updates':>9}  {'Time (ms)':>10}  {'MB/s':>8}  {'ms/MB':>8}")
+
+    for result in results:
+        lines.append(
+            f"{result['size_bytes'] / (1024 * 1024):>8.2f}MB  "
+            f"{result['updates']:>9,}  "
+            f"{result['seconds'] * 1000:>10.1f}  "
+            f"{result['mb_per_s']:>8.1f}  "
+            f"{result['ms_per_mb']:>8.1f}"
+        )
+
+    if len(results) >= 2 and results[0]['ms_per_mb']:
+        # Linear scaling keeps the cost per MB flat across sizes
+        ratio = results[-1]['ms_per_mb'] / results[0]['ms_per_mb']
+        size_factor = results[-1]['size_bytes'] / results[0]['size_bytes']
+        verdict = "linear" if ratio < 2.0 else "SUPERLINEAR"
+        lines.append("")
+        lines.append(f"Cost per MB, largest vs smallest input: {ratio:.2f}x "
+                     f"over a {size_factor:.0f}x size increase ({verdict})")
+
+    return "\n".join(lines)
+
+
+def _run_conversion(input_dir: Path, output_dir: Path, jobs: int, force: bool) -> Dict[str, Any]:
+    """Run the converter once in a fresh interpreter (see CONVERSION_WORKER).
+
+    Raises:
+        RuntimeError: If the worker exits with an error
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", CONVERSION_WORKER, str(SCRIPT_DIR), str(input_dir),
+         str(output_dir), str(jobs), "1" if force else "0"],
+        capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Converter run failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_conversion(skills: int = 50, md_files: int = 3, depth: int = 2,
+                     scripts: int = 2, file_kb: int = 16, jobs: int = 1,
+                     repeat: int = 3, force: bool = False) -> Dict[str, Any]:
+    """Time SkillConverter.run() on a generated skill tree, cold and warm.
+
+    Cold runs convert into an empty output directory. Warm runs repeat the
+    conversion over the output of a cold run, so they measure the
+    incremental path (or a full reconversion with a warm page cache when
+    force is True).
+
+    Args:
+        skills, md_files, depth, scripts, file_kb: Tree shape (see
+            generate_skill_tree())
+        jobs: Worker threads passed to SkillConverter
+        repeat: Runs per mode (the fastest is kept)
+        force: Make warm runs ignore the incremental manifest
+
+    Returns:
+        {
+            'tree': {'skills', 'files', 'bytes'},   # Generated input
+            'cold': {...}, 'warm': {...},           # One entry per mode:
+                # 'seconds', 'skills_per_s', 'mb_per_s', 'peak_rss_mb',
+                # 'converted', 'up_to_date', 'failed', 'phase_totals'
+        }
+    """
+    with tempfile.TemporaryDirectory(prefix="skill-bench-") as temp:
+        input_dir = Path(temp) / "skills"
+        tree = generate_skill_tree(input_dir, skills, md_files, depth, scripts, file_kb)
+        megabytes = tree['bytes'] / (1024 * 1024)
+
+        results: Dict[str, Any] = {'tree': tree}
+        for mode in ('cold', 'warm'):
+            best = None
+            for attempt in range(max(1, repeat)):
+                # Each cold attempt gets a new output directory, which the
+                # warm attempt with the same number then converts over again
+                output_dir = Path(temp) / f"commands-{attempt}"
+                run = _run_conversion(input_dir, output_dir, jobs, force and mode == 'warm')
+                if best is None or run['seconds'] < best['seconds']:
+                    best = run
+
+            seconds = best['seconds']
+            results[mode] = {
+                'seconds': seconds,
+                'skills_per_s': best['skills'] / seconds if seconds else float('inf'),
+                'mb_per_s': megabytes / seconds if seconds else float('inf'),
+                'peak_rss_mb': best['peak_rss_kb'] / 1024,
+                'converted': best['converted'],
+                'up_to_date': best['up_to_date'],
+                'failed': best['failed'],
+                'phase_totals': best['phase_totals'],
+            }
+
+    return results
+
+
+def format_conversion(results: Dict[str, Any]) -> str:
+    """Format conversion results as a table with per-phase times.
+
+    Args:
+        results: Output of bench_conversion()
+
+    Returns:
+        Formatted multi-line string
+    """
+    tree = results['tree']
+    lines = []
+    lines.append("=" * 60)
+    lines.append("CONVERSION BENCHMARK (SkillConverter.run)")
+    lines.append("=" * 60)
+    lines.append(f"Input: {tree['skills']} skills, {tree['files']:,} files, "
+                 f"{tree['bytes'] / (1024 * 1024):.2f} MB")
+    lines.append(f"{'Mode':>6}  {'Time (ms)':>10}  {'Skills/s':>9}  {'MB/s':>8}  "
+                 f"{'Peak RSS':>9}  {'Converted':>9}  {'Skipped':>7}")
+
+    for mode in ('cold', 'warm'):
+        run = results[mode]
+        lines.append(
+            f"{mode:>6}  "
+            f"{run['seconds'] * 1000:>10.1f}  "
+            f"{run['skills_per_s']:>9.1f}  "
+            f"{run['mb_per_s']:>8.1f}  "
+            f"{run['peak_rss_mb']:>7.1f}MB  "
+            f"{run['converted']:>9}  "
+            f"{run['up_to_date']:>7}"
+        )
+
+    lines.append("")
+    lines.append("Phase time (ms), summed over skills:")
+    phases = list(results['cold']['phase_totals'])
+    for phase in results['warm']['phase_totals']:
+        if phase not in phases:
+            phases.append(phase)
+    for phase in phases:
+        cold = results['cold']['phase_totals'].get(phase, {}).get('seconds', 0.0)
+        warm = results['warm']['phase_totals'].get(phase, {}).get('seconds', 0.0)
+        lines.append(f"  {phase:<18} cold {cold * 1000:>9.1f}   warm {warm * 1000:>9.1f}")
+
+    return "\n".join(lines)
+
+
+# ============================================================================
+# Main Function
+# ============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark hot paths of the skill-to-command converter."
+    )
+    parser.add_argument(
+        "--suite",
+        choices=("path-rewrite", "conversion", "all"),
+        default="all",
+        help="Benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=5.0,
+        metavar="N",
+        help="Size of the largest generated document in MB (default: 5)"
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of document sizes, halving from --max-mb (default: 5)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Runs per measurement; the fastest run is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--skills",
+        type=int,
+        default=50,
+        metavar="N",
+        help="Number of generated skills (default: 50)"
+    )
+    parser.add_argument(
+        "--md-files",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Markdown files per skill, including SKILL.md (default: 3)"
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Nesting depth of each skill's asset subdirectory (default: 2)"
+    )
+    parser.add_argument(
+        "--scripts",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Root-level scripts per skill (default: 2)"
+    )
+    parser.add_argument(
+        "--file-kb",
+        type=int,
+        default=16,
+        metavar="N",
+        help="Approximate size of each generated file in KB (default: 16)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker threads passed to SkillConverter (default: 1)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Make the warm conversion run reconvert everything"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of a table"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.max_mb <= 0:
+        parser.error("--max-mb must be positive")
+    if args.steps < 1:
+        parser.error("--steps must be at least 1")
+    if args.skills < 1:
+        parser.error("--skills must be at least 1")
+    if args.md_files < 1:
+        parser.error("--md-files must be at least 1")
+    if min(args.depth, args.scripts) < 0:
+        parser.error("--depth and --scripts cannot be negative")
+    if args.file_kb < 1:
+        parser.error("--file-kb must be at least 1")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args
+
+
+def main():
+    """Main entry point for the benchmarks."""
+    args = parse_args()
+
+    results: Dict[str, Any] = {}
+    if args.suite in ("path-rewrite", "all"):
+        results['path_rewrite'] = bench_path_rewrite(args.max_mb, args.steps, args.repeat)
+    if args.suite in ("conversion", "all"):
+        results['conversion'] = bench_conversion(args.skills, args.md_files, args.depth,
+                                                 args.scripts, args.file_kb, args.jobs,
+                                                 args.repeat, args.force)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        tables = []
+        if 'path_rewrite' in results:
+            tables.append(format_path_rewrite(results['path_rewrite']))
+        if 'conversion' in results:
+            tables.append(format_conversion(results['conversion']))
+        print("\n\n".join(tables))
+
+
+if __name__ == "__main__":
+    main()
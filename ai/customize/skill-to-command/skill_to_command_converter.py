@@ -13,48 +13,147 @@ Key Features:
 - Integrates multiple markdown, code, and config files
 - Follows standardized output format based on sample template
 - Provides detailed reporting of all operations
+- Honors per-skill .skillignore files (gitignore-style exclusion patterns)
+- Converts zipped skill packages (<skill>.zip) directly, without extraction
+- Importable API, including in-memory conversion of a single skill
 
 Usage:
-    python skill_to_command_converter.py
+    python skill_to_command_converter.py [--jobs N] [--force] [--stream] [--atomic] [--watch]
+                                         [--link-mode MODE] [--profile-startup]
+                                         [--quiet] [--log-json PATH] [--report-json PATH]
+                                         [--plan] [--plan-json PATH]
+
+Options:
+    --jobs N            Convert up to N skills concurrently (default: 1, serial)
+    --force             Reconvert every skill, ignoring the incremental manifest
+    --stream            Stream merged markdown to disk instead of building it in memory
+    --atomic            Stage all writes and swap them into place at the end of the run
+    --watch             Keep running and reconvert skills as their files change
+    --profile-startup   Report module import and optional dependency load times
+    --quiet, -q         Only show warnings and errors while converting
+    --log-json PATH     Also write all progress messages as JSON lines to PATH
+    --report-json PATH  Also write the report (with per-phase timing and I/O) as JSON
+    --plan              Dry run: show the per-skill conversion plan and estimated
+                        I/O without writing anything
+    --plan-json PATH    Also write the plan as JSON (implies --plan)
+    --link-mode MODE    How assets are placed in the output: copy (default),
+                        hardlink, reflink, symlink or dedup (hardlinks into a
+                        content-addressed blob store shared by all skills)
+
+Library use:
+    from skill_to_command_converter import SkillConverter, convert_skill
+
+    SkillConverter(input_dir, output_dir, jobs=4).run()
+    output = convert_skill({"SKILL.md": data, "scripts/run.sh": script}, "my-skill")
+    output.content, output.assets   # nothing is read from or written to disk
 
 Author: Skill-to-Command Converter Development Team
 Version: 1.0
 """
 
+import time
+
+# Recorded before any other import so --profile-startup can report the full
+# module load time
+_IMPORT_STARTED = time.perf_counter()
+
 import os
 import sys
 import stat
-import shutil
+import errno
+import logging
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set, Any
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Dict, Set, Any, Mapping, Iterable
 from enum import Enum
 import re
-import glob
-import json
-import time
+import fnmatch
+import bisect
+import codecs
+import threading
+from collections import OrderedDict
+
+# Heavier standard library modules (json, shutil, hashlib, argparse,
+# concurrent.futures) are imported inside the functions that use them, so
+# importing this module stays cheap for tools that embed the converter.
+
+# Diagnostics go through this logger; main() configures output for the CLI
+logger = logging.getLogger("skill_to_command_converter")
+
+# Step-by-step progress output. It does not propagate to the root logger:
+# main() gives it a buffered stdout handler (see configure_console_output()),
+# and code embedding the converter only sees warnings unless it adds one.
+console = logging.getLogger("skill_to_command_converter.console")
+console.propagate = False
+
+
+# ============================================================================
+# Optional Dependencies
+# ============================================================================
+
+# Message logged the first time an optional dependency turns out to be missing
+OPTIONAL_DEPENDENCY_HINTS = {
+    'yaml': (logging.WARNING,
+             "PyYAML not installed. YAML parsing will use regex fallback. "
+             "Install with: pip install pyyaml"),
+    'chardet': (logging.INFO,
+                "chardet not installed. Using standard encoding fallback (utf-8, latin-1, cp1252). "
+                "For better encoding detection, install with: pip install chardet"),
+}
+
+# Resolved optional modules (None = not installed) and their import times
+_optional_modules: Dict[str, Any] = {}
+_optional_import_seconds: Dict[str, float] = {}
+
+
+def _import_optional(name: str):
+    """Import an optional dependency on first use.
+
+    Args:
+        name: Module name (a key of OPTIONAL_DEPENDENCY_HINTS)
+
+    Returns:
+        The module, or None if it is not installed (logged once)
+    """
+    if name in _optional_modules:
+        return _optional_modules[name]
+
+    started = time.perf_counter()
+    try:
+        module = __import__(name)
+    except ImportError:
+        module = None
+        level, message = OPTIONAL_DEPENDENCY_HINTS[name]
+        logger.log(level, message)
+
+    _optional_import_seconds[name] = time.perf_counter() - started
+    _optional_modules[name] = module
+    return module
+
 
-# Try importing PyYAML
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    print("WARNING: PyYAML not installed. YAML parsing will use regex fallback.")
-    print("Install with: pip install pyyaml")
-    print()
-
-# Try importing chardet for encoding detection (optional)
-try:
-    import chardet
-    CHARDET_AVAILABLE = True
-except ImportError:
-    CHARDET_AVAILABLE = False
-    print("INFO: chardet not installed. Using standard encoding fallback (utf-8, latin-1, cp1252).")
-    print("For better encoding detection, install with: pip install chardet")
-    print()
+def _get_yaml():
+    """Return the PyYAML module, or None if it is not installed."""
+    return _import_optional('yaml')
 
 
+def _get_chardet():
+    """Return the chardet module, or None if it is not installed."""
+    return _import_optional('chardet')
+
+
+def __getattr__(name: str):
+    """Resolve YAML_AVAILABLE / CHARDET_AVAILABLE lazily (PEP 562)."""
+    if name == 'YAML_AVAILABLE':
+        return _get_yaml() is not None
+    if name == 'CHARDET_AVAILABLE':
+        return _get_chardet() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Converter version - recorded in the manifest; bumping it invalidates all
+# previously recorded skill hashes so every skill is reconverted once
+CONVERTER_VERSION = "2.1"
+
 # Module-level constants - RELATIVE PATHS (relative to script location)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 INPUT_DIR = SCRIPT_DIR / "skills"
@@ -62,12 +161,25 @@ OUTPUT_DIR = SCRIPT_DIR / "commands"
 SAMPLE_FORMAT = SCRIPT_DIR.parent / "packages" / "droid" / "commands" / "algorithmic-art.md"
 SKELETON_TEMPLATE = SCRIPT_DIR / "COMMAND_SKELETON_TEMPLATE.md"
 
+# Incremental conversion manifest (stored inside OUTPUT_DIR)
+MANIFEST_FILENAME = ".skill_manifest.json"
+
+# Content-addressed asset store for --link-mode dedup (stored inside OUTPUT_DIR)
+BLOB_DIRNAME = ".blobs"
+
+# --atomic: writes are staged in a sibling directory (".{OUTPUT_DIR.name}.staging")
+# that replaces OUTPUT_DIR on commit
+STAGING_SUFFIX = ".staging"
+AT_FDCWD = -100  # dirfd meaning "relative to the current directory" (<fcntl.h>)
+RENAME_EXCHANGE = 2  # renameat2() flag: atomically swap the two paths
+
 
 # Exclusion patterns - Files and directories to skip during processing
 # These patterns help filter out irrelevant files and prevent processing errors
 EXCLUDE_FILES = [
     "LICENSE.txt",
     "LICENSE",
+    ".skillignore",
     "*.bak",
     "*.tmp"
 ]
@@ -78,12 +190,40 @@ EXCLUDE_DIRS = [
     ".git"
 ]
 
+# Files and directories SubdirectoryPreserver never copies, at any depth
+COPY_EXCLUDE_PATTERNS = [
+    "LICENSE.txt",
+    "LICENSE",
+    ".gitignore",
+    ".skillignore",
+    ".git",
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    "*.pyd",
+    ".DS_Store",
+    "Thumbs.db",
+]
+
+# Per-skill exclusion file (gitignore-style patterns, read from the skill
+# root). Matching entries are left out of the skill tree entirely.
+SKILL_IGNORE_FILENAME = ".skillignore"
+
+# Zipped skill packages (as written by skill-creator's package_skill.py) are
+# converted in place of a skill directory of the same name
+SKILL_ARCHIVE_SUFFIX = ".zip"
+ARCHIVE_CHUNK_SIZE = 1024 * 1024  # Bytes per read when streaming archive members
+
 # Script file extensions - Used for detecting root-level executable scripts
 SCRIPT_EXTENSIONS = {'.sh', '.py', '.js', '.ts', '.rb', '.pl', '.bash'}
 
 # Directories to exclude during mode detection - Special directories that don't count as "subdirectories"
 MODE_DETECTION_EXCLUDE_DIRS = {'__pycache__', '.git', 'node_modules', '.venv', 'venv'}
 
+# Directories the skill tree walker records but never descends into - every
+# consumer (discovery, copying, hashing) excludes their contents anyway
+WALK_PRUNE_DIRS = {'__pycache__', '.git'}
+
 # Binary file extensions to exclude (not text-processable)
 BINARY_EXTENSIONS = [
     ".pdf",
@@ -128,10 +268,29 @@ MARKDOWN_EXTENSIONS = [
 MAX_FILE_SIZE_MB = 10  # Maximum file size to process (in megabytes)
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
+# Text decoding - Encoding detection only looks at a bounded prefix, and
+# decoded files are memoized per (path, size, mtime) within a byte budget
+ENCODING_SNIFF_BYTES = 64 * 1024  # Prefix size handed to chardet / the fallback checks
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Total size of decoded text kept in memory
+
 # Retry configuration - Error recovery settings
 RETRY_WAIT_TIME = 0.5  # Seconds to wait between retry attempts
 MAX_RETRIES = 1  # Number of retry attempts for failed operations
 
+# Watch mode - How edits under INPUT_DIR are picked up with --watch
+WATCH_DEBOUNCE_SECONDS = 0.05  # Quiet period after the last event before reconverting
+WATCH_POLL_INTERVAL = 0.1  # Seconds between scans when inotify is unavailable
+
+# Console output settings (see BufferedConsoleHandler)
+LOG_BUFFER_BYTES = 64 * 1024  # Buffered progress text that triggers a write
+LOG_FLUSH_INTERVAL = 0.5  # Seconds after which buffered lines are written anyway
+
+# Asset placement - How preserved subdirectories and relocated scripts are
+# materialized in OUTPUT_DIR (see materialize_file)
+LINK_MODES = ('copy', 'hardlink', 'reflink', 'symlink', 'dedup')
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024  # Bytes requested per copy_file_range()/sendfile() call
+FICLONE = 0x40049409  # Linux ioctl that clones file extents (reflink) on CoW filesystems
+
 
 # ============================================================================
 # Data Structures
@@ -152,2626 +311,5289 @@ class TransformationMode(Enum):
     SINGLE_FILE = "SINGLE_FILE"
 
 
-class ModeDetector:
-    """Detects the appropriate transformation mode for a skill directory.
+# Marks the end of an extension in ExclusionMatcher's suffix trie (None can
+# never be an extension component)
+_TRIE_END = None
 
-    Analyzes the structure of a skill directory to determine which of three
-    transformation strategies should be applied:
-    - DIRECTORY_WITH_SUBDIRS: Skill contains subdirectories to preserve
-    - DIRECTORY_WITH_SCRIPTS: Skill has root-level executable scripts
-    - SINGLE_FILE: Simple skill with only markdown files
+_GLOB_MAGIC_RE = re.compile(r'[*?\[]')
 
-    The detection follows a priority order:
-    1. Check for subdirectories first (highest priority)
-    2. Check for root-level scripts second
-    3. Default to single-file mode (lowest priority)
+
+class ExclusionMatcher:
+    """Exclusion rules compiled once into constant-cost lookups.
+
+    should_exclude_file() used to loop over EXCLUDE_FILES and
+    BINARY_EXTENSIONS for every file, and SubdirectoryPreserver ran fnmatch
+    over each of its patterns per directory entry. A matcher sorts its rules
+    by kind when it is built, so that checking a name costs one set lookup,
+    a short walk of an extension trie and at most two regex matches - no
+    matter how many rules there are.
+
+    Rule kinds:
+    - Exact names ("LICENSE") - frozenset lookup
+    - Extensions (".pdf", ".tar.gz") - suffix trie over the dot-separated
+      name components, so multi-part extensions match as a whole
+    - Name globs ("*.pyc") - one combined regular expression
+    - Path globs ("docs/drafts/*", any pattern containing "/") - one combined
+      regular expression matched against the path relative to the skill root
+
+    Usage:
+        matcher = ExclusionMatcher(["LICENSE", "*.bak"], [".tar.gz"])
+        matcher.matches("backup.tar.gz")   # True
     """
 
-    def detect_mode(self, skill_dir: Path) -> TransformationMode:
-        """Detect the transformation mode for a skill directory.
+    def __init__(self, patterns=(), extensions=(), ignore_case: bool = False):
+        """Compile the rules.
 
         Args:
-            skill_dir: Path to the skill directory to analyze
+            patterns: Exact names and glob patterns (fnmatch syntax). Patterns
+                      containing "/" are matched against relative paths; a
+                      leading "/" is ignored.
+            extensions: File extensions including the leading dot. Always
+                        matched case-insensitively, like Path.suffix.lower().
+            ignore_case: Match names and globs case-insensitively
+        """
+        self.patterns = tuple(patterns)
+        self.extensions = tuple(extensions)
+        self.ignore_case = ignore_case
+
+        names = set()
+        name_globs = []
+        path_globs = []
+        for pattern in self.patterns:
+            if '/' in pattern:
+                path_globs.append(pattern.lstrip('/'))
+            elif _GLOB_MAGIC_RE.search(pattern):
+                name_globs.append(pattern)
+            else:
+                names.add(pattern.lower() if ignore_case else pattern)
+
+        self._names = frozenset(names)
+        self._name_re = self._compile_globs(name_globs)
+        self._path_re = self._compile_globs(path_globs)
+
+        # Components are stored last-first: ".tar.gz" -> {"gz": {"tar": {END}}}
+        self._extension_trie: Dict[Any, dict] = {}
+        for extension in self.extensions:
+            node = self._extension_trie
+            for part in reversed(extension.lower().lstrip('.').split('.')):
+                node = node.setdefault(part, {})
+            node[_TRIE_END] = {}
+
+    def _compile_globs(self, globs: List[str]) -> Optional['re.Pattern']:
+        """Combine glob patterns into a single regex (None if there are none)."""
+        if not globs:
+            return None
+        flags = re.IGNORECASE if self.ignore_case else 0
+        return re.compile('|'.join(fnmatch.translate(glob) for glob in globs), flags)
+
+    def matches(self, name: str, rel_path: Optional[str] = None) -> bool:
+        """Check whether an entry is excluded.
 
-        Returns:
-            TransformationMode enum value indicating which transformation strategy to use
+        Args:
+            name: Entry name (no directory part)
+            rel_path: POSIX path relative to the skill root; path globs are
+                      only checked when it is given
 
-        Algorithm:
-            1. Get all items in skill directory root
-            2. Check for subdirectories (excluding special dirs like __pycache__)
-            3. If subdirectories found, return DIRECTORY_WITH_SUBDIRS
-            4. Check for root-level scripts (by file extension)
-            5. If scripts found, return DIRECTORY_WITH_SCRIPTS
-            6. Otherwise, return SINGLE_FILE
+        Returns:
+            True if any rule matches
         """
-        print(f"\n🔍 Detecting transformation mode for: {skill_dir.name}")
+        if (name.lower() if self.ignore_case else name) in self._names:
+            return True
+        if self._extension_trie and self._match_extension(name):
+            return True
+        if self._name_re is not None and self._name_re.match(name):
+            return True
+        if rel_path is not None and self._path_re is not None and self._path_re.match(rel_path):
+            return True
+        return False
 
-        if not skill_dir.exists() or not skill_dir.is_dir():
-            # Default to SINGLE_FILE for invalid directories
-            print(f"⚠️  Directory does not exist or is not valid: {skill_dir}")
-            print(f"   → Mode: SINGLE_FILE (fallback)")
-            return TransformationMode.SINGLE_FILE
+    def _match_extension(self, name: str) -> bool:
+        """Walk the extension trie from the last name component backwards.
 
-        # Get all items in root directory
-        try:
-            root_items = list(skill_dir.iterdir())
-        except (OSError, PermissionError) as e:
-            # If we can't read the directory, default to SINGLE_FILE
-            print(f"⚠️  Cannot read directory (permission error): {e}")
-            print(f"   → Mode: SINGLE_FILE (fallback)")
-            return TransformationMode.SINGLE_FILE
+        Notes:
+            - Like Path.suffix, a name needs a non-empty stem to have an
+              extension (".gz" has none, "archive.tar.gz" has ".gz" and
+              ".tar.gz")
+        """
+        parts = name.lower().split('.')
+        node = self._extension_trie
 
-        # Step 1: Check for subdirectories (excluding special directories)
-        subdirs = [
-            item for item in root_items
-            if item.is_dir() and item.name not in MODE_DETECTION_EXCLUDE_DIRS
-        ]
+        # parts[0] is the stem and never part of the extension
+        for i in range(len(parts) - 1, 0, -1):
+            node = node.get(parts[i])
+            if node is None:
+                return False
+            if _TRIE_END in node and (i > 1 or parts[0]):
+                return True
 
-        if len(subdirs) > 0:
-            subdir_names = [d.name for d in subdirs]
-            print(f"✓ Found {len(subdirs)} subdirectory(ies): {', '.join(subdir_names)}")
-            print(f"   → Mode: DIRECTORY_WITH_SUBDIRS")
-            return TransformationMode.DIRECTORY_WITH_SUBDIRS
+        return False
 
-        # Step 2: Check for root-level scripts
-        scripts = [
-            item for item in root_items
-            if item.is_file() and item.suffix in SCRIPT_EXTENSIONS
-        ]
 
-        if len(scripts) > 0:
-            script_names = [s.name for s in scripts]
-            print(f"✓ Found {len(scripts)} root-level script(s): {', '.join(script_names)}")
-            print(f"   → Mode: DIRECTORY_WITH_SCRIPTS")
-            return TransformationMode.DIRECTORY_WITH_SCRIPTS
+@dataclass(frozen=True)
+class SkillIgnore:
+    """Compiled contents of a skill's .skillignore file.
 
-        # Step 3: Default to single file mode
-        print(f"✓ No subdirectories or scripts found")
-        print(f"   → Mode: SINGLE_FILE (default)")
-        return TransformationMode.SINGLE_FILE
+    The file uses a subset of .gitignore syntax: one pattern per line, blank
+    lines and lines starting with "#" are skipped, a trailing "/" limits a
+    pattern to directories and a pattern containing "/" is matched against
+    the path relative to the skill root. Negation ("!") is not supported.
 
+    SkillTree.scan() applies these rules while walking, so ignored entries
+    never reach discovery, copying, hashing or mode detection and cost no
+    stat() call.
 
-class MarkdownMerger:
-    """Merges multiple markdown files into a single markdown document.
+    Attributes:
+        files: Matcher for file entries
+        dirs: Matcher for directory entries (also contains the file rules)
+    """
+    files: ExclusionMatcher
+    dirs: ExclusionMatcher
 
-    This class handles the merging of SKILL.md with other markdown files in a skill directory.
-    It extracts YAML frontmatter from the primary file, strips frontmatter from other files,
-    and combines them into a single cohesive document with section headers.
+    # Compiled rules by file content; shared by every skill and rescan
+    _compiled = OrderedDict()
+    _compiled_lock = threading.Lock()
+    CACHE_MAX_ENTRIES = 256
 
-    Key Features:
-    - Preserves YAML frontmatter from primary file (SKILL.md)
-    - Strips frontmatter from secondary files to prevent duplicates
-    - Creates ## section headers from filenames
-    - Merges files in alphabetical order (after SKILL.md)
-    - Handles edge cases (missing files, empty content, malformed YAML)
+    @classmethod
+    def parse(cls, text: str) -> 'SkillIgnore':
+        """Compile the patterns in a .skillignore file.
 
-    Usage:
-        merger = MarkdownMerger()
-        result = merger.merge_markdown_files(skill_md_path, other_md_paths)
-    """
+        Args:
+            text: File content
 
-    def __init__(self):
-        """Initialize the MarkdownMerger."""
-        pass
+        Returns:
+            SkillIgnore for the patterns (cached by content)
+        """
+        with cls._compiled_lock:
+            cached = cls._compiled.get(text)
+            if cached is not None:
+                cls._compiled.move_to_end(text)
+                return cached
+
+        file_patterns = []
+        dir_patterns = []
+        for line in text.splitlines():
+            pattern = line.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
+            if pattern.startswith('!'):
+                logger.warning("Negated pattern not supported in %s: %s",
+                               SKILL_IGNORE_FILENAME, pattern)
+                continue
+            if pattern.endswith('/'):
+                dir_patterns.append(pattern.rstrip('/'))
+            else:
+                file_patterns.append(pattern)
 
-    def extract_frontmatter(self, content: str) -> tuple[dict, str]:
-        """Extract YAML frontmatter from markdown content.
+        ignore = cls(files=ExclusionMatcher(file_patterns),
+                     dirs=ExclusionMatcher(file_patterns + dir_patterns))
 
-        Separates the YAML frontmatter (between --- delimiters) from the
-        main content of a markdown file. Parses the YAML into a dictionary.
+        with cls._compiled_lock:
+            cls._compiled[text] = ignore
+            while len(cls._compiled) > cls.CACHE_MAX_ENTRIES:
+                cls._compiled.popitem(last=False)
+        return ignore
+
+    @classmethod
+    def load(cls, skill_dir: Path) -> Optional['SkillIgnore']:
+        """Read the .skillignore file at the root of a skill directory.
 
         Args:
-            content: Full markdown file content (may include frontmatter)
+            skill_dir: Path to the skill directory
 
         Returns:
-            Tuple of (frontmatter_dict, content_without_frontmatter)
-            - frontmatter_dict: Parsed YAML as dictionary (empty dict if no frontmatter)
-            - content_without_frontmatter: Content after the closing --- delimiter
-
-        Notes:
-            - Frontmatter must be at the start of the file (after stripping whitespace)
-            - Uses --- as both opening and closing delimiters
-            - Returns empty dict if no valid frontmatter found
-            - Uses PyYAML if available, falls back to regex parsing
-            - Attempts to fix common YAML issues automatically
+            SkillIgnore, or None if the skill has no (readable) ignore file
         """
-        frontmatter = {}
+        path = Path(skill_dir) / SKILL_IGNORE_FILENAME
+        try:
+            text, _ = read_text_cached(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            console.warning(f"WARNING: Cannot read {path}: {e}")
+            return None
+        return cls.parse(text)
 
-        # Strip leading whitespace
-        content = content.lstrip()
+    def matches(self, name: str, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a tree entry is ignored."""
+        return (self.dirs if is_dir else self.files).matches(name, rel_path)
 
-        # Check if frontmatter exists
-        if not content.startswith('---'):
-            return {}, content
 
-        # Split into lines
-        lines = content.split('\n')
+# Compiled default rules, shared by discovery (should_exclude_file,
+# should_exclude_dir) and SubdirectoryPreserver
+DISCOVERY_FILE_EXCLUSIONS = ExclusionMatcher(EXCLUDE_FILES, BINARY_EXTENSIONS, ignore_case=True)
+DISCOVERY_DIR_EXCLUSIONS = ExclusionMatcher(EXCLUDE_DIRS, ignore_case=True)
+COPY_EXCLUSIONS = ExclusionMatcher(COPY_EXCLUDE_PATTERNS)
 
-        if len(lines) < 3:
-            # Not enough lines for valid frontmatter
-            return {}, content
 
-        # Find closing delimiter
-        closing_index = -1
-        for i in range(1, len(lines)):
-            if lines[i].strip() == '---':
-                closing_index = i
-                break
+@dataclass
+class TreeNode:
+    """A file or directory in an in-memory skill tree.
+
+    Nodes are produced by SkillTree.scan() from a single os.scandir walk, with
+    the stat data captured once so that consumers never have to stat again.
+
+    Attributes:
+        name: Entry name (e.g., "SKILL.md", "ooxml")
+        path: Filesystem path of the entry (symbolic links are not resolved,
+              but all stat data below describes the link target)
+        rel_path: POSIX path relative to the skill root ("" for the root)
+        is_dir: True for directories (including symlinks to directories)
+        is_symlink: True if the entry itself is a symbolic link
+        size: File size in bytes (0 for directories)
+        mtime_ns: Modification time in nanoseconds (0 for directories)
+        mode: st_mode of the target (0 for directories)
+        inode: st_ino of the target (0 for directories)
+        device: st_dev of the target (0 for directories)
+        children: Child nodes sorted by name (directories only; left empty
+                  for pruned directories such as __pycache__)
+    """
+    name: str
+    path: Path
+    rel_path: str
+    is_dir: bool
+    is_symlink: bool = False
+    size: int = 0
+    mtime_ns: int = 0
+    mode: int = 0
+    inode: int = 0
+    device: int = 0
+    children: List['TreeNode'] = field(default_factory=list)
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'TreeNode':
+        """Build a standalone file node for path with a single stat() call.
+
+        Used where a file was not reached through SkillTree.scan() (e.g., the
+        script list handed to PathUpdater.relocate_scripts).
 
-        if closing_index == -1:
-            # No closing delimiter - no valid frontmatter
-            return {}, content
+        Args:
+            path: File path (symbolic links are followed)
 
-        # Extract YAML block
-        yaml_lines = lines[1:closing_index]
-        yaml_content = '\n'.join(yaml_lines)
+        Returns:
+            TreeNode with the stat data of the file
 
-        # Extract content after frontmatter
-        content_lines = lines[closing_index + 1:]
-        remaining_content = '\n'.join(content_lines).lstrip()
+        Raises:
+            OSError: If the file cannot be stat()ed
+        """
+        path = Path(path)
+        st = os.stat(path)
+        return cls(
+            name=path.name,
+            path=path,
+            rel_path=path.name,
+            is_dir=stat.S_ISDIR(st.st_mode),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            mode=st.st_mode,
+            inode=st.st_ino,
+            device=st.st_dev,
+        )
 
-        # Parse YAML using PyYAML if available
-        if YAML_AVAILABLE:
-            try:
-                # Try parsing with yaml.safe_load()
-                parsed = yaml.safe_load(yaml_content)
+    @property
+    def suffix(self) -> str:
+        """File extension including the dot (same as Path.suffix)."""
+        return Path(self.name).suffix
 
-                if parsed is None:
-                    # Empty YAML block
-                    return {}, remaining_content
+    def is_file(self) -> bool:
+        """Return True for regular files (and symlinks to regular files)."""
+        return not self.is_dir
 
-                if not isinstance(parsed, dict):
-                    # Invalid YAML structure
-                    return {}, remaining_content
+    def is_executable(self) -> bool:
+        """Return True if the owner-executable bit is set."""
+        return bool(self.mode & stat.S_IXUSR)
 
-                # Successfully parsed - convert all values to strings
-                for key, value in parsed.items():
-                    if value is not None:
-                        frontmatter[str(key)] = str(value)
+    def child(self, name: str) -> Optional['TreeNode']:
+        """Return the direct child with the given name, or None."""
+        for node in self.children:
+            if node.name == name:
+                return node
+        return None
 
-                return frontmatter, remaining_content
+    def iter_files(self, prune_dir=None):
+        """Yield all file nodes below this node in sorted, depth-first order.
 
-            except yaml.YAMLError:
-                # YAML parsing failed - try to fix common issues
-                fixed_yaml = self._fix_common_yaml_issues(yaml_content)
+        Args:
+            prune_dir: Optional callable(TreeNode) -> bool; directories for
+                       which it returns True are skipped with their contents
+        """
+        for node in self.children:
+            if node.is_dir:
+                if prune_dir is not None and prune_dir(node):
+                    continue
+                yield from node.iter_files(prune_dir)
+            else:
+                yield node
 
-                try:
-                    parsed = yaml.safe_load(fixed_yaml)
 
-                    if parsed and isinstance(parsed, dict):
-                        # Convert all values to strings
-                        for key, value in parsed.items():
-                            if value is not None:
-                                frontmatter[str(key)] = str(value)
+class SkillTree:
+    """In-memory snapshot of one skill directory, built by a single walk.
 
-                        return frontmatter, remaining_content
-                except yaml.YAMLError:
-                    # Still failed - fall through to regex
-                    pass
+    ModeDetector, discover_files(), the _process_* methods,
+    SubdirectoryPreserver and ConversionManifest all used to walk the same
+    skill directory independently (iterdir, rglob, per-parent checks and
+    per-file stat calls). SkillTree walks it once with os.scandir, caches the
+    stat results on each TreeNode, and is shared by all of them.
 
-        # Regex fallback - simple key: value extraction
-        frontmatter = self._parse_yaml_with_regex(yaml_content)
+    Key Features:
+    - One scandir() per directory and one stat() per entry
+    - Follows symbolic links (like the copy logic), with cycle protection
+    - Records but does not descend into WALK_PRUNE_DIRS
+    - Leaves out entries matched by the skill's .skillignore file
+    - Children sorted by name for deterministic processing
 
-        return frontmatter, remaining_content
+    Usage:
+        tree = SkillTree.scan(skill_dir)
+        tree = SkillTree.from_files("docx", {"SKILL.md": b"..."})
+        with SkillTree.load(INPUT_DIR / "docx.zip") as tree: ...
+        for node in tree.root.children: ...
+    """
 
-    def strip_frontmatter(self, content: str) -> str:
-        """Remove YAML frontmatter from markdown content.
+    def __init__(self, skill_dir: Path, root: TreeNode, error: Optional[OSError] = None,
+                 ignore: Optional[SkillIgnore] = None,
+                 contents: Optional[Mapping[str, bytes]] = None):
+        """Initialize from an already-built root node (use scan() instead).
 
-        Removes the YAML frontmatter block (if present) and returns only
-        the main markdown content.
+        Args:
+            skill_dir: Path to the skill directory
+            root: Root TreeNode
+            error: Error raised while reading the root directory, if any
+            ignore: .skillignore rules applied while scanning, if any
+            contents: File data keyed by rel_path for in-memory trees
+                      (None for trees scanned from disk)
+        """
+        self.skill_dir = skill_dir
+        self.root = root
+        self.error = error
+        self.ignore = ignore
+        self.contents = contents
+
+    @classmethod
+    def from_files(cls, skill_name: str, files: Mapping[str, bytes],
+                   executable: Iterable[str] = ()) -> 'SkillTree':
+        """Build a tree from file contents held in memory.
+
+        Applies the same rules as scan(): a .skillignore entry in files is
+        honored, WALK_PRUNE_DIRS are recorded but not descended into, and
+        children are sorted by name. Node paths are Path(skill_name) /
+        rel_path; they are never opened, file data is served by read_text().
 
         Args:
-            content: Full markdown file content
+            skill_name: Name of the skill (root node name)
+            files: File contents keyed by POSIX path relative to the skill
+                   root (e.g., "SKILL.md", "scripts/pack.py")
+            executable: Keys of files that get an executable mode
 
         Returns:
-            Content without frontmatter (whitespace stripped from start)
+            SkillTree whose `contents` maps rel_path to the file data
 
-        Notes:
-            - Returns original content if no frontmatter is found
-            - Strips leading whitespace after frontmatter removal
+        Raises:
+            ValueError: If a key is empty, absolute, or contains ".."
         """
-        _, content_without_frontmatter = self.extract_frontmatter(content)
-        return content_without_frontmatter
+        executable = {cls._normalize_key(key) for key in executable}
+        contents = {cls._normalize_key(key): bytes(data) for key, data in files.items()}
+        entries = {
+            rel_path: (len(data), 0o100755 if rel_path in executable else 0o100644, 0)
+            for rel_path, data in contents.items()
+        }
+        return cls._from_entries(skill_name, Path(skill_name), entries, contents)
 
-    def _fix_common_yaml_issues(self, yaml_content: str) -> str:
-        """Fix common YAML formatting issues.
+    @classmethod
+    def from_archive(cls, archive_path: Path) -> 'SkillTree':
+        """Build a tree from a zipped skill package without extracting it.
 
-        Attempts to automatically fix common problems in YAML frontmatter
-        that prevent parsing, such as missing quotes or improper spacing.
+        The archive's central directory supplies names, sizes, modes and
+        mtimes; member data is only decompressed when a consumer reads or
+        streams it (see SkillArchive). Call close() when done.
 
         Args:
-            yaml_content: Raw YAML content (without --- delimiters)
+            archive_path: Path to the .zip file
 
         Returns:
-            Fixed YAML content
+            SkillTree rooted at the skill inside the archive (root name is
+            the archive name without SKILL_ARCHIVE_SUFFIX). If the archive
+            cannot be read, the tree has no children and `error` holds the
+            exception.
+        """
+        archive_path = Path(archive_path)
+        skill_name = skill_name_of(archive_path)
 
-        Common fixes applied:
-            - Add quotes around values containing colons
-            - Add spaces after colons if missing
-            - Remove extra trailing whitespace
+        try:
+            archive = SkillArchive(archive_path)
+        except (OSError, ValueError) as e:
+            root = TreeNode(name=skill_name, path=archive_path, rel_path="", is_dir=True)
+            return cls(archive_path, root, e if isinstance(e, OSError) else OSError(str(e)))
+
+        return cls._from_entries(skill_name, archive_path, archive.entries, archive)
+
+    @classmethod
+    def _from_entries(cls, skill_name: str, skill_dir: Path, entries: Dict[str, tuple],
+                      contents) -> 'SkillTree':
+        """Build the node structure for from_files() and from_archive().
+
+        Args:
+            skill_name: Root node name
+            skill_dir: Path that node paths are built under
+            entries: {rel_path: (size, mode, mtime_ns)} of every file
+            contents: rel_path -> data lookup kept as the tree's `contents`
         """
-        lines = yaml_content.split('\n')
-        fixed_lines = []
+        ignore = None
+        if SKILL_IGNORE_FILENAME in contents:
+            ignore = SkillIgnore.parse(decode_text(contents[SKILL_IGNORE_FILENAME])[0])
 
-        for line in lines:
-            # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith('#'):
-                fixed_lines.append(line)
-                continue
+        root = TreeNode(name=skill_name, path=skill_dir, rel_path="", is_dir=True)
+        directories = {"": root}
 
-            # Check if line is a key-value pair
-            if ':' in line:
-                # Split on first colon only
-                parts = line.split(':', 1)
-
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-
-                    # If value contains a colon and isn't already quoted, quote it
-                    if ':' in value and not (
-                        (value.startswith('"') and value.endswith('"')) or
-                        (value.startswith("'") and value.endswith("'"))
-                    ):
-                        # Quote the value
-                        # Escape any existing quotes in the value
-                        value = value.replace('"', '\\"')
-                        value = f'"{value}"'
-
-                    # Reconstruct line with proper spacing
-                    fixed_line = f"{key}: {value}"
-                    fixed_lines.append(fixed_line)
+        for rel_path in sorted(entries):
+            parts = rel_path.split("/")
+            parent = root
+            for depth, name in enumerate(parts):
+                node_rel = "/".join(parts[:depth + 1])
+                is_dir = depth < len(parts) - 1
+
+                if parent is None:
+                    break
+                if ignore is not None and ignore.matches(name, node_rel, is_dir):
+                    break
+
+                if not is_dir:
+                    size, mode, mtime_ns = entries[rel_path]
+                    parent.children.append(TreeNode(
+                        name=name, path=skill_dir / node_rel, rel_path=node_rel,
+                        is_dir=False, size=size, mtime_ns=mtime_ns, mode=mode,
+                    ))
+                elif node_rel in directories:
+                    parent = directories[node_rel]
                 else:
-                    # Keep original line if we can't parse it
-                    fixed_lines.append(line)
-            else:
-                # Not a key-value pair, keep as-is
-                fixed_lines.append(line)
+                    node = TreeNode(name=name, path=skill_dir / node_rel,
+                                    rel_path=node_rel, is_dir=True)
+                    parent.children.append(node)
+                    # Pruned directories are recorded but stay empty
+                    directories[node_rel] = None if name in WALK_PRUNE_DIRS else node
+                    parent = directories[node_rel]
+
+        for node in directories.values():
+            if node is not None:
+                node.children.sort(key=lambda child: child.name)
+
+        return cls(skill_dir, root, None, ignore, contents)
+
+    @staticmethod
+    def _normalize_key(key: str) -> str:
+        """Normalize a from_files() key to a clean relative POSIX path."""
+        parts = [part for part in str(key).replace("\\", "/").split("/") if part not in ("", ".")]
+        if not parts or str(key).startswith("/") or ".." in parts:
+            raise ValueError(f"Invalid skill file path: {key!r}")
+        return "/".join(parts)
+
+    @classmethod
+    def load(cls, skill_path: Path) -> 'SkillTree':
+        """Build the tree of a skill directory or zipped skill package.
 
-        return '\n'.join(fixed_lines)
+        Args:
+            skill_path: Skill directory, or a file for which
+                        is_skill_archive() is True
 
-    def _parse_yaml_with_regex(self, yaml_content: str) -> dict:
-        """Parse YAML using regex fallback (when PyYAML unavailable or fails).
+        Returns:
+            SkillTree from from_archive() or scan()
+        """
+        if is_skill_archive(skill_path):
+            return cls.from_archive(skill_path)
+        return cls.scan(skill_path)
 
-        This is a simple parser that handles basic key: value pairs.
-        Does not support complex YAML features like lists, nested dicts, etc.
+    @property
+    def is_archive(self) -> bool:
+        """True if the tree reads its files from a zipped skill package."""
+        return isinstance(self.contents, SkillArchive)
+
+    def read_text(self, path: Path, store: bool = True) -> tuple[str, str]:
+        """Read and decode a file of the tree (same signature as read_text_cached).
+
+        Trees scanned from disk delegate to read_text_cached(); in-memory and
+        archive trees decode their stored data.
 
         Args:
-            yaml_content: Raw YAML content (without --- delimiters)
+            path: Node path of the file (skill_dir / rel_path)
+            store: Passed to read_text_cached() for disk trees
 
         Returns:
-            Dictionary of key-value pairs (all values as strings)
+            Tuple of (text, encoding) from decode_text()
 
-        Notes:
-            - Only handles simple key: value pairs
-            - Does not support YAML lists, nested structures, or multi-line values
-            - Used as fallback when PyYAML is unavailable or parsing fails
+        Raises:
+            FileNotFoundError: If the tree holds no data for path
         """
-        result = {}
+        if self.contents is None:
+            return read_text_cached(path, store)
 
-        lines = yaml_content.split('\n')
+        rel_path = Path(path).relative_to(self.skill_dir).as_posix()
+        if rel_path not in self.contents:
+            raise FileNotFoundError(errno.ENOENT, "No such file in skill tree", str(path))
+        return decode_text(self.contents[rel_path])
 
-        for line in lines:
-            # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith('#'):
-                continue
+    def open_file(self, node: TreeNode):
+        """Open a file of the tree for binary reading.
 
-            # Look for key: value pattern
-            match = re.match(r'^([a-zA-Z0-9_-]+)\s*:\s*(.*)$', line.strip())
+        Args:
+            node: File node of this tree
 
-            if match:
-                key = match.group(1).strip()
-                value = match.group(2).strip()
+        Returns:
+            Readable binary file object (use as a context manager)
+        """
+        if self.contents is None:
+            return open(node.path, 'rb')
+        if self.is_archive:
+            return self.contents.open(node.rel_path)
 
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
+        import io
 
-                # Unescape quotes
-                value = value.replace('\\"', '"').replace("\\'", "'")
+        return io.BytesIO(self.contents[node.rel_path])
 
-                result[key] = value
+    def close(self) -> None:
+        """Release the archive backing the tree, if any."""
+        if self.is_archive:
+            self.contents.close()
 
-        return result
+    def __enter__(self) -> 'SkillTree':
+        return self
 
-    def create_section_header(self, filename: str) -> str:
-        """Create a section header from a filename.
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-        Converts a markdown filename into a readable section header.
+
+    @classmethod
+    def scan(cls, skill_dir: Path) -> 'SkillTree':
+        """Walk a skill directory once and build its tree.
 
         Args:
-            filename: Filename (e.g., "api-reference.md", "getting_started.md")
+            skill_dir: Path to the skill directory
 
         Returns:
-            Section header as ## markdown (e.g., "## API Reference", "## Getting Started")
+            SkillTree for the directory. If the root cannot be read, the tree
+            has no children and `error` holds the exception.
+        """
+        skill_dir = Path(skill_dir)
+        root = TreeNode(name=skill_dir.name, path=skill_dir, rel_path="", is_dir=True)
 
-        Examples:
-            "api-reference.md" -> "## API Reference"
-            "getting_started.md" -> "## Getting Started"
-            "INSTALL.md" -> "## INSTALL"
-            "readme.md" -> "## Readme"
+        try:
+            root_stat = os.stat(skill_dir)
+        except OSError as e:
+            return cls(skill_dir, root, e)
 
-        Notes:
-            - Removes .md/.markdown extension
-            - Replaces hyphens and underscores with spaces
-            - Title-cases each word (with acronym support)
-            - Returns ## level header for consistency
+        ignore = SkillIgnore.load(skill_dir)
+        error = cls._scan_into(root, root_stat.st_dev,
+                               {(root_stat.st_dev, root_stat.st_ino)}, ignore)
+        return cls(skill_dir, root, error, ignore)
+
+    @classmethod
+    def _scan_into(cls, parent: TreeNode, device: int, ancestors: Set[tuple],
+                   ignore: Optional[SkillIgnore] = None) -> Optional[OSError]:
+        """Populate parent.children from one os.scandir() call (recursive).
+
+        Args:
+            parent: Directory node to fill in
+            device: st_dev of parent (plain subdirectories share it)
+            ancestors: (st_dev, st_ino) of directories on the current path,
+                       used to stop symlink cycles
+            ignore: .skillignore rules; matching entries are skipped before
+                    they are stat()ed
+
+        Returns:
+            The OSError if parent itself could not be read, otherwise None
+            (unreadable subdirectories are simply left empty)
         """
-        # Common acronyms that should be fully capitalized
-        acronyms = {
-            'api': 'API',
-            'cli': 'CLI',
-            'ui': 'UI',
-            'ux': 'UX',
-            'url': 'URL',
-            'html': 'HTML',
-            'css': 'CSS',
-            'js': 'JS',
-            'json': 'JSON',
-            'xml': 'XML',
-            'sql': 'SQL',
-            'rest': 'REST',
-            'http': 'HTTP',
-            'https': 'HTTPS',
-            'ssh': 'SSH',
-            'git': 'Git',
-            'ai': 'AI',
-            'ml': 'ML',
-            'llm': 'LLM',
-            'mcp': 'MCP',
-        }
+        try:
+            with os.scandir(parent.path) as entries:
+                entry_list = sorted(entries, key=lambda e: e.name)
+        except OSError as e:
+            return e
 
-        # Remove file extension
-        if filename.lower().endswith('.md'):
-            name = filename[:-3]
-        elif filename.lower().endswith('.markdown'):
-            name = filename[:-9]
-        else:
-            name = filename
+        prefix = f"{parent.rel_path}/" if parent.rel_path else ""
 
-        # Replace separators with spaces
-        name = name.replace('-', ' ').replace('_', ' ')
+        for entry in entry_list:
+            rel_path = prefix + entry.name
+            try:
+                is_symlink = entry.is_symlink()
+                is_dir = entry.is_dir()
 
-        # Split into words and capitalize each
-        words = name.split()
-        capitalized_words = []
+                if ignore is not None and ignore.matches(entry.name, rel_path, is_dir):
+                    continue
 
-        for word in words:
-            word_lower = word.lower()
-            if word_lower in acronyms:
-                # Use the acronym form
-                capitalized_words.append(acronyms[word_lower])
+                if is_dir and not is_symlink:
+                    # Plain directories: the inode from readdir() is enough
+                    # for cycle detection, no stat() needed
+                    st = None
+                    key = (device, entry.inode())
+                elif is_dir or entry.is_file():
+                    # DirEntry.stat() follows symlinks and caches its result
+                    st = entry.stat()
+                    key = (st.st_dev, st.st_ino)
+                else:
+                    # Broken symlink or special file - nothing to process
+                    continue
+            except OSError:
+                continue
+
+            node = TreeNode(
+                name=entry.name,
+                path=parent.path / entry.name,
+                rel_path=rel_path,
+                is_dir=is_dir,
+                is_symlink=is_symlink,
+            )
+
+            if is_dir:
+                if entry.name not in WALK_PRUNE_DIRS and key not in ancestors:
+                    cls._scan_into(node, key[0], ancestors | {key}, ignore)
             else:
-                # Regular title case
-                capitalized_words.append(word.capitalize())
+                node.size = st.st_size
+                node.mtime_ns = st.st_mtime_ns
+                node.mode = st.st_mode
+                node.inode = st.st_ino
+                node.device = st.st_dev
 
-        title = ' '.join(capitalized_words)
+            parent.children.append(node)
 
-        # Return as ## header
-        return f"## {title}"
+        return None
 
-    def merge_markdown_files(self, primary_file_path, secondary_file_paths: list) -> str:
-        """Merge multiple markdown files into a single document.
 
-        Combines SKILL.md (primary) with other markdown files (secondary).
-        The primary file's frontmatter is preserved, all others are stripped.
-        Each secondary file becomes a section with a ## header.
+class SkillArchive:
+    """Read-only view of the files in a zipped skill package.
 
-        Args:
-            primary_file_path: Path to primary markdown file (typically SKILL.md)
-                              Can be None if no primary file exists
-            secondary_file_paths: List of Path objects for other markdown files
-                                 Will be sorted alphabetically before merging
+    package_skill.py stores a skill as "<skill-name>/<path>" members; archives
+    whose members all share one top-level directory have it stripped, others
+    are read as-is. Member names are normalized like SkillTree.from_files()
+    keys, so names that would escape the skill (absolute, "..") are rejected.
 
-        Returns:
-            Merged markdown content as a single string
+    Lookups decompress on demand: `archive[rel_path]` reads a whole member,
+    open() streams one.
 
-        Merging Algorithm:
-            1. Read primary file (if exists)
-               - Preserve frontmatter
-               - Include content
-            2. Sort secondary files alphabetically
-            3. For each secondary file:
-               - Strip frontmatter
-               - Create ## section header from filename
-               - Append content
-            4. Join all sections with blank lines
+    Attributes:
+        path: Path of the .zip file
+        entries: {rel_path: (size, mode, mtime_ns)} for every file member
+    """
 
-        Notes:
-            - Preserves only the primary file's frontmatter
-            - Creates section headers from filenames
-            - Handles missing files gracefully
-            - Returns empty string if no files can be read
+    def __init__(self, archive_path: Path):
+        """Open the archive and index its members.
+
+        Args:
+            archive_path: Path to the .zip file
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If it is not a valid zip file or a member name is
+                        unsafe (zipfile.BadZipFile is re-raised as ValueError)
         """
-        sections = []
+        import zipfile
 
-        # Step 1: Process primary file (if it exists)
-        if primary_file_path is not None:
-            try:
-                # Convert to Path object if needed
-                if not isinstance(primary_file_path, Path):
-                    primary_file_path = Path(primary_file_path)
+        self.path = Path(archive_path)
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Not a valid skill archive: {self.path.name}: {e}") from e
 
-                if primary_file_path.exists() and primary_file_path.is_file():
-                    # Read primary file content
-                    primary_content = primary_file_path.read_text(encoding='utf-8')
+        try:
+            members = [info for info in self._zip.infolist() if not info.is_dir()]
+            prefix = self._common_prefix([info.filename for info in members])
+
+            self._members = {}
+            self.entries: Dict[str, tuple] = {}
+            for info in members:
+                rel_path = SkillTree._normalize_key(info.filename[len(prefix):])
+                self._members[rel_path] = info
+                self.entries[rel_path] = (info.file_size, self._member_mode(info),
+                                          self._member_mtime_ns(info))
+        except ValueError:
+            self._zip.close()
+            raise
+
+    @staticmethod
+    def _common_prefix(names: List[str]) -> str:
+        """Return "<dir>/" if every member lives under that one directory."""
+        tops = {name.split("/", 1)[0] for name in names}
+        if len(tops) == 1 and all("/" in name for name in names):
+            return tops.pop() + "/"
+        return ""
+
+    @staticmethod
+    def _member_mode(info) -> int:
+        """st_mode of a member (from Unix external attributes, else 0o644)."""
+        mode = info.external_attr >> 16
+        if stat.S_ISREG(mode):
+            return mode
+        return stat.S_IFREG | (stat.S_IMODE(mode) or 0o644)
+
+    @staticmethod
+    def _member_mtime_ns(info) -> int:
+        """Member mtime in nanoseconds (zip timestamps are local time)."""
+        return int(time.mktime(info.date_time + (0, 0, -1))) * 1_000_000_000
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self._members
+
+    def __getitem__(self, rel_path: str) -> bytes:
+        info = self._members[rel_path]
+        data = self._zip.read(info)
+        _record_io(bytes_read=info.compress_size)
+        return data
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def open(self, rel_path: str):
+        """Open a member for streaming (binary, decompressed on the fly)."""
+        info = self._members[rel_path]
+        _record_io(bytes_read=info.compress_size)
+        return self._zip.open(info)
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zip.close()
+
+
+def is_skill_archive(path: Path) -> bool:
+    """Return True if path is a zipped skill package (a SKILL_ARCHIVE_SUFFIX file)."""
+    path = Path(path)
+    return path.suffix.lower() == SKILL_ARCHIVE_SUFFIX and path.is_file()
+
+
+def skill_name_of(skill_path: Path) -> str:
+    """Return the skill name of a skill directory or zipped skill package."""
+    skill_path = Path(skill_path)
+    if skill_path.suffix.lower() == SKILL_ARCHIVE_SUFFIX and not skill_path.is_dir():
+        return skill_path.stem
+    return skill_path.name
 
-                    # Extract frontmatter and content
-                    frontmatter, content = self.extract_frontmatter(primary_content)
 
-                    # Reconstruct with frontmatter (if it exists)
-                    if frontmatter:
-                        # Rebuild YAML frontmatter block
-                        yaml_lines = ['---']
-                        for key, value in frontmatter.items():
-                            # Quote values that contain colons
-                            if ':' in str(value):
-                                yaml_lines.append(f'{key}: "{value}"')
-                            else:
-                                yaml_lines.append(f'{key}: {value}')
-                        yaml_lines.append('---')
+class ModeDetector:
+    """Detects the appropriate transformation mode for a skill directory.
 
-                        primary_section = '\n'.join(yaml_lines) + '\n\n' + content
-                    else:
-                        # No frontmatter, just use content
-                        primary_section = content
+    Analyzes the structure of a skill directory to determine which of three
+    transformation strategies should be applied:
+    - DIRECTORY_WITH_SUBDIRS: Skill contains subdirectories to preserve
+    - DIRECTORY_WITH_SCRIPTS: Skill has root-level executable scripts
+    - SINGLE_FILE: Simple skill with only markdown files
 
-                    sections.append(primary_section.strip())
+    The detection follows a priority order:
+    1. Check for subdirectories first (highest priority)
+    2. Check for root-level scripts second
+    3. Default to single-file mode (lowest priority)
+    """
 
-            except (OSError, PermissionError, UnicodeDecodeError) as e:
-                # Failed to read primary file - continue without it
-                pass
+    def detect_mode(self, skill_dir: Path, tree: Optional[SkillTree] = None) -> TransformationMode:
+        """Detect the transformation mode for a skill directory.
 
-        # Step 2: Process secondary files
-        if secondary_file_paths:
-            # Sort files alphabetically by filename
-            sorted_files = sorted(secondary_file_paths, key=lambda p: p.name.lower())
+        Args:
+            skill_dir: Path to the skill directory to analyze
+            tree: Pre-scanned SkillTree for skill_dir (scanned here if omitted)
 
-            for file_path in sorted_files:
-                try:
-                    # Convert to Path object if needed
-                    if not isinstance(file_path, Path):
-                        file_path = Path(file_path)
+        Returns:
+            TransformationMode enum value indicating which transformation strategy to use
 
-                    if not file_path.exists() or not file_path.is_file():
-                        # Skip non-existent files
-                        continue
+        Algorithm:
+            1. Get all items in skill directory root
+            2. Check for subdirectories (excluding special dirs like __pycache__)
+            3. If subdirectories found, return DIRECTORY_WITH_SUBDIRS
+            4. Check for root-level scripts (by file extension)
+            5. If scripts found, return DIRECTORY_WITH_SCRIPTS
+            6. Otherwise, return SINGLE_FILE
+        """
+        console.info(f"\n🔍 Detecting transformation mode for: {skill_dir.name}")
 
-                    # Read file content
-                    file_content = file_path.read_text(encoding='utf-8')
+        if not skill_dir.exists() or not skill_dir.is_dir():
+            # Default to SINGLE_FILE for invalid directories
+            console.warning(f"⚠️  Directory does not exist or is not valid: {skill_dir}")
+            console.info(f"   → Mode: SINGLE_FILE (fallback)")
+            return TransformationMode.SINGLE_FILE
 
-                    # Strip frontmatter from secondary files
-                    content_without_fm = self.strip_frontmatter(file_content)
+        # Get all items in root directory
+        if tree is None:
+            tree = SkillTree.scan(skill_dir)
 
-                    # Skip empty files
-                    if not content_without_fm.strip():
-                        continue
+        if tree.error is not None:
+            # If we can't read the directory, default to SINGLE_FILE
+            console.warning(f"⚠️  Cannot read directory (permission error): {tree.error}")
+            console.info(f"   → Mode: SINGLE_FILE (fallback)")
+            return TransformationMode.SINGLE_FILE
 
-                    # Create section header from filename
-                    section_header = self.create_section_header(file_path.name)
+        return self.mode_for_tree(tree)
 
-                    # Combine header and content
-                    section = f"{section_header}\n\n{content_without_fm.strip()}"
+    def mode_for_tree(self, tree: SkillTree) -> TransformationMode:
+        """Classify an already-built SkillTree (steps 2-6 of detect_mode).
 
-                    sections.append(section)
+        Works for trees scanned from disk and for in-memory trees built by
+        SkillTree.from_files().
 
-                except (OSError, PermissionError, UnicodeDecodeError) as e:
-                    # Failed to read this file - skip it and continue
-                    continue
+        Args:
+            tree: SkillTree of the skill
 
-        # Step 3: Merge all sections with blank lines between them
-        if not sections:
-            # No content was successfully read
-            return ""
+        Returns:
+            TransformationMode enum value
+        """
+        root_items = tree.root.children
 
-        merged_content = '\n\n'.join(sections)
+        # Step 1: Check for subdirectories (excluding special directories)
+        subdirs = [
+            item for item in root_items
+            if item.is_dir and item.name not in MODE_DETECTION_EXCLUDE_DIRS
+        ]
 
-        return merged_content
+        if len(subdirs) > 0:
+            subdir_names = [d.name for d in subdirs]
+            console.info(f"✓ Found {len(subdirs)} subdirectory(ies): {', '.join(subdir_names)}")
+            console.info(f"   → Mode: DIRECTORY_WITH_SUBDIRS")
+            return TransformationMode.DIRECTORY_WITH_SUBDIRS
 
+        # Step 2: Check for root-level scripts
+        scripts = [
+            item for item in root_items
+            if item.is_file() and item.suffix in SCRIPT_EXTENSIONS
+        ]
 
-class SubdirectoryPreserver:
-    """Preserves subdirectories from skill directory to command directory.
+        if len(scripts) > 0:
+            script_names = [s.name for s in scripts]
+            console.info(f"✓ Found {len(scripts)} root-level script(s): {', '.join(script_names)}")
+            console.info(f"   → Mode: DIRECTORY_WITH_SCRIPTS")
+            return TransformationMode.DIRECTORY_WITH_SCRIPTS
 
-    This class handles copying subdirectories (and their contents) from a skill
-    directory to the command directory while preserving file permissions, excluding
-    unwanted files, and tracking statistics.
+        # Step 3: Default to single file mode
+        console.info(f"✓ No subdirectories or scripts found")
+        console.info(f"   → Mode: SINGLE_FILE (default)")
+        return TransformationMode.SINGLE_FILE
+
+
+@dataclass(frozen=True)
+class ParsedFrontmatter:
+    """Outcome of parsing one YAML frontmatter block.
+
+    Instances are shared through the FrontmatterParser cache, so callers
+    must copy `data` before modifying it.
+
+    Attributes:
+        data: Parsed key/value pairs, all values converted to strings.
+        method: How the block was parsed:
+                - "empty": block held no keys (or only comments)
+                - "fast": flat `key: value` lines handled without PyYAML
+                - "yaml": parsed by PyYAML as written
+                - "not_dict": PyYAML returned a non-mapping (data is empty)
+                - "fixed": parsed by PyYAML after _fix_common_yaml_issues()
+                - "fix_invalid": the fixed block was not a non-empty mapping
+                                 (data holds the regex fallback result)
+                - "regex": PyYAML unavailable or failed twice, regex fallback
+        warnings: Diagnostic lines describing parse failures and fixes,
+                  in the order they occurred.
+    """
+    data: Dict[str, str]
+    method: str
+    warnings: tuple = ()
+
+
+class FrontmatterParser:
+    """Parses YAML frontmatter for MarkdownMerger and SkillConverter.
+
+    Both the metadata step and the markdown merge read the frontmatter of
+    SKILL.md. Routing them through one parser means each block is parsed
+    once per run: results are cached by a hash of the block text, so the
+    second lookup for the same SKILL.md is a dictionary hit.
 
     Key Features:
-    - Recursive directory copying with shutil.copytree
-    - File permission preservation (especially executable bit for scripts)
-    - Exclusion of unwanted files (LICENSE.txt, .gitignore, __pycache__)
-    - Symbolic link resolution before copying
-    - File count tracking and reporting
-    - Handles nested directory structures
+    - Precompiled regexes for delimiter search and line matching
+    - Fast path for flat `key: value` frontmatter that skips PyYAML
+    - PyYAML with automatic fixes for common mistakes, then a regex fallback
+    - Thread-safe cache keyed by content hash, bounded by entry count
+    - Timing counters reported in the run summary
 
     Usage:
-        preserver = SubdirectoryPreserver()
-        stats = preserver.copy_subdirectories(source_dir, dest_dir, subdir_names)
+        parser = FrontmatterParser()
+        parsed, body, missing_close = parser.extract(content)
+        if parsed is not None: ...
+        stats = parser.get_stats()
     """
 
-    # Files and directories to exclude at any depth
-    EXCLUDE_PATTERNS = {
-        'LICENSE.txt',
-        'LICENSE',
-        '.gitignore',
-        '.git',
-        '__pycache__',
-        '*.pyc',
-        '*.pyo',
-        '*.pyd',
-        '.DS_Store',
-        'Thumbs.db',
-    }
+    # Maximum number of parsed blocks kept in the cache
+    CACHE_MAX_ENTRIES = 4096
 
-    def __init__(self):
-        """Initialize the SubdirectoryPreserver."""
-        pass
+    # Closing delimiter: a line holding only --- (surrounding whitespace allowed)
+    _CLOSING_RE = re.compile(r'^[^\S\n]*---[^\S\n]*$', re.MULTILINE)
 
-    def copy_subdirectories(self, source_dir: Path, dest_dir: Path,
-                           subdir_names: list) -> dict:
-        """Copy specified subdirectories from source to destination.
+    # Regex fallback: one key: value pair per (stripped) line
+    _KEY_VALUE_RE = re.compile(r'^([a-zA-Z0-9_-]+)\s*:\s*(.*)$')
 
-        Recursively copies subdirectories while preserving permissions and
-        excluding unwanted files.
+    # Fast path: an unindented key, a colon, and an optional single-line value
+    _FLAT_LINE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*?))? *')
 
-        Args:
-            source_dir: Source skill directory containing subdirectories
-            dest_dir: Destination command directory where subdirs will be copied
-            subdir_names: List of subdirectory names to copy (e.g., ['scripts', 'ooxml'])
+    # Plain scalars starting with these characters may be indicators, numbers,
+    # dates or other non-string YAML values, so they go through PyYAML
+    _FLAT_REJECT_START = frozenset('-?:,[]{}#&*!|>\'"%@`<=.+~0123456789')
+
+    # Words PyYAML resolves to booleans or null (compared case-insensitively)
+    _FLAT_REJECT_WORDS = frozenset({'y', 'n', 'yes', 'no', 'true', 'false',
+                                    'on', 'off', 'null'})
+
+    def __init__(self):
+        """Initialize an empty cache and zeroed counters."""
+        self._cache: Dict[str, ParsedFrontmatter] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero the counters reported by get_stats() (the cache is kept)."""
+        with self._lock:
+            self._stats = {
+                'blocks': 0,
+                'cache_hits': 0,
+                'fast_path': 0,
+                'yaml': 0,
+                'regex': 0,
+                'seconds': 0.0,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the parse counters.
 
         Returns:
-            Dictionary with copy statistics:
             {
-                'copied_dirs': int,      # Number of directories copied
-                'copied_files': int,     # Number of files copied
-                'excluded_files': int,   # Number of files excluded
-                'errors': list,          # List of error messages
+                'blocks': int,        # Blocks parsed (cache misses)
+                'cache_hits': int,    # Lookups answered from the cache
+                'fast_path': int,     # Blocks handled without PyYAML
+                'yaml': int,          # Blocks that went through PyYAML
+                'regex': int,         # Blocks that ended in the regex fallback
+                'seconds': float,     # Time spent splitting and parsing
             }
+        """
+        with self._lock:
+            return dict(self._stats)
 
-        Notes:
-            - Creates dest_dir if it doesn't exist
-            - Preserves file permissions including executable bit
-            - Resolves symbolic links before copying
-            - Excludes files matching EXCLUDE_PATTERNS
-            - Handles errors gracefully and reports them
+    def split(self, content: str) -> tuple:
+        """Locate the frontmatter block without parsing it.
+
+        Args:
+            content: Full markdown file content
+
+        Returns:
+            Tuple of (yaml_block, remaining_content, missing_close):
+            - yaml_block: Text between the --- delimiters, or None
+            - remaining_content: Content after the closing delimiter (leading
+              whitespace stripped), or the whole stripped content if there is
+              no frontmatter
+            - missing_close: True if an opening --- has no closing delimiter
+
+        Notes:
+            - Frontmatter must be at the start of the file (after stripping whitespace)
+            - Needs at least three lines (opening, block, closing)
         """
-        stats = {
-            'copied_dirs': 0,
-            'copied_files': 0,
-            'excluded_files': 0,
-            'errors': [],
-        }
+        content = content.lstrip()
 
-        # Convert to Path objects if needed
-        if not isinstance(source_dir, Path):
-            source_dir = Path(source_dir)
-        if not isinstance(dest_dir, Path):
-            dest_dir = Path(dest_dir)
+        if not content.startswith('---'):
+            return None, content, False
 
-        # Create destination directory if it doesn't exist
-        try:
-            dest_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            stats['errors'].append(f"Failed to create destination directory: {e}")
-            return stats
+        first_newline = content.find('\n')
+        if first_newline == -1 or content.find('\n', first_newline + 1) == -1:
+            # Not enough lines for valid frontmatter
+            return None, content, False
 
-        # Copy each subdirectory
-        for subdir_name in subdir_names:
-            source_subdir = source_dir / subdir_name
-            dest_subdir = dest_dir / subdir_name
+        closing = self._CLOSING_RE.search(content, first_newline + 1)
+        if closing is None:
+            return None, content, True
 
-            # Check if source subdirectory exists
-            if not source_subdir.exists() or not source_subdir.is_dir():
-                stats['errors'].append(f"Source subdirectory not found: {subdir_name}")
-                continue
+        yaml_block = content[first_newline + 1:closing.start() - 1]
+        remaining = content[closing.end() + 1:].lstrip()
+        return yaml_block, remaining, False
 
-            # Use recursive copy with our custom logic
-            try:
-                self._copy_directory_recursive(source_subdir, dest_subdir, stats)
-                stats['copied_dirs'] += 1
-            except Exception as e:
-                stats['errors'].append(f"Error copying {subdir_name}: {e}")
+    def extract(self, content: str) -> tuple:
+        """Split off and parse the frontmatter of a markdown document.
 
-        return stats
+        Args:
+            content: Full markdown file content
 
-    def _copy_directory_recursive(self, src_dir: Path, dest_dir: Path,
-                                  stats: dict) -> None:
-        """Recursively copy a directory while preserving permissions and excluding files.
+        Returns:
+            Tuple of (parsed, remaining_content, missing_close), where parsed
+            is a ParsedFrontmatter or None if there is no frontmatter block
+            (see split() for the other two values)
+        """
+        started = time.perf_counter()
+        yaml_block, remaining, missing_close = self.split(content)
+        elapsed = time.perf_counter() - started
+
+        parsed = self.parse(yaml_block) if yaml_block is not None else None
+
+        with self._lock:
+            self._stats['seconds'] += elapsed
+        return parsed, remaining, missing_close
+
+    def parse(self, yaml_block: str) -> ParsedFrontmatter:
+        """Parse a frontmatter block, reusing the cached result if seen before.
 
         Args:
-            src_dir: Source directory to copy
-            dest_dir: Destination directory
-            stats: Statistics dictionary to update
+            yaml_block: YAML text between the --- delimiters
 
-        Notes:
-            - Updates stats in place
-            - Excludes files matching EXCLUDE_PATTERNS
-            - Preserves file permissions
-            - Resolves symbolic links
+        Returns:
+            ParsedFrontmatter (shared with the cache; do not modify data)
         """
-        # Create destination directory
+        import hashlib
+
+        started = time.perf_counter()
+        key = hashlib.blake2b(yaml_block.encode('utf-8', 'surrogatepass'),
+                              digest_size=16).hexdigest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._stats['cache_hits'] += 1
+                self._stats['seconds'] += time.perf_counter() - started
+                return cached
+
+        parsed = self._parse_uncached(yaml_block)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = parsed
+
+            self._stats['blocks'] += 1
+            self._stats['seconds'] += elapsed
+            if parsed.method in ('fast', 'empty'):
+                self._stats['fast_path'] += 1
+            elif parsed.method in ('regex', 'fix_invalid'):
+                self._stats['regex'] += 1
+            else:
+                self._stats['yaml'] += 1
+
+        return parsed
+
+    def _parse_uncached(self, yaml_block: str) -> ParsedFrontmatter:
+        """Parse a frontmatter block: fast path, then PyYAML, then regex."""
+        flat = self._parse_flat(yaml_block)
+        if flat is not None:
+            return ParsedFrontmatter(flat, 'fast' if flat else 'empty')
+
+        yaml = _get_yaml()
+        if yaml is None:
+            return ParsedFrontmatter(self._parse_yaml_with_regex(yaml_block), 'regex',
+                                     ("INFO: Using regex fallback for YAML parsing",))
+
         try:
-            dest_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            stats['errors'].append(f"Failed to create directory {dest_dir}: {e}")
-            return
+            parsed = yaml.safe_load(yaml_block)
+        except yaml.YAMLError as e:
+            warnings = [f"WARNING: YAML parsing failed: {e}",
+                        "  Attempting to fix common YAML issues..."]
+        else:
+            if parsed is None:
+                return ParsedFrontmatter({}, 'empty')
+            if not isinstance(parsed, dict):
+                return ParsedFrontmatter({}, 'not_dict', (
+                    f"WARNING: YAML front matter is not a dictionary, got {type(parsed)}",))
+            return ParsedFrontmatter(self._stringify(parsed), 'yaml')
 
-        # Iterate through source directory contents
         try:
-            items = list(src_dir.iterdir())
-        except (OSError, PermissionError) as e:
-            stats['errors'].append(f"Failed to read directory {src_dir}: {e}")
-            return
+            parsed = yaml.safe_load(self._fix_common_yaml_issues(yaml_block))
+        except yaml.YAMLError as e2:
+            warnings.append(f"  ✗ Still failed after fixes: {e2}")
+            return ParsedFrontmatter(self._parse_yaml_with_regex(yaml_block), 'regex',
+                                     tuple(warnings))
+
+        if parsed and isinstance(parsed, dict):
+            warnings.append("  ✓ Successfully parsed YAML after fixes")
+            return ParsedFrontmatter(self._stringify(parsed), 'fixed', tuple(warnings))
+
+        warnings.append("  ✗ YAML still invalid after fixes")
+        return ParsedFrontmatter(self._parse_yaml_with_regex(yaml_block), 'fix_invalid',
+                                 tuple(warnings))
+
+    @staticmethod
+    def _stringify(parsed: dict) -> Dict[str, str]:
+        """Convert a PyYAML mapping to strings, dropping null values."""
+        return {str(key): str(value) for key, value in parsed.items() if value is not None}
+
+    def _parse_flat(self, yaml_block: str) -> Optional[Dict[str, str]]:
+        """Parse flat `key: value` frontmatter without PyYAML.
+
+        Only accepts blocks where every line is blank, a comment, or an
+        unindented key with a single-line plain value that PyYAML would load
+        as the same string. Anything else (quotes, lists, nesting, numbers,
+        booleans, dates, inline comments) returns None so the caller falls
+        back to PyYAML.
 
-        for item in items:
-            # Check if item should be excluded
-            if self._should_exclude(item.name):
-                stats['excluded_files'] += 1
+        Args:
+            yaml_block: YAML text between the --- delimiters
+
+        Returns:
+            Dictionary of key/value pairs, or None if the block is not flat
+        """
+        result = {}
+
+        for line in yaml_block.split('\n'):
+            if not line or line.isspace() or line.startswith('#'):
                 continue
 
-            # Preserve original name before resolving symlinks
-            original_name = item.name
+            match = self._FLAT_LINE_RE.fullmatch(line)
+            if match is None:
+                return None
 
-            # Resolve symbolic links
-            if item.is_symlink():
-                try:
-                    item = item.resolve()
-                except (OSError, RuntimeError) as e:
-                    stats['errors'].append(f"Failed to resolve symlink {item}: {e}")
-                    continue
+            key, value = match.group(1), match.group(2)
+            if key.lower() in self._FLAT_REJECT_WORDS:
+                return None
 
-            # Use original name for destination (preserves symlink names)
-            dest_item = dest_dir / original_name
+            if not value:
+                # "key:" loads as null, which is dropped below
+                result[key] = None
+                continue
 
-            if item.is_dir():
-                # Recursively copy subdirectory
-                self._copy_directory_recursive(item, dest_item, stats)
-                stats['copied_dirs'] += 1
-            elif item.is_file():
-                # Copy file with permissions
-                if self._copy_with_permissions(item, dest_item):
-                    stats['copied_files'] += 1
-                else:
-                    stats['errors'].append(f"Failed to copy file {item}")
+            if (value[0] in self._FLAT_REJECT_START
+                    or not value.isprintable()
+                    or value.endswith(':')
+                    or ': ' in value
+                    or ' #' in value
+                    or value.lower() in self._FLAT_REJECT_WORDS):
+                return None
 
-    def _should_exclude(self, filename: str) -> bool:
-        """Check if a file should be excluded based on EXCLUDE_PATTERNS.
+            result[key] = value
+
+        return {key: value for key, value in result.items() if value is not None}
+
+    def _fix_common_yaml_issues(self, yaml_content: str) -> str:
+        """Fix common YAML formatting issues.
+
+        Attempts to automatically fix common problems in YAML frontmatter
+        that prevent parsing, such as missing quotes or improper spacing.
 
         Args:
-            filename: Name of the file to check
+            yaml_content: Raw YAML content (without --- delimiters)
 
         Returns:
-            True if file should be excluded, False otherwise
+            Fixed YAML content
 
-        Notes:
-            - Checks against EXCLUDE_PATTERNS set
-            - Supports exact matches and glob patterns (*.pyc)
+        Common fixes applied:
+            - Add quotes around values containing colons
+            - Add spaces after colons if missing
+            - Remove extra trailing whitespace
         """
-        import fnmatch
+        lines = yaml_content.split('\n')
+        fixed_lines = []
 
-        # Check for exact match
-        if filename in self.EXCLUDE_PATTERNS:
-            return True
+        for line in lines:
+            # Skip empty lines and comments
+            if not line.strip() or line.strip().startswith('#'):
+                fixed_lines.append(line)
+                continue
 
-        # Check for glob pattern match
-        for pattern in self.EXCLUDE_PATTERNS:
-            if '*' in pattern or '?' in pattern:
-                if fnmatch.fnmatch(filename, pattern):
-                    return True
+            # Check if line is a key-value pair
+            if ':' in line:
+                # Split on first colon only
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+
+                # If value contains a colon and isn't already quoted, quote it
+                if ':' in value and not (
+                    (value.startswith('"') and value.endswith('"')) or
+                    (value.startswith("'") and value.endswith("'"))
+                ):
+                    # Escape any existing quotes in the value
+                    value = value.replace('"', '\\"')
+                    value = f'"{value}"'
+
+                # Reconstruct line with proper spacing
+                fixed_lines.append(f"{key}: {value}")
+            else:
+                # Not a key-value pair, keep as-is
+                fixed_lines.append(line)
 
-        return False
+        return '\n'.join(fixed_lines)
 
-    def _copy_with_permissions(self, src: Path, dest: Path) -> bool:
-        """Copy a file while preserving permissions.
+    def _parse_yaml_with_regex(self, yaml_content: str) -> Dict[str, str]:
+        """Parse YAML using regex fallback (when PyYAML unavailable or fails).
+
+        This is a simple parser that handles basic key: value pairs.
+        Does not support complex YAML features like lists, nested dicts, etc.
 
         Args:
-            src: Source file path
-            dest: Destination file path
+            yaml_content: Raw YAML content (without --- delimiters)
 
         Returns:
-            True if copy succeeded, False otherwise
-
-        Notes:
-            - Preserves file mode (permissions)
-            - Especially important for executable scripts
-            - Handles symbolic links by resolving them first
+            Dictionary of key-value pairs (all values as strings)
         """
-        try:
-            # Copy file content
-            shutil.copy2(src, dest)  # copy2 preserves metadata including permissions
+        result = {}
 
-            # Explicitly preserve executable bit (just to be sure)
-            if os.access(src, os.X_OK):
-                # Get current permissions and ensure executable bit is set
-                current_mode = dest.stat().st_mode
-                dest.chmod(current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        for line in yaml_content.split('\n'):
+            line = line.strip()
 
-            return True
+            # Skip empty lines and comments
+            if not line or line.startswith('#'):
+                continue
 
-        except (OSError, PermissionError, IOError) as e:
-            return False
+            match = self._KEY_VALUE_RE.match(line)
+            if match:
+                key = match.group(1)
+                value = match.group(2).strip()
 
+                # Remove quotes if present
+                if value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
+                elif value.startswith("'") and value.endswith("'"):
+                    value = value[1:-1]
 
-class PathUpdater:
-    """Updates file paths in markdown content after script relocation.
+                # Unescape quotes
+                value = value.replace('\\"', '"').replace("\\'", "'")
 
-    This class handles the relocation of root-level scripts to a skill-specific
-    subdirectory and updates all references to those scripts in markdown files.
+                result[key] = value
+
+        return result
+
+
+class MarkdownMerger:
+    """Merges multiple markdown files into a single markdown document.
+
+    This class handles the merging of SKILL.md with other markdown files in a skill directory.
+    It extracts YAML frontmatter from the primary file, strips frontmatter from other files,
+    and combines them into a single cohesive document with section headers.
 
     Key Features:
-    - Detects script files by extension (SCRIPT_EXTENSIONS)
-    - Relocates scripts to /commands/{skill-name}/ subdirectory
-    - Finds relative path references in markdown (./script.sh patterns)
-    - Updates paths to point to relocated scripts (./{skill-name}/script.sh)
-    - Preserves paths in code blocks (examples shouldn't be updated)
-    - Tracks number of path updates made
+    - Preserves YAML frontmatter from primary file (SKILL.md)
+    - Strips frontmatter from secondary files to prevent duplicates
+    - Creates ## section headers from filenames
+    - Merges files in alphabetical order (after SKILL.md)
+    - Handles edge cases (missing files, empty content, malformed YAML)
+    - Section-at-a-time generator for streaming output
 
     Usage:
-        updater = PathUpdater()
-        relocated = updater.relocate_scripts(source_dir, dest_dir, skill_name, script_files)
-        updated_md = updater.update_paths_in_markdown(markdown_content, skill_name, script_files)
+        merger = MarkdownMerger()
+        result = merger.merge_markdown_files(skill_md_path, other_md_paths)
+        for section in merger.iter_merged_sections(skill_md_path, other_md_paths): ...
     """
 
-    def __init__(self):
-        """Initialize the PathUpdater."""
-        pass
+    # Text placed between merged sections
+    SECTION_SEPARATOR = '\n\n'
 
-    def relocate_scripts(self, source_dir: Path, dest_dir: Path,
-                        skill_name: str, script_files: list) -> dict:
-        """Relocate script files from source to skill-specific subdirectory.
+    def __init__(self, frontmatter_parser: Optional[FrontmatterParser] = None):
+        """Initialize the MarkdownMerger.
 
-        Moves root-level script files to a subdirectory named after the skill
-        while preserving their permissions.
+        Args:
+            frontmatter_parser: Parser shared with the caller, so frontmatter
+                                already parsed elsewhere is not parsed again
+                                (a private parser is created if omitted)
+        """
+        self.frontmatter_parser = frontmatter_parser or FrontmatterParser()
+
+    def extract_frontmatter(self, content: str) -> tuple[dict, str]:
+        """Extract YAML frontmatter from markdown content.
+
+        Separates the YAML frontmatter (between --- delimiters) from the
+        main content of a markdown file. Parses the YAML into a dictionary.
 
         Args:
-            source_dir: Source skill directory containing scripts
-            dest_dir: Destination commands directory
-            skill_name: Name of the skill (used for subdirectory name)
-            script_files: List of Path objects for script files to relocate
+            content: Full markdown file content (may include frontmatter)
 
         Returns:
-            Dictionary with relocation statistics:
-            {
-                'relocated_count': int,    # Number of scripts relocated
-                'errors': list,            # List of error messages
-            }
+            Tuple of (frontmatter_dict, content_without_frontmatter)
+            - frontmatter_dict: Parsed YAML as dictionary (empty dict if no frontmatter)
+            - content_without_frontmatter: Content after the closing --- delimiter
 
         Notes:
-            - Creates {dest_dir}/{skill_name}/ subdirectory
-            - Preserves file permissions including executable bit
-            - Handles errors gracefully
+            - Frontmatter must be at the start of the file (after stripping whitespace)
+            - Uses --- as both opening and closing delimiters
+            - Returns empty dict if no valid frontmatter found
+            - Parsed by the shared FrontmatterParser (cached by content hash)
+            - Uses PyYAML if needed, falls back to regex parsing
+            - Attempts to fix common YAML issues automatically
         """
-        stats = {
-            'relocated_count': 0,
-            'errors': [],
-        }
-
-        # Convert to Path objects if needed
-        if not isinstance(source_dir, Path):
-            source_dir = Path(source_dir)
-        if not isinstance(dest_dir, Path):
-            dest_dir = Path(dest_dir)
-
-        # Create skill subdirectory
-        skill_subdir = dest_dir / skill_name
-        try:
-            skill_subdir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            stats['errors'].append(f"Failed to create subdirectory {skill_name}: {e}")
-            return stats
+        parsed, remaining_content, _ = self.frontmatter_parser.extract(content)
 
-        # Relocate each script file
-        for script_file in script_files:
-            if not isinstance(script_file, Path):
-                script_file = Path(script_file)
+        if parsed is None:
+            return {}, remaining_content
 
-            # Build source and destination paths
-            if script_file.is_absolute():
-                source_path = script_file
-            else:
-                source_path = source_dir / script_file
+        return dict(parsed.data), remaining_content
 
-            dest_path = skill_subdir / script_file.name
+    def strip_frontmatter(self, content: str) -> str:
+        """Remove YAML frontmatter from markdown content.
 
-            # Copy file with permissions
-            try:
-                shutil.copy2(source_path, dest_path)
+        Removes the YAML frontmatter block (if present) and returns only
+        the main markdown content.
 
-                # Ensure executable bit is preserved
-                if os.access(source_path, os.X_OK):
-                    current_mode = dest_path.stat().st_mode
-                    dest_path.chmod(current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        Args:
+            content: Full markdown file content
 
-                stats['relocated_count'] += 1
+        Returns:
+            Content without frontmatter (whitespace stripped from start)
 
-            except (OSError, PermissionError, IOError) as e:
-                stats['errors'].append(f"Failed to relocate {script_file.name}: {e}")
-
-        return stats
+        Notes:
+            - Returns original content if no frontmatter is found
+            - Strips leading whitespace after frontmatter removal
+            - Only locates the block; the YAML itself is not parsed
+        """
+        _, content_without_frontmatter, _ = self.frontmatter_parser.split(content)
+        return content_without_frontmatter
 
-    def update_paths_in_markdown(self, content: str, skill_name: str,
-                                 script_files: list) -> tuple[str, int]:
-        """Update script paths in markdown content after relocation.
+    def create_section_header(self, filename: str) -> str:
+        """Create a section header from a filename.
 
-        Finds references to relocated scripts in markdown and updates them
-        to point to the new location in the skill subdirectory.
+        Converts a markdown filename into a readable section header.
 
         Args:
-            content: Markdown content to update
-            skill_name: Name of the skill (subdirectory name)
-            script_files: List of script filenames that were relocated
+            filename: Filename (e.g., "api-reference.md", "getting_started.md")
 
         Returns:
-            Tuple of (updated_content, update_count)
-            - updated_content: Markdown with updated paths
-            - update_count: Number of path replacements made
+            Section header as ## markdown (e.g., "## API Reference", "## Getting Started")
 
-        Path Transformations:
-            ./script.sh        → ./{skill-name}/script.sh
-            ./setup.py         → ./{skill-name}/setup.py
-            scripts/helper.sh  → {skill-name}/helper.sh (root-level only)
+        Examples:
+            "api-reference.md" -> "## API Reference"
+            "getting_started.md" -> "## Getting Started"
+            "INSTALL.md" -> "## INSTALL"
+            "readme.md" -> "## Readme"
 
         Notes:
-            - Only updates paths to relocated scripts
-            - Preserves paths in code blocks (triple backticks)
-            - Uses regex to find path references
-            - Case-sensitive matching
+            - Removes .md/.markdown extension
+            - Replaces hyphens and underscores with spaces
+            - Title-cases each word (with acronym support)
+            - Returns ## level header for consistency
         """
-        update_count = 0
-        updated_content = content
-
-        # Extract just filenames from script_files
-        script_filenames = []
-        for script in script_files:
-            if isinstance(script, Path):
-                script_filenames.append(script.name)
-            else:
-                script_filenames.append(Path(script).name)
-
-        # Find all script path references
-        path_matches = self._find_script_paths(updated_content, script_filenames)
+        # Common acronyms that should be fully capitalized
+        acronyms = {
+            'api': 'API',
+            'cli': 'CLI',
+            'ui': 'UI',
+            'ux': 'UX',
+            'url': 'URL',
+            'html': 'HTML',
+            'css': 'CSS',
+            'js': 'JS',
+            'json': 'JSON',
+            'xml': 'XML',
+            'sql': 'SQL',
+            'rest': 'REST',
+            'http': 'HTTP',
+            'https': 'HTTPS',
+            'ssh': 'SSH',
+            'git': 'Git',
+            'ai': 'AI',
+            'ml': 'ML',
+            'llm': 'LLM',
+            'mcp': 'MCP',
+        }
 
-        # Sort by position (descending) to avoid offset issues during replacement
-        path_matches.sort(key=lambda x: x[1], reverse=True)
+        # Remove file extension
+        if filename.lower().endswith('.md'):
+            name = filename[:-3]
+        elif filename.lower().endswith('.markdown'):
+            name = filename[:-9]
+        else:
+            name = filename
 
-        # Replace each path (if not in code block)
-        for original_path, start_pos, end_pos in path_matches:
-            # Check if this path is in a code block
-            if self._is_in_code_block(updated_content, start_pos):
-                continue  # Skip paths in code blocks
+        # Replace separators with spaces
+        name = name.replace('-', ' ').replace('_', ' ')
 
-            # Replace the path
-            new_path = self._replace_path(original_path, skill_name)
+        # Split into words and capitalize each
+        words = name.split()
+        capitalized_words = []
 
-            # Perform replacement
-            updated_content = (
-                updated_content[:start_pos] +
-                new_path +
-                updated_content[end_pos:]
-            )
+        for word in words:
+            word_lower = word.lower()
+            if word_lower in acronyms:
+                # Use the acronym form
+                capitalized_words.append(acronyms[word_lower])
+            else:
+                # Regular title case
+                capitalized_words.append(word.capitalize())
 
-            update_count += 1
+        title = ' '.join(capitalized_words)
 
-        return updated_content, update_count
+        # Return as ## header
+        return f"## {title}"
 
-    def _find_script_paths(self, content: str, script_files: list) -> list:
-        """Find all references to script files in markdown content.
+    def merge_markdown_files(self, primary_file_path, secondary_file_paths: list,
+                             reader=None) -> str:
+        """Merge multiple markdown files into a single document.
 
-        Uses regex to locate path references like ./script.sh, ./setup.py, etc.
+        Combines SKILL.md (primary) with other markdown files (secondary).
+        The primary file's frontmatter is preserved, all others are stripped.
+        Each secondary file becomes a section with a ## header.
 
         Args:
-            content: Markdown content to search
-            script_files: List of script filenames to look for
+            primary_file_path: Path to primary markdown file (typically SKILL.md)
+                              Can be None if no primary file exists
+            secondary_file_paths: List of Path objects for other markdown files
+                                 Will be sorted alphabetically before merging
+            reader: Optional replacement for read_text_cached (same
+                    signature), e.g. to merge files held in memory
 
         Returns:
-            List of tuples: [(original_path, start_pos, end_pos), ...]
+            Merged markdown content as a single string
+
+        Merging Algorithm:
+            1. Read primary file (if exists)
+               - Preserve frontmatter
+               - Include content
+            2. Sort secondary files alphabetically
+            3. For each secondary file:
+               - Strip frontmatter
+               - Create ## section header from filename
+               - Append content
+            4. Join all sections with blank lines
 
         Notes:
-            - Finds relative paths starting with ./ or ../
-            - Matches script filenames from script_files list
-            - Returns position information for replacement
+            - Preserves only the primary file's frontmatter
+            - Creates section headers from filenames
+            - Handles missing files gracefully
+            - Returns empty string if no files can be read
+            - Builds the whole document in memory; use iter_merged_sections()
+              to stream it instead
         """
-        matches = []
+        return self.SECTION_SEPARATOR.join(
+            self.iter_merged_sections(primary_file_path, secondary_file_paths,
+                                      reader=reader)
+        )
 
-        for script_name in script_files:
-            # Escape special regex characters in filename
-            escaped_name = re.escape(script_name)
+    def iter_merged_sections(self, primary_file_path, secondary_file_paths: list,
+                             cache_reads: bool = True, reader=None):
+        """Yield the sections of the merged document one at a time.
 
-            # Pattern matches: ./ or ../ or nothing, followed by the script name
-            # This captures paths like:
-            # - ./script.sh
-            # - ../script.sh
-            # - script.sh (just the filename)
-            pattern = r'(\./|\.\./|)' + escaped_name
+        Produces exactly the sections merge_markdown_files() joins with
+        SECTION_SEPARATOR, reading each file only when its section is needed,
+        so at most one source file is held in memory at a time.
 
-            for match in re.finditer(pattern, content):
-                original_path = match.group(0)
-                start_pos = match.start()
-                end_pos = match.end()
+        Args:
+            primary_file_path: Path to primary markdown file (typically SKILL.md)
+                              Can be None if no primary file exists
+            secondary_file_paths: List of Path objects for other markdown files
+                                 Will be sorted alphabetically before merging
+            cache_reads: Keep secondary file contents in the read cache (see
+                         read_text_cached). Streaming callers pass False.
+            reader: Callable(path, store=True) -> (text, encoding) used to
+                    read every file (defaults to read_text_cached)
 
-                matches.append((original_path, start_pos, end_pos))
+        Yields:
+            Section strings (stripped), primary section first
+        """
+        if reader is None:
+            reader = read_text_cached
 
-        return matches
+        # Step 1: Process primary file (if it exists)
+        if primary_file_path is not None:
+            try:
+                # Convert to Path object if needed
+                if not isinstance(primary_file_path, Path):
+                    primary_file_path = Path(primary_file_path)
 
-    def _is_in_code_block(self, content: str, position: int) -> bool:
-        """Check if a position in the content is inside a code block.
+                # Read primary file content (shared with safe_read_file's cache)
+                primary_content, encoding = reader(primary_file_path)
 
-        Code blocks (triple backticks) contain examples that shouldn't
-        be updated.
+                if encoding == 'utf-8':
+                    # Extract frontmatter and content
+                    frontmatter, content = self.extract_frontmatter(primary_content)
 
-        Args:
-            content: Full markdown content
-            position: Character position to check
+                    # Reconstruct with frontmatter (if it exists)
+                    if frontmatter:
+                        # Rebuild YAML frontmatter block
+                        yaml_lines = ['---']
+                        for key, value in frontmatter.items():
+                            # Quote values that contain colons
+                            if ':' in str(value):
+                                yaml_lines.append(f'{key}: "{value}"')
+                            else:
+                                yaml_lines.append(f'{key}: {value}')
+                        yaml_lines.append('---')
 
-        Returns:
-            True if position is inside a code block, False otherwise
+                        primary_section = '\n'.join(yaml_lines) + '\n\n' + content
+                    else:
+                        # No frontmatter, just use content
+                        primary_section = content
 
-        Notes:
-            - Checks for triple backtick code blocks (```)
-            - Checks for indented code blocks (4 spaces)
-            - Handles both fenced and indented code blocks
-        """
-        # Find all code block boundaries (triple backticks)
-        code_blocks = []
+                    yield primary_section.strip()
 
-        # Find fenced code blocks (```)
-        lines = content.split('\n')
-        in_code_block = False
-        current_pos = 0
-        block_start = 0
+            except (OSError, PermissionError, UnicodeDecodeError):
+                # Failed to read primary file - continue without it
+                pass
 
-        for line in lines:
-            line_length = len(line) + 1  # +1 for newline
+        # Step 2: Process secondary files
+        if secondary_file_paths:
+            # Sort files alphabetically by filename
+            sorted_files = sorted(secondary_file_paths, key=lambda p: p.name.lower())
 
-            if line.strip().startswith('```'):
-                if in_code_block:
-                    # End of code block
-                    code_blocks.append((block_start, current_pos + line_length))
-                    in_code_block = False
-                else:
-                    # Start of code block
-                    block_start = current_pos
-                    in_code_block = True
+            for file_path in sorted_files:
+                try:
+                    # Convert to Path object if needed
+                    if not isinstance(file_path, Path):
+                        file_path = Path(file_path)
 
-            current_pos += line_length
+                    # Read file content (missing files raise OSError and are skipped)
+                    file_content, encoding = reader(file_path, store=cache_reads)
 
-        # Check if position is within any code block
-        for block_start, block_end in code_blocks:
-            if block_start <= position < block_end:
-                return True
+                    if encoding != 'utf-8':
+                        # Only UTF-8 files are merged
+                        continue
 
-        return False
+                    # Strip frontmatter from secondary files
+                    content_without_fm = self.strip_frontmatter(file_content)
 
-    def _replace_path(self, original_path: str, skill_name: str) -> str:
-        """Replace a script path with the relocated path.
+                    # Skip empty files
+                    if not content_without_fm.strip():
+                        continue
 
-        Transforms paths to point to the skill subdirectory.
+                    # Create section header from filename
+                    section_header = self.create_section_header(file_path.name)
 
-        Args:
-            original_path: Original path (e.g., "./script.sh")
-            skill_name: Skill name (subdirectory name)
+                    # Combine header and content
+                    section = f"{section_header}\n\n{content_without_fm.strip()}"
 
-        Returns:
-            Updated path (e.g., "./{skill-name}/script.sh")
+                    yield section
 
-        Examples:
-            ./script.sh        → ./{skill-name}/script.sh
-            ./setup.py         → ./{skill-name}/setup.py
-            script.sh          → {skill-name}/script.sh
+                except (OSError, PermissionError, UnicodeDecodeError):
+                    # Failed to read this file - skip it and continue
+                    continue
 
-        Notes:
-            - Preserves ./ prefix if present
-            - Handles paths with and without ./
-            - Uses skill_name as subdirectory
-        """
-        # Extract filename from path
-        if '/' in original_path:
-            # Path has directory component
-            filename = original_path.split('/')[-1]
-        else:
-            filename = original_path
 
-        # Build new path based on original format
-        if original_path.startswith('./'):
-            # ./script.sh → ./{skill-name}/script.sh
-            return f"./{skill_name}/{filename}"
-        elif original_path.startswith('../'):
-            # ../script.sh → ./{skill-name}/script.sh (normalize to current dir)
-            return f"./{skill_name}/{filename}"
-        else:
-            # script.sh → {skill-name}/script.sh
-            return f"{skill_name}/{filename}"
 
+class SubdirectoryPreserver:
+    """Preserves subdirectories from skill directory to command directory.
 
-@dataclass
-class ProcessingResult:
-    """Result of processing a single skill directory.
+    This class handles copying subdirectories (and their contents) from a skill
+    directory to the command directory while preserving file permissions, excluding
+    unwanted files, and tracking statistics.
 
-    This dataclass captures the complete outcome of converting a single skill
-    directory into a command markdown file. It tracks both successful operations
-    and any errors encountered during processing.
+    Key Features:
+    - Recursive directory copying driven by the pre-scanned SkillTree
+    - Kernel-side copies (copy_file_range/sendfile) or hardlink, reflink and
+      symlink placement, selected by link_mode
+    - Unchanged destination files (same size and mtime) are left untouched
+    - File permission preservation (especially executable bit for scripts)
+    - Exclusion of unwanted files (LICENSE.txt, .gitignore, __pycache__)
+    - Symbolic link resolution before copying
+    - File count tracking and reporting
+    - Handles nested directory structures
 
-    Attributes:
-        skill_name: Name of the skill directory being processed (e.g., "algorithmic-art").
-                   This is the directory name, not the full path.
+    Usage:
+        preserver = SubdirectoryPreserver(link_mode='hardlink')
+        stats = preserver.copy_subdirectories(source_dir, dest_dir, subdir_names)
+    """
 
-        status: Processing outcome indicator. Must be one of:
-               - "SUCCESS": All files processed without errors, output file created
-               - "PARTIAL_SUCCESS": Output file created but some non-critical errors occurred
-               - "FAILED": Processing failed, no output file created or unusable output
+    # Files and directories to exclude at any depth (compiled once into
+    # COPY_EXCLUSIONS)
+    EXCLUDE_PATTERNS = set(COPY_EXCLUDE_PATTERNS)
 
-        output_file: Absolute path to the generated command markdown file.
-                    None if processing failed before file creation.
+    def __init__(self, link_mode: str = 'copy', blob_store: Optional['BlobStore'] = None):
+        """Initialize the SubdirectoryPreserver.
 
-        files_processed: List of relative paths (from skill directory root) of all files
-                        that were successfully read and included in the output.
-                        Includes markdown files, code files, and configuration files.
+        Args:
+            link_mode: One of LINK_MODES - how files are placed in the
+                       destination (see materialize_file)
+            blob_store: BlobStore backing the dedup link mode
 
-        errors: List of error messages encountered during processing.
-               Empty list indicates no errors. Errors may include:
-               - File read failures (encoding issues, permissions, not found)
-               - Parsing errors (malformed YAML/JSON)
-               - Template processing errors
-               - File write failures
+        Raises:
+            ValueError: If link_mode is not a known mode, or is dedup
+                        without a blob_store
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode!r} (expected one of {', '.join(LINK_MODES)})")
+        if link_mode == 'dedup' and blob_store is None:
+            raise ValueError("The dedup link mode requires a BlobStore")
+        self.link_mode = link_mode
+        self.blob_store = blob_store
 
-        notes: List of informational messages about the processing.
-              Used for warnings, skipped files, fallback operations, etc.
-              Examples: "Skipped binary file: image.png", "Using regex fallback for YAML"
+    def copy_subdirectories(self, source_dir: Path, dest_dir: Path,
+                           subdir_names: list, tree: Optional[SkillTree] = None) -> dict:
+        """Copy specified subdirectories from source to destination.
 
-        retry_count: Number of retry attempts made during processing.
-                    0 indicates successful first attempt.
-                    Used to track reliability and identify problematic skills.
+        Recursively copies subdirectories while preserving permissions and
+        excluding unwanted files.
 
-        transformation_mode: The transformation mode detected for this skill.
-                           One of: DIRECTORY_WITH_SUBDIRS, DIRECTORY_WITH_SCRIPTS, SINGLE_FILE.
-                           None if mode detection was not performed.
+        Args:
+            source_dir: Source skill directory containing subdirectories
+            dest_dir: Destination command directory where subdirs will be copied
+            subdir_names: List of subdirectory names to copy (e.g., ['scripts', 'ooxml'])
+            tree: Pre-scanned SkillTree for source_dir (scanned here if omitted)
 
-        markdown_files_merged: Number of markdown files that were merged together.
-                             0 for skills with only SKILL.md, >1 for skills with multiple .md files.
+        Returns:
+            Dictionary with copy statistics:
+            {
+                'copied_dirs': int,      # Number of directories copied
+                'copied_files': int,     # Number of files now present in dest
+                'skipped_files': int,    # ...of which were already up to date
+                'linked_files': int,     # ...of which were hard/symbolic linked
+                'excluded_files': int,   # Number of files excluded
+                'errors': list,          # List of error messages
+            }
 
-        subdirectories_copied: Number of subdirectories that were preserved and copied.
-                             Only applicable for DIRECTORY_WITH_SUBDIRS mode.
+        Notes:
+            - Creates dest_dir if it doesn't exist
+            - Preserves file permissions including executable bit
+            - Resolves symbolic links before copying
+            - Excludes files matching EXCLUDE_PATTERNS
+            - Handles errors gracefully and reports them
+        """
+        stats = {
+            'copied_dirs': 0,
+            'copied_files': 0,
+            'skipped_files': 0,
+            'linked_files': 0,
+            'excluded_files': 0,
+            'errors': [],
+        }
 
-        scripts_relocated: Number of root-level scripts that were relocated to skill subdirectory.
-                         Only applicable for DIRECTORY_WITH_SCRIPTS mode.
+        # Convert to Path objects if needed
+        if not isinstance(source_dir, Path):
+            source_dir = Path(source_dir)
+        if not isinstance(dest_dir, Path):
+            dest_dir = Path(dest_dir)
 
-        path_updates_count: Number of path references updated in markdown after script relocation.
-                          0 if no scripts were relocated or no paths needed updating.
+        # Create destination directory if it doesn't exist
+        try:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            stats['errors'].append(f"Failed to create destination directory: {e}")
+            return stats
 
-        path_update_details: List of specific path updates made (e.g., "./setup.sh → ./skill/setup.sh").
-                           Empty list if no path updates were made.
-    """
-    skill_name: str
-    status: str
-    output_file: Optional[str]
-    files_processed: List[str]
-    errors: List[str]
-    notes: List[str]
-    retry_count: int
-    transformation_mode: Optional[str] = None
-    markdown_files_merged: int = 0
-    subdirectories_copied: int = 0
-    scripts_relocated: int = 0
-    path_updates_count: int = 0
-    path_update_details: List[str] = field(default_factory=list)
+        if tree is None:
+            tree = SkillTree.scan(source_dir)
 
+        # Copy each subdirectory
+        for subdir_name in subdir_names:
+            source_node = tree.root.child(subdir_name)
+            dest_subdir = dest_dir / subdir_name
 
-@dataclass
-class ConversionReport:
-    """Final report for entire conversion process.
+            # Check if source subdirectory exists
+            if source_node is None or not source_node.is_dir:
+                stats['errors'].append(f"Source subdirectory not found: {subdir_name}")
+                continue
 
-    This dataclass aggregates results from all skill directory conversions
-    and provides summary statistics for the entire batch operation. Used
-    for final reporting and logging.
+            # Use recursive copy with our custom logic
+            try:
+                self._copy_directory_recursive(source_node, dest_subdir, stats)
+                stats['copied_dirs'] += 1
+            except Exception as e:
+                stats['errors'].append(f"Error copying {subdir_name}: {e}")
 
-    Attributes:
-        total_skills: Total number of skill directories discovered and queued
-                     for processing. This is the count of all subdirectories
-                     found in the skills/ input directory.
+        return stats
 
-        successful: Count of skills that completed with status="SUCCESS".
-                   These skills were fully processed without any errors.
+    def plan_subdirectories(self, dest_dir: Path, subdir_names: list,
+                            tree: SkillTree, link_mode: Optional[str] = None) -> dict:
+        """Compute what copy_subdirectories() would do, without writing.
 
-        partial_success: Count of skills that completed with status="PARTIAL_SUCCESS".
-                        These skills produced output but encountered some non-critical
-                        errors (e.g., skipped files, encoding warnings).
+        Args:
+            dest_dir: Destination command directory
+            subdir_names: List of subdirectory names to copy
+            tree: Pre-scanned SkillTree of the source skill directory
+            link_mode: Link mode to predict for (defaults to self.link_mode;
+                       archive skills are always copied)
 
-        failed: Count of skills that completed with status="FAILED".
-               These skills did not produce usable output files due to
-               critical errors during processing.
+        Returns:
+            Dictionary with the same counters as copy_subdirectories(), plus
+            'copied_bytes' (total size of the files placed in dest_dir) and
+            'written_bytes' (size of the files whose data would be copied)
 
-        total_files_processed: Sum of all files successfully processed across
-                              all skills. Counts individual files that were
-                              read and included in command outputs.
+        Notes:
+            - Applies the same exclusion rules as the real copy
+            - Uses plan_materialize() to tell unchanged destination files apart
+        """
+        stats = {
+            'copied_dirs': 0,
+            'copied_files': 0,
+            'skipped_files': 0,
+            'linked_files': 0,
+            'excluded_files': 0,
+            'copied_bytes': 0,
+            'written_bytes': 0,
+            'errors': [],
+        }
 
-        total_errors: Sum of all errors encountered across all skills.
-                     Calculated from len(result.errors) for each result.
-                     High error count indicates systematic issues.
+        for subdir_name in subdir_names:
+            source_node = tree.root.child(subdir_name)
+            if source_node is None or not source_node.is_dir:
+                stats['errors'].append(f"Source subdirectory not found: {subdir_name}")
+                continue
 
-        total_retries: Sum of all retry attempts across all skills.
-                      Calculated from result.retry_count for each result.
-                      High retry count indicates reliability issues.
+            self._plan_directory_recursive(source_node, Path(dest_dir) / subdir_name, stats,
+                                           link_mode or self.link_mode)
+            stats['copied_dirs'] += 1
 
-        results: List of ProcessingResult objects, one per skill directory.
-                Ordered by processing sequence. Used for detailed reporting
-                and debugging. Allows inspection of individual skill outcomes.
-    """
-    total_skills: int
-    successful: int
-    partial_success: int
-    failed: int
-    total_files_processed: int
-    total_errors: int
-    total_retries: int
-    results: List[ProcessingResult]
+        return stats
 
+    def iter_preserved_files(self, tree: SkillTree, subdir_names: list):
+        """Yield the file nodes copy_subdirectories() would place.
 
-# ============================================================================
-# Utility Functions
-# ============================================================================
+        Args:
+            tree: SkillTree of the source skill
+            subdir_names: List of subdirectory names to copy
 
-def detect_encoding(file_path: Path) -> str:
-    """Detect the encoding of a file.
+        Yields:
+            TreeNode for each file below the named subdirectories that is
+            not excluded, in sorted depth-first order
+        """
+        for subdir_name in subdir_names:
+            source_node = tree.root.child(subdir_name)
+            if source_node is not None and source_node.is_dir:
+                yield from self._iter_files_recursive(source_node)
 
-    Uses chardet library if available for automatic detection. Otherwise,
-    tries common encodings in sequence: UTF-8, Latin-1, CP1252.
+    def _iter_files_recursive(self, src_node: TreeNode):
+        """Yield the non-excluded files below src_node (see iter_preserved_files)."""
+        for item in src_node.children:
+            if self._should_exclude(item.name):
+                continue
+            if item.is_dir:
+                yield from self._iter_files_recursive(item)
+            else:
+                yield item
 
-    Args:
-        file_path: Path to the file to analyze.
+    def _plan_directory_recursive(self, src_node: TreeNode, dest_dir: Path,
+                                  stats: dict, link_mode: str) -> None:
+        """Dry-run counterpart of _copy_directory_recursive() (updates stats)."""
+        for item in src_node.children:
+            if self._should_exclude(item.name):
+                stats['excluded_files'] += 1
+                continue
 
-    Returns:
-        Detected encoding name as a string. Returns 'utf-8' as fallback
-        if detection fails.
+            dest_item = dest_dir / item.name
 
-    Notes:
-        - chardet provides better accuracy but is optional
-        - Fallback sequence covers most Western text files
-        - Always returns a valid encoding name
-    """
-    # Try chardet first if available
-    if CHARDET_AVAILABLE:
-        try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
-
-            # Use chardet to detect encoding
-            detected = chardet.detect(raw_data)
-            if detected and detected['encoding']:
-                confidence = detected.get('confidence', 0)
-                encoding = detected['encoding']
-
-                # Only use chardet result if confidence is reasonable
-                if confidence > 0.7:
-                    return encoding
-        except Exception as e:
-            # If chardet fails, fall through to manual detection
-            pass
+            if item.is_dir:
+                self._plan_directory_recursive(item, dest_item, stats, link_mode)
+                stats['copied_dirs'] += 1
+                continue
+
+            outcome = plan_materialize(item.path, dest_item, item, link_mode)
+            stats['copied_files'] += 1
+            stats['copied_bytes'] += item.size
+            if outcome == "skipped":
+                stats['skipped_files'] += 1
+            elif outcome == "linked":
+                stats['linked_files'] += 1
+            else:
+                stats['written_bytes'] += item.size
+
+    def _copy_directory_recursive(self, src_node: TreeNode, dest_dir: Path,
+                                  stats: dict) -> None:
+        """Recursively copy a directory while preserving permissions and excluding files.
 
-    # Try common encodings in sequence
-    encodings_to_try = ['utf-8', 'latin-1', 'cp1252']
+        Args:
+            src_node: SkillTree node of the source directory to copy
+            dest_dir: Destination directory
+            stats: Statistics dictionary to update
 
-    for encoding in encodings_to_try:
+        Notes:
+            - Updates stats in place
+            - Excludes files matching EXCLUDE_PATTERNS
+            - Preserves file permissions
+            - Follows symbolic links (content of the target is copied under the
+              link's own name)
+            - Files whose destination is already up to date are counted in
+              both copied_files and skipped_files
+        """
+        # Create destination directory
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                # Try to read first 1024 bytes to verify encoding works
-                f.read(1024)
-            return encoding
-        except (UnicodeDecodeError, LookupError):
-            continue
-        except Exception:
-            # Other errors (permission, file not found) should propagate
-            pass
+            dest_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            stats['errors'].append(f"Failed to create directory {dest_dir}: {e}")
+            return
 
-    # If all detection methods fail, return utf-8 as safe default
-    return 'utf-8'
+        for item in src_node.children:
+            # Check if item should be excluded
+            if self._should_exclude(item.name):
+                stats['excluded_files'] += 1
+                continue
 
+            # Use original name for destination (preserves symlink names)
+            dest_item = dest_dir / item.name
 
-def safe_read_file(file_path: Path, retry: bool = True) -> Optional[str]:
-    """Safely read a file with automatic encoding detection and retry logic.
+            if item.is_dir:
+                # Recursively copy subdirectory
+                self._copy_directory_recursive(item, dest_item, stats)
+                stats['copied_dirs'] += 1
+            else:
+                # Place file according to link_mode (copy, link or skip)
+                try:
+                    outcome = materialize_file(item.path, dest_item, item, self.link_mode,
+                                               self.blob_store)
+                except OSError as e:
+                    stats['errors'].append(f"Failed to copy file {item.path}: {e}")
+                    continue
 
-    Attempts to read a file using detected encoding. Implements retry logic
-    for transient failures like temporary permission issues or locks.
+                stats['copied_files'] += 1
+                if outcome == "skipped":
+                    stats['skipped_files'] += 1
+                elif outcome == "linked":
+                    stats['linked_files'] += 1
 
-    Args:
-        file_path: Path to the file to read.
-        retry: If True, retry once after 0.5s wait on failure. Default: True.
+    def _should_exclude(self, filename: str) -> bool:
+        """Check if a file should be excluded based on EXCLUDE_PATTERNS.
 
-    Returns:
-        File contents as a string, or None if reading fails.
+        Args:
+            filename: Name of the file to check
 
-    Error Handling:
-        - FileNotFoundError: Returns None, logs warning (no retry)
-        - PermissionError: Retries if retry=True, returns None on final failure
-        - UnicodeDecodeError: Returns None with error logging (no retry)
-        - Other exceptions: Retries if retry=True, returns None on final failure
+        Returns:
+            True if file should be excluded, False otherwise
 
-    Notes:
-        - Uses detect_encoding() for automatic encoding detection
-        - Uses retry_operation() for consistent retry behavior
-        - Retry delay is RETRY_WAIT_TIME (0.5 seconds)
-        - Maximum of 1 retry attempt (2 total attempts)
-    """
-    def _attempt_read() -> str:
-        """Internal function to attempt file read."""
-        # Detect encoding first
-        encoding = detect_encoding(file_path)
+        Notes:
+            - Checks against EXCLUDE_PATTERNS via the precompiled COPY_EXCLUSIONS
+            - Supports exact matches and glob patterns (*.pyc)
+        """
+        return COPY_EXCLUSIONS.matches(filename)
 
-        # Read file with detected encoding
-        with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-            content = f.read()
+    def _copy_with_permissions(self, src: Path, dest: Path,
+                               src_node: Optional[TreeNode] = None) -> bool:
+        """Copy a file while preserving permissions.
 
-        return content
+        Args:
+            src: Source file path
+            dest: Destination file path
+            src_node: SkillTree node for src; when given, its cached stat data
+                      supplies mode and mtime so no further stat() is needed
 
-    # Try to read the file - handle non-retryable errors first
-    try:
-        # Use retry_operation if retry is enabled
-        if retry:
-            return retry_operation(
-                _attempt_read,
-                operation_name=f"read {file_path.name}",
-                max_retries=MAX_RETRIES,
-                delay=RETRY_WAIT_TIME
-            )
-        else:
-            return _attempt_read()
+        Returns:
+            True if copy succeeded (or dest was already up to date), False otherwise
 
-    except FileNotFoundError:
-        print(f"WARNING: File not found: {file_path}")
-        return None
+        Notes:
+            - Preserves file mode (permissions) and modification time
+            - Especially important for executable scripts
+            - Handles symbolic links by resolving them first
+            - Honors self.link_mode (see materialize_file)
+        """
+        try:
+            if src_node is None:
+                src_node = TreeNode.from_path(src)
+            materialize_file(src, dest, src_node, self.link_mode, self.blob_store)
+            return True
 
-    except UnicodeDecodeError as e:
-        print(f"ERROR: Unicode decode error for {file_path.name}: {e}")
-        return None
+        except (OSError, PermissionError, IOError) as e:
+            return False
 
-    except Exception as e:
-        # All other errors (including retry exhaustion)
-        print(f"ERROR: Failed to read {file_path.name}: {e}")
-        return None
 
+class PathUpdater:
+    """Updates file paths in markdown content after script relocation.
 
-def should_exclude_file(file_path: Path) -> bool:
-    """Check if a file should be excluded from processing.
+    This class handles the relocation of root-level scripts to a skill-specific
+    subdirectory and updates all references to those scripts in markdown files.
 
-    Applies exclusion rules based on:
-    - Filename patterns (LICENSE.txt, *.bak, etc.)
-    - File extensions (binary files)
-    - File size limits
+    Key Features:
+    - Detects script files by extension (SCRIPT_EXTENSIONS)
+    - Relocates scripts to /commands/{skill-name}/ subdirectory
+    - Finds relative path references in markdown (./script.sh patterns)
+    - Updates paths to point to relocated scripts (./{skill-name}/script.sh)
+    - Preserves paths in code blocks (examples shouldn't be updated)
+    - Tracks number of path updates made
 
-    Args:
-        file_path: Path to the file to check.
+    Usage:
+        updater = PathUpdater()
+        relocated = updater.relocate_scripts(source_dir, dest_dir, skill_name, script_files)
+        updated_md = updater.update_paths_in_markdown(markdown_content, skill_name, script_files)
+    """
 
-    Returns:
-        True if file should be excluded, False if it should be processed.
+    def __init__(self, link_mode: str = 'copy', blob_store: Optional['BlobStore'] = None):
+        """Initialize the PathUpdater.
 
-    Exclusion Rules:
-        1. Files matching EXCLUDE_FILES patterns
-        2. Files with BINARY_EXTENSIONS
-        3. Files exceeding MAX_FILE_SIZE_BYTES
-        4. Files in directories matching EXCLUDE_DIRS (checked separately)
+        Args:
+            link_mode: One of LINK_MODES - how relocated scripts are placed
+                       in the destination (see materialize_file)
+            blob_store: BlobStore backing the dedup link mode
 
-    Notes:
-        - Case-insensitive filename matching
-        - Uses glob-style pattern matching for EXCLUDE_FILES
-        - Size check prevents processing huge files
-    """
-    # Get filename and extension
-    filename = file_path.name
-    extension = file_path.suffix.lower()
+        Raises:
+            ValueError: If link_mode is not a known mode, or is dedup
+                        without a blob_store
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode!r} (expected one of {', '.join(LINK_MODES)})")
+        if link_mode == 'dedup' and blob_store is None:
+            raise ValueError("The dedup link mode requires a BlobStore")
+        self.link_mode = link_mode
+        self.blob_store = blob_store
 
-    # Check against excluded filenames (exact match or pattern)
-    for pattern in EXCLUDE_FILES:
-        if pattern.startswith('*'):
-            # Wildcard pattern (e.g., *.bak)
-            if filename.endswith(pattern[1:]):
-                return True
-        else:
-            # Exact match (case-insensitive)
-            if filename.lower() == pattern.lower():
-                return True
+    def relocate_scripts(self, source_dir: Path, dest_dir: Path,
+                        skill_name: str, script_files: list) -> dict:
+        """Relocate script files from source to skill-specific subdirectory.
 
-    # Check against binary extensions
-    if extension in BINARY_EXTENSIONS:
-        return True
+        Moves root-level script files to a subdirectory named after the skill
+        while preserving their permissions.
 
-    # Check file size
-    try:
-        file_size = file_path.stat().st_size
-        if file_size > MAX_FILE_SIZE_BYTES:
-            print(f"WARNING: Excluding {filename} - exceeds size limit ({file_size / (1024*1024):.1f} MB)")
-            return True
+        Args:
+            source_dir: Source skill directory containing scripts
+            dest_dir: Destination commands directory
+            skill_name: Name of the skill (used for subdirectory name)
+            script_files: List of Path objects for script files to relocate
 
-        # Also exclude empty files
-        if file_size == 0:
-            return True
-    except Exception as e:
-        # If we can't get file size, exclude it to be safe
-        print(f"WARNING: Cannot stat {filename}: {e}")
-        return True
+        Returns:
+            Dictionary with relocation statistics:
+            {
+                'relocated_count': int,    # Number of scripts relocated
+                'skipped_count': int,      # ...of which were already up to date
+                'errors': list,            # List of error messages
+            }
 
-    return False
+        Notes:
+            - Creates {dest_dir}/{skill_name}/ subdirectory
+            - Preserves file permissions including executable bit
+            - Honors self.link_mode (see materialize_file)
+            - Handles errors gracefully
+        """
+        stats = {
+            'relocated_count': 0,
+            'skipped_count': 0,
+            'errors': [],
+        }
 
+        # Convert to Path objects if needed
+        if not isinstance(source_dir, Path):
+            source_dir = Path(source_dir)
+        if not isinstance(dest_dir, Path):
+            dest_dir = Path(dest_dir)
 
-def should_exclude_dir(dir_name: str) -> bool:
-    """Check if a directory should be excluded from processing.
+        # Create skill subdirectory
+        skill_subdir = dest_dir / skill_name
+        try:
+            skill_subdir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            stats['errors'].append(f"Failed to create subdirectory {skill_name}: {e}")
+            return stats
 
-    Checks directory name against EXCLUDE_DIRS patterns.
+        # Relocate each script file
+        for script_file in script_files:
+            if not isinstance(script_file, Path):
+                script_file = Path(script_file)
 
-    Args:
-        dir_name: Name of the directory (not full path, just the directory name).
+            # Build source and destination paths
+            if script_file.is_absolute():
+                source_path = script_file
+            else:
+                source_path = source_dir / script_file
 
-    Returns:
-        True if directory should be excluded, False if it should be processed.
+            dest_path = skill_subdir / script_file.name
 
-    Exclusion Rules:
-        - Directories matching EXCLUDE_DIRS patterns
-        - Case-insensitive matching
+            # Copy file with permissions
+            try:
+                source_node = TreeNode.from_path(source_path)
+                outcome = materialize_file(source_path, dest_path, source_node,
+                                           self.link_mode, self.blob_store)
+                if outcome == "skipped":
+                    stats['skipped_count'] += 1
 
-    Notes:
-        - Used during recursive file discovery
-        - Helps skip irrelevant directories like __pycache__, .git, scripts/
-    """
-    # Normalize directory name to lowercase for comparison
-    dir_name_lower = dir_name.lower()
+                stats['relocated_count'] += 1
 
-    # Check against excluded directory names
-    for excluded in EXCLUDE_DIRS:
-        if dir_name_lower == excluded.lower():
-            return True
+            except (OSError, PermissionError, IOError) as e:
+                stats['errors'].append(f"Failed to relocate {script_file.name}: {e}")
 
-    return False
+        return stats
 
+    def update_paths_in_markdown(self, content: str, skill_name: str,
+                                 script_files: list) -> tuple[str, int]:
+        """Update script paths in markdown content after relocation.
 
-def get_language_hint(file_path: Path) -> str:
-    """Get syntax highlighting language hint for a file.
+        Finds references to relocated scripts in markdown and updates them
+        to point to the new location in the skill subdirectory.
 
-    Maps file extensions to language identifiers used in markdown
-    code blocks for syntax highlighting.
+        Args:
+            content: Markdown content to update
+            skill_name: Name of the skill (subdirectory name)
+            script_files: List of script filenames that were relocated
 
-    Args:
-        file_path: Path to the file.
+        Returns:
+            Tuple of (updated_content, update_count)
+            - updated_content: Markdown with updated paths
+            - update_count: Number of path replacements made
 
-    Returns:
-        Language identifier string (e.g., 'python', 'javascript', 'bash').
-        Returns empty string if no specific language mapping exists.
+        Path Transformations:
+            ./script.sh        → ./{skill-name}/script.sh
+            ./setup.py         → ./{skill-name}/setup.py
+            scripts/helper.sh  → {skill-name}/helper.sh (root-level only)
 
-    Language Mappings:
-        - .py → python
-        - .js, .jsx → javascript
-        - .ts, .tsx → typescript
-        - .sh, .bash → bash
-        - .json → json
-        - .yaml, .yml → yaml
-        - .xml → xml
-        - .md, .markdown → markdown
-        - And more...
+        Notes:
+            - Only updates paths to relocated scripts
+            - Preserves paths in code blocks (triple backticks)
+            - Uses regex to find path references
+            - Case-sensitive matching
+            - Single pass: one regex over all script names, code block
+              ranges computed once, output assembled from chunks, so the
+              cost is linear in the size of the content
+        """
+        # Extract just filenames from script_files
+        script_filenames = []
+        for script in script_files:
+            if isinstance(script, Path):
+                script_filenames.append(script.name)
+            else:
+                script_filenames.append(Path(script).name)
 
-    Notes:
-        - Used when creating code blocks in output markdown
-        - Enables proper syntax highlighting in rendered markdown
-        - Empty string is valid (renders as plain text)
-    """
-    # Get file extension (lowercase, without the dot)
-    extension = file_path.suffix.lower()
+        pattern = self._compile_script_pattern(script_filenames)
+        if pattern is None:
+            return content, 0
 
-    # Map extensions to language identifiers
-    language_map = {
-        # Programming languages
-        '.py': 'python',
-        '.js': 'javascript',
-        '.jsx': 'javascript',
-        '.ts': 'typescript',
-        '.tsx': 'typescript',
-        '.java': 'java',
-        '.c': 'c',
-        '.cpp': 'cpp',
-        '.cc': 'cpp',
-        '.cxx': 'cpp',
-        '.h': 'c',
-        '.hpp': 'cpp',
-        '.cs': 'csharp',
-        '.rb': 'ruby',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.php': 'php',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
+        block_starts, block_ends, _ = self._find_code_block_ranges(content)
+        return self._rewrite_paths(content, skill_name, pattern, block_starts, block_ends)
 
-        # Shell scripts
-        '.sh': 'bash',
-        '.bash': 'bash',
-        '.zsh': 'bash',
-        '.fish': 'fish',
+    def iter_updated_sections(self, sections, skill_name: str, script_files: list,
+                              stats: dict):
+        """Update script paths section by section (streaming counterpart).
 
-        # Web technologies
-        '.html': 'html',
-        '.htm': 'html',
-        '.css': 'css',
-        '.scss': 'scss',
-        '.sass': 'sass',
-        '.less': 'less',
+        Applies the same rewrite as update_paths_in_markdown() to each section
+        of a document produced by MarkdownMerger.iter_merged_sections(), so the
+        whole document never has to be in memory.
 
-        # Data formats
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.toml': 'toml',
-        '.xml': 'xml',
-        '.csv': 'csv',
+        Args:
+            sections: Iterable of section strings
+            skill_name: Name of the skill (subdirectory name)
+            script_files: List of script filenames that were relocated
+            stats: Dictionary whose 'update_count' entry is incremented by the
+                   number of replacements as sections are consumed
 
-        # Markup
-        '.md': 'markdown',
-        '.markdown': 'markdown',
-        '.rst': 'rst',
+        Yields:
+            Updated section strings
 
-        # Configuration
-        '.ini': 'ini',
-        '.cfg': 'ini',
-        '.conf': 'conf',
+        Notes:
+            - A code fence left open at the end of a section is treated as
+              continuing into the following sections (as markdown renders
+              it); the in-memory rewriter only honors fences that are closed
+              later in the document
+        """
+        stats.setdefault('update_count', 0)
+        pattern = self._compile_script_pattern([Path(name).name for name in script_files])
+        block_open = False
 
-        # Other
-        '.sql': 'sql',
-        '.txt': 'text',
-    }
+        for section in sections:
+            if pattern is None:
+                yield section
+                continue
 
-    # Return mapped language or empty string
-    return language_map.get(extension, '')
+            block_starts, block_ends, open_start = self._find_code_block_ranges(section, block_open)
+            block_open = open_start is not None
+            if block_open:
+                block_starts.append(open_start)
+                block_ends.append(len(section) + 1)
 
+            updated, count = self._rewrite_paths(section, skill_name, pattern,
+                                                 block_starts, block_ends)
+            stats['update_count'] += count
+            yield updated
 
-def retry_operation(operation, operation_name: str = "operation",
-                   max_retries: int = MAX_RETRIES, delay: float = RETRY_WAIT_TIME) -> Any:
-    """
-    Retry an operation with delay between attempts.
+    def _rewrite_paths(self, content: str, skill_name: str, pattern: 're.Pattern',
+                       block_starts: list, block_ends: list) -> tuple[str, int]:
+        """Replace every script reference outside the given code block ranges.
 
-    Executes the given operation and retries it if it fails. Uses exponential
-    backoff or fixed delay between retries. Designed for transient failures
-    like network issues, file locks, or temporary permission errors.
+        Args:
+            content: Markdown content to update
+            skill_name: Name of the skill (subdirectory name)
+            pattern: Pattern from _compile_script_pattern()
+            block_starts: Sorted code block start offsets
+            block_ends: Matching code block end offsets
 
-    Args:
-        operation: Callable (function or lambda) to execute. Should take no arguments.
-        operation_name: Human-readable name for logging (e.g., "read file X")
-        max_retries: Maximum number of retry attempts (default: MAX_RETRIES=1)
-        delay: Seconds to wait between retry attempts (default: RETRY_WAIT_TIME=0.5)
+        Returns:
+            Tuple of (updated_content, update_count)
+        """
+        chunks = []
+        last_end = 0
+        block_index = 0
+        update_count = 0
 
-    Returns:
-        The result of the operation if successful
+        for match in pattern.finditer(content):
+            start_pos = match.start()
 
-    Raises:
-        Exception: If all attempts fail, raises the last exception encountered
+            # Matches arrive in position order, so the code block cursor
+            # only ever moves forward
+            while block_index < len(block_ends) and block_ends[block_index] <= start_pos:
+                block_index += 1
+            if block_index < len(block_starts) and block_starts[block_index] <= start_pos:
+                continue  # Skip paths in code blocks
 
-    Example:
-        >>> result = retry_operation(
-        ...     lambda: file_path.read_text(),
-        ...     operation_name="read config.json",
-        ...     max_retries=1,
-        ...     delay=0.5
-        ... )
+            chunks.append(content[last_end:start_pos])
+            chunks.append(self._replace_path(match.group(0), skill_name))
+            last_end = match.end()
+            update_count += 1
 
-    Notes:
-        - Logs retry attempts to stdout
-        - First attempt is not counted as a retry
-        - Logs success if retry succeeds
-        - Total attempts = max_retries + 1 (initial attempt + retries)
-    """
-    attempt = 0
-    last_error = None
+        if not update_count:
+            return content, 0
 
-    while attempt <= max_retries:
-        try:
-            # Execute the operation
-            result = operation()
+        chunks.append(content[last_end:])
+        return ''.join(chunks), update_count
 
-            # Log success on retry
-            if attempt > 0:
-                print(f"    ✓ Retry #{attempt} succeeded for {operation_name}")
+    def _compile_script_pattern(self, script_files: list) -> Optional['re.Pattern']:
+        """Build one regex matching a reference to any of the given scripts.
 
-            return result
+        Args:
+            script_files: List of script filenames
 
-        except Exception as e:
-            # Store error and increment attempt counter
-            last_error = e
-            attempt += 1
+        Returns:
+            Compiled pattern, or None if script_files is empty
 
-            # If we have retries left, log and wait
-            if attempt <= max_retries:
-                print(f"    ⚠ Retry #{attempt} for {operation_name} after error: {str(e)[:80]}")
-                time.sleep(delay)
-            # Otherwise, we've exhausted retries (will raise below)
+        Notes:
+            - Pattern: (./|../|)(name1|name2|...), names escaped
+            - Longer names come first, so a name that is a prefix of another
+              (run.sh / run.sh.in) never cuts the longer match short
+        """
+        names = sorted(set(script_files), key=lambda name: (-len(name), name))
+        if not names:
+            return None
 
-    # All attempts failed - raise exception with details
-    total_attempts = max_retries + 1
-    error_msg = f"{operation_name} failed after {total_attempts} attempt(s)"
-    if last_error:
-        error_msg += f": {last_error}"
+        alternation = '|'.join(re.escape(name) for name in names)
+        return re.compile(r'(\./|\.\./|)(?:' + alternation + ')')
 
-    raise Exception(error_msg)
+    def _find_code_block_ranges(self, content: str,
+                                block_open: bool = False) -> tuple[list, list, Optional[int]]:
+        """Locate all fenced code blocks (```) in one scan.
 
+        Args:
+            content: Full markdown content
+            block_open: True if content starts inside a code block opened
+                        earlier (its first fence then closes that block)
 
-# ============================================================================
-# SkillConverter Class
-# ============================================================================
+        Returns:
+            Tuple of (starts, ends, open_start)
+            - starts, ends: sorted, parallel lists of character offsets;
+              block i covers starts[i] <= position < ends[i], from the start
+              of its opening fence line to the end of its closing fence line
+            - open_start: offset of a final fence that is never closed, or
+              None. The unclosed fence is not included in starts/ends.
+        """
+        starts = []
+        ends = []
+        block_start = 0 if block_open else None
+
+        # A fence is a line whose first non-whitespace characters are ```
+        for fence in re.finditer(r'^[^\S\n]*```', content, re.MULTILINE):
+            if block_start is None:
+                block_start = fence.start()
+            else:
+                line_end = content.find('\n', fence.end())
+                if line_end == -1:
+                    line_end = len(content)
+                starts.append(block_start)
+                ends.append(line_end + 1)
+                block_start = None
 
-class SkillConverter:
-    """Main converter class for processing skill directories into command files.
+        return starts, ends, block_start
 
-    This class orchestrates the entire conversion process:
-    1. Discovers all skill directories in the input folder
-    2. Processes each skill directory individually
-    3. Generates output command markdown files
-    4. Tracks results and generates final reports
+    def _find_script_paths(self, content: str, script_files: list) -> list:
+        """Find all references to script files in markdown content.
 
-    Attributes:
-        results: List of ProcessingResult objects tracking each skill conversion.
-        mode_detector: ModeDetector instance for detecting transformation modes.
-        markdown_merger: MarkdownMerger instance for merging markdown files.
-        subdirectory_preserver: SubdirectoryPreserver instance for copying subdirectories.
-        path_updater: PathUpdater instance for relocating scripts and updating paths.
-    """
+        Uses regex to locate path references like ./script.sh, ./setup.py, etc.
 
-    def __init__(self):
-        """Initialize the converter and its component classes."""
-        self.results: List[ProcessingResult] = []
+        Args:
+            content: Markdown content to search
+            script_files: List of script filenames to look for
 
-        # Initialize v2.0 component classes
-        self.mode_detector = ModeDetector()
-        self.markdown_merger = MarkdownMerger()
-        self.subdirectory_preserver = SubdirectoryPreserver()
-        self.path_updater = PathUpdater()
+        Returns:
+            List of tuples: [(original_path, start_pos, end_pos), ...]
 
-    def read_file_with_retry(self, file_path: Path) -> Optional[str]:
-        """Read a file with encoding detection and retry logic.
+        Notes:
+            - Finds relative paths starting with ./ or ../
+            - Matches script filenames from script_files list
+            - Returns position information for replacement, in position order
+        """
+        # Pattern matches: ./ or ../ or nothing, followed by a script name
+        # This captures paths like:
+        # - ./script.sh
+        # - ../script.sh
+        # - script.sh (just the filename)
+        pattern = self._compile_script_pattern(script_files)
+        if pattern is None:
+            return []
+
+        return [(match.group(0), match.start(), match.end())
+                for match in pattern.finditer(content)]
 
-        Uses safe_read_file() utility which handles:
-        - Encoding detection (UTF-8, Latin-1, CP1252, or chardet if available)
-        - Retry logic (1 retry with 0.5s delay)
-        - Error handling for permissions, encoding, and other issues
+    def _is_in_code_block(self, content: str, position: int) -> bool:
+        """Check if a position in the content is inside a code block.
 
-        This method adds integration logging and provides a clean interface
-        for the conversion pipeline.
+        Code blocks (triple backticks) contain examples that shouldn't
+        be updated.
 
         Args:
-            file_path: Path to file to read
+            content: Full markdown content
+            position: Character position to check
 
         Returns:
-            File content as string, or None if failed after all retry attempts
+            True if position is inside a code block, False otherwise
 
         Notes:
-            - Logs read attempts and results
-            - Uses safe_read_file() for all heavy lifting
-            - Retry logic is handled by safe_read_file()
+            - Checks for triple backtick code blocks (```)
+            - Scans the whole content on every call; update_paths_in_markdown()
+              computes the ranges once instead
         """
-        # Log attempt
-        print(f"  Reading file: {file_path.name}")
-
-        # Call safe_read_file() with retry enabled
-        content = safe_read_file(file_path, retry=True)
-
-        # Log result
-        if content is not None:
-            print(f"    ✓ Successfully read {file_path.name} ({len(content)} chars)")
-        else:
-            print(f"    ✗ Failed to read {file_path.name}")
-
-        return content
+        starts, ends, _ = self._find_code_block_ranges(content)
+        index = bisect.bisect_right(starts, position) - 1
+        return index >= 0 and position < ends[index]
 
-    def extract_yaml_frontmatter(self, content: str) -> Dict[str, str]:
-        """Extract YAML front matter from markdown content.
+    def _replace_path(self, original_path: str, skill_name: str) -> str:
+        """Replace a script path with the relocated path.
 
-        Looks for YAML between --- delimiters at the start of the content.
-        Attempts to fix common YAML formatting issues.
+        Transforms paths to point to the skill subdirectory.
 
         Args:
-            content: Markdown file content
+            original_path: Original path (e.g., "./script.sh")
+            skill_name: Skill name (subdirectory name)
 
         Returns:
-            Dictionary with 'description' and optional 'argument-hint'.
-            May also include other fields found in the YAML (e.g., 'name', 'license').
-            Returns empty dict if no valid YAML found.
+            Updated path (e.g., "./{skill-name}/script.sh")
 
-        Error Handling:
-            - Returns empty dict if no --- delimiters found
-            - Attempts to fix common YAML issues before giving up
-            - Logs warnings for malformed YAML
+        Examples:
+            ./script.sh        → ./{skill-name}/script.sh
+            ./setup.py         → ./{skill-name}/setup.py
+            script.sh          → {skill-name}/script.sh
 
-        Common YAML Issues Fixed:
-            - Missing quotes around values with colons
-            - Extra whitespace
-            - Missing spaces after colons
+        Notes:
+            - Preserves ./ prefix if present
+            - Handles paths with and without ./
+            - Uses skill_name as subdirectory
         """
-        result = {}
-
-        # Strip leading whitespace and check for --- delimiter
-        content = content.lstrip()
-
-        if not content.startswith('---'):
-            # No YAML front matter
-            return result
+        # Extract filename from path
+        if '/' in original_path:
+            # Path has directory component
+            filename = original_path.split('/')[-1]
+        else:
+            filename = original_path
 
-        # Find the closing --- delimiter
-        # We need to find the second occurrence of --- (first is opening, second is closing)
-        lines = content.split('\n')
+        # Build new path based on original format
+        if original_path.startswith('./'):
+            # ./script.sh → ./{skill-name}/script.sh
+            return f"./{skill_name}/{filename}"
+        elif original_path.startswith('../'):
+            # ../script.sh → ./{skill-name}/script.sh (normalize to current dir)
+            return f"./{skill_name}/{filename}"
+        else:
+            # script.sh → {skill-name}/script.sh
+            return f"{skill_name}/{filename}"
 
-        if len(lines) < 3:
-            # Not enough lines for valid YAML front matter
-            return result
 
-        # Find closing delimiter
-        closing_index = -1
-        for i in range(1, len(lines)):
-            if lines[i].strip() == '---':
-                closing_index = i
-                break
+class ConversionManifest:
+    """Persistent record of skill input hashes for incremental conversion.
 
-        if closing_index == -1:
-            # No closing delimiter found
-            print("WARNING: YAML front matter missing closing '---' delimiter")
-            return result
+    The manifest lives in OUTPUT_DIR and maps each skill name to a content
+    hash of everything in its skill directory (SKILL.md, secondary markdown,
+    scripts, subdirectories) together with the output it produced. On the
+    next run, a skill whose hash is unchanged - and whose output still
+    exists - can be skipped entirely.
 
-        # Extract YAML block (lines between the two --- delimiters)
-        yaml_lines = lines[1:closing_index]
-        yaml_content = '\n'.join(yaml_lines)
+    Key Features:
+    - SHA-256 content hash per file, combined into one digest per skill
+    - Per-file (size, mtime) cache so unchanged files are never re-read
+    - Converter version recorded; a version change invalidates all entries
+    - Output ownership index (output filename -> skill name) so reruns
+      overwrite their own output and conflicts resolve without disk probes
+    - Thread-safe updates (used from SkillConverter worker threads)
+    - Atomic save (write to temp file, then rename)
+
+    Manifest Format:
+        {
+            "converter_version": "2.1",
+            "skills": {
+                "docx": {
+                    "digest": "<sha256 hex>",
+                    "output_file": "docx.md",
+                    "asset_dir": "docx",
+                    "link_mode": "copy",
+                    "files": {"SKILL.md": [size, mtime_ns, "<sha256 hex>"], ...}
+                }
+            },
+            "output_owners": {"docx.md": "docx", ...}
+        }
 
-        # Try to parse YAML
-        if YAML_AVAILABLE:
-            try:
-                # Try parsing with yaml.safe_load()
-                parsed = yaml.safe_load(yaml_content)
+    Usage:
+        manifest = ConversionManifest(OUTPUT_DIR / MANIFEST_FILENAME)
+        digest, files = manifest.compute_skill_hash(skill_dir)
+        if manifest.is_up_to_date(skill_name, digest, OUTPUT_DIR): ...
+        manifest.record(skill_name, digest, files, "docx.md", "docx")
+        manifest.save()
+    """
 
-                if parsed is None:
-                    # Empty YAML block
-                    return result
+    # Directories that never influence conversion output
+    IGNORED_DIRS = MODE_DETECTION_EXCLUDE_DIRS
 
-                if not isinstance(parsed, dict):
-                    print(f"WARNING: YAML front matter is not a dictionary, got {type(parsed)}")
-                    return result
+    # Read size used when hashing file contents
+    HASH_CHUNK_SIZE = 1024 * 1024
 
-                # Successfully parsed - return the dictionary
-                # Convert all values to strings for consistency
-                for key, value in parsed.items():
-                    if value is not None:
-                        result[str(key)] = str(value)
+    def __init__(self, manifest_path: Path):
+        """Initialize and load the manifest.
 
-                return result
+        Args:
+            manifest_path: Location of the manifest JSON file
+        """
+        self.manifest_path = Path(manifest_path)
+        self.skills: Dict[str, Dict[str, Any]] = {}
+        self.output_owners: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.load()
 
-            except yaml.YAMLError as e:
-                # YAML parsing failed - try to fix common issues
-                print(f"WARNING: YAML parsing failed: {e}")
-                print("  Attempting to fix common YAML issues...")
+    def load(self) -> None:
+        """Load manifest entries from disk.
 
-                # Try fixing common issues
-                fixed_yaml = self._fix_common_yaml_issues(yaml_content)
+        Notes:
+            - Missing, unreadable or corrupt manifests start empty
+            - Entries written by a different CONVERTER_VERSION are discarded
+        """
+        import json
 
-                try:
-                    parsed = yaml.safe_load(fixed_yaml)
+        self.skills = {}
+        self.output_owners = {}
 
-                    if parsed and isinstance(parsed, dict):
-                        # Convert all values to strings
-                        for key, value in parsed.items():
-                            if value is not None:
-                                result[str(key)] = str(value)
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
 
-                        print("  ✓ Successfully parsed YAML after fixes")
-                        return result
-                    else:
-                        print("  ✗ YAML still invalid after fixes")
-                        return result
+        if not isinstance(data, dict):
+            return
 
-                except yaml.YAMLError as e2:
-                    print(f"  ✗ Still failed after fixes: {e2}")
-                    # Fall through to regex fallback
-        else:
-            # PyYAML not available - use regex fallback
-            print("INFO: Using regex fallback for YAML parsing")
+        # Ownership survives converter upgrades - output names do not depend
+        # on the converter version, only on the skill that produced them
+        owners = data.get('output_owners')
+        if isinstance(owners, dict):
+            self.output_owners = {str(k): str(v) for k, v in owners.items()}
 
-        # Regex fallback - simple key: value extraction
-        result = self._parse_yaml_with_regex(yaml_content)
+        if data.get('converter_version') != CONVERTER_VERSION:
+            return
 
-        return result
+        skills = data.get('skills')
+        if isinstance(skills, dict):
+            self.skills = skills
 
-    def _fix_common_yaml_issues(self, yaml_content: str) -> str:
-        """Fix common YAML formatting issues.
+        # Manifests without an ownership index: derive it from recorded outputs
+        for skill_name, entry in self.skills.items():
+            output_file = entry.get('output_file') if isinstance(entry, dict) else None
+            if output_file:
+                self.output_owners.setdefault(output_file, skill_name)
 
-        Args:
-            yaml_content: Raw YAML content
+    def save(self) -> bool:
+        """Write the manifest to disk atomically.
 
         Returns:
-            Fixed YAML content
-
-        Common fixes:
-            - Add quotes around values containing colons
-            - Add spaces after colons if missing
-            - Remove extra trailing whitespace
+            True if the manifest was written, False on error
         """
-        lines = yaml_content.split('\n')
-        fixed_lines = []
-
-        for line in lines:
-            # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith('#'):
-                fixed_lines.append(line)
-                continue
+        import json
 
-            # Check if line is a key-value pair
-            if ':' in line:
-                # Split on first colon only
-                parts = line.split(':', 1)
-
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-
-                    # If value contains a colon and isn't already quoted, quote it
-                    if ':' in value and not (
-                        (value.startswith('"') and value.endswith('"')) or
-                        (value.startswith("'") and value.endswith("'"))
-                    ):
-                        # Quote the value
-                        # Escape any existing quotes in the value
-                        value = value.replace('"', '\\"')
-                        value = f'"{value}"'
-
-                    # Reconstruct line with proper spacing
-                    fixed_line = f"{key}: {value}"
-                    fixed_lines.append(fixed_line)
-                else:
-                    # Keep original line if we can't parse it
-                    fixed_lines.append(line)
-            else:
-                # Not a key-value pair, keep as-is
-                fixed_lines.append(line)
+        with self._lock:
+            data = {
+                'converter_version': CONVERTER_VERSION,
+                'skills': dict(sorted(self.skills.items())),
+                'output_owners': dict(sorted(self.output_owners.items())),
+            }
 
-        return '\n'.join(fixed_lines)
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
 
-    def _parse_yaml_with_regex(self, yaml_content: str) -> Dict[str, str]:
-        """Parse YAML using regex fallback (when PyYAML unavailable).
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+                f.write('\n')
+            os.replace(temp_path, self.manifest_path)
+            return True
+        except OSError as e:
+            console.warning(f"WARNING: Failed to save manifest {self.manifest_path}: {e}")
+            return False
 
-        This is a simple parser that handles basic key: value pairs.
-        Does not support complex YAML features like lists, nested dicts, etc.
+    def compute_skill_hash(self, skill_dir: Path,
+                           tree: Optional[SkillTree] = None) -> tuple[str, Dict[str, list]]:
+        """Compute the content hash of a skill directory.
 
         Args:
-            yaml_content: Raw YAML content
+            skill_dir: Path to the skill directory
+            tree: Pre-scanned SkillTree for skill_dir (scanned here if omitted)
 
         Returns:
-            Dictionary of key-value pairs
+            Tuple of (digest, file_entries)
+            - digest: SHA-256 hex digest over all input files and CONVERTER_VERSION
+            - file_entries: {relative_path: [size, mtime_ns, file_sha256]}
+
+        Notes:
+            - Files whose size and mtime match the previous manifest entry
+              reuse the recorded hash instead of being read again
+            - The executable bit is part of the digest (it is preserved on copy)
+            - Symbolic links are followed, matching SubdirectoryPreserver
+            - Zipped skill packages are hashed member by member, so an
+              archive rebuilt from unchanged files keeps its digest
         """
-        result = {}
+        entries: Dict[str, list] = {}
+        import hashlib
 
-        lines = yaml_content.split('\n')
+        digest = hashlib.sha256(f"converter:{CONVERTER_VERSION}\n".encode('utf-8'))
 
-        for line in lines:
-            # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith('#'):
-                continue
+        if tree is None:
+            tree = SkillTree.load(skill_dir)
 
-            # Look for key: value pattern
-            match = re.match(r'^([a-zA-Z0-9_-]+)\s*:\s*(.*)$', line.strip())
+        previous = self.skills.get(tree.root.name, {}).get('files', {})
 
-            if match:
-                key = match.group(1).strip()
-                value = match.group(2).strip()
+        # Tree children are sorted, so the walk order (and digest) is stable
+        for node in tree.root.iter_files(lambda d: d.name in self.IGNORED_DIRS):
+            rel_path = node.rel_path
 
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
+            cached = previous.get(rel_path)
+            if cached and cached[0] == node.size and cached[1] == node.mtime_ns:
+                file_hash = cached[2]
+            else:
+                file_hash = self._hash_file(node, tree)
+                if file_hash is None:
+                    continue
 
-                # Unescape quotes
-                value = value.replace('\\"', '"').replace("\\'", "'")
+            entries[rel_path] = [node.size, node.mtime_ns, file_hash]
+            executable = 'x' if node.is_executable() else '-'
+            digest.update(f"{rel_path}\0{executable}\0{file_hash}\n".encode('utf-8'))
 
-                result[key] = value
+        return digest.hexdigest(), entries
 
-        return result
+    def _hash_file(self, node: TreeNode, tree: SkillTree) -> Optional[str]:
+        """Return the SHA-256 hex digest of a file's contents, or None on error."""
+        import hashlib
 
-    def discover_skills(self) -> List[Path]:
-        """Discover all skill directories (non-recursive scan of INPUT_DIR).
+        file_digest = hashlib.sha256()
+        size = 0
 
-        Performs a non-recursive scan of the INPUT_DIR to find all immediate
-        subdirectories that represent skill directories. Does not traverse
-        into subdirectories.
+        try:
+            with tree.open_file(node) as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                    file_digest.update(chunk)
+                    size += len(chunk)
+        except OSError:
+            return None
 
-        Returns:
-            List of Path objects representing skill directories.
-            Returns empty list if INPUT_DIR doesn't exist or has no subdirectories.
+        _record_io(bytes_read=size)
+        return file_digest.hexdigest()
 
-        Notes:
-            - Only scans immediate children of INPUT_DIR
-            - Excludes directories matching EXCLUDE_DIRS patterns
-            - Returns sorted list for consistent processing order
-        """
-        skills = []
+    def is_up_to_date(self, skill_name: str, digest: str, output_dir: Path) -> bool:
+        """Check whether a skill's recorded output is still current.
 
-        try:
-            # Check if INPUT_DIR exists
-            if not INPUT_DIR.exists():
-                print(f"WARNING: Input directory not found: {INPUT_DIR}")
-                return skills
+        Args:
+            skill_name: Name of the skill
+            digest: Freshly computed digest from compute_skill_hash()
+            output_dir: Directory holding the generated outputs
 
-            if not INPUT_DIR.is_dir():
-                print(f"ERROR: Input path is not a directory: {INPUT_DIR}")
-                return skills
+        Returns:
+            True if the digest matches and the recorded outputs still exist
+        """
+        entry = self.skills.get(skill_name)
+        if not entry or entry.get('digest') != digest:
+            return False
 
-            # Scan only direct children (non-recursive)
-            for item in INPUT_DIR.iterdir():
-                # Filter: must be directory, not excluded
-                if item.is_dir() and not should_exclude_dir(item.name):
-                    skills.append(item)
+        output_file = entry.get('output_file')
+        if not output_file or not (output_dir / output_file).is_file():
+            return False
 
-            # Sort alphabetically for consistent processing
-            skills.sort(key=lambda p: p.name.lower())
+        asset_dir = entry.get('asset_dir')
+        if asset_dir and not (output_dir / asset_dir).is_dir():
+            return False
 
-            # Log results
-            print(f"\nDiscovered {len(skills)} skill directories:")
-            for skill_path in skills:
-                print(f"  - {skill_path.name}")
+        return True
 
-            if len(skills) == 0:
-                print("  (No valid skill directories found)")
+    def get_entry(self, skill_name: str) -> Optional[Dict[str, Any]]:
+        """Return the manifest entry for a skill, or None if not recorded."""
+        return self.skills.get(skill_name)
 
-        except PermissionError as e:
-            print(f"ERROR: Permission denied accessing {INPUT_DIR}: {e}")
-        except Exception as e:
-            print(f"ERROR: Failed to discover skills in {INPUT_DIR}: {e}")
+    def record(self, skill_name: str, digest: str, files: Dict[str, list],
+               output_file: str, asset_dir: Optional[str] = None,
+               link_mode: str = 'copy') -> None:
+        """Record a successful conversion.
 
-        return skills
+        Args:
+            skill_name: Name of the skill
+            digest: Digest from compute_skill_hash()
+            files: Per-file entries from compute_skill_hash()
+            output_file: Generated markdown filename (relative to OUTPUT_DIR)
+            asset_dir: Generated asset directory name, if any
+            link_mode: Link mode the assets were placed with
+        """
+        with self._lock:
+            self.skills[skill_name] = {
+                'digest': digest,
+                'output_file': output_file,
+                'asset_dir': asset_dir,
+                'link_mode': link_mode,
+                'files': files,
+            }
 
-    def discover_files(self, skill_dir: Path) -> Dict[str, Any]:
-        """Recursively discover files within a skill directory.
+    def forget(self, skill_name: str) -> None:
+        """Remove a skill's entry so it is reconverted next time."""
+        with self._lock:
+            self.skills.pop(skill_name, None)
 
-        Scans the skill directory recursively to find all relevant files.
-        Categorizes files by type (markdown, code, config) for organized
-        processing.
+    def claim_output(self, skill_name: str, filename: str) -> str:
+        """Resolve the output filename for a skill using the ownership index.
 
         Args:
-            skill_dir: Path to the skill directory to scan.
+            skill_name: Name of the skill claiming an output file
+            filename: Preferred filename (e.g., "mcp-builder.md")
 
         Returns:
-            Dictionary mapping file categories to lists of file paths:
-            - 'skill_md': SKILL.md from root directory (Path or None)
-            - 'markdown': List of other .md/.markdown files
-            - 'code': List of code files (.py, .js, .sh, etc.)
-            - 'config': List of config files (.json, .yaml, .xml)
-            - 'other': List of other text files
+            Filename now owned by skill_name
+
+        Resolution Order:
+            1. Preferred name free or already owned by this skill -> use it
+               (and release any suffixed name the skill held before)
+            2. Skill already owns a suffixed name -> keep it (stable reruns)
+            3. Otherwise take the first free "-2", "-3", ... suffix
 
         Notes:
-            - Recursive scan - processes all subdirectories
-            - Applies exclusion rules (EXCLUDE_DIRS, EXCLUDE_FILES)
-            - Skips binary files automatically
-            - Returns sorted lists for consistent ordering
+            - Purely in-memory: no filesystem probes
+            - Files on disk that no skill owns (e.g., outputs written before the
+              index existed) are claimed and overwritten in place
         """
-        result = {
-            "skill_md": None,
-            "markdown": [],
-            "code": [],
-            "config": [],
-            "other": []
-        }
+        if filename.endswith('.md'):
+            base_name, extension = filename[:-3], '.md'
+        else:
+            base_name, extension = filename, ''
 
-        # Check for SKILL.md in root directory
-        skill_md_path = skill_dir / "SKILL.md"
-        if skill_md_path.exists() and skill_md_path.is_file():
-            if not should_exclude_file(skill_md_path):
-                result["skill_md"] = skill_md_path
+        with self._lock:
+            owned = [name for name, owner in self.output_owners.items() if owner == skill_name]
 
-        # Define config extensions (separate from pure code files)
-        config_extensions = {'.json', '.yaml', '.yml', '.xml'}
+            if self.output_owners.get(filename, skill_name) == skill_name:
+                for name in owned:
+                    if name != filename:
+                        del self.output_owners[name]
+                self.output_owners[filename] = skill_name
+                return filename
 
-        # Define pure code extensions (excluding config formats)
-        code_extensions = {'.py', '.js', '.sh', '.ts', '.jsx', '.tsx'}
+            if owned:
+                return owned[0]
 
-        # Recursively walk directory tree
-        try:
-            for item in skill_dir.rglob('*'):
-                # Skip directories
-                if item.is_dir():
-                    continue
+            counter = 2
+            while f"{base_name}-{counter}{extension}" in self.output_owners:
+                counter += 1
 
-                # Check if any parent directory should be excluded
-                skip_file = False
-                for parent in item.parents:
-                    # Only check parents within the skill_dir
-                    if parent == skill_dir:
-                        break
-                    if parent.is_relative_to(skill_dir):
-                        if should_exclude_dir(parent.name):
-                            skip_file = True
-                            break
+            candidate = f"{base_name}-{counter}{extension}"
+            self.output_owners[candidate] = skill_name
+            return candidate
 
-                if skip_file:
-                    continue
+    def release_missing_owners(self, skill_names: Set[str]) -> None:
+        """Drop ownership claims held by skills that no longer exist.
 
-                # Check if file should be excluded
-                if should_exclude_file(item):
-                    continue
+        Args:
+            skill_names: Names of all skills discovered in this run
+        """
+        with self._lock:
+            self.output_owners = {
+                name: owner for name, owner in self.output_owners.items()
+                if owner in skill_names
+            }
 
-                # Skip SKILL.md from root (already processed)
-                if item == skill_md_path:
-                    continue
 
-                # Categorize file by extension
-                extension = item.suffix.lower()
+class BlobStore:
+    """Content-addressed store that deduplicates identical assets across skills.
 
-                if extension in MARKDOWN_EXTENSIONS:
-                    result["markdown"].append(item)
-                elif extension in config_extensions:
-                    result["config"].append(item)
-                elif extension in code_extensions:
-                    result["code"].append(item)
-                else:
-                    # Other text files (only if not binary and passes filters)
-                    result["other"].append(item)
+    Every preserved file is stored once under OUTPUT_DIR/.blobs, keyed by the
+    SHA-256 of its contents, and each skill's asset directory is populated
+    with hard links to the blobs. Skills that ship identical trees (e.g. the
+    ooxml/ directories of docx and pptx) then share one copy on disk.
 
-            # Sort each category alphabetically for consistent ordering
-            for key in ["markdown", "code", "config", "other"]:
-                result[key].sort(key=lambda p: str(p))
+    Key Features:
+    - Digests seeded from the ConversionManifest, so files are not re-read
+    - Executable bit is part of the key (hard links share their mode)
+    - Atomic ingest (temp file, then link into place) safe across threads
+    - Usage scan reporting bytes saved, pruning blobs no longer referenced
 
-        except PermissionError as e:
-            print(f"WARNING: Permission denied accessing {skill_dir}: {e}")
-        except Exception as e:
-            print(f"ERROR: Failed to scan {skill_dir}: {e}")
+    Store Layout:
+        .blobs/3f/3f9a...e1       blob for a regular file (mode 0644)
+        .blobs/3f/3f9a...e1.x     blob for an executable file (mode 0755)
 
-        return result
+    Usage:
+        store = BlobStore(OUTPUT_DIR / BLOB_DIRNAME)
+        store.remember_digests(tree, file_entries)
+        outcome = store.materialize(src_node, dest_path)
+        usage = store.scan_usage(prune=True)
+    """
 
-    def categorize_content_files(self, files: Dict[str, Any]) -> Dict[str, List[Path]]:
-        """
-        Categorize discovered files by purpose for output generation.
+    # Read size used when hashing files whose digest is not already known
+    HASH_CHUNK_SIZE = 1024 * 1024
 
-        Takes the dictionary from discover_files() and categorizes files
-        by their intended purpose in the output documentation.
+    def __init__(self, root: Path):
+        """Initialize the store (nothing is created until the first ingest).
 
         Args:
-            files: Dictionary from discover_files() with categorized files:
-                   - 'skill_md': SKILL.md from root (Path or None)
-                   - 'markdown': List of other .md/.markdown files
-                   - 'code': List of code files (.py, .js, .sh, etc.)
-                   - 'config': List of config files (.json, .yaml, .xml)
-                   - 'other': List of other text files
+            root: Directory holding the blobs (normally OUTPUT_DIR / BLOB_DIRNAME)
+        """
+        self.root = Path(root)
+        self._digests: Dict[tuple, str] = {}
+        self._lock = threading.Lock()
 
-        Returns:
-            Dictionary mapping content types to file lists:
-            {
-                'reference': [Path, ...],  # Reference documentation
-                'examples': [Path, ...],    # Example files
-                'code': [Path, ...],        # Code to show in blocks
-                'themes': [Path, ...]       # Theme files
-            }
+    @staticmethod
+    def _digest_key(node: TreeNode) -> tuple:
+        """Cache key identifying one version of a source file."""
+        return (node.device, node.inode, node.size, node.mtime_ns)
 
-        Categorization Logic:
-            - Files in 'reference/' or 'docs/' directories → Reference
-            - Files in 'examples/', 'templates/' directories → Examples
-            - Files in 'themes/' directory → Themes (theme showcase files)
-            - Files matching 'example*', '*_example.*', 'demo*' patterns → Examples
-            - Code files (.py, .js, .sh, .ts, .jsx, .tsx) → Code
-            - Config files (.json, .yaml, .yml, .xml) → Code (shown as examples)
-            - Other markdown files → Reference (general documentation)
+    def remember_digests(self, tree: SkillTree, file_entries: Dict[str, list]) -> None:
+        """Seed the digest cache from ConversionManifest.compute_skill_hash() output.
+
+        Args:
+            tree: SkillTree the entries were computed from
+            file_entries: {relative_path: [size, mtime_ns, file_sha256]}
         """
-        result = {
-            'reference': [],
-            'examples': [],
-            'code': [],
-            'themes': []
-        }
+        with self._lock:
+            for node in tree.root.iter_files():
+                entry = file_entries.get(node.rel_path)
+                if entry and entry[0] == node.size and entry[1] == node.mtime_ns:
+                    self._digests[self._digest_key(node)] = entry[2]
 
-        # Collect all files to categorize
-        all_files = []
+    def digest(self, node: TreeNode) -> str:
+        """Return the SHA-256 of a source file, hashing it only if not cached.
 
-        # Include SKILL.md if it exists (prioritize as reference)
-        if files.get('skill_md'):
-            all_files.append(files['skill_md'])
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = self._digest_key(node)
+        cached = self._digests.get(key)
+        if cached is not None:
+            return cached
 
-        # Add all other file categories
-        for category in ['markdown', 'code', 'config', 'other']:
-            all_files.extend(files.get(category, []))
+        import hashlib
 
-        # Categorize each file based on path and naming patterns
-        for file_path in all_files:
-            # Get path components for directory checking
-            path_parts = file_path.parts
-            filename = file_path.name.lower()
-            extension = file_path.suffix.lower()
+        file_digest = hashlib.sha256()
+        with open(node.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                file_digest.update(chunk)
+        _record_io(bytes_read=node.size)
 
-            # Priority 1: Check for themes directory
-            # Theme files are special - they showcase visual themes
-            if 'themes' in path_parts:
-                result['themes'].append(file_path)
-                print(f"    [THEMES] {file_path.name} (in themes/ directory)")
-                continue
+        with self._lock:
+            self._digests[key] = file_digest.hexdigest()
+        return self._digests[key]
 
-            # Priority 2: Check for examples/templates directories
-            # These directories explicitly contain example content
-            if any(part in ['examples', 'templates', 'demos', 'samples'] for part in path_parts):
-                result['examples'].append(file_path)
-                print(f"    [EXAMPLES] {file_path.name} (in examples/templates directory)")
-                continue
+    def blob_path(self, digest: str, executable: bool) -> Path:
+        """Return the store location for a digest."""
+        name = digest + ('.x' if executable else '')
+        return self.root / digest[:2] / name
 
-            # Priority 3: Check for reference/docs directories
-            # These directories contain reference documentation
-            if any(part in ['reference', 'docs', 'documentation'] for part in path_parts):
-                result['reference'].append(file_path)
-                print(f"    [REFERENCE] {file_path.name} (in reference/docs directory)")
-                continue
+    def ingest(self, node: TreeNode) -> Path:
+        """Make sure a blob exists for a source file and return its path.
 
-            # Priority 4: Check filename patterns for examples
-            # Files explicitly named as examples or demos
-            if (filename.startswith('example') or
-                '_example.' in filename or
-                '-example.' in filename or
-                filename.startswith('demo') or
-                '_demo.' in filename or
-                '-demo.' in filename or
-                filename.startswith('sample') or
-                '_sample.' in filename or
-                '-sample.' in filename):
-                result['examples'].append(file_path)
-                print(f"    [EXAMPLES] {file_path.name} (filename pattern match)")
-                continue
+        Args:
+            node: Stat data of the source file
 
-            # Priority 5: Categorize by file type
+        Returns:
+            Path of the blob holding the file's contents
 
-            # Pure code files (.py, .js, .sh, etc.) - shown as code blocks
-            if extension in ['.py', '.js', '.sh', '.ts', '.jsx', '.tsx']:
-                result['code'].append(file_path)
-                print(f"    [CODE] {file_path.name} (code file)")
-            # Config/data files (.json, .yaml, .xml) - shown as code examples
-            elif extension in ['.json', '.yaml', '.yml', '.xml']:
-                result['code'].append(file_path)
-                print(f"    [CODE] {file_path.name} (config file)")
-            # Markdown files default to reference documentation
-            elif extension in ['.md', '.markdown']:
-                result['reference'].append(file_path)
-                print(f"    [REFERENCE] {file_path.name} (markdown file)")
-            # Other text files default to reference
-            else:
-                result['reference'].append(file_path)
-                print(f"    [REFERENCE] {file_path.name} (other file)")
+        Raises:
+            OSError: If the blob cannot be written
+        """
+        executable = node.is_executable()
+        blob = self.blob_path(self.digest(node), executable)
+        if blob.exists():
+            return blob
 
-        # Print summary
-        print(f"\n  Categorization Summary:")
-        print(f"    Reference: {len(result['reference'])} files")
-        print(f"    Examples: {len(result['examples'])} files")
-        print(f"    Code: {len(result['code'])} files")
-        print(f"    Themes: {len(result['themes'])} files")
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = blob.with_name(f".tmp-{os.getpid()}-{threading.get_ident()}-{blob.name}")
 
-        return result
+        try:
+            _copy_file_data(node.path, temp_path)
+            os.chmod(temp_path, 0o755 if executable else 0o644)
+            os.utime(temp_path, ns=(node.mtime_ns, node.mtime_ns))
+            try:
+                # link() never replaces an existing blob, so files already
+                # linked to it keep sharing the same inode
+                os.link(temp_path, blob)
+            except FileExistsError:
+                pass  # Another worker stored the same content first
+        finally:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
-    def parse_sample_format(self) -> Dict[str, Any]:
-        """
-        Parse the sample format file to understand output structure.
+        return blob
 
-        Reads algorithmic-art.md to extract:
-        - Section patterns and hierarchy
-        - Expected section names (Steps, Examples, Usage)
-        - YAML front matter structure
-        - Overall content organization
+    def materialize(self, node: TreeNode, dest: Path) -> str:
+        """Place a source file at dest as a hard link to its blob.
+
+        Args:
+            node: Stat data of the source file
+            dest: Destination file path
 
         Returns:
-            Dictionary with structure information:
-            - yaml_fields: List of YAML front matter field names
-            - sections: List of all section titles (## headers)
-            - step_sections: List of dicts with step info (number, title)
-            - has_steps: Boolean indicating if Step sections exist
-            - has_examples: Boolean indicating if Examples section exists
-            - has_usage: Boolean indicating if Usage section exists
-            - step_count: Number of Step sections found
+            "skipped" if dest already is the blob, "linked" if it was linked,
+            "copied" if the blob had to be copied (hard link limit reached)
+
+        Raises:
+            OSError: If the blob or dest cannot be created
         """
-        sample_path = SAMPLE_FORMAT
+        blob = self.ingest(node)
+        blob_st = os.stat(blob)
 
-        # Validate sample file exists
-        if not sample_path.exists():
-            print(f"WARNING: Sample format file not found: {sample_path}")
-            return {
-                "yaml_fields": [],
-                "sections": [],
-                "step_sections": [],
-                "has_steps": False,
-                "has_examples": False,
-                "has_usage": False,
-                "step_count": 0
-            }
+        try:
+            dest_st = os.lstat(dest)
+        except FileNotFoundError:
+            dest_st = None
 
-        print(f"\nParsing sample format file: {sample_path.name}")
+        if dest_st is not None:
+            if (dest_st.st_dev, dest_st.st_ino) == (blob_st.st_dev, blob_st.st_ino):
+                return "skipped"
+            os.unlink(dest)
 
-        # Read sample file
-        content = self.read_file_with_retry(sample_path)
+        try:
+            os.link(blob, dest)
+            _record_io()
+            return "linked"
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
 
-        if content is None:
-            print(f"ERROR: Failed to read sample format file: {sample_path}")
-            return {
-                "yaml_fields": [],
-                "sections": [],
-                "step_sections": [],
-                "has_steps": False,
-                "has_examples": False,
-                "has_usage": False,
-                "step_count": 0
-            }
+        _copy_file_data(blob, dest)
+        os.chmod(dest, stat.S_IMODE(blob_st.st_mode))
+        os.utime(dest, ns=(blob_st.st_mtime_ns, blob_st.st_mtime_ns))
+        return "copied"
 
-        # Extract YAML front matter structure
-        print("  Extracting YAML front matter...")
-        yaml_data = self.extract_yaml_frontmatter(content)
-        yaml_fields = list(yaml_data.keys()) if yaml_data else []
-        print(f"    Found {len(yaml_fields)} YAML fields: {', '.join(yaml_fields)}")
+    def scan_usage(self, prune: bool = False) -> Dict[str, int]:
+        """Measure how much space the store saves, optionally pruning unused blobs.
 
-        # Find section headers (## headers)
-        print("  Analyzing section structure...")
-        sections = []
-        step_sections = []
-        has_examples = False
-        has_usage = False
+        A blob's link count minus one is the number of asset files sharing it,
+        so every link beyond the first is a copy that did not have to be written.
 
-        lines = content.split('\n')
-        for line in lines:
-            # Match ## headers (level 2 headers)
-            if line.startswith('## '):
-                section_title = line[3:].strip()
-                sections.append(section_title)
+        Args:
+            prune: Delete blobs that no asset file links to any more
 
-                # Check for step sections
-                step_match = re.match(r'Step (\d+):', section_title)
-                if step_match:
-                    step_num = int(step_match.group(1))
-                    step_sections.append({
-                        "number": step_num,
-                        "title": section_title
-                    })
-                    print(f"    Found: {section_title}")
+        Returns:
+            Dictionary with store statistics:
+            {
+                'blobs': int,           # Blobs in the store
+                'unique_bytes': int,    # Bytes actually stored
+                'logical_bytes': int,   # Bytes of all asset files linking to blobs
+                'saved_bytes': int,     # logical_bytes - unique_bytes
+                'pruned': int,          # Unreferenced blobs deleted
+            }
+        """
+        usage = {'blobs': 0, 'unique_bytes': 0, 'logical_bytes': 0,
+                 'saved_bytes': 0, 'pruned': 0}
 
-                # Check for Examples and Usage sections
-                if section_title.lower() == 'examples':
-                    has_examples = True
-                    print(f"    Found: {section_title}")
-                elif section_title.lower() == 'usage':
-                    has_usage = True
-                    print(f"    Found: {section_title}")
+        try:
+            shards = [e for e in os.scandir(self.root) if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return usage
+
+        for shard in shards:
+            with os.scandir(shard.path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
 
-        # Build structure info
-        structure = {
-            "yaml_fields": yaml_fields,
-            "sections": sections,
-            "step_sections": step_sections,
-            "has_steps": len(step_sections) > 0,
-            "has_examples": has_examples,
-            "has_usage": has_usage,
-            "step_count": len(step_sections)
-        }
+                    references = st.st_nlink - 1
+                    if references <= 0:
+                        if prune:
+                            try:
+                                os.unlink(entry.path)
+                                usage['pruned'] += 1
+                            except OSError:
+                                pass
+                        continue
 
-        print(f"\n  Summary:")
-        print(f"    Total sections: {len(sections)}")
-        print(f"    Step sections: {len(step_sections)}")
-        print(f"    Has Examples: {has_examples}")
-        print(f"    Has Usage: {has_usage}")
+                    usage['blobs'] += 1
+                    usage['unique_bytes'] += st.st_size
+                    usage['logical_bytes'] += st.st_size * references
 
-        return structure
+        usage['saved_bytes'] = usage['logical_bytes'] - usage['unique_bytes']
+        return usage
 
-    def _convert_skill_name_to_title(self, skill_name: str) -> str:
-        """
-        Convert a skill name to a human-readable title.
 
-        Handles common acronyms and capitalizes words properly.
+# (st_dev, st_ino) of the files OutputStaging.prepare() hard linked into the
+# staging tree. Each carries one link that only the mirror holds, which
+# _is_materialized() discounts so unchanged staged files are still skipped.
+_STAGED_INODES: set[tuple[int, int]] = set()
 
-        Args:
-            skill_name: Skill directory name (e.g., "mcp-builder", "algorithmic-art")
 
-        Returns:
-            Human-readable title (e.g., "MCP Builder", "Algorithmic Art")
-        """
-        # Common acronyms that should be fully capitalized
-        acronyms = {
-            'mcp': 'MCP',
-            'api': 'API',
-            'cli': 'CLI',
-            'ui': 'UI',
-            'ux': 'UX',
-            'url': 'URL',
-            'html': 'HTML',
-            'css': 'CSS',
-            'js': 'JS',
-            'json': 'JSON',
-            'xml': 'XML',
-            'sql': 'SQL',
-            'rest': 'REST',
-            'http': 'HTTP',
-            'https': 'HTTPS',
-            'ssh': 'SSH',
-            'git': 'Git',
-            'ai': 'AI',
-            'ml': 'ML',
-            'llm': 'LLM',
-        }
+class OutputStaging:
+    """Stages all writes of a run in a sibling directory and swaps it in at once.
 
-        # Replace separators with spaces
-        title = skill_name.replace('-', ' ').replace('_', ' ')
+    Writing straight into OUTPUT_DIR means a crash halfway through a run
+    leaves commands/ half-updated, and concurrent readers can see partially
+    written files. With staging, the current tree is first mirrored into a
+    sibling directory with hard links (no file data is copied), the run
+    writes into that mirror, and commit() makes it durable with one batched
+    sync and replaces OUTPUT_DIR with a single atomic rename.
 
-        # Split into words and capitalize each
-        words = title.split()
-        capitalized_words = []
+    Key Features:
+    - Unchanged files are hard links, so preparing the mirror is cheap and
+      skipped skills cost nothing
+    - One syncfs() for the whole staging tree instead of an fsync() per
+      written file (falls back to fsync()ing only the new files)
+    - renameat2(RENAME_EXCHANGE) swaps the trees atomically; without it,
+      two renames leave OUTPUT_DIR missing only for an instant
+    - A staging tree left behind by a crash is discarded by the next run
 
-        for word in words:
-            word_lower = word.lower()
-            if word_lower in acronyms:
-                # Use the acronym form
-                capitalized_words.append(acronyms[word_lower])
-            else:
-                # Regular title case
-                capitalized_words.append(word.capitalize())
+    Usage:
+        staging = OutputStaging(OUTPUT_DIR)
+        staging.prepare()
+        ...write into staging.path...
+        staging.commit()    # or staging.abort()
 
-        return ' '.join(capitalized_words)
+    Notes:
+        - Writers must replace files rather than rewrite them in place, or
+          they would modify the live tree through the shared hard links
+          (materialize_file(), write_output_stream() and the manifest
+          already do; write_output_file() unlinks shared files first)
+    """
 
-    def generate_fallback_metadata(self, skill_name: str, files_dict: Dict[str, Any]) -> Dict[str, str]:
-        """
-        Generate fallback metadata when SKILL.md is missing or has no YAML.
+    def __init__(self, output_dir: Path):
+        """Initialize staging for output_dir (nothing is created until prepare()).
 
         Args:
-            skill_name: Name of the skill directory
-            files_dict: Dictionary from discover_files()
-
-        Returns:
-            Dictionary with 'description' and 'argument-hint'
+            output_dir: Live output directory to be replaced on commit
         """
-        print(f"    Generating fallback metadata for {skill_name}...")
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir.with_name(f".{self.output_dir.name}{STAGING_SUFFIX}")
+        self.stats = {
+            'linked_files': 0,
+            'synced_files': 0,
+            'sync_method': None,
+            'swap_method': None,
+        }
 
-        # ========================================
-        # 1. Convert skill-name to readable title
-        # ========================================
-        # E.g., "mcp-builder" -> "MCP Builder"
-        # E.g., "algorithmic-art" -> "Algorithmic Art"
-        title = self._convert_skill_name_to_title(skill_name)
+    def prepare(self) -> Path:
+        """Create the staging directory as a hard-linked mirror of output_dir.
 
-        # ========================================
-        # 2. Generate description based on skill name
-        # ========================================
-        description = f"Tools and utilities for {title}"
+        Returns:
+            Path of the staging directory
 
-        # ========================================
-        # 3. Determine argument-hint from file types
-        # ========================================
-        argument_hint = "<arguments>"  # Default
+        Raises:
+            OSError: If the staging tree cannot be created
+        """
+        import shutil
 
-        # Check for themes directory/files
-        has_themes = False
-        for category in ['markdown', 'code', 'config', 'other']:
-            for file_path in files_dict.get(category, []):
-                if 'themes' in file_path.parts:
-                    has_themes = True
-                    break
-            if has_themes:
-                break
+        if os.path.lexists(self.path):
+            # Left behind by an interrupted run - never committed, so discard it
+            shutil.rmtree(self.path)
 
-        if has_themes:
-            argument_hint = "<theme-name>"
-            print(f"      Detected themes - using argument-hint: {argument_hint}")
-        else:
-            # Check for code files (suggests file processing)
-            has_code = len(files_dict.get('code', [])) > 0
-            if has_code:
-                argument_hint = "<file-path>"
-                print(f"      Detected code files - using argument-hint: {argument_hint}")
+        _STAGED_INODES.clear()
 
-        # ========================================
-        # 4. Try to extract summary from first available markdown file
-        # ========================================
-        # Priority: SKILL.md, then other markdown files
-        summary = None
+        if self.output_dir.is_dir():
+            self._link_tree(self.output_dir, self.path)
+        else:
+            self.path.mkdir(parents=True)
 
-        if files_dict.get('skill_md'):
-            skill_md_content = self.read_file_with_retry(files_dict['skill_md'])
-            if skill_md_content:
-                summary = self._extract_first_paragraph_from_markdown(skill_md_content)
+        return self.path
 
-        # If no summary from SKILL.md, try other markdown files
-        if not summary:
-            for md_file in files_dict.get('markdown', []):
-                md_content = self.read_file_with_retry(md_file)
-                if md_content:
-                    summary = self._extract_first_paragraph_from_markdown(md_content)
-                    if summary:
-                        print(f"      Extracted summary from: {md_file.name}")
-                        break
+    def _link_tree(self, src: Path, dest: Path) -> None:
+        """Mirror src into dest: directories are created, files hard linked."""
+        import shutil
 
-        # Use summary as description if found
-        if summary:
-            description = summary
-            print(f"      Using extracted summary as description")
-        else:
-            print(f"      Using generated description: {description}")
+        os.mkdir(dest)
+        shutil.copymode(src, dest)
 
-        # ========================================
-        # 5. Build and return metadata dictionary
-        # ========================================
-        result = {
-            'description': description,
-            'argument-hint': argument_hint
-        }
+        with os.scandir(src) as entries:
+            for entry in entries:
+                target = dest / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    self._link_tree(Path(entry.path), target)
+                    continue
 
-        print(f"      Generated fallback metadata:")
-        print(f"        description: {result['description']}")
-        print(f"        argument-hint: {result['argument-hint']}")
+                try:
+                    os.link(entry.path, target, follow_symlinks=False)
+                except OSError as e:
+                    if e.errno not in _COPY_FALLBACK_ERRNOS:
+                        raise
+                    shutil.copy2(entry.path, target, follow_symlinks=False)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    _STAGED_INODES.add((st.st_dev, st.st_ino))
+                self.stats['linked_files'] += 1
 
-        return result
+    def commit(self) -> None:
+        """Make the staged tree durable and swap it into place.
 
-    def _extract_first_paragraph_from_markdown(self, content: str) -> Optional[str]:
+        Raises:
+            OSError: If the swap fails (output_dir is then left unchanged
+                     unless the fallback failed between its two renames)
         """
-        Extract the first substantial paragraph from markdown content.
+        import shutil
 
-        Skips YAML front matter and headers to find the first real paragraph.
+        self._sync()
 
-        Args:
-            content: Markdown file content
+        if not os.path.lexists(self.output_dir):
+            os.rename(self.path, self.output_dir)
+            self.stats['swap_method'] = 'rename'
+        elif self._exchange():
+            # The previous tree now lives at the staging path
+            self.stats['swap_method'] = 'renameat2'
+            shutil.rmtree(self.path, ignore_errors=True)
+        else:
+            previous = self.output_dir.with_name(f".{self.output_dir.name}{STAGING_SUFFIX}-old")
+            if os.path.lexists(previous):
+                shutil.rmtree(previous)
+            os.rename(self.output_dir, previous)
+            os.rename(self.path, self.output_dir)
+            self.stats['swap_method'] = 'rename'
+            shutil.rmtree(previous, ignore_errors=True)
+
+        _STAGED_INODES.clear()
+        self._fsync_path(self.output_dir.parent)
+
+    def abort(self) -> None:
+        """Discard the staging tree, leaving output_dir untouched."""
+        import shutil
+
+        _STAGED_INODES.clear()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _sync(self) -> None:
+        """Flush the staging tree to disk in one batch."""
+        if _syncfs(self.path):
+            self.stats['sync_method'] = 'syncfs'
+            return
+
+        # Files written by this run are the only ones not hard linked from
+        # the live tree; directories are synced so their entries persist
+        self.stats['sync_method'] = 'fsync'
+        for dirpath, _, filenames in os.walk(self.path):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.lstat(path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode) and st.st_nlink == 1:
+                    self._fsync_path(path)
+                    self.stats['synced_files'] += 1
+            self._fsync_path(dirpath)
+
+    def _exchange(self) -> bool:
+        """Atomically swap self.path and output_dir with renameat2().
 
         Returns:
-            First paragraph as a string, or None if not found
+            True if the trees were exchanged, False if renameat2() or
+            RENAME_EXCHANGE is not available here
         """
-        # Remove YAML front matter if present
-        content = content.lstrip()
-        if content.startswith('---'):
-            lines = content.split('\n')
-            closing_idx = -1
-            for i in range(1, len(lines)):
-                if lines[i].strip() == '---':
-                    closing_idx = i
-                    break
+        renameat2 = _libc_function('renameat2')
+        if renameat2 is None:
+            return False
 
-            if closing_idx > 0:
-                content = '\n'.join(lines[closing_idx + 1:])
+        import ctypes
 
-        # Split into lines and find first substantial paragraph
-        lines = content.split('\n')
+        result = renameat2(AT_FDCWD, os.fsencode(self.path),
+                           AT_FDCWD, os.fsencode(self.output_dir), RENAME_EXCHANGE)
+        if result == 0:
+            return True
 
-        paragraph_lines = []
-        in_paragraph = False
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM):
+            return False
+        raise OSError(err, os.strerror(err), str(self.output_dir))
 
-        for line in lines:
-            stripped = line.strip()
+    @staticmethod
+    def _fsync_path(path) -> None:
+        """fsync() a file or directory, ignoring filesystems that refuse it."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-            # Skip empty lines before we start collecting
-            if not in_paragraph and not stripped:
-                continue
 
-            # Skip headers
-            if stripped.startswith('#'):
-                continue
+class PhaseTimer:
+    """Records wall time and file I/O of consecutive processing phases.
 
-            # If we hit an empty line after starting, we're done
-            if in_paragraph and not stripped:
-                break
+    Starting a phase ends the previous one, so a processor can mark each of
+    its steps with one begin() call. I/O is taken from the per-thread
+    counters maintained by _record_io() (reads, copies, links and output
+    writes), which keeps concurrent skills from mixing their numbers.
 
-            # If we have a non-empty line, collect it
-            if stripped:
-                paragraph_lines.append(stripped)
-                in_paragraph = True
+    Each phase is accumulated into metrics as:
+        {'seconds': float, 'bytes_read': int, 'bytes_written': int, 'files': int}
 
-        if paragraph_lines:
-            return ' '.join(paragraph_lines)
+    Usage:
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+        timer.begin('merge')
+        ...
+        timer.begin('write_output')   # ends 'merge'
+        ...
+        timer.end()
+    """
 
-        return None
+    # Pipeline order of the phases recorded by SkillConverter (reports list
+    # phases in this order; unknown phase names follow)
+    PHASES = ('scan', 'hash', 'mode_detection', 'discover', 'merge',
+              'copy_subdirs', 'relocate_scripts', 'rewrite_paths', 'write_output')
 
-    def generate_output_content(self, skill_name: str, files_dict: Dict[str, Any],
-                               categorized: Dict[str, List[Path]],
-                               metadata: Dict[str, str]) -> str:
-        """
-        Generate final output markdown content from categorized files.
+    def __init__(self, metrics: Dict[str, Dict[str, float]]):
+        """Initialize the timer.
 
         Args:
-            skill_name: Name of the skill
-            files_dict: Dictionary from discover_files()
-            categorized: Dictionary from categorize_content_files()
-            metadata: YAML front matter metadata
-
-        Returns:
-            Complete markdown content string
+            metrics: Dictionary that phase totals are added to
         """
-        print(f"\n  Generating output content for {skill_name}...")
+        self.metrics = metrics
+        self._phase: Optional[str] = None
+        self._started = 0.0
+        self._io_started = (0, 0, 0)
+
+    def begin(self, phase: str) -> None:
+        """End the current phase (if any) and start timing a new one."""
+        self.end()
+        self._phase = phase
+        self._io_started = io_counters()
+        self._started = time.perf_counter()
+
+    def end(self) -> None:
+        """Add the current phase's time and I/O to metrics (no-op if idle)."""
+        if self._phase is None:
+            return
 
-        # ========================================
-        # 0. Use fallback metadata if needed
-        # ========================================
-        # Check if we need to generate fallback for any missing fields
-        needs_fallback = (
-            not metadata or
-            'description' not in metadata or
-            'argument-hint' not in metadata
-        )
+        elapsed = time.perf_counter() - self._started
+        bytes_read, bytes_written, files = io_counters()
+        entry = self.metrics.setdefault(self._phase, {
+            'seconds': 0.0, 'bytes_read': 0, 'bytes_written': 0, 'files': 0
+        })
+        entry['seconds'] += elapsed
+        entry['bytes_read'] += bytes_read - self._io_started[0]
+        entry['bytes_written'] += bytes_written - self._io_started[1]
+        entry['files'] += files - self._io_started[2]
+        self._phase = None
 
-        if needs_fallback:
-            print("    Metadata incomplete - using fallback for missing fields...")
-            fallback = self.generate_fallback_metadata(skill_name, files_dict)
 
-            # Merge fallback with existing metadata
-            if not metadata:
-                metadata = fallback
-            else:
-                # Only fill in missing fields
-                if 'description' not in metadata:
-                    metadata['description'] = fallback['description']
-                if 'argument-hint' not in metadata:
-                    metadata['argument-hint'] = fallback['argument-hint']
+@dataclass
+class ProcessingResult:
+    """Result of processing a single skill directory.
 
-        output_lines = []
+    This dataclass captures the complete outcome of converting a single skill
+    directory into a command markdown file. It tracks both successful operations
+    and any errors encountered during processing.
 
-        # ========================================
-        # 1. Build YAML front matter
-        # ========================================
-        print("    Building YAML front matter...")
-        output_lines.append("---")
+    Attributes:
+        skill_name: Name of the skill directory being processed (e.g., "algorithmic-art").
+                   This is the directory name, not the full path.
 
-        # Add description (required - now guaranteed to exist)
-        output_lines.append(f"description: {metadata['description']}")
+        status: Processing outcome indicator. Must be one of:
+               - "SUCCESS": All files processed without errors, output file created
+               - "PARTIAL_SUCCESS": Output file created but some non-critical errors occurred
+               - "FAILED": Processing failed, no output file created or unusable output
+               - "UP_TO_DATE": Inputs unchanged since the last run (per the manifest),
+                               existing output kept and processing skipped
 
-        # Add argument-hint if present
-        if "argument-hint" in metadata:
-            output_lines.append(f"argument-hint: {metadata['argument-hint']}")
+        output_file: Absolute path to the generated command markdown file.
+                    None if processing failed before file creation.
 
-        output_lines.append("---")
-        output_lines.append("")  # Blank line after front matter
+        files_processed: List of relative paths (from skill directory root) of all files
+                        that were successfully read and included in the output.
+                        Includes markdown files, code files, and configuration files.
 
-        # ========================================
-        # 2. Extract summary from SKILL.md
-        # ========================================
-        print("    Extracting summary from SKILL.md...")
-        if files_dict.get("skill_md"):
-            skill_md_content = self.read_file_with_retry(files_dict["skill_md"])
-            if skill_md_content:
-                summary = self._extract_summary_from_skill_md(skill_md_content)
-                if summary:
-                    output_lines.append(summary)
-                    output_lines.append("")
+        errors: List of error messages encountered during processing.
+               Empty list indicates no errors. Errors may include:
+               - File read failures (encoding issues, permissions, not found)
+               - Parsing errors (malformed YAML/JSON)
+               - Template processing errors
+               - File write failures
 
-        # ========================================
-        # 3. Generate Step sections from reference files
-        # ========================================
-        print("    Generating Step sections from reference files...")
-        reference_files = categorized.get('reference', [])
+        notes: List of informational messages about the processing.
+              Used for warnings, skipped files, fallback operations, etc.
+              Examples: "Skipped binary file: image.png", "Using regex fallback for YAML"
 
-        # Filter out SKILL.md from reference files
-        reference_files = [f for f in reference_files if f != files_dict.get("skill_md")]
+        retry_count: Number of retry attempts made during processing.
+                    0 indicates successful first attempt.
+                    Used to track reliability and identify problematic skills.
 
-        if reference_files:
-            step_num = 1
-            for ref_file in reference_files:
-                ref_content = self.read_file_with_retry(ref_file)
-                if ref_content:
-                    # Generate step section
-                    step_section = self._generate_step_section(step_num, ref_file, ref_content)
-                    if step_section:
-                        output_lines.append(step_section)
-                        output_lines.append("")
-                        step_num += 1
+        transformation_mode: The transformation mode detected for this skill.
+                           One of: DIRECTORY_WITH_SUBDIRS, DIRECTORY_WITH_SCRIPTS, SINGLE_FILE.
+                           None if mode detection was not performed.
 
-        # ========================================
-        # 4. Generate Examples section
-        # ========================================
-        print("    Generating Examples section...")
-        examples_files = categorized.get('examples', [])
-        themes_files = categorized.get('themes', [])
+        markdown_files_merged: Number of markdown files that were merged together.
+                             0 for skills with only SKILL.md, >1 for skills with multiple .md files.
 
-        if examples_files or themes_files:
-            output_lines.append("## Examples")
-            output_lines.append("")
+        subdirectories_copied: Number of subdirectories that were preserved and copied.
+                             Only applicable for DIRECTORY_WITH_SUBDIRS mode.
 
-            # Add examples
-            for example_file in examples_files:
-                example_content = self.read_file_with_retry(example_file)
-                if example_content:
-                    example_section = self._generate_example_section(example_file, example_content)
-                    if example_section:
-                        output_lines.append(example_section)
-                        output_lines.append("")
+        scripts_relocated: Number of root-level scripts that were relocated to skill subdirectory.
+                         Only applicable for DIRECTORY_WITH_SCRIPTS mode.
 
-            # Add themes
-            for theme_file in themes_files:
-                theme_content = self.read_file_with_retry(theme_file)
-                if theme_content:
-                    theme_section = self._generate_theme_section(theme_file, theme_content)
-                    if theme_section:
-                        output_lines.append(theme_section)
-                        output_lines.append("")
+        path_updates_count: Number of path references updated in markdown after script relocation.
+                          0 if no scripts were relocated or no paths needed updating.
 
-        # ========================================
-        # 5. Generate code blocks from code files
-        # ========================================
-        print("    Generating code blocks from code files...")
-        code_files = categorized.get('code', [])
+        path_update_details: List of specific path updates made (e.g., "./setup.sh → ./skill/setup.sh").
+                           Empty list if no path updates were made.
 
-        if code_files:
-            # Add code files as a section if there are standalone code files
-            # that weren't already included in steps or examples
-            for code_file in code_files:
-                code_content = self.read_file_with_retry(code_file)
-                if code_content:
-                    code_block = self._generate_code_block(code_file, code_content)
-                    if code_block:
-                        output_lines.append(code_block)
-                        output_lines.append("")
+        phase_metrics: Wall time and I/O per processing phase, in the order the
+                      phases ran (see PhaseTimer). Phases include scan, hash,
+                      mode_detection, discover, merge, copy_subdirs,
+                      relocate_scripts, rewrite_paths and write_output.
+    """
+    skill_name: str
+    status: str
+    output_file: Optional[str]
+    files_processed: List[str]
+    errors: List[str]
+    notes: List[str]
+    retry_count: int
+    transformation_mode: Optional[str] = None
+    markdown_files_merged: int = 0
+    subdirectories_copied: int = 0
+    scripts_relocated: int = 0
+    path_updates_count: int = 0
+    path_update_details: List[str] = field(default_factory=list)
+    phase_metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
-        # ========================================
-        # 6. Add Usage section
-        # ========================================
-        print("    Adding Usage section...")
-        usage_section = self._generate_usage_section(skill_name, metadata)
-        output_lines.append(usage_section)
-        output_lines.append("")
 
-        # ========================================
-        # 7. Join and return
-        # ========================================
-        result = "\n".join(output_lines)
-        print(f"    Generated {len(result)} characters of content")
+@dataclass
+class ConversionReport:
+    """Final report for entire conversion process.
 
-        return result
+    This dataclass aggregates results from all skill directory conversions
+    and provides summary statistics for the entire batch operation. Used
+    for final reporting and logging.
 
-    def _extract_summary_from_skill_md(self, content: str) -> Optional[str]:
-        """
-        Extract the summary paragraph from SKILL.md.
+    Attributes:
+        total_skills: Total number of skill directories discovered and queued
+                     for processing. This is the count of all subdirectories
+                     found in the skills/ input directory.
 
-        The summary is the first substantial paragraph after the YAML front matter
-        and any headers.
+        successful: Count of skills that completed with status="SUCCESS".
+                   These skills were fully processed without any errors.
 
-        Args:
-            content: Content of SKILL.md
+        partial_success: Count of skills that completed with status="PARTIAL_SUCCESS".
+                        These skills produced output but encountered some non-critical
+                        errors (e.g., skipped files, encoding warnings).
 
-        Returns:
-            Summary paragraph as a string, or None if not found
-        """
-        # Reuse the generic paragraph extraction method
-        return self._extract_first_paragraph_from_markdown(content)
+        failed: Count of skills that completed with status="FAILED".
+               These skills did not produce usable output files due to
+               critical errors during processing.
 
-    def _generate_step_section(self, step_num: int, file_path: Path, content: str) -> Optional[str]:
-        """
-        Generate a Step section from a reference file.
+        total_files_processed: Sum of all files successfully processed across
+                              all skills. Counts individual files that were
+                              read and included in command outputs.
 
-        Args:
-            step_num: Step number (1, 2, 3, ...)
-            file_path: Path to the reference file
-            content: Content of the reference file
+        total_errors: Sum of all errors encountered across all skills.
+                     Calculated from len(result.errors) for each result.
+                     High error count indicates systematic issues.
 
-        Returns:
-            Step section as markdown string
-        """
-        # Generate step title from filename
-        filename = file_path.stem  # Get filename without extension
+        total_retries: Sum of all retry attempts across all skills.
+                      Calculated from result.retry_count for each result.
+                      High retry count indicates reliability issues.
 
-        # Convert filename to title (e.g., "mcp_best_practices" -> "MCP Best Practices")
-        title = filename.replace('_', ' ').replace('-', ' ').title()
+        results: List of ProcessingResult objects, one per skill directory.
+                Ordered by processing sequence. Used for detailed reporting
+                and debugging. Allows inspection of individual skill outcomes.
 
-        # Build step header
-        step_header = f"## Step {step_num}: {title}"
+        up_to_date: Count of skills that completed with status="UP_TO_DATE".
+                   These skills were unchanged since the previous run and
+                   were skipped using the incremental manifest.
 
-        # Remove any YAML front matter from content
-        content = content.lstrip()
-        if content.startswith('---'):
-            lines = content.split('\n')
-            closing_idx = -1
-            for i in range(1, len(lines)):
-                if lines[i].strip() == '---':
-                    closing_idx = i
-                    break
+        dedup_stats: BlobStore.scan_usage() result when assets were placed
+                    with --link-mode dedup, otherwise None. saved_bytes is
+                    the disk space avoided by sharing identical files.
 
-            if closing_idx > 0:
-                content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+        frontmatter_stats: FrontmatterParser.get_stats() for the run - blocks
+                          parsed, cache hits, fast path / PyYAML / regex
+                          counts and total parse time. None if not collected.
 
-        # Remove the first # header if it exists (since we're adding our own header)
-        lines = content.split('\n')
-        if lines and lines[0].strip().startswith('# '):
-            content = '\n'.join(lines[1:]).lstrip()
+        phase_totals: Per-phase metrics summed over all results (see
+                     ProcessingResult.phase_metrics), in PhaseTimer.PHASES order.
 
-        return f"{step_header}\n\n{content}"
+        elapsed_seconds: Wall time of the whole run, including discovery and
+                        saving the manifest.
+    """
+    total_skills: int
+    successful: int
+    partial_success: int
+    failed: int
+    total_files_processed: int
+    total_errors: int
+    total_retries: int
+    results: List[ProcessingResult]
+    up_to_date: int = 0
+    dedup_stats: Optional[Dict[str, int]] = None
+    frontmatter_stats: Optional[Dict[str, Any]] = None
+    phase_totals: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
 
-    def _generate_example_section(self, file_path: Path, content: str) -> Optional[str]:
-        """
-        Generate an example subsection from an example file.
 
-        Args:
-            file_path: Path to the example file
-            content: Content of the example file
+@dataclass
+class SkillPlan:
+    """Planned conversion of a single skill directory (--plan dry run).
 
-        Returns:
-            Example subsection as markdown string
-        """
-        # For markdown files, include the content directly
-        if file_path.suffix.lower() in MARKDOWN_EXTENSIONS:
-            # Remove any YAML front matter
+    Produced by SkillConverter.plan_skill(), which runs mode detection,
+    discovery, merging and path rewriting in memory and only inspects the
+    output directory - nothing is written.
+
+    Attributes:
+        skill_name: Name of the skill directory
+        action: "CONVERT", "UP_TO_DATE" (inputs unchanged per the manifest,
+                the run would skip it) or "FAILED" (the run would fail)
+        transformation_mode: Detected TransformationMode value
+        output_file: Output filename the run would write (after conflict
+                     resolution)
+        markdown_files: Relative paths of the markdown files to merge,
+                        primary SKILL.md first
+        output_bytes: Size of the merged output markdown in bytes
+        asset_dir: Asset directory name in OUTPUT_DIR, or None if the skill
+                   has no subdirectories or scripts to place
+        subdirectories: Subdirectories that would be preserved
+        scripts: Root-level scripts that would be relocated
+        asset_files: Asset files that would be present in asset_dir
+        asset_bytes: Total size of those files
+        unchanged_assets: ...of which are already up to date in OUTPUT_DIR
+        linked_assets: ...of which would be hard or symbolic links
+        excluded_files: Entries left out by the copy exclusion rules
+        path_rewrites: Script path references that would be rewritten
+        bytes_read: Estimated input bytes read by the conversion
+        bytes_written: Estimated bytes written to OUTPUT_DIR
+        errors: Problems found while planning
+    """
+    skill_name: str
+    action: str = "CONVERT"
+    transformation_mode: Optional[str] = None
+    output_file: Optional[str] = None
+    markdown_files: List[str] = field(default_factory=list)
+    output_bytes: int = 0
+    asset_dir: Optional[str] = None
+    subdirectories: List[str] = field(default_factory=list)
+    scripts: List[str] = field(default_factory=list)
+    asset_files: int = 0
+    asset_bytes: int = 0
+    unchanged_assets: int = 0
+    linked_assets: int = 0
+    excluded_files: int = 0
+    path_rewrites: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ConversionPlan:
+    """Dry-run plan for a whole conversion (see SkillConverter.plan()).
+
+    Attributes:
+        skills: One SkillPlan per discovered skill, in processing order
+        elapsed_seconds: Time taken to build the plan
+    """
+    skills: List[SkillPlan]
+    elapsed_seconds: float = 0.0
+
+    def count(self, action: str) -> int:
+        """Return the number of skills with the given action."""
+        return sum(1 for skill in self.skills if skill.action == action)
+
+    def total(self, attribute: str) -> int:
+        """Return the sum of a numeric SkillPlan attribute over all skills."""
+        return sum(getattr(skill, attribute) for skill in self.skills)
+
+
+@dataclass
+class ConversionOutput:
+    """Result of converting one skill held in memory (see convert_skill()).
+
+    Attributes:
+        skill_name: Name of the skill
+        transformation_mode: Detected TransformationMode value
+        output_file: Name of the command file (e.g., "docx.md")
+        content: Merged and path-rewritten command markdown
+        assets: Asset files keyed by their path relative to the output
+                directory (e.g., "docx/scripts/pack.py"), in sorted order
+        executable: Keys of assets (and the command file) that carry an
+                    executable bit
+        markdown_files: Relative paths of the merged markdown files,
+                        primary SKILL.md first
+        scripts_relocated: Root-level scripts moved into the asset directory
+        path_updates_count: Script path references rewritten in content
+        errors: Problems found during conversion (the output is still
+                returned, as a disk run would still write it)
+    """
+    skill_name: str
+    transformation_mode: str
+    output_file: str
+    content: str = ""
+    assets: Dict[str, bytes] = field(default_factory=dict)
+    executable: Set[str] = field(default_factory=set)
+    markdown_files: List[str] = field(default_factory=list)
+    scripts_relocated: int = 0
+    path_updates_count: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def files(self) -> Dict[str, bytes]:
+        """Every output file keyed by relative path, command file first."""
+        return {self.output_file: self.content.encode('utf-8'), **self.assets}
+
+
+# ============================================================================
+# Utility Functions
+# ============================================================================
+
+# Encodings tried in order when the data is not UTF-8 and chardet is
+# unavailable or unsure (latin-1 accepts any byte sequence)
+FALLBACK_ENCODINGS = ['utf-8', 'latin-1', 'cp1252']
+
+# Decoded file cache: (path, size, mtime_ns) -> (text, encoding), LRU order
+_read_cache: "OrderedDict[tuple, tuple[str, str]]" = OrderedDict()
+_read_cache_bytes = 0
+_read_cache_lock = threading.Lock()
+
+# Per-thread I/O totals read by PhaseTimer; each skill is converted on a
+# single thread, so the difference across a phase belongs to that skill
+_io_local = threading.local()
+
+
+def _record_io(bytes_read: int = 0, bytes_written: int = 0, files: int = 1) -> None:
+    """Add file I/O performed by the current thread to its counters.
+
+    Args:
+        bytes_read: Bytes read from source files
+        bytes_written: Bytes written to output files
+        files: Files opened, created or linked
+    """
+    _io_local.bytes_read = getattr(_io_local, 'bytes_read', 0) + bytes_read
+    _io_local.bytes_written = getattr(_io_local, 'bytes_written', 0) + bytes_written
+    _io_local.files = getattr(_io_local, 'files', 0) + files
+
+
+def io_counters() -> tuple:
+    """Return (bytes_read, bytes_written, files) recorded on the current thread."""
+    return (getattr(_io_local, 'bytes_read', 0),
+            getattr(_io_local, 'bytes_written', 0),
+            getattr(_io_local, 'files', 0))
+
+
+def _detect_encoding_from_bytes(sample: bytes, complete: bool = False) -> str:
+    """Guess the encoding of a byte sample.
+
+    Args:
+        sample: Raw bytes, usually the first ENCODING_SNIFF_BYTES of a file
+        complete: True if sample is the whole file (a multi-byte character
+                  cut off at the end is then an error rather than truncation)
+
+    Returns:
+        Encoding name; 'utf-8' if the sample is valid UTF-8
+
+    Notes:
+        - The UTF-8 check runs first: it is a single C-level decode and
+          covers nearly every file in a skill directory
+        - chardet (if installed) then sees only the sample, never the whole
+          file, and is trusted above 0.7 confidence
+        - Otherwise FALLBACK_ENCODINGS are tried on the sample
+    """
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=complete)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    chardet = _get_chardet()
+    if chardet is not None:
+        try:
+            detected = chardet.detect(sample)
+            if detected and detected['encoding'] and detected.get('confidence', 0) > 0.7:
+                return detected['encoding']
+        except Exception:
+            # If chardet fails, fall through to manual detection
+            pass
+
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            sample.decode(encoding)
+            return encoding
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    return 'utf-8'
+
+
+def detect_encoding(file_path: Path) -> str:
+    """Detect the encoding of a file.
+
+    Reads at most ENCODING_SNIFF_BYTES from the start of the file and checks
+    them for UTF-8 validity first. Otherwise uses chardet if available, then
+    tries common encodings in sequence: UTF-8, Latin-1, CP1252.
+
+    Args:
+        file_path: Path to the file to analyze.
+
+    Returns:
+        Detected encoding name as a string. Returns 'utf-8' as fallback
+        if detection fails.
+
+    Notes:
+        - chardet provides better accuracy but is optional
+        - Fallback sequence covers most Western text files
+        - Always returns a valid encoding name
+        - safe_read_file() does not call this; it sniffs the bytes it has
+          already read instead of opening the file again
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            sample = f.read(ENCODING_SNIFF_BYTES + 1)
+    except OSError:
+        return 'utf-8'
+
+    complete = len(sample) <= ENCODING_SNIFF_BYTES
+    return _detect_encoding_from_bytes(sample[:ENCODING_SNIFF_BYTES], complete)
+
+
+def decode_text(data: bytes) -> tuple[str, str]:
+    """Decode file contents the way every reader in the converter does.
+
+    A strict UTF-8 decode is tried first; if that fails, the encoding is
+    detected from the first ENCODING_SNIFF_BYTES and the data is decoded
+    with errors='replace'.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Tuple of (text, encoding). encoding is 'utf-8' only if the whole
+        buffer is valid UTF-8. Line endings are normalized to '\\n'.
+    """
+    try:
+        result = (data.decode('utf-8'), 'utf-8')
+    except UnicodeDecodeError:
+        encoding = _detect_encoding_from_bytes(data[:ENCODING_SNIFF_BYTES],
+                                               len(data) <= ENCODING_SNIFF_BYTES)
+        try:
+            result = (data.decode(encoding, errors='replace'), encoding)
+        except LookupError:
+            result = (data.decode('utf-8', errors='replace'), 'utf-8')
+
+    # Universal newlines, as open(..., 'r') would have produced
+    if '\r' in result[0]:
+        result = (result[0].replace('\r\n', '\n').replace('\r', '\n'), result[1])
+
+    return result
+
+
+def read_text_cached(file_path: Path, store: bool = True) -> tuple[str, str]:
+    """Read and decode a file with a single read, memoizing the result.
+
+    The file is read into memory once and decoded with decode_text().
+    Results are cached per (path, size, mtime_ns), so reading the same
+    unchanged file again in one run costs a single stat().
+
+    Args:
+        file_path: Path to the file to read.
+        store: Add the result to the cache. Pass False for files that are
+               read exactly once (e.g., when streaming output), so they do
+               not occupy memory for the rest of the run.
+
+    Returns:
+        Tuple of (text, encoding). encoding is 'utf-8' only if the whole file
+        is valid UTF-8. Line endings are normalized to '\\n'.
+
+    Raises:
+        OSError: If the file cannot be stat()ed or read (FileNotFoundError,
+                 PermissionError, IsADirectoryError, ...)
+
+    Notes:
+        - Thread-safe; cache size is bounded by READ_CACHE_MAX_BYTES
+          (least recently used entries are evicted first)
+    """
+    global _read_cache_bytes
+
+    st = os.stat(file_path)
+    key = (os.fspath(file_path), st.st_size, st.st_mtime_ns)
+
+    with _read_cache_lock:
+        cached = _read_cache.get(key)
+        if cached is not None:
+            _read_cache.move_to_end(key)
+            return cached
+
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    _record_io(bytes_read=len(data))
+
+    result = decode_text(data)
+
+    entry_bytes = len(data)
+    if store and entry_bytes <= READ_CACHE_MAX_BYTES:
+        with _read_cache_lock:
+            if key not in _read_cache:
+                _read_cache[key] = result
+                _read_cache_bytes += entry_bytes
+                while _read_cache_bytes > READ_CACHE_MAX_BYTES:
+                    (_, old_size, _), _ = _read_cache.popitem(last=False)
+                    _read_cache_bytes -= old_size
+
+    return result
+
+
+def clear_read_cache() -> None:
+    """Drop all memoized file contents (see read_text_cached)."""
+    global _read_cache_bytes
+
+    with _read_cache_lock:
+        _read_cache.clear()
+        _read_cache_bytes = 0
+
+
+def safe_read_file(file_path: Path, retry: bool = True) -> Optional[str]:
+    """Safely read a file with automatic encoding detection and retry logic.
+
+    Reads the file once and decodes it using the detected encoding (see
+    read_text_cached). Implements retry logic for transient failures like
+    temporary permission issues or locks.
+
+    Args:
+        file_path: Path to the file to read.
+        retry: If True, retry once after 0.5s wait on failure. Default: True.
+
+    Returns:
+        File contents as a string, or None if reading fails.
+
+    Error Handling:
+        - FileNotFoundError: Returns None, logs warning (no retry)
+        - PermissionError: Retries if retry=True, returns None on final failure
+        - UnicodeDecodeError: Returns None with error logging (no retry)
+        - Other exceptions: Retries if retry=True, returns None on final failure
+
+    Notes:
+        - Encoding is detected from the bytes already read (UTF-8 first,
+          then chardet / fallbacks on a bounded prefix)
+        - Repeated reads of an unchanged file are served from memory
+        - Uses retry_operation() for consistent retry behavior
+        - Retry delay is RETRY_WAIT_TIME (0.5 seconds)
+        - Maximum of 1 retry attempt (2 total attempts)
+    """
+    def _attempt_read() -> str:
+        """Internal function to attempt file read."""
+        content, _encoding = read_text_cached(file_path)
+        return content
+
+    # Try to read the file - handle non-retryable errors first
+    try:
+        # Use retry_operation if retry is enabled
+        if retry:
+            return retry_operation(
+                _attempt_read,
+                operation_name=f"read {file_path.name}",
+                max_retries=MAX_RETRIES,
+                delay=RETRY_WAIT_TIME
+            )
+        else:
+            return _attempt_read()
+
+    except FileNotFoundError:
+        console.warning(f"WARNING: File not found: {file_path}")
+        return None
+
+    except UnicodeDecodeError as e:
+        console.error(f"ERROR: Unicode decode error for {file_path.name}: {e}")
+        return None
+
+    except Exception as e:
+        # All other errors (including retry exhaustion)
+        console.error(f"ERROR: Failed to read {file_path.name}: {e}")
+        return None
+
+
+def should_exclude_file(file_path: Path, file_size: Optional[int] = None) -> bool:
+    """Check if a file should be excluded from processing.
+
+    Applies exclusion rules based on:
+    - Filename patterns (LICENSE.txt, *.bak, etc.)
+    - File extensions (binary files)
+    - File size limits
+
+    Args:
+        file_path: Path to the file to check.
+        file_size: Size in bytes if already known (e.g., from a SkillTree
+                   node); avoids an extra stat() call.
+
+    Returns:
+        True if file should be excluded, False if it should be processed.
+
+    Exclusion Rules:
+        1. Files matching EXCLUDE_FILES patterns
+        2. Files with BINARY_EXTENSIONS
+        3. Files exceeding MAX_FILE_SIZE_BYTES
+        4. Files in directories matching EXCLUDE_DIRS (checked separately)
+
+    Notes:
+        - Case-insensitive filename matching
+        - Uses glob-style pattern matching for EXCLUDE_FILES
+        - Multi-part extensions (.tar.gz) are matched as a whole
+        - Rules are precompiled in DISCOVERY_FILE_EXCLUSIONS
+        - Size check prevents processing huge files
+    """
+    filename = file_path.name
+
+    # Excluded names, patterns and binary extensions in one compiled check
+    if DISCOVERY_FILE_EXCLUSIONS.matches(filename):
+        return True
+
+    # Check file size
+    try:
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        if file_size > MAX_FILE_SIZE_BYTES:
+            console.warning(f"WARNING: Excluding {filename} - exceeds size limit ({file_size / (1024*1024):.1f} MB)")
+            return True
+
+        # Also exclude empty files
+        if file_size == 0:
+            return True
+    except Exception as e:
+        # If we can't get file size, exclude it to be safe
+        console.warning(f"WARNING: Cannot stat {filename}: {e}")
+        return True
+
+    return False
+
+
+def should_exclude_dir(dir_name: str) -> bool:
+    """Check if a directory should be excluded from processing.
+
+    Checks directory name against EXCLUDE_DIRS patterns.
+
+    Args:
+        dir_name: Name of the directory (not full path, just the directory name).
+
+    Returns:
+        True if directory should be excluded, False if it should be processed.
+
+    Exclusion Rules:
+        - Directories matching EXCLUDE_DIRS patterns
+        - Case-insensitive matching
+
+    Notes:
+        - Used during recursive file discovery
+        - Helps skip irrelevant directories like __pycache__, .git, scripts/
+    """
+    return DISCOVERY_DIR_EXCLUSIONS.matches(dir_name)
+
+
+def get_language_hint(file_path: Path) -> str:
+    """Get syntax highlighting language hint for a file.
+
+    Maps file extensions to language identifiers used in markdown
+    code blocks for syntax highlighting.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Language identifier string (e.g., 'python', 'javascript', 'bash').
+        Returns empty string if no specific language mapping exists.
+
+    Language Mappings:
+        - .py → python
+        - .js, .jsx → javascript
+        - .ts, .tsx → typescript
+        - .sh, .bash → bash
+        - .json → json
+        - .yaml, .yml → yaml
+        - .xml → xml
+        - .md, .markdown → markdown
+        - And more...
+
+    Notes:
+        - Used when creating code blocks in output markdown
+        - Enables proper syntax highlighting in rendered markdown
+        - Empty string is valid (renders as plain text)
+    """
+    # Get file extension (lowercase, without the dot)
+    extension = file_path.suffix.lower()
+
+    # Map extensions to language identifiers
+    language_map = {
+        # Programming languages
+        '.py': 'python',
+        '.js': 'javascript',
+        '.jsx': 'javascript',
+        '.ts': 'typescript',
+        '.tsx': 'typescript',
+        '.java': 'java',
+        '.c': 'c',
+        '.cpp': 'cpp',
+        '.cc': 'cpp',
+        '.cxx': 'cpp',
+        '.h': 'c',
+        '.hpp': 'cpp',
+        '.cs': 'csharp',
+        '.rb': 'ruby',
+        '.go': 'go',
+        '.rs': 'rust',
+        '.php': 'php',
+        '.swift': 'swift',
+        '.kt': 'kotlin',
+        '.scala': 'scala',
+
+        # Shell scripts
+        '.sh': 'bash',
+        '.bash': 'bash',
+        '.zsh': 'bash',
+        '.fish': 'fish',
+
+        # Web technologies
+        '.html': 'html',
+        '.htm': 'html',
+        '.css': 'css',
+        '.scss': 'scss',
+        '.sass': 'sass',
+        '.less': 'less',
+
+        # Data formats
+        '.json': 'json',
+        '.yaml': 'yaml',
+        '.yml': 'yaml',
+        '.toml': 'toml',
+        '.xml': 'xml',
+        '.csv': 'csv',
+
+        # Markup
+        '.md': 'markdown',
+        '.markdown': 'markdown',
+        '.rst': 'rst',
+
+        # Configuration
+        '.ini': 'ini',
+        '.cfg': 'ini',
+        '.conf': 'conf',
+
+        # Other
+        '.sql': 'sql',
+        '.txt': 'text',
+    }
+
+    # Return mapped language or empty string
+    return language_map.get(extension, '')
+
+
+# Errors from the fast copy/link paths that only mean "not possible here"
+# (unsupported filesystem, cross-device, sandboxed syscall, ...); the next,
+# more portable strategy is tried instead
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP,
+    errno.ENOTTY, errno.EBADF, errno.EPERM, errno.EACCES, errno.EMLINK,
+})
+
+
+def _target_mode(src_node: TreeNode) -> int:
+    """Permission bits a copied file should get (executables stay executable for all)."""
+    mode = stat.S_IMODE(src_node.mode)
+    if src_node.is_executable():
+        mode |= stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+    return mode
+
+
+def _is_materialized(src: Path, dest: Path, dest_st: os.stat_result,
+                     src_node: TreeNode, link_mode: str) -> bool:
+    """Check whether an existing destination entry already matches its source.
+
+    Args:
+        src: Source file path
+        dest: Existing destination path
+        dest_st: lstat() result for dest
+        src_node: Stat data of the source file
+        link_mode: One of LINK_MODES
+
+    Returns:
+        True if dest can be kept as-is
+    """
+    if link_mode == 'symlink':
+        return stat.S_ISLNK(dest_st.st_mode) and os.readlink(dest) == os.path.abspath(src)
+
+    if not stat.S_ISREG(dest_st.st_mode):
+        return False
+
+    same_inode = (dest_st.st_dev, dest_st.st_ino) == (src_node.device, src_node.inode)
+    if link_mode == 'hardlink':
+        if same_inode:
+            return True
+        if dest_st.st_dev == src_node.device:
+            # Linking is possible, so an old copy gets replaced by a link
+            return False
+    else:
+        links = dest_st.st_nlink
+        if (dest_st.st_dev, dest_st.st_ino) in _STAGED_INODES:
+            # The staging mirror's own link; writers replace files rather
+            # than write through it, so it does not make the file shared
+            links -= 1
+        if same_inode or links > 1:
+            # A hard link left by an earlier hardlink/dedup run; writing to it
+            # would modify the skill source or a shared blob, so it is replaced
+            return False
+
+    return (dest_st.st_size == src_node.size
+            and dest_st.st_mtime_ns == src_node.mtime_ns
+            and stat.S_IMODE(dest_st.st_mode) == _target_mode(src_node))
+
+
+_libc = None
+
+
+def _libc_function(name: str):
+    """Return a function from the C library (through ctypes), or None.
+
+    The library is loaded on first use; None is returned on platforms
+    without a C library or when the function does not exist (e.g.,
+    renameat2() before glibc 2.28).
+    """
+    global _libc
+
+    import ctypes
+    import ctypes.util
+
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        except OSError:
+            _libc = False
+    if not _libc:
+        return None
+    return getattr(_libc, name, None)
+
+
+def _syncfs(path: Path) -> bool:
+    """Flush the whole filesystem holding path with one syncfs() call.
+
+    Returns:
+        True on success, False if syncfs() is unavailable or failed (the
+        caller then falls back to fsync())
+    """
+    syncfs = _libc_function('syncfs')
+    if syncfs is None:
+        return False
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        return syncfs(fd) == 0
+    finally:
+        os.close(fd)
+
+
+def _reflink_file(src: Path, dest: Path) -> bool:
+    """Clone src into dest with the FICLONE ioctl (btrfs, XFS, bcachefs, ...).
+
+    Returns:
+        True if dest now shares src's extents, False if cloning is not
+        supported here (dest is then left created but empty)
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            _record_io(files=2)
+            return True
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            return False
+
+
+def _copy_file_data(src: Path, dest: Path) -> None:
+    """Copy file contents using the fastest mechanism the platform offers.
+
+    Tries os.copy_file_range() (in-kernel copy, may share extents on CoW
+    filesystems or use server-side copy on NFS), then os.sendfile(), then a
+    buffered shutil.copyfileobj(). Each fallback resumes at the offset the
+    previous strategy reached.
+
+    Raises:
+        OSError: If the file cannot be read or written
+    """
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        offset = 0
+
+        size = os.fstat(infd).st_size
+        _record_io(bytes_read=size, bytes_written=size, files=2)
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while True:
+                    copied = os.copy_file_range(infd, outfd, COPY_CHUNK_SIZE, offset, offset)
+                    if copied == 0:
+                        return
+                    offset += copied
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+        if hasattr(os, 'sendfile'):
+            try:
+                os.lseek(outfd, offset, os.SEEK_SET)
+                while True:
+                    copied = os.sendfile(outfd, infd, offset, COPY_CHUNK_SIZE)
+                    if copied == 0:
+                        return
+                    offset += copied
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+        import shutil
+
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        shutil.copyfileobj(fsrc, fdst)
+
+
+def materialize_file(src: Path, dest: Path, src_node: TreeNode,
+                     link_mode: str = 'copy',
+                     blob_store: Optional[BlobStore] = None) -> str:
+    """Place a source file at dest according to link_mode.
+
+    Link modes:
+        copy:     Kernel-side data copy (copy_file_range -> sendfile -> read/write)
+        reflink:  Copy-on-write clone via FICLONE, falling back to copy
+        hardlink: os.link() to the source, falling back to copy (e.g., across
+                  filesystems). The link shares the source's mode and mtime.
+        symlink:  Absolute symbolic link to the source
+        dedup:    Hard link to the file's blob in blob_store (see BlobStore)
+
+    An existing destination that already matches is left untouched: for
+    copies, the same size, mtime and permission bits; for links, the same
+    target. Anything else at dest is unlinked first, so writes never go
+    through a link back into the skill sources.
+
+    Args:
+        src: Source file path
+        dest: Destination file path
+        src_node: Stat data for src (from SkillTree.scan() or TreeNode.from_path())
+        link_mode: One of LINK_MODES
+        blob_store: Store used by the dedup link mode
+
+    Returns:
+        "skipped" if dest was already up to date, "linked" if a hard or
+        symbolic link was created, "copied" if file data was written
+
+    Raises:
+        OSError: If dest cannot be created
+    """
+    if link_mode == 'dedup':
+        return blob_store.materialize(src_node, dest)
+
+    try:
+        dest_st = os.lstat(dest)
+    except FileNotFoundError:
+        dest_st = None
+
+    if dest_st is not None:
+        if _is_materialized(src, dest, dest_st, src_node, link_mode):
+            return "skipped"
+        os.unlink(dest)
+
+    if link_mode == 'hardlink':
+        try:
+            os.link(src, dest)
+            _record_io()
+            return "linked"
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    elif link_mode == 'symlink':
+        os.symlink(os.path.abspath(src), dest)
+        _record_io()
+        return "linked"
+
+    if not (link_mode == 'reflink' and _reflink_file(src, dest)):
+        _copy_file_data(src, dest)
+
+    os.chmod(dest, _target_mode(src_node))
+    os.utime(dest, ns=(src_node.mtime_ns, src_node.mtime_ns))
+    return "copied"
+
+
+def extract_file(tree: SkillTree, src_node: TreeNode, dest: Path) -> str:
+    """Stream a file of an archive (or in-memory) SkillTree to dest.
+
+    Member data goes straight from the decompressor into dest in
+    ARCHIVE_CHUNK_SIZE reads, without a temporary extracted copy.
+    There is no source file to link to, so every link mode copies; a
+    destination with the same size, mtime and permission bits is kept, as
+    materialize_file() does for copies.
+
+    Args:
+        tree: SkillTree holding src_node
+        src_node: File node of tree
+        dest: Destination file path
+
+    Returns:
+        "skipped" if dest was already up to date, "copied" otherwise
+
+    Raises:
+        OSError: If dest cannot be written
+    """
+    try:
+        dest_st = os.lstat(dest)
+    except FileNotFoundError:
+        dest_st = None
+
+    if dest_st is not None:
+        if _is_materialized(src_node.path, dest, dest_st, src_node, 'copy'):
+            return "skipped"
+        os.unlink(dest)
+
+    import shutil
+
+    with tree.open_file(src_node) as fsrc, open(dest, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, ARCHIVE_CHUNK_SIZE)
+    _record_io(bytes_written=src_node.size)
+
+    os.chmod(dest, _target_mode(src_node))
+    os.utime(dest, ns=(src_node.mtime_ns, src_node.mtime_ns))
+    return "copied"
+
+
+def plan_materialize(src: Path, dest: Path, src_node: TreeNode,
+                     link_mode: str = 'copy') -> str:
+    """Predict what materialize_file() would do, without touching dest.
+
+    Args:
+        src: Source file path
+        dest: Destination file path
+        src_node: Stat data for src
+        link_mode: One of LINK_MODES
+
+    Returns:
+        "skipped", "linked" or "copied", as materialize_file() would return
+
+    Notes:
+        - Only lstat()s dest; used by the --plan dry run
+        - Fallbacks are not predicted: hardlink and reflink are assumed to
+          succeed (a reflink is reported as "copied", since it writes a new
+          file), and dedup is reported as "linked" (data copied into the blob
+          store for new content is not counted)
+    """
+    if link_mode == 'dedup':
+        return "linked"
+
+    try:
+        dest_st = os.lstat(dest)
+    except FileNotFoundError:
+        dest_st = None
+
+    if dest_st is not None and _is_materialized(src, dest, dest_st, src_node, link_mode):
+        return "skipped"
+
+    if link_mode in ('hardlink', 'symlink'):
+        return "linked"
+    return "copied"
+
+
+def retry_operation(operation, operation_name: str = "operation",
+                   max_retries: int = MAX_RETRIES, delay: float = RETRY_WAIT_TIME) -> Any:
+    """
+    Retry an operation with delay between attempts.
+
+    Executes the given operation and retries it if it fails. Uses exponential
+    backoff or fixed delay between retries. Designed for transient failures
+    like network issues, file locks, or temporary permission errors.
+
+    Args:
+        operation: Callable (function or lambda) to execute. Should take no arguments.
+        operation_name: Human-readable name for logging (e.g., "read file X")
+        max_retries: Maximum number of retry attempts (default: MAX_RETRIES=1)
+        delay: Seconds to wait between retry attempts (default: RETRY_WAIT_TIME=0.5)
+
+    Returns:
+        The result of the operation if successful
+
+    Raises:
+        Exception: If all attempts fail, raises the last exception encountered
+
+    Example:
+        >>> result = retry_operation(
+        ...     lambda: file_path.read_text(),
+        ...     operation_name="read config.json",
+        ...     max_retries=1,
+        ...     delay=0.5
+        ... )
+
+    Notes:
+        - Logs retry attempts to stdout
+        - First attempt is not counted as a retry
+        - Logs success if retry succeeds
+        - Total attempts = max_retries + 1 (initial attempt + retries)
+    """
+    attempt = 0
+    last_error = None
+
+    while attempt <= max_retries:
+        try:
+            # Execute the operation
+            result = operation()
+
+            # Log success on retry
+            if attempt > 0:
+                console.info(f"    ✓ Retry #{attempt} succeeded for {operation_name}")
+
+            return result
+
+        except Exception as e:
+            # Store error and increment attempt counter
+            last_error = e
+            attempt += 1
+
+            # If we have retries left, log and wait
+            if attempt <= max_retries:
+                console.warning(f"    ⚠ Retry #{attempt} for {operation_name} after error: {str(e)[:80]}")
+                time.sleep(delay)
+            # Otherwise, we've exhausted retries (will raise below)
+
+    # All attempts failed - raise exception with details
+    total_attempts = max_retries + 1
+    error_msg = f"{operation_name} failed after {total_attempts} attempt(s)"
+    if last_error:
+        error_msg += f": {last_error}"
+
+    raise Exception(error_msg)
+
+
+# ============================================================================
+# Console Output
+# ============================================================================
+
+# Skill being converted on the current thread, attached to JSON log events
+_log_context = threading.local()
+
+
+class BufferedConsoleHandler(logging.Handler):
+    """Logging handler that batches formatted lines into few large writes.
+
+    A conversion logs several lines per file; writing and flushing each one
+    separately makes terminal I/O a visible share of runtime on large trees.
+    Lines are collected in memory and written in one call when the buffer
+    reaches LOG_BUFFER_BYTES, when LOG_FLUSH_INTERVAL has passed since the
+    last write, when a WARNING or higher arrives, or when flush() is called
+    (print_report(), watch mode and logging.shutdown() at exit do this).
+
+    Usage:
+        handler = BufferedConsoleHandler(sys.stdout)
+        console.addHandler(handler)
+        ...
+        handler.flush()
+    """
+
+    def __init__(self, stream=None, capacity: int = LOG_BUFFER_BYTES,
+                 interval: float = LOG_FLUSH_INTERVAL):
+        """Initialize the handler.
+
+        Args:
+            stream: Text stream to write to (default: sys.stdout at call time)
+            capacity: Buffered characters that trigger a write
+            interval: Seconds after which buffered lines are written on the
+                      next record, even if the buffer is not full
+        """
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stdout
+        self.capacity = capacity
+        self.interval = interval
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_write = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer one formatted record (called with the handler lock held)."""
+        try:
+            line = self.format(record) + '\n'
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._buffer.append(line)
+        self._buffered += len(line)
+
+        if (self._buffered >= self.capacity
+                or record.levelno >= logging.WARNING
+                or time.monotonic() - self._last_write >= self.interval):
+            self._write()
+
+    def _write(self) -> None:
+        """Write and clear the buffer (caller holds the handler lock)."""
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        if hasattr(self.stream, 'flush'):
+            self.stream.flush()
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        """Write everything buffered so far."""
+        self.acquire()
+        try:
+            self._write()
+        finally:
+            self.release()
+
+
+class JsonLinesHandler(logging.Handler):
+    """Logging handler that appends one JSON object per event to a file.
+
+    Each line holds the event time, level, logger name, thread, the skill
+    being converted on that thread (or null) and the message with its
+    surrounding whitespace removed, e.g.:
+
+        {"time": 1760000000.12, "level": "INFO", "logger": "...console",
+         "thread": "ThreadPoolExecutor-0_1", "skill": "docx",
+         "message": "✓ Merged 1 markdown files (1234 characters)"}
+
+    The file is written through a regular buffered stream and flushed on
+    close (logging.shutdown() closes handlers at exit).
+    """
+
+    def __init__(self, path: Path):
+        """Open (truncate) the event file.
+
+        Args:
+            path: Destination file for the JSON-lines events
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one event line."""
+        import json
+
+        try:
+            event = {
+                'time': round(record.created, 6),
+                'level': record.levelname,
+                'logger': record.name,
+                'thread': record.threadName,
+                'skill': getattr(_log_context, 'skill', None),
+                'message': record.getMessage().strip(),
+            }
+            self._file.write(json.dumps(event, ensure_ascii=False) + '\n')
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush buffered events to the file."""
+        self.acquire()
+        try:
+            if not self._file.closed:
+                self._file.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Flush and close the event file."""
+        self.acquire()
+        try:
+            if not self._file.closed:
+                self._file.close()
+        finally:
+            self.release()
+        super().close()
+
+
+def configure_console_output(quiet: bool = False, log_json: Optional[Path] = None,
+                             stream=None) -> None:
+    """Attach the CLI handlers to the converter's loggers.
+
+    Progress lines (the console logger) go to a BufferedConsoleHandler on
+    stdout; diagnostics (the module logger) keep the stderr handler that
+    logging.basicConfig() installs. With log_json, every event from both
+    loggers is also written to a JSON-lines file.
+
+    Args:
+        quiet: Only show warnings and errors (the final report is printed
+               regardless)
+        log_json: Optional path for the JSON-lines event stream
+        stream: Console stream (default: sys.stdout)
+
+    Raises:
+        OSError: If the JSON-lines file cannot be opened
+    """
+    for handler in list(console.handlers):
+        console.removeHandler(handler)
+        handler.close()
+
+    console_handler = BufferedConsoleHandler(stream)
+    console_handler.setLevel(logging.WARNING if quiet else logging.INFO)
+    console.addHandler(console_handler)
+
+    # In quiet mode without an event stream, skip building INFO records at all
+    console.setLevel(logging.WARNING if quiet and log_json is None else logging.INFO)
+
+    if log_json is not None:
+        json_handler = JsonLinesHandler(log_json)
+        console.addHandler(json_handler)
+        logger.addHandler(json_handler)
+
+
+def flush_console() -> None:
+    """Write out buffered progress lines (before printing directly to stdout)."""
+    for handler in console.handlers:
+        handler.flush()
+
+
+# ============================================================================
+# SkillConverter Class
+# ============================================================================
+
+class SkillConverter:
+    """Main converter class for processing skill directories into command files.
+
+    This class orchestrates the entire conversion process:
+    1. Discovers all skill directories in the input folder
+    2. Processes each skill directory individually
+    3. Generates output command markdown files
+    4. Tracks results and generates final reports
+
+    Attributes:
+        input_dir: Directory scanned for skill directories.
+        output_dir: Directory the command files and assets are written to
+                    (the staging directory while an --atomic run is active).
+        results: List of ProcessingResult objects tracking each skill conversion.
+        frontmatter_parser: FrontmatterParser shared with markdown_merger.
+        mode_detector: ModeDetector instance for detecting transformation modes.
+        markdown_merger: MarkdownMerger instance for merging markdown files.
+        subdirectory_preserver: SubdirectoryPreserver instance for copying subdirectories.
+        path_updater: PathUpdater instance for relocating scripts and updating paths.
+        jobs: Maximum number of skills converted concurrently (1 = serial).
+        force: If True, ignore the manifest and reconvert every skill.
+        link_mode: How assets are placed in output_dir (see LINK_MODES).
+        blob_store: BlobStore under output_dir for the dedup link mode, else None.
+        stream: If True, merged markdown is streamed to disk (see write_output_stream).
+        manifest: ConversionManifest for incremental conversion (loaded lazily).
+        dedup_stats: BlobStore.scan_usage() result from the last run (dedup mode only).
+    """
+
+    def __init__(self, input_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                 jobs: int = 1, force: bool = False, link_mode: str = 'copy',
+                 stream: bool = False, atomic: bool = False):
+        """Initialize the converter and its component classes.
+
+        Args:
+            input_dir: Directory holding the skill directories (defaults to
+                       the module-level INPUT_DIR at construction time)
+            output_dir: Directory receiving the command files (defaults to
+                        the module-level OUTPUT_DIR at construction time)
+            jobs: Number of worker threads used by run() to convert skills
+                  concurrently. Values below 1 are treated as 1 (serial).
+            force: Reconvert all skills even if the manifest says they are
+                   up to date.
+            link_mode: One of LINK_MODES - how subdirectory assets and
+                       relocated scripts are placed in OUTPUT_DIR.
+            stream: Write merged markdown section by section to a temporary
+                    file that is renamed into place, instead of building the
+                    whole document in memory.
+            atomic: Stage every write of a run in a sibling directory and
+                    swap it in place of OUTPUT_DIR at the end (see
+                    OutputStaging), so readers and crashes never see a
+                    half-updated output tree.
+
+        Raises:
+            ValueError: If link_mode is not a known mode
+        """
+        self.input_dir = Path(input_dir) if input_dir is not None else INPUT_DIR
+        self.output_dir = Path(output_dir) if output_dir is not None else OUTPUT_DIR
+        self.results: List[ProcessingResult] = []
+        self.dedup_stats: Optional[Dict[str, int]] = None
+        self.jobs = max(1, int(jobs))
+        self.force = force
+        self.link_mode = link_mode
+        self.stream = stream
+        self.atomic = atomic
+        self.manifest: Optional[ConversionManifest] = None
+        self.blob_store = BlobStore(self.output_dir / BLOB_DIRNAME) if link_mode == 'dedup' else None
+
+        # Initialize v2.0 component classes
+        self.frontmatter_parser = FrontmatterParser()
+        self.mode_detector = ModeDetector()
+        self.markdown_merger = MarkdownMerger(self.frontmatter_parser)
+        self.subdirectory_preserver = SubdirectoryPreserver(link_mode, self.blob_store)
+        self.path_updater = PathUpdater(link_mode, self.blob_store)
+
+    def get_manifest(self) -> ConversionManifest:
+        """Return the incremental conversion manifest, loading it on first use.
+
+        Returns:
+            ConversionManifest backed by output_dir / MANIFEST_FILENAME
+        """
+        if self.manifest is None:
+            self.manifest = ConversionManifest(self.output_dir / MANIFEST_FILENAME)
+        return self.manifest
+
+    def read_file_with_retry(self, file_path: Path) -> Optional[str]:
+        """Read a file with encoding detection and retry logic.
+
+        Uses safe_read_file() utility which handles:
+        - Encoding detection (UTF-8, Latin-1, CP1252, or chardet if available)
+        - Retry logic (1 retry with 0.5s delay)
+        - Error handling for permissions, encoding, and other issues
+
+        This method adds integration logging and provides a clean interface
+        for the conversion pipeline.
+
+        Args:
+            file_path: Path to file to read
+
+        Returns:
+            File content as string, or None if failed after all retry attempts
+
+        Notes:
+            - Logs read attempts and results
+            - Uses safe_read_file() for all heavy lifting
+            - Retry logic is handled by safe_read_file()
+        """
+        # Log attempt
+        console.info(f"  Reading file: {file_path.name}")
+
+        # Call safe_read_file() with retry enabled
+        content = safe_read_file(file_path, retry=True)
+
+        # Log result
+        if content is not None:
+            console.info(f"    ✓ Successfully read {file_path.name} ({len(content)} chars)")
+        else:
+            console.warning(f"    ✗ Failed to read {file_path.name}")
+
+        return content
+
+    def extract_yaml_frontmatter(self, content: str) -> Dict[str, str]:
+        """Extract YAML front matter from markdown content.
+
+        Looks for YAML between --- delimiters at the start of the content.
+        Attempts to fix common YAML formatting issues.
+
+        Args:
+            content: Markdown file content
+
+        Returns:
+            Dictionary with 'description' and optional 'argument-hint'.
+            May also include other fields found in the YAML (e.g., 'name', 'license').
+            Returns empty dict if no valid YAML found.
+
+        Error Handling:
+            - Returns empty dict if no --- delimiters found
+            - Attempts to fix common YAML issues before giving up
+            - Logs warnings for malformed YAML
+
+        Common YAML Issues Fixed:
+            - Missing quotes around values with colons
+            - Extra whitespace
+            - Missing spaces after colons
+
+        Notes:
+            - Parsed by the shared FrontmatterParser, so the merge step reuses
+              this result instead of parsing SKILL.md again
+        """
+        parsed, _, missing_close = self.frontmatter_parser.extract(content)
+
+        if parsed is None:
+            if missing_close:
+                console.warning("WARNING: YAML front matter missing closing '---' delimiter")
+            return {}
+
+        for warning in parsed.warnings:
+            console.warning(warning)
+
+        if parsed.method == 'fix_invalid':
+            # Fixed YAML that still is not a mapping yields no metadata
+            return {}
+
+        return dict(parsed.data)
+
+    def discover_skills(self) -> List[Path]:
+        """Discover all skill directories (non-recursive scan of INPUT_DIR).
+
+        Performs a non-recursive scan of the INPUT_DIR to find all immediate
+        subdirectories that represent skill directories, and zipped skill
+        packages (see is_skill_archive). Does not traverse into subdirectories.
+
+        Returns:
+            List of Path objects representing skill directories and archives.
+            Returns empty list if INPUT_DIR doesn't exist or has no subdirectories.
+
+        Notes:
+            - Only scans immediate children of INPUT_DIR
+            - Excludes directories matching EXCLUDE_DIRS patterns
+            - An archive is skipped (with a warning) if a skill directory of
+              the same name exists
+            - Returns sorted list for consistent processing order
+        """
+        skills = []
+
+        try:
+            # Check if INPUT_DIR exists
+            if not self.input_dir.exists():
+                console.warning(f"WARNING: Input directory not found: {self.input_dir}")
+                return skills
+
+            if not self.input_dir.is_dir():
+                console.error(f"ERROR: Input path is not a directory: {self.input_dir}")
+                return skills
+
+            # Scan only direct children (non-recursive)
+            archives = []
+            for item in self.input_dir.iterdir():
+                # Filter: must be directory (or skill archive), not excluded
+                if item.is_dir():
+                    if not should_exclude_dir(item.name):
+                        skills.append(item)
+                elif is_skill_archive(item) and not should_exclude_dir(skill_name_of(item)):
+                    archives.append(item)
+
+            directory_names = {item.name for item in skills}
+            for archive in archives:
+                if skill_name_of(archive) in directory_names:
+                    console.warning(f"WARNING: Skipping {archive.name} - skill directory "
+                                    f"{skill_name_of(archive)}/ takes precedence")
+                else:
+                    skills.append(archive)
+
+            # Sort alphabetically for consistent processing
+            skills.sort(key=lambda p: p.name.lower())
+
+            # Log results
+            console.info(f"\nDiscovered {len(skills)} skill directories:")
+            for skill_path in skills:
+                console.info(f"  - {skill_path.name}")
+
+            if len(skills) == 0:
+                console.info("  (No valid skill directories found)")
+
+        except PermissionError as e:
+            console.error(f"ERROR: Permission denied accessing {self.input_dir}: {e}")
+        except Exception as e:
+            console.error(f"ERROR: Failed to discover skills in {self.input_dir}: {e}")
+
+        return skills
+
+    def discover_files(self, skill_dir: Path, tree: Optional[SkillTree] = None) -> Dict[str, Any]:
+        """Recursively discover files within a skill directory.
+
+        Scans the skill directory recursively to find all relevant files.
+        Categorizes files by type (markdown, code, config) for organized
+        processing.
+
+        Args:
+            skill_dir: Path to the skill directory to scan.
+            tree: Pre-scanned SkillTree for skill_dir (scanned here if omitted)
+
+        Returns:
+            Dictionary mapping file categories to lists of file paths:
+            - 'skill_md': SKILL.md from root directory (Path or None)
+            - 'markdown': List of other .md/.markdown files
+            - 'code': List of code files (.py, .js, .sh, etc.)
+            - 'config': List of config files (.json, .yaml, .xml)
+            - 'other': List of other text files
+
+        Notes:
+            - Recursive scan - processes all subdirectories
+            - Applies exclusion rules (EXCLUDE_DIRS, EXCLUDE_FILES)
+            - Excluded directories are pruned once, not re-checked per file
+            - Skips binary files automatically
+            - Returns sorted lists for consistent ordering
+        """
+        result = {
+            "skill_md": None,
+            "markdown": [],
+            "code": [],
+            "config": [],
+            "other": []
+        }
+
+        if tree is None:
+            tree = SkillTree.scan(skill_dir)
+
+        # Check for SKILL.md in root directory
+        skill_md_path = skill_dir / "SKILL.md"
+        skill_md_node = tree.root.child("SKILL.md")
+        if skill_md_node is not None and skill_md_node.is_file():
+            if not should_exclude_file(skill_md_path, skill_md_node.size):
+                result["skill_md"] = skill_md_path
+
+        # Define config extensions (separate from pure code files)
+        config_extensions = {'.json', '.yaml', '.yml', '.xml'}
+
+        # Define pure code extensions (excluding config formats)
+        code_extensions = {'.py', '.js', '.sh', '.ts', '.jsx', '.tsx'}
+
+        # Walk the pre-scanned tree, pruning excluded directories once
+        try:
+            for node in tree.root.iter_files(lambda d: should_exclude_dir(d.name)):
+                item = node.path
+
+                # Check if file should be excluded
+                if should_exclude_file(item, node.size):
+                    continue
+
+                # Skip SKILL.md from root (already processed)
+                if item == skill_md_path:
+                    continue
+
+                # Categorize file by extension
+                extension = item.suffix.lower()
+
+                if extension in MARKDOWN_EXTENSIONS:
+                    result["markdown"].append(item)
+                elif extension in config_extensions:
+                    result["config"].append(item)
+                elif extension in code_extensions:
+                    result["code"].append(item)
+                else:
+                    # Other text files (only if not binary and passes filters)
+                    result["other"].append(item)
+
+            # Sort each category alphabetically for consistent ordering
+            for key in ["markdown", "code", "config", "other"]:
+                result[key].sort(key=lambda p: str(p))
+
+        except PermissionError as e:
+            console.warning(f"WARNING: Permission denied accessing {skill_dir}: {e}")
+        except Exception as e:
+            console.error(f"ERROR: Failed to scan {skill_dir}: {e}")
+
+        return result
+
+    def categorize_content_files(self, files: Dict[str, Any]) -> Dict[str, List[Path]]:
+        """
+        Categorize discovered files by purpose for output generation.
+
+        Takes the dictionary from discover_files() and categorizes files
+        by their intended purpose in the output documentation.
+
+        Args:
+            files: Dictionary from discover_files() with categorized files:
+                   - 'skill_md': SKILL.md from root (Path or None)
+                   - 'markdown': List of other .md/.markdown files
+                   - 'code': List of code files (.py, .js, .sh, etc.)
+                   - 'config': List of config files (.json, .yaml, .xml)
+                   - 'other': List of other text files
+
+        Returns:
+            Dictionary mapping content types to file lists:
+            {
+                'reference': [Path, ...],  # Reference documentation
+                'examples': [Path, ...],    # Example files
+                'code': [Path, ...],        # Code to show in blocks
+                'themes': [Path, ...]       # Theme files
+            }
+
+        Categorization Logic:
+            - Files in 'reference/' or 'docs/' directories → Reference
+            - Files in 'examples/', 'templates/' directories → Examples
+            - Files in 'themes/' directory → Themes (theme showcase files)
+            - Files matching 'example*', '*_example.*', 'demo*' patterns → Examples
+            - Code files (.py, .js, .sh, .ts, .jsx, .tsx) → Code
+            - Config files (.json, .yaml, .yml, .xml) → Code (shown as examples)
+            - Other markdown files → Reference (general documentation)
+        """
+        result = {
+            'reference': [],
+            'examples': [],
+            'code': [],
+            'themes': []
+        }
+
+        # Collect all files to categorize
+        all_files = []
+
+        # Include SKILL.md if it exists (prioritize as reference)
+        if files.get('skill_md'):
+            all_files.append(files['skill_md'])
+
+        # Add all other file categories
+        for category in ['markdown', 'code', 'config', 'other']:
+            all_files.extend(files.get(category, []))
+
+        # Categorize each file based on path and naming patterns
+        for file_path in all_files:
+            # Get path components for directory checking
+            path_parts = file_path.parts
+            filename = file_path.name.lower()
+            extension = file_path.suffix.lower()
+
+            # Priority 1: Check for themes directory
+            # Theme files are special - they showcase visual themes
+            if 'themes' in path_parts:
+                result['themes'].append(file_path)
+                console.info(f"    [THEMES] {file_path.name} (in themes/ directory)")
+                continue
+
+            # Priority 2: Check for examples/templates directories
+            # These directories explicitly contain example content
+            if any(part in ['examples', 'templates', 'demos', 'samples'] for part in path_parts):
+                result['examples'].append(file_path)
+                console.info(f"    [EXAMPLES] {file_path.name} (in examples/templates directory)")
+                continue
+
+            # Priority 3: Check for reference/docs directories
+            # These directories contain reference documentation
+            if any(part in ['reference', 'docs', 'documentation'] for part in path_parts):
+                result['reference'].append(file_path)
+                console.info(f"    [REFERENCE] {file_path.name} (in reference/docs directory)")
+                continue
+
+            # Priority 4: Check filename patterns for examples
+            # Files explicitly named as examples or demos
+            if (filename.startswith('example') or
+                '_example.' in filename or
+                '-example.' in filename or
+                filename.startswith('demo') or
+                '_demo.' in filename or
+                '-demo.' in filename or
+                filename.startswith('sample') or
+                '_sample.' in filename or
+                '-sample.' in filename):
+                result['examples'].append(file_path)
+                console.info(f"    [EXAMPLES] {file_path.name} (filename pattern match)")
+                continue
+
+            # Priority 5: Categorize by file type
+
+            # Pure code files (.py, .js, .sh, etc.) - shown as code blocks
+            if extension in ['.py', '.js', '.sh', '.ts', '.jsx', '.tsx']:
+                result['code'].append(file_path)
+                console.info(f"    [CODE] {file_path.name} (code file)")
+            # Config/data files (.json, .yaml, .xml) - shown as code examples
+            elif extension in ['.json', '.yaml', '.yml', '.xml']:
+                result['code'].append(file_path)
+                console.info(f"    [CODE] {file_path.name} (config file)")
+            # Markdown files default to reference documentation
+            elif extension in ['.md', '.markdown']:
+                result['reference'].append(file_path)
+                console.info(f"    [REFERENCE] {file_path.name} (markdown file)")
+            # Other text files default to reference
+            else:
+                result['reference'].append(file_path)
+                console.info(f"    [REFERENCE] {file_path.name} (other file)")
+
+        # Print summary
+        console.info(f"\n  Categorization Summary:")
+        console.info(f"    Reference: {len(result['reference'])} files")
+        console.info(f"    Examples: {len(result['examples'])} files")
+        console.info(f"    Code: {len(result['code'])} files")
+        console.info(f"    Themes: {len(result['themes'])} files")
+
+        return result
+
+    def parse_sample_format(self) -> Dict[str, Any]:
+        """
+        Parse the sample format file to understand output structure.
+
+        Reads algorithmic-art.md to extract:
+        - Section patterns and hierarchy
+        - Expected section names (Steps, Examples, Usage)
+        - YAML front matter structure
+        - Overall content organization
+
+        Returns:
+            Dictionary with structure information:
+            - yaml_fields: List of YAML front matter field names
+            - sections: List of all section titles (## headers)
+            - step_sections: List of dicts with step info (number, title)
+            - has_steps: Boolean indicating if Step sections exist
+            - has_examples: Boolean indicating if Examples section exists
+            - has_usage: Boolean indicating if Usage section exists
+            - step_count: Number of Step sections found
+        """
+        sample_path = SAMPLE_FORMAT
+
+        # Validate sample file exists
+        if not sample_path.exists():
+            console.warning(f"WARNING: Sample format file not found: {sample_path}")
+            return {
+                "yaml_fields": [],
+                "sections": [],
+                "step_sections": [],
+                "has_steps": False,
+                "has_examples": False,
+                "has_usage": False,
+                "step_count": 0
+            }
+
+        console.info(f"\nParsing sample format file: {sample_path.name}")
+
+        # Read sample file
+        content = self.read_file_with_retry(sample_path)
+
+        if content is None:
+            console.error(f"ERROR: Failed to read sample format file: {sample_path}")
+            return {
+                "yaml_fields": [],
+                "sections": [],
+                "step_sections": [],
+                "has_steps": False,
+                "has_examples": False,
+                "has_usage": False,
+                "step_count": 0
+            }
+
+        # Extract YAML front matter structure
+        console.info("  Extracting YAML front matter...")
+        yaml_data = self.extract_yaml_frontmatter(content)
+        yaml_fields = list(yaml_data.keys()) if yaml_data else []
+        console.info(f"    Found {len(yaml_fields)} YAML fields: {', '.join(yaml_fields)}")
+
+        # Find section headers (## headers)
+        console.info("  Analyzing section structure...")
+        sections = []
+        step_sections = []
+        has_examples = False
+        has_usage = False
+
+        lines = content.split('\n')
+        for line in lines:
+            # Match ## headers (level 2 headers)
+            if line.startswith('## '):
+                section_title = line[3:].strip()
+                sections.append(section_title)
+
+                # Check for step sections
+                step_match = re.match(r'Step (\d+):', section_title)
+                if step_match:
+                    step_num = int(step_match.group(1))
+                    step_sections.append({
+                        "number": step_num,
+                        "title": section_title
+                    })
+                    console.info(f"    Found: {section_title}")
+
+                # Check for Examples and Usage sections
+                if section_title.lower() == 'examples':
+                    has_examples = True
+                    console.info(f"    Found: {section_title}")
+                elif section_title.lower() == 'usage':
+                    has_usage = True
+                    console.info(f"    Found: {section_title}")
+
+        # Build structure info
+        structure = {
+            "yaml_fields": yaml_fields,
+            "sections": sections,
+            "step_sections": step_sections,
+            "has_steps": len(step_sections) > 0,
+            "has_examples": has_examples,
+            "has_usage": has_usage,
+            "step_count": len(step_sections)
+        }
+
+        console.info(f"\n  Summary:")
+        console.info(f"    Total sections: {len(sections)}")
+        console.info(f"    Step sections: {len(step_sections)}")
+        console.info(f"    Has Examples: {has_examples}")
+        console.info(f"    Has Usage: {has_usage}")
+
+        return structure
+
+    def _convert_skill_name_to_title(self, skill_name: str) -> str:
+        """
+        Convert a skill name to a human-readable title.
+
+        Handles common acronyms and capitalizes words properly.
+
+        Args:
+            skill_name: Skill directory name (e.g., "mcp-builder", "algorithmic-art")
+
+        Returns:
+            Human-readable title (e.g., "MCP Builder", "Algorithmic Art")
+        """
+        # Common acronyms that should be fully capitalized
+        acronyms = {
+            'mcp': 'MCP',
+            'api': 'API',
+            'cli': 'CLI',
+            'ui': 'UI',
+            'ux': 'UX',
+            'url': 'URL',
+            'html': 'HTML',
+            'css': 'CSS',
+            'js': 'JS',
+            'json': 'JSON',
+            'xml': 'XML',
+            'sql': 'SQL',
+            'rest': 'REST',
+            'http': 'HTTP',
+            'https': 'HTTPS',
+            'ssh': 'SSH',
+            'git': 'Git',
+            'ai': 'AI',
+            'ml': 'ML',
+            'llm': 'LLM',
+        }
+
+        # Replace separators with spaces
+        title = skill_name.replace('-', ' ').replace('_', ' ')
+
+        # Split into words and capitalize each
+        words = title.split()
+        capitalized_words = []
+
+        for word in words:
+            word_lower = word.lower()
+            if word_lower in acronyms:
+                # Use the acronym form
+                capitalized_words.append(acronyms[word_lower])
+            else:
+                # Regular title case
+                capitalized_words.append(word.capitalize())
+
+        return ' '.join(capitalized_words)
+
+    def generate_fallback_metadata(self, skill_name: str, files_dict: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Generate fallback metadata when SKILL.md is missing or has no YAML.
+
+        Args:
+            skill_name: Name of the skill directory
+            files_dict: Dictionary from discover_files()
+
+        Returns:
+            Dictionary with 'description' and 'argument-hint'
+        """
+        console.info(f"    Generating fallback metadata for {skill_name}...")
+
+        # ========================================
+        # 1. Convert skill-name to readable title
+        # ========================================
+        # E.g., "mcp-builder" -> "MCP Builder"
+        # E.g., "algorithmic-art" -> "Algorithmic Art"
+        title = self._convert_skill_name_to_title(skill_name)
+
+        # ========================================
+        # 2. Generate description based on skill name
+        # ========================================
+        description = f"Tools and utilities for {title}"
+
+        # ========================================
+        # 3. Determine argument-hint from file types
+        # ========================================
+        argument_hint = "<arguments>"  # Default
+
+        # Check for themes directory/files
+        has_themes = False
+        for category in ['markdown', 'code', 'config', 'other']:
+            for file_path in files_dict.get(category, []):
+                if 'themes' in file_path.parts:
+                    has_themes = True
+                    break
+            if has_themes:
+                break
+
+        if has_themes:
+            argument_hint = "<theme-name>"
+            console.info(f"      Detected themes - using argument-hint: {argument_hint}")
+        else:
+            # Check for code files (suggests file processing)
+            has_code = len(files_dict.get('code', [])) > 0
+            if has_code:
+                argument_hint = "<file-path>"
+                console.info(f"      Detected code files - using argument-hint: {argument_hint}")
+
+        # ========================================
+        # 4. Try to extract summary from first available markdown file
+        # ========================================
+        # Priority: SKILL.md, then other markdown files
+        summary = None
+
+        if files_dict.get('skill_md'):
+            skill_md_content = self.read_file_with_retry(files_dict['skill_md'])
+            if skill_md_content:
+                summary = self._extract_first_paragraph_from_markdown(skill_md_content)
+
+        # If no summary from SKILL.md, try other markdown files
+        if not summary:
+            for md_file in files_dict.get('markdown', []):
+                md_content = self.read_file_with_retry(md_file)
+                if md_content:
+                    summary = self._extract_first_paragraph_from_markdown(md_content)
+                    if summary:
+                        console.info(f"      Extracted summary from: {md_file.name}")
+                        break
+
+        # Use summary as description if found
+        if summary:
+            description = summary
+            console.info(f"      Using extracted summary as description")
+        else:
+            console.info(f"      Using generated description: {description}")
+
+        # ========================================
+        # 5. Build and return metadata dictionary
+        # ========================================
+        result = {
+            'description': description,
+            'argument-hint': argument_hint
+        }
+
+        console.info(f"      Generated fallback metadata:")
+        console.info(f"        description: {result['description']}")
+        console.info(f"        argument-hint: {result['argument-hint']}")
+
+        return result
+
+    def _extract_first_paragraph_from_markdown(self, content: str) -> Optional[str]:
+        """
+        Extract the first substantial paragraph from markdown content.
+
+        Skips YAML front matter and headers to find the first real paragraph.
+
+        Args:
+            content: Markdown file content
+
+        Returns:
+            First paragraph as a string, or None if not found
+        """
+        # Remove YAML front matter if present
+        content = content.lstrip()
+        if content.startswith('---'):
+            lines = content.split('\n')
+            closing_idx = -1
+            for i in range(1, len(lines)):
+                if lines[i].strip() == '---':
+                    closing_idx = i
+                    break
+
+            if closing_idx > 0:
+                content = '\n'.join(lines[closing_idx + 1:])
+
+        # Split into lines and find first substantial paragraph
+        lines = content.split('\n')
+
+        paragraph_lines = []
+        in_paragraph = False
+
+        for line in lines:
+            stripped = line.strip()
+
+            # Skip empty lines before we start collecting
+            if not in_paragraph and not stripped:
+                continue
+
+            # Skip headers
+            if stripped.startswith('#'):
+                continue
+
+            # If we hit an empty line after starting, we're done
+            if in_paragraph and not stripped:
+                break
+
+            # If we have a non-empty line, collect it
+            if stripped:
+                paragraph_lines.append(stripped)
+                in_paragraph = True
+
+        if paragraph_lines:
+            return ' '.join(paragraph_lines)
+
+        return None
+
+    def generate_output_content(self, skill_name: str, files_dict: Dict[str, Any],
+                               categorized: Dict[str, List[Path]],
+                               metadata: Dict[str, str]) -> str:
+        """
+        Generate final output markdown content from categorized files.
+
+        Args:
+            skill_name: Name of the skill
+            files_dict: Dictionary from discover_files()
+            categorized: Dictionary from categorize_content_files()
+            metadata: YAML front matter metadata
+
+        Returns:
+            Complete markdown content string
+        """
+        console.info(f"\n  Generating output content for {skill_name}...")
+
+        # ========================================
+        # 0. Use fallback metadata if needed
+        # ========================================
+        # Check if we need to generate fallback for any missing fields
+        needs_fallback = (
+            not metadata or
+            'description' not in metadata or
+            'argument-hint' not in metadata
+        )
+
+        if needs_fallback:
+            console.info("    Metadata incomplete - using fallback for missing fields...")
+            fallback = self.generate_fallback_metadata(skill_name, files_dict)
+
+            # Merge fallback with existing metadata
+            if not metadata:
+                metadata = fallback
+            else:
+                # Only fill in missing fields
+                if 'description' not in metadata:
+                    metadata['description'] = fallback['description']
+                if 'argument-hint' not in metadata:
+                    metadata['argument-hint'] = fallback['argument-hint']
+
+        output_lines = []
+
+        # ========================================
+        # 1. Build YAML front matter
+        # ========================================
+        console.info("    Building YAML front matter...")
+        output_lines.append("---")
+
+        # Add description (required - now guaranteed to exist)
+        output_lines.append(f"description: {metadata['description']}")
+
+        # Add argument-hint if present
+        if "argument-hint" in metadata:
+            output_lines.append(f"argument-hint: {metadata['argument-hint']}")
+
+        output_lines.append("---")
+        output_lines.append("")  # Blank line after front matter
+
+        # ========================================
+        # 2. Extract summary from SKILL.md
+        # ========================================
+        console.info("    Extracting summary from SKILL.md...")
+        if files_dict.get("skill_md"):
+            skill_md_content = self.read_file_with_retry(files_dict["skill_md"])
+            if skill_md_content:
+                summary = self._extract_summary_from_skill_md(skill_md_content)
+                if summary:
+                    output_lines.append(summary)
+                    output_lines.append("")
+
+        # ========================================
+        # 3. Generate Step sections from reference files
+        # ========================================
+        console.info("    Generating Step sections from reference files...")
+        reference_files = categorized.get('reference', [])
+
+        # Filter out SKILL.md from reference files
+        reference_files = [f for f in reference_files if f != files_dict.get("skill_md")]
+
+        if reference_files:
+            step_num = 1
+            for ref_file in reference_files:
+                ref_content = self.read_file_with_retry(ref_file)
+                if ref_content:
+                    # Generate step section
+                    step_section = self._generate_step_section(step_num, ref_file, ref_content)
+                    if step_section:
+                        output_lines.append(step_section)
+                        output_lines.append("")
+                        step_num += 1
+
+        # ========================================
+        # 4. Generate Examples section
+        # ========================================
+        console.info("    Generating Examples section...")
+        examples_files = categorized.get('examples', [])
+        themes_files = categorized.get('themes', [])
+
+        if examples_files or themes_files:
+            output_lines.append("## Examples")
+            output_lines.append("")
+
+            # Add examples
+            for example_file in examples_files:
+                example_content = self.read_file_with_retry(example_file)
+                if example_content:
+                    example_section = self._generate_example_section(example_file, example_content)
+                    if example_section:
+                        output_lines.append(example_section)
+                        output_lines.append("")
+
+            # Add themes
+            for theme_file in themes_files:
+                theme_content = self.read_file_with_retry(theme_file)
+                if theme_content:
+                    theme_section = self._generate_theme_section(theme_file, theme_content)
+                    if theme_section:
+                        output_lines.append(theme_section)
+                        output_lines.append("")
+
+        # ========================================
+        # 5. Generate code blocks from code files
+        # ========================================
+        console.info("    Generating code blocks from code files...")
+        code_files = categorized.get('code', [])
+
+        if code_files:
+            # Add code files as a section if there are standalone code files
+            # that weren't already included in steps or examples
+            for code_file in code_files:
+                code_content = self.read_file_with_retry(code_file)
+                if code_content:
+                    code_block = self._generate_code_block(code_file, code_content)
+                    if code_block:
+                        output_lines.append(code_block)
+                        output_lines.append("")
+
+        # ========================================
+        # 6. Add Usage section
+        # ========================================
+        console.info("    Adding Usage section...")
+        usage_section = self._generate_usage_section(skill_name, metadata)
+        output_lines.append(usage_section)
+        output_lines.append("")
+
+        # ========================================
+        # 7. Join and return
+        # ========================================
+        result = "\n".join(output_lines)
+        console.info(f"    Generated {len(result)} characters of content")
+
+        return result
+
+    def _extract_summary_from_skill_md(self, content: str) -> Optional[str]:
+        """
+        Extract the summary paragraph from SKILL.md.
+
+        The summary is the first substantial paragraph after the YAML front matter
+        and any headers.
+
+        Args:
+            content: Content of SKILL.md
+
+        Returns:
+            Summary paragraph as a string, or None if not found
+        """
+        # Reuse the generic paragraph extraction method
+        return self._extract_first_paragraph_from_markdown(content)
+
+    def _generate_step_section(self, step_num: int, file_path: Path, content: str) -> Optional[str]:
+        """
+        Generate a Step section from a reference file.
+
+        Args:
+            step_num: Step number (1, 2, 3, ...)
+            file_path: Path to the reference file
+            content: Content of the reference file
+
+        Returns:
+            Step section as markdown string
+        """
+        # Generate step title from filename
+        filename = file_path.stem  # Get filename without extension
+
+        # Convert filename to title (e.g., "mcp_best_practices" -> "MCP Best Practices")
+        title = filename.replace('_', ' ').replace('-', ' ').title()
+
+        # Build step header
+        step_header = f"## Step {step_num}: {title}"
+
+        # Remove any YAML front matter from content
+        content = content.lstrip()
+        if content.startswith('---'):
+            lines = content.split('\n')
+            closing_idx = -1
+            for i in range(1, len(lines)):
+                if lines[i].strip() == '---':
+                    closing_idx = i
+                    break
+
+            if closing_idx > 0:
+                content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+
+        # Remove the first # header if it exists (since we're adding our own header)
+        lines = content.split('\n')
+        if lines and lines[0].strip().startswith('# '):
+            content = '\n'.join(lines[1:]).lstrip()
+
+        return f"{step_header}\n\n{content}"
+
+    def _generate_example_section(self, file_path: Path, content: str) -> Optional[str]:
+        """
+        Generate an example subsection from an example file.
+
+        Args:
+            file_path: Path to the example file
+            content: Content of the example file
+
+        Returns:
+            Example subsection as markdown string
+        """
+        # For markdown files, include the content directly
+        if file_path.suffix.lower() in MARKDOWN_EXTENSIONS:
+            # Remove any YAML front matter
             content = content.lstrip()
             if content.startswith('---'):
                 lines = content.split('\n')
@@ -2781,1473 +5603,3125 @@ class SkillConverter:
                         closing_idx = i
                         break
 
-                if closing_idx > 0:
-                    content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+                if closing_idx > 0:
+                    content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+
+            return content
+
+        # For code files, show as code block
+        filename = file_path.name
+        language = get_language_hint(file_path)
+
+        return f"**{filename}:**\n\n```{language}\n{content}\n```"
+
+    def _generate_theme_section(self, file_path: Path, content: str) -> Optional[str]:
+        """
+        Generate a theme subsection from a theme file.
+
+        Args:
+            file_path: Path to the theme file
+            content: Content of the theme file
+
+        Returns:
+            Theme subsection as markdown string
+        """
+        # Themes are typically markdown files with theme specifications
+        # Remove any YAML front matter
+        content = content.lstrip()
+        if content.startswith('---'):
+            lines = content.split('\n')
+            closing_idx = -1
+            for i in range(1, len(lines)):
+                if lines[i].strip() == '---':
+                    closing_idx = i
+                    break
+
+            if closing_idx > 0:
+                content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+
+        return content
+
+    def _generate_code_block(self, file_path: Path, content: str) -> Optional[str]:
+        """
+        Generate a code block from a code file.
+
+        Args:
+            file_path: Path to the code file
+            content: Content of the code file
+
+        Returns:
+            Code block as markdown string with proper syntax highlighting
+        """
+        filename = file_path.name
+        language = get_language_hint(file_path)
+
+        # Get relative path from skill directory for context
+        # (helps identify the purpose of the code file)
+
+        return f"**{filename}:**\n\n```{language}\n{content}\n```"
+
+    def _generate_usage_section(self, skill_name: str, metadata: Dict[str, str]) -> str:
+        """
+        Generate the Usage section for the command.
+
+        Args:
+            skill_name: Name of the skill
+            metadata: YAML front matter metadata
+
+        Returns:
+            Usage section as markdown string
+        """
+        lines = []
+        lines.append("## Usage")
+        lines.append("")
+
+        # Get argument hint if available
+        arg_hint = metadata.get('argument-hint', '[arguments]')
+
+        # Basic usage
+        lines.append(f"**Basic usage:** `/{skill_name} {arg_hint}`")
+
+        return '\n'.join(lines)
+
+    def generate_output_filename(self, skill_name: str) -> str:
+        """
+        Generate safe output filename from skill name.
+
+        Converts skill directory name to kebab-case and sanitizes for
+        safe filesystem usage. Handles edge cases like empty names,
+        special characters, and ensures .md extension.
+
+        Args:
+            skill_name: Name of skill directory (e.g., "MCP Builder", "algorithmic_art")
+
+        Returns:
+            Sanitized filename with .md extension (e.g., "mcp-builder.md", "algorithmic-art.md")
+
+        Examples:
+            "MCP Builder" -> "mcp-builder.md"
+            "algorithmic_art" -> "algorithmic-art.md"
+            "My Cool  Skill!!!" -> "my-cool-skill.md"
+            "___test___" -> "test.md"
+            "" -> "unnamed-skill.md"
+            "123" -> "123.md"
+        """
+        # Handle empty or whitespace-only names
+        if not skill_name or not skill_name.strip():
+            return "unnamed-skill.md"
+
+        # Remove .md extension if present (since we'll add it at the end)
+        filename = skill_name
+        if filename.lower().endswith('.md'):
+            filename = filename[:-3]
+
+        # Convert to lowercase
+        filename = filename.lower()
+
+        # Replace spaces, underscores, and dots with hyphens
+        filename = filename.replace(' ', '-').replace('_', '-').replace('.', '-')
+
+        # Remove special characters - keep only alphanumeric and hyphens
+        # This regex keeps: a-z, 0-9, and hyphens
+        filename = re.sub(r'[^a-z0-9-]', '', filename)
+
+        # Replace multiple consecutive hyphens with a single hyphen
+        filename = re.sub(r'-+', '-', filename)
+
+        # Remove leading and trailing hyphens
+        filename = filename.strip('-')
+
+        # If after sanitization we have nothing left, use default name
+        if not filename:
+            return "unnamed-skill.md"
+
+        # Ensure .md extension
+        if not filename.endswith('.md'):
+            filename = f"{filename}.md"
+
+        return filename
+
+    def check_naming_conflict(self, filename: str, output_dir: Path,
+                              skill_name: Optional[str] = None) -> str:
+        """
+        Resolve naming conflicts using the output ownership index.
+
+        Each output file is owned by the skill that produced it. Reruns get
+        their own previous file back (and overwrite it in place); only a
+        genuine clash between two different skills that sanitize to the same
+        name receives a numeric suffix (-2, -3, etc.).
+
+        Args:
+            filename: Proposed filename (e.g., "mcp-builder.md")
+            output_dir: Output directory the filename belongs to
+            skill_name: Skill claiming the file (defaults to the filename stem)
+
+        Returns:
+            Final filename (possibly with -2, -3 suffix if another skill owns it)
+
+        Examples:
+            Rerunning "mcp-builder":
+                "mcp-builder.md" -> "mcp-builder.md" (overwritten in place)
+            "mcp_builder" after "mcp-builder" claimed the name:
+                "mcp-builder.md" -> "mcp-builder-2.md"
+
+        Notes:
+            - Resolved entirely from the in-memory index (no exists() probes)
+            - The index is persisted in the manifest inside output_dir
+            - Handles files with and without .md extension
+        """
+        if skill_name is None:
+            skill_name = filename[:-3] if filename.endswith('.md') else filename
+
+        if output_dir == self.output_dir:
+            manifest = self.get_manifest()
+        else:
+            manifest = ConversionManifest(output_dir / MANIFEST_FILENAME)
+
+        final_filename = manifest.claim_output(skill_name, filename)
+
+        if final_filename != filename:
+            console.info(f"    Naming conflict resolved: {filename} -> {final_filename}")
+
+        return final_filename
+
+    def ensure_output_directory(self) -> bool:
+        """
+        Ensure output directory exists and is writable.
+
+        Creates OUTPUT_DIR if it doesn't exist, verifies write permissions.
+        Handles errors gracefully for permissions, disk space, etc.
+
+        Returns:
+            True if directory is ready (exists and writable), False if failed
+
+        Error Handling:
+            - PermissionError: Logs error and returns False
+            - OSError: Logs error (disk space, I/O issues) and returns False
+            - Other exceptions: Logs unexpected errors and returns False
+
+        Notes:
+            - Creates parent directories if needed (parents=True)
+            - Verifies the path is actually a directory
+            - Tests write permissions by checking directory stats
+        """
+        try:
+            # Check if OUTPUT_DIR already exists
+            if self.output_dir.exists():
+                console.info(f"  Output directory exists: {self.output_dir}")
+
+                # Verify it's actually a directory (not a file)
+                if not self.output_dir.is_dir():
+                    console.error(f"  ERROR: Output path exists but is not a directory: {self.output_dir}")
+                    return False
+
+                # Check write permissions by trying to get stats
+                # On Unix systems, we can check os.access
+                if not os.access(self.output_dir, os.W_OK):
+                    console.error(f"  ERROR: Output directory is not writable: {self.output_dir}")
+                    return False
+
+                console.info(f"  ✓ Output directory is writable")
+                return True
+
+            # Directory doesn't exist - create it
+            console.info(f"  Creating output directory: {self.output_dir}")
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Verify creation succeeded
+            if not self.output_dir.exists():
+                console.error(f"  ERROR: Failed to create output directory: {self.output_dir}")
+                return False
+
+            # Verify write permissions on newly created directory
+            if not os.access(self.output_dir, os.W_OK):
+                console.error(f"  ERROR: Created directory is not writable: {self.output_dir}")
+                return False
+
+            console.info(f"  ✓ Successfully created output directory: {self.output_dir}")
+            return True
+
+        except PermissionError as e:
+            console.error(f"  ERROR: Permission denied creating output directory: {e}")
+            return False
+
+        except OSError as e:
+            # Handles disk space, I/O errors, etc.
+            console.error(f"  ERROR: OS error creating output directory: {e}")
+            return False
+
+        except Exception as e:
+            # Catch any unexpected errors
+            console.error(f"  ERROR: Unexpected error with output directory: {e}")
+            return False
+
+    def write_output_file(self, filename: str, content: str) -> bool:
+        """
+        Write content to output file in OUTPUT_DIR.
+
+        Creates the output directory if needed, writes content with UTF-8 encoding,
+        and handles all errors gracefully.
+
+        Args:
+            filename: Name of the output file (e.g., "mcp-builder.md")
+            content: Markdown content to write
+
+        Returns:
+            True if file was written successfully, False if failed
+
+        Error Handling:
+            - Directory creation failures: Returns False
+            - PermissionError: Logs and returns False
+            - IOError/OSError: Logs and returns False (disk full, etc.)
+            - UnicodeEncodeError: Logs and returns False
+            - Other exceptions: Logs and returns False
+
+        Notes:
+            - Automatically calls ensure_output_directory()
+            - Uses UTF-8 encoding for all output files
+            - Tracks and logs overwrites vs new file creation
+            - Logs file size after successful write
+            - Can be wrapped with retry logic in error handling layer
+        """
+        # Ensure output directory exists and is writable
+        console.info(f"\n  Writing output file: {filename}")
+        console.info(f"    Checking output directory...")
+
+        if not self.ensure_output_directory():
+            console.error(f"    ERROR: Cannot write file - output directory not available")
+            return False
+
+        # Build full output path
+        output_path = self.output_dir / filename
+
+        # Check if file already exists (for overwrite tracking)
+        file_existed = output_path.exists()
+
+        def _attempt_write():
+            """Internal function to attempt file write."""
+            console.info(f"    Writing content to: {output_path}")
+
+            # Never rewrite a hard-linked file in place: with --atomic it is
+            # shared with the live output tree (see OutputStaging)
+            try:
+                if os.lstat(output_path).st_nlink > 1:
+                    os.unlink(output_path)
+            except FileNotFoundError:
+                pass
+
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+            # Verify file was written
+            if not output_path.exists():
+                raise IOError(f"File was not created: {output_path}")
+
+            written = output_path.stat().st_size
+            _record_io(bytes_written=written)
+            return written
+
+        # Try to write the file with retry logic
+        try:
+            file_size = retry_operation(
+                _attempt_write,
+                operation_name=f"write {filename}",
+                max_retries=MAX_RETRIES,
+                delay=RETRY_WAIT_TIME
+            )
+
+            if file_size == 0:
+                console.warning(f"    WARNING: File was created but is empty: {output_path}")
+                # Don't return False here - empty files might be valid in some cases
+
+            # Log success with overwrite status
+            if file_existed:
+                console.info(f"    ✓ Overwritten: {filename} ({file_size} bytes)")
+            else:
+                console.info(f"    ✓ Created: {filename} ({file_size} bytes)")
+
+            return True
+
+        except PermissionError as e:
+            console.error(f"    ERROR: Permission denied writing file {filename}: {e}")
+            return False
+
+        except OSError as e:
+            # Handles disk full, I/O errors, etc.
+            console.error(f"    ERROR: OS error writing file {filename}: {e}")
+            return False
+
+        except UnicodeEncodeError as e:
+            console.error(f"    ERROR: Unicode encoding error writing file {filename}: {e}")
+            return False
+
+        except Exception as e:
+            # Catch any unexpected errors (including retry exhaustion)
+            console.error(f"    ERROR: Failed to write file {filename}: {e}")
+            return False
+
+    def write_output_stream(self, filename: str, sections,
+                            separator: str = MarkdownMerger.SECTION_SEPARATOR) -> Optional[int]:
+        """
+        Stream sections into an output file in OUTPUT_DIR, replacing it atomically.
+
+        Sections are written to a temporary file in OUTPUT_DIR as they are
+        produced, then renamed over the final path, so memory use does not
+        grow with the size of the document and readers never see a partially
+        written file.
+
+        Args:
+            filename: Name of the output file (e.g., "mcp-builder.md")
+            sections: Iterable of section strings (e.g., from
+                      MarkdownMerger.iter_merged_sections())
+            separator: Text written between consecutive sections
+
+        Returns:
+            Number of characters written, or None if the file could not be written
+
+        Notes:
+            - Same logging and error handling as write_output_file()
+            - Not retried: the sections iterable can only be consumed once
+            - The temporary file is removed if writing fails
+        """
+        console.info(f"\n  Writing output file: {filename}")
+        console.info(f"    Checking output directory...")
+
+        if not self.ensure_output_directory():
+            console.error(f"    ERROR: Cannot write file - output directory not available")
+            return None
+
+        output_path = self.output_dir / filename
+        temp_path = self.output_dir / f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        file_existed = output_path.exists()
+        content_chars = 0
+
+        try:
+            console.info(f"    Streaming content to: {output_path}")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for index, section in enumerate(sections):
+                    if index:
+                        f.write(separator)
+                        content_chars += len(separator)
+                    f.write(section)
+                    content_chars += len(section)
+
+            os.replace(temp_path, output_path)
+            file_size = output_path.stat().st_size
+            _record_io(bytes_written=file_size)
+
+        except Exception as e:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+            if isinstance(e, PermissionError):
+                console.error(f"    ERROR: Permission denied writing file {filename}: {e}")
+            elif isinstance(e, UnicodeEncodeError):
+                console.error(f"    ERROR: Unicode encoding error writing file {filename}: {e}")
+            elif isinstance(e, OSError):
+                console.error(f"    ERROR: OS error writing file {filename}: {e}")
+            else:
+                console.error(f"    ERROR: Failed to write file {filename}: {e}")
+            return None
+
+        if file_size == 0:
+            console.warning(f"    WARNING: File was created but is empty: {output_path}")
+
+        if file_existed:
+            console.info(f"    ✓ Overwritten: {filename} ({file_size} bytes)")
+        else:
+            console.info(f"    ✓ Created: {filename} ({file_size} bytes)")
+
+        return content_chars
+
+    def _merge_or_stream(self, skill_md: Optional[Path], md_files: List[Path],
+                         errors: List[str]) -> Optional[str]:
+        """Merge a skill's markdown in memory, or defer it to the write step (--stream).
+
+        Args:
+            skill_md: Primary markdown file, or None
+            md_files: Secondary markdown files
+            errors: Error list of the current skill; an empty-content error
+                    is appended here
+
+        Returns:
+            Merged content, or None when streaming (see _write_merged_output())
+        """
+        markdown_count = (1 if skill_md else 0) + len(md_files)
+
+        if self.stream:
+            # Sections are produced while the output file is written
+            console.info(f"  ✓ Streaming {markdown_count} markdown files into the output")
+            return None
+
+        merged_content = self.markdown_merger.merge_markdown_files(skill_md, md_files)
+
+        if not merged_content or len(merged_content.strip()) == 0:
+            error_msg = "Generated empty merged content"
+            errors.append(error_msg)
+            console.error(f"  ERROR: {error_msg}")
+        else:
+            console.info(f"  ✓ Merged {markdown_count} markdown files ({len(merged_content)} characters)")
+
+        return merged_content
+
+    def _write_merged_output(self, filename: str, merged_content: Optional[str],
+                             skill_md: Optional[Path], md_files: List[Path],
+                             errors: List[str], skill_name: Optional[str] = None,
+                             script_names: Optional[List[str]] = None) -> tuple[bool, int]:
+        """Write the command markdown produced by _merge_or_stream().
+
+        Writes merged_content, or when streaming merges (and path-rewrites)
+        the markdown straight into the file with _stream_merged_output().
+
+        Args:
+            filename: Output filename (relative to OUTPUT_DIR)
+            merged_content: Result of _merge_or_stream()
+            skill_md: Primary markdown file, or None
+            md_files: Secondary markdown files
+            errors: Error list of the current skill
+            skill_name: Skill name for streamed path updates
+            script_names: Relocated script filenames rewritten while
+                          streaming, or None
+
+        Returns:
+            Tuple of (write_success, path_update_count); the count is only
+            non-zero for streamed path updates
+        """
+        if self.stream:
+            return self._stream_merged_output(filename, skill_md, md_files, errors,
+                                              skill_name, script_names)
+        return self.write_output_file(filename, merged_content), 0
+
+    def _stream_merged_output(self, filename: str, skill_md: Optional[Path],
+                              md_files: List[Path], errors: List[str],
+                              skill_name: Optional[str] = None,
+                              script_names: Optional[List[str]] = None) -> tuple[bool, int]:
+        """Merge markdown files straight into the output file (--stream mode).
+
+        Chains MarkdownMerger.iter_merged_sections(), optionally
+        PathUpdater.iter_updated_sections(), and write_output_stream(), so
+        only one section is in memory at a time.
+
+        Args:
+            filename: Output filename (relative to OUTPUT_DIR)
+            skill_md: Primary markdown file, or None
+            md_files: Secondary markdown files
+            errors: Error list of the current skill; an empty-content error
+                    is appended here, as in the in-memory path
+            skill_name: Skill name for path updates
+            script_names: Relocated script filenames whose references are
+                          rewritten, or None to skip path updates
+
+        Returns:
+            Tuple of (write_success, path_update_count)
+        """
+        sections = self.markdown_merger.iter_merged_sections(skill_md, md_files,
+                                                             cache_reads=False)
+        path_stats = {'update_count': 0}
+        if script_names:
+            sections = self.path_updater.iter_updated_sections(sections, skill_name,
+                                                               script_names, path_stats)
+
+        content_chars = self.write_output_stream(filename, sections)
+        if content_chars is None:
+            return False, 0
+
+        if content_chars == 0:
+            # Sections are stripped, so the document is empty only if the
+            # primary file was
+            error_msg = "Generated empty merged content"
+            errors.append(error_msg)
+            console.error(f"  ERROR: {error_msg}")
+        else:
+            markdown_count = (1 if skill_md else 0) + len(md_files)
+            console.info(f"  ✓ Merged {markdown_count} markdown files ({content_chars} characters)")
+
+        return True, path_stats['update_count']
+
+    def _process_with_subdirs(self, skill_dir: Path, skill_name: str,
+                              tree: Optional[SkillTree] = None) -> ProcessingResult:
+        """Process skill with DIRECTORY_WITH_SUBDIRS mode.
+
+        For skills that contain subdirectories to preserve (e.g., docx with scripts/, ooxml/).
+
+        Processing steps:
+        1. Find all markdown files in skill directory
+        2. Merge markdown files using MarkdownMerger
+        3. Preserve subdirectories using SubdirectoryPreserver
+        4. Write merged markdown to /commands/{skill}.md
+        5. Track statistics in ProcessingResult
+
+        Args:
+            skill_dir: Path to skill directory
+            skill_name: Name of the skill
+
+        Returns:
+            ProcessingResult with transformation statistics
+        """
+        errors = []
+        notes = []
+        files_processed = []
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name} (DIRECTORY_WITH_SUBDIRS mode)")
+        console.info(f"{'=' * 60}")
+
+        try:
+            # Step 1: Find all markdown files
+            timer.begin('discover')
+            console.info(f"\n[1/4] Finding markdown files...")
+            if tree is None:
+                tree = SkillTree.scan(skill_dir)
+
+            skill_md_node, md_nodes, _, subdirs = self._discover_root_files(
+                tree, TransformationMode.DIRECTORY_WITH_SUBDIRS
+            )
+            skill_md = skill_md_node.path if skill_md_node else None
+            md_files = [node.path for node in md_nodes]
+
+            console.info(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
+            console.info(f"  ✓ Found {len(md_files)} secondary markdown files")
+
+            # Step 2: Merge markdown files
+            timer.begin('merge')
+            console.info(f"\n[2/4] Merging markdown files...")
+            merged_content = self._merge_or_stream(skill_md, md_files, errors)
+
+            # Track processed files
+            if skill_md:
+                try:
+                    files_processed.append(str(skill_md.relative_to(self.input_dir)))
+                except ValueError:
+                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
+                    files_processed.append(str(skill_md.relative_to(skill_dir)))
+            for md_file in md_files:
+                try:
+                    files_processed.append(str(md_file.relative_to(self.input_dir)))
+                except ValueError:
+                    files_processed.append(str(md_file.relative_to(skill_dir)))
+
+            # Step 3: Preserve subdirectories
+            timer.begin('copy_subdirs')
+            console.info(f"\n[3/4] Preserving subdirectories...")
+
+            if subdirs:
+                # Create destination directory: /commands/{skill}/
+                dest_dir = self.output_dir / skill_name
+                dest_dir.mkdir(parents=True, exist_ok=True)
+
+                # Copy subdirectories
+                stats = self.subdirectory_preserver.copy_subdirectories(
+                    skill_dir, dest_dir, subdirs, tree
+                )
+
+                console.info(f"  ✓ Copied {stats['copied_dirs']} directories, {stats['copied_files']} files")
+
+                if stats['skipped_files'] > 0:
+                    console.info(f"  ✓ Skipped {stats['skipped_files']} unchanged files")
+
+                if stats['linked_files'] > 0:
+                    console.info(f"  ✓ Linked {stats['linked_files']} files ({self.link_mode})")
+
+                if stats['excluded_files'] > 0:
+                    console.info(f"  ✓ Excluded {stats['excluded_files']} files")
+
+                if stats['errors']:
+                    errors.extend(stats['errors'])
+                    console.warning(f"  WARNING: {len(stats['errors'])} errors during copying")
+            else:
+                stats = {'copied_dirs': 0, 'copied_files': 0, 'skipped_files': 0,
+                         'linked_files': 0, 'excluded_files': 0, 'errors': []}
+                console.info(f"  ✓ No subdirectories to preserve")
+
+            # Step 4: Write output markdown
+            timer.begin('write_output')
+            console.info(f"\n[4/4] Writing output markdown...")
+            output_filename = self.generate_output_filename(skill_name)
+            final_filename = self.check_naming_conflict(output_filename, self.output_dir, skill_name)
+
+            if output_filename != final_filename:
+                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
+                console.info(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+
+            write_success, _ = self._write_merged_output(final_filename, merged_content,
+                                                         skill_md, md_files, errors)
+
+            if not write_success:
+                error_msg = f"Failed to write output file: {final_filename}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                status = "FAILED"
+            else:
+                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
+                console.info(f"\n✓ Status: {status}")
+                console.info(f"  Output: {final_filename}")
+                if subdirs:
+                    console.info(f"  Assets: /commands/{skill_name}/")
+
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status=status,
+                output_file=final_filename if write_success else None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="DIRECTORY_WITH_SUBDIRS",
+                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
+                subdirectories_copied=stats['copied_dirs'],
+                scripts_relocated=0,
+                path_updates_count=0,
+                path_update_details=[],
+                phase_metrics=phase_metrics
+            )
+
+        except Exception as e:
+            error_msg = f"Unexpected error in _process_with_subdirs: {e}"
+            errors.append(error_msg)
+            console.error(f"\n  FATAL ERROR: {error_msg}")
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status="FAILED",
+                output_file=None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="DIRECTORY_WITH_SUBDIRS",
+                phase_metrics=phase_metrics
+            )
+
+    def _process_with_scripts(self, skill_dir: Path, skill_name: str,
+                              tree: Optional[SkillTree] = None) -> ProcessingResult:
+        """Process skill with DIRECTORY_WITH_SCRIPTS mode.
+
+        For skills that contain root-level executable scripts (e.g., root-cause-tracing).
+
+        Processing steps:
+        1. Find all markdown files and scripts in skill directory
+        2. Merge markdown files using MarkdownMerger
+        3. Relocate scripts to /commands/{skill}/ using PathUpdater
+        4. Update script paths in markdown using PathUpdater
+        5. Write merged markdown to /commands/{skill}.md
+        6. Track statistics in ProcessingResult
+
+        Args:
+            skill_dir: Path to skill directory
+            skill_name: Name of the skill
+
+        Returns:
+            ProcessingResult with transformation statistics
+        """
+        errors = []
+        notes = []
+        files_processed = []
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name} (DIRECTORY_WITH_SCRIPTS mode)")
+        console.info(f"{'=' * 60}")
+
+        try:
+            # Step 1: Find all markdown files and scripts
+            timer.begin('discover')
+            console.info(f"\n[1/5] Finding markdown files and scripts...")
+            if tree is None:
+                tree = SkillTree.scan(skill_dir)
+
+            skill_md_node, md_nodes, script_nodes, _ = self._discover_root_files(
+                tree, TransformationMode.DIRECTORY_WITH_SCRIPTS
+            )
+            skill_md = skill_md_node.path if skill_md_node else None
+            md_files = [node.path for node in md_nodes]
+            script_files = [node.path for node in script_nodes]
+
+            console.info(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
+            console.info(f"  ✓ Found {len(md_files)} secondary markdown files")
+            console.info(f"  ✓ Found {len(script_files)} script files")
+
+            # Step 2: Merge markdown files
+            timer.begin('merge')
+            console.info(f"\n[2/5] Merging markdown files...")
+            merged_content = self._merge_or_stream(skill_md, md_files, errors)
+
+            # Track processed files
+            if skill_md:
+                try:
+                    files_processed.append(str(skill_md.relative_to(self.input_dir)))
+                except ValueError:
+                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
+                    files_processed.append(str(skill_md.relative_to(skill_dir)))
+            for md_file in md_files:
+                try:
+                    files_processed.append(str(md_file.relative_to(self.input_dir)))
+                except ValueError:
+                    files_processed.append(str(md_file.relative_to(skill_dir)))
+
+            # Step 3: Relocate scripts
+            timer.begin('relocate_scripts')
+            console.info(f"\n[3/5] Relocating scripts...")
+
+            if script_files:
+                # Relocate scripts to OUTPUT_DIR/{skill_name}/
+                # Note: relocate_scripts creates the skill subdirectory
+                reloc_stats = self.path_updater.relocate_scripts(
+                    skill_dir, self.output_dir, skill_name, script_files
+                )
+
+                console.info(f"  ✓ Relocated {reloc_stats['relocated_count']} scripts")
+
+                if reloc_stats['skipped_count'] > 0:
+                    console.info(f"  ✓ Skipped {reloc_stats['skipped_count']} unchanged scripts")
+
+                if reloc_stats['errors']:
+                    errors.extend(reloc_stats['errors'])
+                    console.warning(f"  WARNING: {len(reloc_stats['errors'])} errors during relocation")
+
+                for script in script_files:
+                    try:
+                        files_processed.append(str(script.relative_to(self.input_dir)))
+                    except ValueError:
+                        files_processed.append(str(script.relative_to(skill_dir)))
+            else:
+                reloc_stats = {'relocated_count': 0, 'skipped_count': 0, 'errors': []}
+                console.info(f"  ✓ No scripts to relocate")
+
+            # Step 4: Update paths in markdown
+            timer.begin('rewrite_paths')
+            console.info(f"\n[4/5] Updating script paths in markdown...")
+
+            if script_files and self.stream:
+                path_update_count = 0
+                console.info(f"  ✓ Path updates are applied while streaming the output")
+            elif script_files and merged_content:
+                script_names = [script.name for script in script_files]
+                updated_content, update_count = self.path_updater.update_paths_in_markdown(
+                    merged_content, skill_name, script_names
+                )
+
+                if update_count > 0:
+                    merged_content = updated_content
+                    console.info(f"  ✓ Updated {update_count} path references")
+                    notes.append(f"Updated {update_count} script path references")
+                else:
+                    console.info(f"  ✓ No path updates needed")
+
+                path_update_count = update_count
+            else:
+                path_update_count = 0
+                console.info(f"  ✓ No path updates needed")
+
+            # Step 5: Write output markdown
+            timer.begin('write_output')
+            console.info(f"\n[5/5] Writing output markdown...")
+            output_filename = self.generate_output_filename(skill_name)
+            final_filename = self.check_naming_conflict(output_filename, self.output_dir, skill_name)
+
+            if output_filename != final_filename:
+                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
+                console.info(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+
+            write_success, streamed_updates = self._write_merged_output(
+                final_filename, merged_content, skill_md, md_files, errors,
+                skill_name, [script.name for script in script_files]
+            )
+            if streamed_updates > 0:
+                path_update_count = streamed_updates
+                console.info(f"  ✓ Updated {path_update_count} path references")
+                notes.append(f"Updated {path_update_count} script path references")
+
+            if not write_success:
+                error_msg = f"Failed to write output file: {final_filename}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                status = "FAILED"
+            else:
+                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
+                console.info(f"\n✓ Status: {status}")
+                console.info(f"  Output: {final_filename}")
+                if script_files:
+                    console.info(f"  Scripts: /commands/{skill_name}/")
+
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status=status,
+                output_file=final_filename if write_success else None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="DIRECTORY_WITH_SCRIPTS",
+                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
+                subdirectories_copied=0,
+                scripts_relocated=reloc_stats['relocated_count'],
+                path_updates_count=path_update_count,
+                path_update_details=[],
+                phase_metrics=phase_metrics
+            )
+
+        except Exception as e:
+            error_msg = f"Unexpected error in _process_with_scripts: {e}"
+            errors.append(error_msg)
+            console.error(f"\n  FATAL ERROR: {error_msg}")
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status="FAILED",
+                output_file=None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="DIRECTORY_WITH_SCRIPTS",
+                phase_metrics=phase_metrics
+            )
+
+    def _process_single_file(self, skill_dir: Path, skill_name: str,
+                             tree: Optional[SkillTree] = None) -> ProcessingResult:
+        """Process skill with SINGLE_FILE mode.
+
+        For simple skills with only markdown files (e.g., brainstorming, algorithmic-art).
+
+        Processing steps:
+        1. Find all markdown files in skill directory
+        2. Merge markdown files using MarkdownMerger (if multiple present)
+        3. Write merged markdown to /commands/{skill}.md
+        4. Track statistics in ProcessingResult
+
+        Args:
+            skill_dir: Path to skill directory
+            skill_name: Name of the skill
+
+        Returns:
+            ProcessingResult with transformation statistics
+        """
+        errors = []
+        notes = []
+        files_processed = []
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name} (SINGLE_FILE mode)")
+        console.info(f"{'=' * 60}")
+
+        try:
+            # Step 1: Find all markdown files
+            timer.begin('discover')
+            console.info(f"\n[1/3] Finding markdown files...")
+            if tree is None:
+                tree = SkillTree.scan(skill_dir)
+
+            skill_md_node, md_nodes, _, _ = self._discover_root_files(
+                tree, TransformationMode.SINGLE_FILE
+            )
+            skill_md = skill_md_node.path if skill_md_node else None
+            md_files = [node.path for node in md_nodes]
+
+            console.info(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
+            console.info(f"  ✓ Found {len(md_files)} secondary markdown files")
+
+            # Step 2: Merge markdown files
+            timer.begin('merge')
+            console.info(f"\n[2/3] Merging markdown files...")
+            merged_content = self._merge_or_stream(skill_md, md_files, errors)
+
+            # Track processed files
+            if skill_md:
+                try:
+                    files_processed.append(str(skill_md.relative_to(self.input_dir)))
+                except ValueError:
+                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
+                    files_processed.append(str(skill_md.relative_to(skill_dir)))
+            for md_file in md_files:
+                try:
+                    files_processed.append(str(md_file.relative_to(self.input_dir)))
+                except ValueError:
+                    files_processed.append(str(md_file.relative_to(skill_dir)))
+
+            # Step 3: Write output markdown
+            timer.begin('write_output')
+            console.info(f"\n[3/3] Writing output markdown...")
+            output_filename = self.generate_output_filename(skill_name)
+            final_filename = self.check_naming_conflict(output_filename, self.output_dir, skill_name)
+
+            if output_filename != final_filename:
+                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
+                console.info(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+
+            write_success, _ = self._write_merged_output(final_filename, merged_content,
+                                                         skill_md, md_files, errors)
+
+            if not write_success:
+                error_msg = f"Failed to write output file: {final_filename}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                status = "FAILED"
+            else:
+                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
+                console.info(f"\n✓ Status: {status}")
+                console.info(f"  Output: {final_filename}")
+
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status=status,
+                output_file=final_filename if write_success else None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="SINGLE_FILE",
+                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
+                subdirectories_copied=0,
+                scripts_relocated=0,
+                path_updates_count=0,
+                path_update_details=[],
+                phase_metrics=phase_metrics
+            )
+
+        except Exception as e:
+            error_msg = f"Unexpected error in _process_single_file: {e}"
+            errors.append(error_msg)
+            console.error(f"\n  FATAL ERROR: {error_msg}")
+            timer.end()
+
+            return ProcessingResult(
+                skill_name=skill_name,
+                status="FAILED",
+                output_file=None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=0,
+                transformation_mode="SINGLE_FILE",
+                phase_metrics=phase_metrics
+            )
+
+    def process_skill(self, skill_dir: Path) -> ProcessingResult:
+        """Process a single skill directory using v2.0 transformation modes.
+
+        This is the main entry point for skill processing. It detects the
+        appropriate transformation mode and routes to specialized processors:
+
+        1. DIRECTORY_WITH_SUBDIRS: Skills with subdirectories (e.g., docx)
+        2. DIRECTORY_WITH_SCRIPTS: Skills with root-level scripts (e.g., root-cause-tracing)
+        3. SINGLE_FILE: Simple markdown-only skills (e.g., brainstorming)
+
+        Args:
+            skill_dir: Path to the skill directory to process.
 
-            return content
+        Returns:
+            ProcessingResult object with status, output file path,
+            files processed, errors, notes, and transformation statistics.
 
-        # For code files, show as code block
-        filename = file_path.name
-        language = get_language_hint(file_path)
+        Error Handling:
+            - Catches all exceptions to prevent one skill from breaking batch
+            - Records errors in ProcessingResult.errors list
+            - Returns FAILED status if critical errors occur
+            - Falls back to SINGLE_FILE mode if detection is ambiguous
+
+        Notes:
+            - Uses ModeDetector to determine transformation mode
+            - Routes to specialized _process_* methods
+            - Maintains backward compatibility via fallback
+            - Skips skills whose content hash matches the manifest and returns
+              an UP_TO_DATE result (unless force=True)
+            - skill_dir may also be a zipped skill package, converted by
+              _process_archive() without extraction
+        """
+        skill_name = skill_name_of(skill_dir)
+
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name}")
+        console.info(f"{'=' * 60}")
+
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+
+        # Walk the skill directory (or archive index) once; every later
+        # stage reuses this tree
+        timer.begin('scan')
+        with SkillTree.load(skill_dir) as tree:
+            # Incremental check: skip skills whose inputs are unchanged
+            timer.begin('hash')
+            manifest = self.get_manifest()
+            digest, file_entries = manifest.compute_skill_hash(skill_dir, tree)
+            if self.blob_store is not None and not tree.is_archive:
+                self.blob_store.remember_digests(tree, file_entries)
+            expected_output = manifest.claim_output(skill_name, self.generate_output_filename(skill_name))
+            entry = self._current_manifest_entry(skill_name, digest, expected_output)
+            timer.end()
+
+            if entry is not None:
+                console.info(f"  ✓ Up to date (inputs unchanged) - keeping {entry['output_file']}")
+                return ProcessingResult(
+                    skill_name=skill_name,
+                    status="UP_TO_DATE",
+                    output_file=entry['output_file'],
+                    files_processed=[],
+                    errors=[],
+                    notes=[],
+                    retry_count=0,
+                    phase_metrics=phase_metrics
+                )
+
+            if is_skill_archive(skill_dir):
+                result = self._process_archive(skill_dir, skill_name, tree)
+            else:
+                result = self._process_skill_by_mode(skill_dir, skill_name, tree)
+            result.phase_metrics = {**phase_metrics, **result.phase_metrics}
+
+        # Only clean conversions are recorded; anything else is retried next run
+        if result.status == "SUCCESS" and result.output_file:
+            asset_dir = skill_name if (self.output_dir / skill_name).is_dir() else None
+            manifest.record(skill_name, digest, file_entries, result.output_file,
+                            asset_dir, self.link_mode)
+        else:
+            manifest.forget(skill_name)
+
+        return result
+
+    def _current_manifest_entry(self, skill_name: str, digest: str,
+                                expected_output: str) -> Optional[Dict[str, Any]]:
+        """Return the manifest entry of a skill whose recorded output is current.
+
+        Args:
+            skill_name: Name of the skill
+            digest: Content hash of the skill's inputs
+            expected_output: Output filename claimed for the skill
+
+        Returns:
+            The manifest entry if the skill can be skipped (inputs, output
+            name and link mode unchanged and outputs present), otherwise None.
+            Always None with force=True.
+        """
+        manifest = self.get_manifest()
+        entry = manifest.get_entry(skill_name)
+
+        if (not self.force and entry and entry.get('output_file') == expected_output
+                and entry.get('link_mode', 'copy') == self.link_mode
+                and manifest.is_up_to_date(skill_name, digest, self.output_dir)):
+            return entry
+        return None
+
+    def _process_skill_by_mode(self, skill_dir: Path, skill_name: str,
+                               tree: Optional[SkillTree] = None) -> ProcessingResult:
+        """Detect the transformation mode and route to the matching processor.
+
+        Args:
+            skill_dir: Path to the skill directory to process.
+            skill_name: Name of the skill.
+            tree: Pre-scanned SkillTree shared by all processing stages.
+
+        Returns:
+            ProcessingResult from the selected _process_* method.
+        """
+        errors = []
+        notes = []
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
+
+        try:
+            # Step 1: Detect transformation mode (subtask 5.3)
+            console.info(f"\n[Mode Detection] Analyzing directory structure...")
+            timer.begin('mode_detection')
+            mode = self.mode_detector.detect_mode(skill_dir, tree)
+            timer.end()
+
+            console.info(f"  ✓ Detected mode: {mode.value}")
+            notes.append(f"Transformation mode: {mode.value}")
+
+            # Step 2: Route to appropriate processing method (subtasks 5.7, 5.8, 5.9)
+            if mode == TransformationMode.DIRECTORY_WITH_SUBDIRS:
+                console.info(f"  → Routing to DIRECTORY_WITH_SUBDIRS processor")
+                result = self._process_with_subdirs(skill_dir, skill_name, tree)
+
+            elif mode == TransformationMode.DIRECTORY_WITH_SCRIPTS:
+                console.info(f"  → Routing to DIRECTORY_WITH_SCRIPTS processor")
+                result = self._process_with_scripts(skill_dir, skill_name, tree)
+
+            else:  # SINGLE_FILE mode (includes fallback)
+                console.info(f"  → Routing to SINGLE_FILE processor")
+                result = self._process_single_file(skill_dir, skill_name, tree)
+
+            result.phase_metrics = {**phase_metrics, **result.phase_metrics}
+            return result
+
+        except Exception as e:
+            # Fallback behavior (subtask 5.9): If mode detection fails, default to SINGLE_FILE
+            timer.end()
+            error_msg = f"Mode detection failed for {skill_name}: {e}"
+            console.warning(f"\n  WARNING: {error_msg}")
+            console.info(f"  → Falling back to SINGLE_FILE mode")
+
+            notes.append("Mode detection failed - using SINGLE_FILE fallback")
+            errors.append(error_msg)
+
+            # Attempt to process with SINGLE_FILE mode as fallback
+            try:
+                result = self._process_single_file(skill_dir, skill_name, tree)
+                # Add fallback notes to result
+                result.notes.extend(notes)
+                result.errors.extend(errors)
+                result.phase_metrics = {**phase_metrics, **result.phase_metrics}
+                return result
+            except Exception as fallback_error:
+                # If even fallback fails, return FAILED status
+                return ProcessingResult(
+                    skill_name=skill_name,
+                    status="FAILED",
+                    output_file=None,
+                    files_processed=[],
+                    errors=errors + [f"Fallback processing failed: {fallback_error}"],
+                    notes=notes,
+                    retry_count=0,
+                    transformation_mode="SINGLE_FILE",
+                    phase_metrics=phase_metrics
+                )
+
+    def process_skill_legacy(self, skill_dir: Path) -> ProcessingResult:
+        """Legacy processing method (pre-v2.0).
+
+        This method contains the original v1.0 processing logic and is kept
+        for reference and potential fallback scenarios. New code should use
+        process_skill() which routes to specialized v2.0 processors.
+
+        Complete processing pipeline for one skill:
+        1. Discover all files in the skill directory
+        2. Read and parse file contents
+        3. Generate command markdown using template
+        4. Write output file
+        5. Return processing result with status and metadata
+
+        Args:
+            skill_dir: Path to the skill directory to process.
+
+        Returns:
+            ProcessingResult object with status, output file path,
+            files processed, errors, and notes.
+
+        Error Handling:
+            - Catches all exceptions to prevent one skill from breaking batch
+            - Records errors in ProcessingResult.errors list
+            - Returns FAILED status if critical errors occur
+            - Returns PARTIAL_SUCCESS if some files couldn't be processed
+
+        Notes:
+            - Implements retry logic for transient failures
+            - Creates output directory if it doesn't exist
+            - Uses SKELETON_TEMPLATE for output format
+        """
+        skill_name = skill_dir.name
+        files_processed = []
+        errors = []
+        notes = []
+        retry_count = 0
+
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name} (LEGACY MODE)")
+        console.info(f"{'=' * 60}")
+
+        try:
+            # Step 1: Discover all files in the skill directory
+            console.info(f"\n[1/6] Discovering files in {skill_name}...")
+            files_dict = self.discover_files(skill_dir)
+
+            if not files_dict:
+                error_msg = f"No files discovered in {skill_name}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                return ProcessingResult(
+                    skill_name=skill_name,
+                    status="FAILED",
+                    output_file=None,
+                    files_processed=[],
+                    errors=errors,
+                    notes=notes,
+                    retry_count=0
+                )
+
+            # Count total files discovered
+            total_files = (
+                (1 if files_dict.get('skill_md') else 0) +
+                len(files_dict.get('markdown', [])) +
+                len(files_dict.get('code', [])) +
+                len(files_dict.get('config', [])) +
+                len(files_dict.get('other', []))
+            )
+            console.info(f"  ✓ Discovered {total_files} files")
+
+            # Step 2: Extract metadata from SKILL.md (if present)
+            console.info(f"\n[2/6] Extracting metadata...")
+            metadata = {}
+
+            if files_dict.get('skill_md'):
+                skill_md_path = files_dict['skill_md']
+                content = self.read_file_with_retry(skill_md_path)
+
+                if content:
+                    metadata = self.extract_yaml_frontmatter(content)
+                    files_processed.append(str(skill_md_path.relative_to(self.input_dir)))
+                    console.info(f"  ✓ Extracted metadata from SKILL.md")
+                    if metadata:
+                        console.info(f"    - Description: {metadata.get('description', 'N/A')[:60]}...")
+                        if metadata.get('argument-hint'):
+                            console.info(f"    - Argument hint: {metadata.get('argument-hint')}")
+                else:
+                    error_msg = f"Failed to read SKILL.md in {skill_name}"
+                    errors.append(error_msg)
+                    notes.append("Using fallback metadata generation")
+                    console.warning(f"  WARNING: {error_msg}")
+            else:
+                notes.append("No SKILL.md found - using fallback metadata")
+                console.warning(f"  WARNING: No SKILL.md found")
+
+            # Generate fallback metadata if needed
+            if not metadata:
+                console.info(f"  Generating fallback metadata...")
+                metadata = self.generate_fallback_metadata(skill_name, files_dict)
+                console.info(f"  ✓ Generated fallback metadata")
+
+            # Step 3: Categorize content files
+            console.info(f"\n[3/6] Categorizing content files...")
+            categorized = self.categorize_content_files(files_dict)
+
+            category_counts = {
+                'reference': len(categorized.get('reference', [])),
+                'examples': len(categorized.get('examples', [])),
+                'code': len(categorized.get('code', [])),
+                'themes': len(categorized.get('themes', []))
+            }
+            console.info(f"  ✓ Categorized files:")
+            for category, count in category_counts.items():
+                if count > 0:
+                    console.info(f"    - {category}: {count} files")
+
+            # Step 4: Generate output content
+            console.info(f"\n[4/6] Generating output content...")
+            try:
+                output_content = self.generate_output_content(
+                    skill_name=skill_name,
+                    files_dict=files_dict,
+                    categorized=categorized,
+                    metadata=metadata
+                )
+
+                if not output_content or len(output_content.strip()) == 0:
+                    error_msg = "Generated empty output content"
+                    errors.append(error_msg)
+                    console.error(f"  ERROR: {error_msg}")
+                    return ProcessingResult(
+                        skill_name=skill_name,
+                        status="FAILED",
+                        output_file=None,
+                        files_processed=files_processed,
+                        errors=errors,
+                        notes=notes,
+                        retry_count=retry_count
+                    )
+
+                content_size = len(output_content)
+                console.info(f"  ✓ Generated {content_size} characters of content")
+
+                # Track all files that were integrated into the output
+                for file_list in [categorized.get('reference', []),
+                                 categorized.get('examples', []),
+                                 categorized.get('code', []),
+                                 categorized.get('themes', [])]:
+                    for file_path in file_list:
+                        rel_path = str(file_path.relative_to(self.input_dir))
+                        if rel_path not in files_processed:
+                            files_processed.append(rel_path)
+
+            except Exception as e:
+                error_msg = f"Failed to generate output content: {e}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                return ProcessingResult(
+                    skill_name=skill_name,
+                    status="FAILED",
+                    output_file=None,
+                    files_processed=files_processed,
+                    errors=errors,
+                    notes=notes,
+                    retry_count=retry_count
+                )
+
+            # Step 5: Generate output filename with conflict resolution
+            console.info(f"\n[5/6] Determining output filename...")
+            base_filename = self.generate_output_filename(skill_name)
+            final_filename = self.check_naming_conflict(base_filename, self.output_dir, skill_name)
+
+            if base_filename != final_filename:
+                notes.append(f"Naming conflict resolved: {base_filename} → {final_filename}")
+                console.info(f"  ! Conflict resolved: {base_filename} → {final_filename}")
+            else:
+                console.info(f"  ✓ Output filename: {final_filename}")
+
+            # Step 6: Write output file
+            console.info(f"\n[6/6] Writing output file...")
+            write_success = self.write_output_file(final_filename, output_content)
+
+            if not write_success:
+                error_msg = f"Failed to write output file: {final_filename}"
+                errors.append(error_msg)
+                console.error(f"  ERROR: {error_msg}")
+                return ProcessingResult(
+                    skill_name=skill_name,
+                    status="FAILED",
+                    output_file=None,
+                    files_processed=files_processed,
+                    errors=errors,
+                    notes=notes,
+                    retry_count=retry_count
+                )
 
-        return f"**{filename}:**\n\n```{language}\n{content}\n```"
+            # Determine final status
+            if errors:
+                status = "PARTIAL_SUCCESS"
+                notes.append(f"Completed with {len(errors)} error(s)")
+                console.warning(f"\n⚠ Status: PARTIAL_SUCCESS ({len(errors)} errors)")
+            else:
+                status = "SUCCESS"
+                console.info(f"\n✓ Status: SUCCESS")
 
-    def _generate_theme_section(self, file_path: Path, content: str) -> Optional[str]:
-        """
-        Generate a theme subsection from a theme file.
+            console.info(f"  Output: {final_filename}")
+            console.info(f"  Files processed: {len(files_processed)}")
 
-        Args:
-            file_path: Path to the theme file
-            content: Content of the theme file
+            return ProcessingResult(
+                skill_name=skill_name,
+                status=status,
+                output_file=final_filename,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=retry_count
+            )
 
-        Returns:
-            Theme subsection as markdown string
-        """
-        # Themes are typically markdown files with theme specifications
-        # Remove any YAML front matter
-        content = content.lstrip()
-        if content.startswith('---'):
-            lines = content.split('\n')
-            closing_idx = -1
-            for i in range(1, len(lines)):
-                if lines[i].strip() == '---':
-                    closing_idx = i
-                    break
+        except Exception as e:
+            # Catch-all for any unexpected errors
+            error_msg = f"Unexpected error processing {skill_name}: {e}"
+            errors.append(error_msg)
+            console.error(f"\n  FATAL ERROR: {error_msg}")
 
-            if closing_idx > 0:
-                content = '\n'.join(lines[closing_idx + 1:]).lstrip()
+            return ProcessingResult(
+                skill_name=skill_name,
+                status="FAILED",
+                output_file=None,
+                files_processed=files_processed,
+                errors=errors,
+                notes=notes,
+                retry_count=retry_count
+            )
 
-        return content
+    def _process_skill_safely(self, skill_dir: Path) -> ProcessingResult:
+        """Process one skill, converting unexpected exceptions into a FAILED result.
 
-    def _generate_code_block(self, file_path: Path, content: str) -> Optional[str]:
-        """
-        Generate a code block from a code file.
+        Used by run() for both serial and concurrent processing so that one
+        broken skill never aborts the batch.
 
         Args:
-            file_path: Path to the code file
-            content: Content of the code file
+            skill_dir: Path to the skill directory to process.
 
         Returns:
-            Code block as markdown string with proper syntax highlighting
+            ProcessingResult from process_skill(), or a FAILED result if it raised.
         """
-        filename = file_path.name
-        language = get_language_hint(file_path)
-
-        # Get relative path from skill directory for context
-        # (helps identify the purpose of the code file)
-
-        return f"**{filename}:**\n\n```{language}\n{content}\n```"
+        _log_context.skill = skill_name_of(skill_dir)
+        try:
+            return self.process_skill(skill_dir)
+        except Exception as e:
+            # Catch any unexpected errors and continue with next skill
+            console.error(f"\nFATAL ERROR processing {skill_dir.name}: {e}")
+            console.info(f"  Skipping to next skill...")
+            # Create a FAILED result
+            return ProcessingResult(
+                skill_name=skill_name_of(skill_dir),
+                status="FAILED",
+                output_file=None,
+                files_processed=[],
+                errors=[f"Fatal error: {e}"],
+                notes=[],
+                retry_count=0
+            )
+        finally:
+            _log_context.skill = None
 
-    def _generate_usage_section(self, skill_name: str, metadata: Dict[str, str]) -> str:
-        """
-        Generate the Usage section for the command.
+    def format_summary_section(self, report: ConversionReport) -> str:
+        """Format summary statistics section of the report.
 
         Args:
-            skill_name: Name of the skill
-            metadata: YAML front matter metadata
+            report: ConversionReport object with aggregated statistics
 
         Returns:
-            Usage section as markdown string
+            Formatted string with summary statistics
+
+        Notes:
+            - Includes total counts, success rate calculation
+            - Uses separators for visual clarity
+            - Displays all key metrics at a glance
         """
         lines = []
-        lines.append("## Usage")
+
+        lines.append("=" * 60)
+        lines.append("SUMMARY STATISTICS")
+        lines.append("=" * 60)
         lines.append("")
+        lines.append(f"Total Skills Processed: {report.total_skills}")
+        lines.append(f"Successful Conversions: {report.successful}")
+        lines.append(f"Partial Successes: {report.partial_success}")
+        lines.append(f"Failed Conversions: {report.failed}")
+        lines.append(f"Up-To-Date (Skipped): {report.up_to_date}")
+        lines.append(f"Total Files Processed: {report.total_files_processed}")
+        lines.append(f"Total Errors: {report.total_errors}")
+        lines.append(f"Total Retries: {report.total_retries}")
 
-        # Get argument hint if available
-        arg_hint = metadata.get('argument-hint', '[arguments]')
+        # Calculate and display success rate
+        if report.total_skills > 0:
+            success_rate = ((report.successful + report.partial_success + report.up_to_date)
+                           / report.total_skills * 100)
+            lines.append(f"Success Rate: {success_rate:.1f}%")
 
-        # Basic usage
-        lines.append(f"**Basic usage:** `/{skill_name} {arg_hint}`")
+        if report.dedup_stats is not None:
+            dedup = report.dedup_stats
+            lines.append(f"Deduplicated Bytes Saved: {dedup['saved_bytes']:,} "
+                         f"({dedup['blobs']} unique blobs, {dedup['unique_bytes']:,} bytes stored)")
+
+        if report.frontmatter_stats is not None:
+            fm = report.frontmatter_stats
+            lines.append(f"Frontmatter Parse Time: {fm['seconds'] * 1000:.1f} ms "
+                         f"({fm['blocks']} parsed: {fm['fast_path']} fast path, "
+                         f"{fm['yaml']} PyYAML, {fm['regex']} regex; "
+                         f"{fm['cache_hits']} cache hits)")
+
+        if report.phase_totals:
+            lines.append(f"Run Wall Time: {report.elapsed_seconds:.2f} s")
+            lines.append("Phase Timings (summed over skills):")
+            lines.append(f"  {'Phase':<18}{'Time (ms)':>11}{'Read (KB)':>12}"
+                         f"{'Written (KB)':>14}{'Files':>8}")
+            for phase, metrics in report.phase_totals.items():
+                lines.append(f"  {phase:<18}{metrics['seconds'] * 1000:>11.1f}"
+                             f"{metrics['bytes_read'] / 1024:>12,.1f}"
+                             f"{metrics['bytes_written'] / 1024:>14,.1f}"
+                             f"{metrics['files']:>8,}")
 
-        return '\n'.join(lines)
+        lines.append("")
 
-    def generate_output_filename(self, skill_name: str) -> str:
-        """
-        Generate safe output filename from skill name.
+        return "\n".join(lines)
 
-        Converts skill directory name to kebab-case and sanitizes for
-        safe filesystem usage. Handles edge cases like empty names,
-        special characters, and ensures .md extension.
+    def format_success_section(self, report: ConversionReport) -> str:
+        """Format successful conversions section of the report.
 
         Args:
-            skill_name: Name of skill directory (e.g., "MCP Builder", "algorithmic_art")
+            report: ConversionReport object with all processing results
 
         Returns:
-            Sanitized filename with .md extension (e.g., "mcp-builder.md", "algorithmic-art.md")
+            Formatted string listing all successful conversions
 
-        Examples:
-            "MCP Builder" -> "mcp-builder.md"
-            "algorithmic_art" -> "algorithmic-art.md"
-            "My Cool  Skill!!!" -> "my-cool-skill.md"
-            "___test___" -> "test.md"
-            "" -> "unnamed-skill.md"
-            "123" -> "123.md"
+        Notes:
+            - Lists only SUCCESS status results
+            - Shows output file, file count, and notes for each
+            - Includes v2.0 transformation statistics (mode, merged files, etc.)
+            - Returns empty string if no successful conversions
         """
-        # Handle empty or whitespace-only names
-        if not skill_name or not skill_name.strip():
-            return "unnamed-skill.md"
-
-        # Remove .md extension if present (since we'll add it at the end)
-        filename = skill_name
-        if filename.lower().endswith('.md'):
-            filename = filename[:-3]
-
-        # Convert to lowercase
-        filename = filename.lower()
-
-        # Replace spaces, underscores, and dots with hyphens
-        filename = filename.replace(' ', '-').replace('_', '-').replace('.', '-')
+        successful_results = [r for r in report.results
+                             if r.status == "SUCCESS"]
 
-        # Remove special characters - keep only alphanumeric and hyphens
-        # This regex keeps: a-z, 0-9, and hyphens
-        filename = re.sub(r'[^a-z0-9-]', '', filename)
+        if not successful_results:
+            return ""
 
-        # Replace multiple consecutive hyphens with a single hyphen
-        filename = re.sub(r'-+', '-', filename)
+        lines = []
+        lines.append("=" * 60)
+        lines.append(f"SUCCESSFUL CONVERSIONS ({len(successful_results)})")
+        lines.append("=" * 60)
+        lines.append("")
 
-        # Remove leading and trailing hyphens
-        filename = filename.strip('-')
+        for i, result in enumerate(successful_results, 1):
+            lines.append(f"[{i}] {result.skill_name}")
+            lines.append(f"    Output: {result.output_file}")
+            lines.append(f"    Files Processed: {len(result.files_processed)}")
 
-        # If after sanitization we have nothing left, use default name
-        if not filename:
-            return "unnamed-skill.md"
+            # Add v2.0 transformation mode (subtask 6.1)
+            if result.transformation_mode:
+                lines.append(f"    Transformation Mode: {result.transformation_mode}")
 
-        # Ensure .md extension
-        if not filename.endswith('.md'):
-            filename = f"{filename}.md"
+                # Add v2.0 transformation statistics (subtasks 6.2-6.5)
+                stats_lines = []
 
-        return filename
+                # Markdown files merged (subtask 6.2)
+                if result.markdown_files_merged > 0:
+                    stats_lines.append(f"Merged {result.markdown_files_merged} markdown file(s)")
 
-    def check_naming_conflict(self, filename: str, output_dir: Path) -> str:
-        """
-        Check for naming conflicts and resolve with numeric suffixes.
+                # Subdirectories copied (subtask 6.3)
+                if result.subdirectories_copied > 0:
+                    stats_lines.append(f"Copied {result.subdirectories_copied} subdirectory(ies)")
 
-        If a file with the given name already exists in the output directory,
-        appends a numeric suffix (-2, -3, etc.) until an available name is found.
+                # Scripts relocated (subtask 6.4)
+                if result.scripts_relocated > 0:
+                    stats_lines.append(f"Relocated {result.scripts_relocated} script(s)")
 
-        Args:
-            filename: Proposed filename (e.g., "mcp-builder.md")
-            output_dir: Output directory path to check for conflicts
+                # Path updates (subtask 6.5)
+                if result.path_updates_count > 0:
+                    stats_lines.append(f"Updated {result.path_updates_count} path reference(s)")
 
-        Returns:
-            Final filename (possibly with -2, -3 suffix if conflict existed)
+                if stats_lines:
+                    lines.append(f"    Statistics: {', '.join(stats_lines)}")
 
-        Examples:
-            If "mcp-builder.md" exists:
-                "mcp-builder.md" -> "mcp-builder-2.md"
-            If "mcp-builder.md" and "mcp-builder-2.md" exist:
-                "mcp-builder.md" -> "mcp-builder-3.md"
+            if result.notes:
+                lines.append("    Notes:")
+                for note in result.notes:
+                    lines.append(f"      - {note}")
 
-        Notes:
-            - Only checks for conflicts, doesn't create files
-            - Always returns a safe, available filename
-            - Handles files with and without .md extension
-        """
-        # Ensure output directory exists for checking
-        if not output_dir.exists():
-            # If directory doesn't exist, no conflicts possible
-            return filename
+            lines.append("")
 
-        # Split filename into base and extension
-        if filename.endswith('.md'):
-            base_name = filename[:-3]  # Remove .md
-            extension = '.md'
-        else:
-            base_name = filename
-            extension = ''
-
-        # Check if original filename is available
-        candidate_path = output_dir / filename
-        if not candidate_path.exists():
-            return filename
-
-        # Original name is taken, try with numeric suffixes
-        counter = 2
-        max_attempts = 1000  # Safety limit to prevent infinite loops
-
-        while counter <= max_attempts:
-            # Build candidate filename with suffix
-            candidate_filename = f"{base_name}-{counter}{extension}"
-            candidate_path = output_dir / candidate_filename
-
-            # Check if this name is available
-            if not candidate_path.exists():
-                print(f"    Naming conflict resolved: {filename} -> {candidate_filename}")
-                return candidate_filename
-
-            counter += 1
-
-        # If we somehow exhausted all attempts (very unlikely),
-        # return a timestamp-based name as last resort
-        import time
-        timestamp = int(time.time())
-        fallback_filename = f"{base_name}-{timestamp}{extension}"
-        print(f"    WARNING: Exhausted numeric suffixes, using timestamp: {fallback_filename}")
-        return fallback_filename
+        return "\n".join(lines)
 
-    def ensure_output_directory(self) -> bool:
-        """
-        Ensure output directory exists and is writable.
+    def format_up_to_date_section(self, report: ConversionReport) -> str:
+        """Format the up-to-date (skipped) skills section of the report.
 
-        Creates OUTPUT_DIR if it doesn't exist, verifies write permissions.
-        Handles errors gracefully for permissions, disk space, etc.
+        Args:
+            report: ConversionReport object with all processing results
 
         Returns:
-            True if directory is ready (exists and writable), False if failed
-
-        Error Handling:
-            - PermissionError: Logs error and returns False
-            - OSError: Logs error (disk space, I/O issues) and returns False
-            - Other exceptions: Logs unexpected errors and returns False
+            Formatted string listing all UP_TO_DATE skills
 
         Notes:
-            - Creates parent directories if needed (parents=True)
-            - Verifies the path is actually a directory
-            - Tests write permissions by checking directory stats
+            - One line per skill with its existing output file
+            - Returns empty string if no skills were skipped
         """
-        try:
-            # Check if OUTPUT_DIR already exists
-            if OUTPUT_DIR.exists():
-                print(f"  Output directory exists: {OUTPUT_DIR}")
-
-                # Verify it's actually a directory (not a file)
-                if not OUTPUT_DIR.is_dir():
-                    print(f"  ERROR: Output path exists but is not a directory: {OUTPUT_DIR}")
-                    return False
-
-                # Check write permissions by trying to get stats
-                # On Unix systems, we can check os.access
-                if not os.access(OUTPUT_DIR, os.W_OK):
-                    print(f"  ERROR: Output directory is not writable: {OUTPUT_DIR}")
-                    return False
-
-                print(f"  ✓ Output directory is writable")
-                return True
+        up_to_date_results = [r for r in report.results
+                              if r.status == "UP_TO_DATE"]
 
-            # Directory doesn't exist - create it
-            print(f"  Creating output directory: {OUTPUT_DIR}")
-            OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-            # Verify creation succeeded
-            if not OUTPUT_DIR.exists():
-                print(f"  ERROR: Failed to create output directory: {OUTPUT_DIR}")
-                return False
-
-            # Verify write permissions on newly created directory
-            if not os.access(OUTPUT_DIR, os.W_OK):
-                print(f"  ERROR: Created directory is not writable: {OUTPUT_DIR}")
-                return False
-
-            print(f"  ✓ Successfully created output directory: {OUTPUT_DIR}")
-            return True
+        if not up_to_date_results:
+            return ""
 
-        except PermissionError as e:
-            print(f"  ERROR: Permission denied creating output directory: {e}")
-            return False
+        lines = []
+        lines.append("=" * 60)
+        lines.append(f"UP-TO-DATE SKILLS ({len(up_to_date_results)})")
+        lines.append("=" * 60)
+        lines.append("")
 
-        except OSError as e:
-            # Handles disk space, I/O errors, etc.
-            print(f"  ERROR: OS error creating output directory: {e}")
-            return False
+        for result in up_to_date_results:
+            lines.append(f"[UP_TO_DATE] {result.skill_name} -> {result.output_file}")
 
-        except Exception as e:
-            # Catch any unexpected errors
-            print(f"  ERROR: Unexpected error with output directory: {e}")
-            return False
+        lines.append("")
 
-    def write_output_file(self, filename: str, content: str) -> bool:
-        """
-        Write content to output file in OUTPUT_DIR.
+        return "\n".join(lines)
 
-        Creates the output directory if needed, writes content with UTF-8 encoding,
-        and handles all errors gracefully.
+    def format_failure_section(self, report: ConversionReport) -> str:
+        """Format failed and partial success conversions section.
 
         Args:
-            filename: Name of the output file (e.g., "mcp-builder.md")
-            content: Markdown content to write
+            report: ConversionReport object with all processing results
 
         Returns:
-            True if file was written successfully, False if failed
-
-        Error Handling:
-            - Directory creation failures: Returns False
-            - PermissionError: Logs and returns False
-            - IOError/OSError: Logs and returns False (disk full, etc.)
-            - UnicodeEncodeError: Logs and returns False
-            - Other exceptions: Logs and returns False
+            Formatted string listing all failed/partial conversions
 
         Notes:
-            - Automatically calls ensure_output_directory()
-            - Uses UTF-8 encoding for all output files
-            - Tracks and logs overwrites vs new file creation
-            - Logs file size after successful write
-            - Can be wrapped with retry logic in error handling layer
+            - Lists FAILED and PARTIAL_SUCCESS status results
+            - Shows detailed errors and suggestions for each
+            - Returns empty string if no failures/partial successes
         """
-        # Ensure output directory exists and is writable
-        print(f"\n  Writing output file: {filename}")
-        print(f"    Checking output directory...")
+        failed_results = [r for r in report.results
+                         if r.status in ["FAILED", "PARTIAL_SUCCESS"]]
 
-        if not self.ensure_output_directory():
-            print(f"    ERROR: Cannot write file - output directory not available")
-            return False
+        if not failed_results:
+            return ""
 
-        # Build full output path
-        output_path = OUTPUT_DIR / filename
+        lines = []
+        lines.append("=" * 60)
+        lines.append(f"FAILED / PARTIAL SUCCESS CONVERSIONS ({len(failed_results)})")
+        lines.append("=" * 60)
+        lines.append("")
 
-        # Check if file already exists (for overwrite tracking)
-        file_existed = output_path.exists()
+        for i, result in enumerate(failed_results, 1):
+            lines.append(f"[{result.status}] {result.skill_name}")
 
-        def _attempt_write():
-            """Internal function to attempt file write."""
-            print(f"    Writing content to: {output_path}")
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if result.output_file:
+                lines.append(f"    Output: {result.output_file}")
+            else:
+                lines.append(f"    Output: N/A")
 
-            # Verify file was written
-            if not output_path.exists():
-                raise IOError(f"File was not created: {output_path}")
+            if result.files_processed:
+                lines.append(f"    Files Processed: {len(result.files_processed)}")
+                # Show first 5 files
+                for file in result.files_processed[:5]:
+                    lines.append(f"      - {file}")
+                if len(result.files_processed) > 5:
+                    lines.append(f"      ... and {len(result.files_processed) - 5} more")
 
-            return output_path.stat().st_size
+            if result.errors:
+                lines.append("    Errors:")
+                for error in result.errors:
+                    lines.append(f"      - {error}")
 
-        # Try to write the file with retry logic
-        try:
-            file_size = retry_operation(
-                _attempt_write,
-                operation_name=f"write {filename}",
-                max_retries=MAX_RETRIES,
-                delay=RETRY_WAIT_TIME
-            )
+            if result.retry_count > 0:
+                lines.append(f"    Retry Attempts: {result.retry_count}")
 
-            if file_size == 0:
-                print(f"    WARNING: File was created but is empty: {output_path}")
-                # Don't return False here - empty files might be valid in some cases
+            # Provide suggestions based on status
+            if result.status == "PARTIAL_SUCCESS":
+                lines.append("    Suggestion: Review output file, may need manual adjustments")
+            elif result.status == "FAILED":
+                lines.append("    Suggestion: Check directory permissions and file accessibility")
 
-            # Log success with overwrite status
-            if file_existed:
-                print(f"    ✓ Overwritten: {filename} ({file_size} bytes)")
-            else:
-                print(f"    ✓ Created: {filename} ({file_size} bytes)")
+            lines.append("")
 
-            return True
+        return "\n".join(lines)
 
-        except PermissionError as e:
-            print(f"    ERROR: Permission denied writing file {filename}: {e}")
-            return False
+    def print_report(self, report: ConversionReport):
+        """Print formatted conversion report to stdout.
 
-        except OSError as e:
-            # Handles disk full, I/O errors, etc.
-            print(f"    ERROR: OS error writing file {filename}: {e}")
-            return False
+        Args:
+            report: ConversionReport object with all results
 
-        except UnicodeEncodeError as e:
-            print(f"    ERROR: Unicode encoding error writing file {filename}: {e}")
-            return False
+        Notes:
+            - Prints summary, successful conversions, and failures
+            - Uses clear sections with separators
+            - Provides actionable suggestions for failures
+            - Buffered progress output is flushed first, so the report
+              always follows it
+        """
+        flush_console()
+        print("\n")
+        print(self.format_summary_section(report))
+        print(self.format_success_section(report))
+        up_to_date_section = self.format_up_to_date_section(report)
+        if up_to_date_section:
+            print(up_to_date_section)
+        print(self.format_failure_section(report))
 
-        except Exception as e:
-            # Catch any unexpected errors (including retry exhaustion)
-            print(f"    ERROR: Failed to write file {filename}: {e}")
-            return False
+    def report_to_dict(self, report: ConversionReport) -> Dict[str, Any]:
+        """Convert a report to JSON-serializable data (see write_report_json).
 
-    def _process_with_subdirs(self, skill_dir: Path, skill_name: str) -> ProcessingResult:
-        """Process skill with DIRECTORY_WITH_SUBDIRS mode.
+        Args:
+            report: ConversionReport object with all results
 
-        For skills that contain subdirectories to preserve (e.g., docx with scripts/, ooxml/).
+        Returns:
+            Dictionary with run options, summary counts, frontmatter and
+            dedup statistics, per-phase totals and one entry per skill
+        """
+        return {
+            'converter_version': CONVERTER_VERSION,
+            'input_dir': str(self.input_dir),
+            'output_dir': str(self.output_dir),
+            'options': {
+                'jobs': self.jobs,
+                'force': self.force,
+                'link_mode': self.link_mode,
+                'stream': self.stream,
+            },
+            'elapsed_seconds': report.elapsed_seconds,
+            'summary': {
+                'total_skills': report.total_skills,
+                'successful': report.successful,
+                'partial_success': report.partial_success,
+                'failed': report.failed,
+                'up_to_date': report.up_to_date,
+                'total_files_processed': report.total_files_processed,
+                'total_errors': report.total_errors,
+                'total_retries': report.total_retries,
+            },
+            'frontmatter': report.frontmatter_stats,
+            'dedup': report.dedup_stats,
+            'phase_totals': report.phase_totals,
+            'skills': [
+                {
+                    'skill_name': r.skill_name,
+                    'status': r.status,
+                    'transformation_mode': r.transformation_mode,
+                    'output_file': r.output_file,
+                    'files_processed': len(r.files_processed),
+                    'errors': r.errors,
+                    'markdown_files_merged': r.markdown_files_merged,
+                    'subdirectories_copied': r.subdirectories_copied,
+                    'scripts_relocated': r.scripts_relocated,
+                    'path_updates_count': r.path_updates_count,
+                    'phase_metrics': r.phase_metrics,
+                }
+                for r in report.results
+            ],
+        }
 
-        Processing steps:
-        1. Find all markdown files in skill directory
-        2. Merge markdown files using MarkdownMerger
-        3. Preserve subdirectories using SubdirectoryPreserver
-        4. Write merged markdown to /commands/{skill}.md
-        5. Track statistics in ProcessingResult
+    def write_report_json(self, report: ConversionReport, path: Path) -> bool:
+        """Write the report as JSON for tracking performance across releases.
 
         Args:
-            skill_dir: Path to skill directory
-            skill_name: Name of the skill
+            report: ConversionReport object with all results
+            path: Destination file (written atomically)
 
         Returns:
-            ProcessingResult with transformation statistics
+            True if the file was written, False on error
         """
-        errors = []
-        notes = []
-        files_processed = []
+        return self._write_json(self.report_to_dict(report), path, "JSON report")
 
-        print(f"\n{'=' * 60}")
-        print(f"Processing skill: {skill_name} (DIRECTORY_WITH_SUBDIRS mode)")
-        print(f"{'=' * 60}")
+    def _write_json(self, data: Dict[str, Any], path: Path, description: str) -> bool:
+        """Write data as indented JSON, atomically (temp file, then rename).
 
-        try:
-            # Step 1: Find all markdown files
-            print(f"\n[1/4] Finding markdown files...")
-            md_files = []
-            skill_md = None
-
-            for item in skill_dir.iterdir():
-                if item.is_file() and item.suffix.lower() == '.md':
-                    if item.name.upper() == 'SKILL.MD':
-                        skill_md = item
-                    else:
-                        md_files.append(item)
+        Args:
+            data: JSON-serializable data
+            path: Destination file
+            description: What is written, for the log messages
 
-            print(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
-            print(f"  ✓ Found {len(md_files)} secondary markdown files")
+        Returns:
+            True if the file was written, False on error
+        """
+        import json
 
-            # Step 2: Merge markdown files
-            print(f"\n[2/4] Merging markdown files...")
-            merged_content = self.markdown_merger.merge_markdown_files(skill_md, md_files)
+        path = Path(path)
+        temp_path = path.with_name(path.name + '.tmp')
 
-            if not merged_content or len(merged_content.strip()) == 0:
-                error_msg = "Generated empty merged content"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-            else:
-                markdown_count = (1 if skill_md else 0) + len(md_files)
-                print(f"  ✓ Merged {markdown_count} markdown files ({len(merged_content)} characters)")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.write('\n')
+            os.replace(temp_path, path)
+            console.info(f"\n✓ {description} written to: {path}")
+            return True
+        except OSError as e:
+            console.warning(f"WARNING: Failed to write {description} {path}: {e}")
+            return False
 
-            # Track processed files
-            if skill_md:
-                try:
-                    files_processed.append(str(skill_md.relative_to(INPUT_DIR)))
-                except ValueError:
-                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
-                    files_processed.append(str(skill_md.relative_to(skill_dir)))
-            for md_file in md_files:
-                try:
-                    files_processed.append(str(md_file.relative_to(INPUT_DIR)))
-                except ValueError:
-                    files_processed.append(str(md_file.relative_to(skill_dir)))
+    def generate_report(self) -> ConversionReport:
+        """Generate final conversion report.
 
-            # Step 3: Preserve subdirectories
-            print(f"\n[3/4] Preserving subdirectories...")
+        Aggregates all ProcessingResult objects to create a comprehensive
+        ConversionReport with summary statistics.
 
-            # Find all subdirectories (excluding special dirs)
-            subdirs = []
-            for item in skill_dir.iterdir():
-                if item.is_dir() and item.name not in MODE_DETECTION_EXCLUDE_DIRS:
-                    subdirs.append(item.name)
+        Returns:
+            ConversionReport object containing:
+            - Total skill count
+            - Success/partial/failure counts
+            - Total files processed
+            - Total errors and retries
+            - List of all individual results
 
-            if subdirs:
-                # Create destination directory: /commands/{skill}/
-                dest_dir = OUTPUT_DIR / skill_name
-                dest_dir.mkdir(parents=True, exist_ok=True)
+        Notes:
+            - Calculates statistics from self.results
+            - Should be called after all skills are processed
+            - Results are available for detailed inspection
+        """
+        # Count results by status
+        successful = sum(1 for r in self.results if r.status == "SUCCESS")
+        partial = sum(1 for r in self.results if r.status == "PARTIAL_SUCCESS")
+        failed = sum(1 for r in self.results if r.status == "FAILED")
+        up_to_date = sum(1 for r in self.results if r.status == "UP_TO_DATE")
 
-                # Copy subdirectories
-                stats = self.subdirectory_preserver.copy_subdirectories(
-                    skill_dir, dest_dir, subdirs
-                )
+        # Sum total files and errors
+        total_files = sum(len(r.files_processed) for r in self.results)
+        total_errors = sum(len(r.errors) for r in self.results)
+        total_retries = sum(r.retry_count for r in self.results)
 
-                print(f"  ✓ Copied {stats['copied_dirs']} directories, {stats['copied_files']} files")
+        # Sum per-phase metrics, listed in pipeline order
+        phase_totals: Dict[str, Dict[str, float]] = {}
+        for r in self.results:
+            for phase, metrics in r.phase_metrics.items():
+                totals = phase_totals.setdefault(phase, dict.fromkeys(metrics, 0))
+                for key, value in metrics.items():
+                    totals[key] += value
 
-                if stats['excluded_files'] > 0:
-                    print(f"  ✓ Excluded {stats['excluded_files']} files")
+        rank = {phase: index for index, phase in enumerate(PhaseTimer.PHASES)}
+        phase_totals = dict(sorted(phase_totals.items(),
+                                   key=lambda item: rank.get(item[0], len(rank))))
 
-                if stats['errors']:
-                    errors.extend(stats['errors'])
-                    print(f"  WARNING: {len(stats['errors'])} errors during copying")
-            else:
-                stats = {'copied_dirs': 0, 'copied_files': 0, 'excluded_files': 0, 'errors': []}
-                print(f"  ✓ No subdirectories to preserve")
+        return ConversionReport(
+            total_skills=len(self.results),
+            successful=successful,
+            partial_success=partial,
+            failed=failed,
+            total_files_processed=total_files,
+            total_errors=total_errors,
+            total_retries=total_retries,
+            results=self.results,
+            up_to_date=up_to_date,
+            dedup_stats=self.dedup_stats,
+            frontmatter_stats=self.frontmatter_parser.get_stats(),
+            phase_totals=phase_totals
+        )
 
-            # Step 4: Write output markdown
-            print(f"\n[4/4] Writing output markdown...")
-            output_filename = self.generate_output_filename(skill_name)
-            final_filename = self.check_naming_conflict(output_filename, OUTPUT_DIR)
+    def run(self) -> ConversionReport:
+        """Main execution method.
 
-            if output_filename != final_filename:
-                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
-                print(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+        Orchestrates the complete conversion process:
+        1. Discover all skill directories
+        2. Process each skill directory
+        3. Generate and return final report
 
-            write_success = self.write_output_file(final_filename, merged_content)
+        Returns:
+            ConversionReport object with complete results.
 
-            if not write_success:
-                error_msg = f"Failed to write output file: {final_filename}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                status = "FAILED"
-            else:
-                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
-                print(f"\n✓ Status: {status}")
-                print(f"  Output: {final_filename}")
-                if subdirs:
-                    print(f"  Assets: /commands/{skill_name}/")
+        Notes:
+            - Creates output directory if it doesn't exist
+            - Processes skills in sorted order for consistency
+            - Continues processing even if individual skills fail
+            - With jobs > 1, skills are converted in a thread pool; results are
+              still collected in sorted order, so the report is unchanged
+              (only the interleaving of progress output differs)
+        """
+        console.info("\n" + "=" * 60)
+        console.info("SKILL-TO-COMMAND CONVERTER")
+        console.info("=" * 60)
+        console.info(f"Input Directory: {self.input_dir}")
+        console.info(f"Output Directory: {self.output_dir}")
+        console.info("=" * 60)
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status=status,
-                output_file=final_filename if write_success else None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=0,
-                transformation_mode="DIRECTORY_WITH_SUBDIRS",
-                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
-                subdirectories_copied=stats['copied_dirs'],
-                scripts_relocated=0,
-                path_updates_count=0,
-                path_update_details=[]
+        run_started = time.perf_counter()
+
+        # Frontmatter timings cover this run only (the parse cache is kept)
+        self.frontmatter_parser.reset_stats()
+
+        # Step 1: Ensure output directory exists
+        console.info("\n[Step 1/3] Checking output directory...")
+        if not self.ensure_output_directory():
+            console.error("ERROR: Cannot create or access output directory")
+            console.error("Aborting conversion process.")
+            return ConversionReport(
+                total_skills=0,
+                successful=0,
+                partial_success=0,
+                failed=0,
+                total_files_processed=0,
+                total_errors=0,
+                total_retries=0,
+                results=[]
             )
 
-        except Exception as e:
-            error_msg = f"Unexpected error in _process_with_subdirs: {e}"
-            errors.append(error_msg)
-            print(f"\n  FATAL ERROR: {error_msg}")
+        # Step 2: Discover all skill directories
+        console.info("\n[Step 2/3] Discovering skill directories...")
+        skill_dirs = self.discover_skills()
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status="FAILED",
-                output_file=None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=0,
-                transformation_mode="DIRECTORY_WITH_SUBDIRS"
+        if not skill_dirs:
+            console.warning("WARNING: No skill directories found")
+            console.warning(f"  Checked directory: {self.input_dir}")
+            console.warning("  Make sure the INPUT_DIR contains skill subdirectories")
+            return ConversionReport(
+                total_skills=0,
+                successful=0,
+                partial_success=0,
+                failed=0,
+                total_files_processed=0,
+                total_errors=0,
+                total_retries=0,
+                results=[]
             )
 
-    def _process_with_scripts(self, skill_dir: Path, skill_name: str) -> ProcessingResult:
-        """Process skill with DIRECTORY_WITH_SCRIPTS mode.
-
-        For skills that contain root-level executable scripts (e.g., root-cause-tracing).
-
-        Processing steps:
-        1. Find all markdown files and scripts in skill directory
-        2. Merge markdown files using MarkdownMerger
-        3. Relocate scripts to /commands/{skill}/ using PathUpdater
-        4. Update script paths in markdown using PathUpdater
-        5. Write merged markdown to /commands/{skill}.md
-        6. Track statistics in ProcessingResult
+        console.info(f"Found {len(skill_dirs)} skill directories")
+        console.info(f"Skills: {', '.join([d.name for d in skill_dirs[:5]])}")
+        if len(skill_dirs) > 5:
+            console.info(f"  ... and {len(skill_dirs) - 5} more")
 
-        Args:
-            skill_dir: Path to skill directory
-            skill_name: Name of the skill
+        # Step 3: Process each skill directory
+        console.info("\n[Step 3/3] Processing skill directories...")
+        console.info(f"Starting batch processing of {len(skill_dirs)} skills...")
+        console.info("")
 
-        Returns:
-            ProcessingResult with transformation statistics
-        """
-        errors = []
-        notes = []
-        files_processed = []
+        ordered_dirs = sorted(skill_dirs)
 
-        print(f"\n{'=' * 60}")
-        print(f"Processing skill: {skill_name} (DIRECTORY_WITH_SCRIPTS mode)")
-        print(f"{'=' * 60}")
+        # With --atomic everything below writes into the staging tree
+        staging = self._begin_staging()
 
         try:
-            # Step 1: Find all markdown files and scripts
-            print(f"\n[1/5] Finding markdown files and scripts...")
-            md_files = []
-            skill_md = None
-            script_files = []
-
-            for item in skill_dir.iterdir():
-                if item.is_file():
-                    if item.suffix.lower() == '.md':
-                        if item.name.upper() == 'SKILL.MD':
-                            skill_md = item
-                        else:
-                            md_files.append(item)
-                    elif item.suffix.lower() in SCRIPT_EXTENSIONS:
-                        script_files.append(item)
-
-            print(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
-            print(f"  ✓ Found {len(md_files)} secondary markdown files")
-            print(f"  ✓ Found {len(script_files)} script files")
-
-            # Step 2: Merge markdown files
-            print(f"\n[2/5] Merging markdown files...")
-            merged_content = self.markdown_merger.merge_markdown_files(skill_md, md_files)
-
-            if not merged_content or len(merged_content.strip()) == 0:
-                error_msg = "Generated empty merged content"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
+            # Claim output names up front in sorted order so that conflict
+            # resolution is deterministic even when skills run concurrently
+            manifest = self.get_manifest()
+            manifest.release_missing_owners({skill_name_of(d) for d in ordered_dirs})
+            for skill_dir in ordered_dirs:
+                skill_name = skill_name_of(skill_dir)
+                manifest.claim_output(skill_name, self.generate_output_filename(skill_name))
+
+            if self.jobs > 1 and len(ordered_dirs) > 1:
+                workers = min(self.jobs, len(ordered_dirs))
+                console.info(f"Using {workers} worker threads")
+                # pool.map() yields results in submission order, so self.results
+                # (and therefore the report) matches the serial run exactly
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    self.results.extend(pool.map(self._process_skill_safely, ordered_dirs))
             else:
-                markdown_count = (1 if skill_md else 0) + len(md_files)
-                print(f"  ✓ Merged {markdown_count} markdown files ({len(merged_content)} characters)")
-
-            # Track processed files
-            if skill_md:
-                try:
-                    files_processed.append(str(skill_md.relative_to(INPUT_DIR)))
-                except ValueError:
-                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
-                    files_processed.append(str(skill_md.relative_to(skill_dir)))
-            for md_file in md_files:
-                try:
-                    files_processed.append(str(md_file.relative_to(INPUT_DIR)))
-                except ValueError:
-                    files_processed.append(str(md_file.relative_to(skill_dir)))
+                for skill_dir in ordered_dirs:
+                    self.results.append(self._process_skill_safely(skill_dir))
 
-            # Step 3: Relocate scripts
-            print(f"\n[3/5] Relocating scripts...")
+            # Persist hashes so the next run can skip unchanged skills
+            self.get_manifest().save()
+        except BaseException:
+            self._end_staging(staging, commit=False)
+            raise
 
-            if script_files:
-                # Relocate scripts to OUTPUT_DIR/{skill_name}/
-                # Note: relocate_scripts creates the skill subdirectory
-                reloc_stats = self.path_updater.relocate_scripts(
-                    skill_dir, OUTPUT_DIR, skill_name, script_files
-                )
+        self._end_staging(staging, commit=True)
 
-                print(f"  ✓ Relocated {reloc_stats['relocated_count']} scripts")
+        # Drop blobs no skill links to any more and measure what sharing saved
+        if self.blob_store is not None:
+            self.dedup_stats = self.blob_store.scan_usage(prune=True)
 
-                if reloc_stats['errors']:
-                    errors.extend(reloc_stats['errors'])
-                    print(f"  WARNING: {len(reloc_stats['errors'])} errors during relocation")
+        # Step 4: Generate final report
+        console.info("\n" + "=" * 60)
+        console.info("PROCESSING COMPLETE")
+        console.info("=" * 60)
+        console.info("")
 
-                for script in script_files:
-                    try:
-                        files_processed.append(str(script.relative_to(INPUT_DIR)))
-                    except ValueError:
-                        files_processed.append(str(script.relative_to(skill_dir)))
-            else:
-                reloc_stats = {'relocated_count': 0, 'errors': []}
-                print(f"  ✓ No scripts to relocate")
+        report = self.generate_report()
+        report.elapsed_seconds = time.perf_counter() - run_started
+        self.print_report(report)
 
-            # Step 4: Update paths in markdown
-            print(f"\n[4/5] Updating script paths in markdown...")
+        return report
 
-            if script_files and merged_content:
-                script_names = [script.name for script in script_files]
-                updated_content, update_count = self.path_updater.update_paths_in_markdown(
-                    merged_content, skill_name, script_names
-                )
+    def _begin_staging(self) -> Optional[OutputStaging]:
+        """Start staging output for --atomic (no-op otherwise).
 
-                if update_count > 0:
-                    merged_content = updated_content
-                    print(f"  ✓ Updated {update_count} path references")
-                    notes.append(f"Updated {update_count} script path references")
-                else:
-                    print(f"  ✓ No path updates needed")
+        Mirrors the output directory into an OutputStaging directory and
+        points self.output_dir, the manifest and the blob store at it, so
+        every writer works on the mirror unchanged.
 
-                path_update_count = update_count
-            else:
-                path_update_count = 0
-                print(f"  ✓ No path updates needed")
+        Returns:
+            The OutputStaging, or None when atomic is off
+        """
+        if not self.atomic:
+            return None
 
-            # Step 5: Write output markdown
-            print(f"\n[5/5] Writing output markdown...")
-            output_filename = self.generate_output_filename(skill_name)
-            final_filename = self.check_naming_conflict(output_filename, OUTPUT_DIR)
+        staging = OutputStaging(self.output_dir)
+        staging.prepare()
+        console.info(f"Staging output in {staging.path} "
+                     f"({staging.stats['linked_files']} existing files linked)")
 
-            if output_filename != final_filename:
-                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
-                print(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+        self._retarget_output(staging.path)
+        return staging
 
-            write_success = self.write_output_file(final_filename, merged_content)
+    def _end_staging(self, staging: Optional[OutputStaging], commit: bool) -> None:
+        """Restore the output directory and commit or discard the staged output.
 
-            if not write_success:
-                error_msg = f"Failed to write output file: {final_filename}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                status = "FAILED"
-            else:
-                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
-                print(f"\n✓ Status: {status}")
-                print(f"  Output: {final_filename}")
-                if script_files:
-                    print(f"  Scripts: /commands/{skill_name}/")
+        Args:
+            staging: Result of _begin_staging()
+            commit: Swap the staged tree into place (False discards it)
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status=status,
-                output_file=final_filename if write_success else None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=0,
-                transformation_mode="DIRECTORY_WITH_SCRIPTS",
-                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
-                subdirectories_copied=0,
-                scripts_relocated=reloc_stats['relocated_count'],
-                path_updates_count=path_update_count,
-                path_update_details=[]
-            )
+        Raises:
+            OSError: If the commit fails (the staged tree is discarded)
+        """
+        if staging is None:
+            return
 
-        except Exception as e:
-            error_msg = f"Unexpected error in _process_with_scripts: {e}"
-            errors.append(error_msg)
-            print(f"\n  FATAL ERROR: {error_msg}")
+        self._retarget_output(staging.output_dir)
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status="FAILED",
-                output_file=None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=0,
-                transformation_mode="DIRECTORY_WITH_SCRIPTS"
-            )
+        if not commit:
+            staging.abort()
+            return
 
-    def _process_single_file(self, skill_dir: Path, skill_name: str) -> ProcessingResult:
-        """Process skill with SINGLE_FILE mode.
+        started = time.perf_counter()
+        try:
+            staging.commit()
+        except OSError:
+            staging.abort()
+            raise
+
+        console.info(f"✓ Committed staged output ({staging.stats['sync_method']}, "
+                     f"{staging.stats['swap_method']}, "
+                     f"{(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    def _retarget_output(self, output_dir: Path) -> None:
+        """Point the converter, its manifest and the blob store at output_dir."""
+        self.output_dir = output_dir
+        if self.manifest is not None:
+            self.manifest.manifest_path = output_dir / MANIFEST_FILENAME
+        if self.blob_store is not None:
+            self.blob_store.root = output_dir / BLOB_DIRNAME
+
+    def _discover_root_files(self, tree: SkillTree, mode: TransformationMode) -> tuple:
+        """Select the root-level inputs of a skill (shared by every conversion path).
 
-        For simple skills with only markdown files (e.g., brainstorming, algorithmic-art).
+        Args:
+            tree: SkillTree of the skill
+            mode: Detected transformation mode
 
-        Processing steps:
-        1. Find all markdown files in skill directory
-        2. Merge markdown files using MarkdownMerger (if multiple present)
-        3. Write merged markdown to /commands/{skill}.md
-        4. Track statistics in ProcessingResult
+        Returns:
+            Tuple of (skill_md_node, md_nodes, script_nodes, subdirectories):
+            the SKILL.md node or None, the other markdown nodes, the scripts
+            to relocate (DIRECTORY_WITH_SCRIPTS only) and the names of the
+            subdirectories to preserve (DIRECTORY_WITH_SUBDIRS only)
+        """
+        skill_md_node = None
+        md_nodes = []
+        script_nodes = []
+        subdirectories = []
+        for node in tree.root.children:
+            if node.is_file():
+                if node.suffix.lower() == '.md':
+                    if node.name.upper() == 'SKILL.MD':
+                        skill_md_node = node
+                    else:
+                        md_nodes.append(node)
+                elif (mode == TransformationMode.DIRECTORY_WITH_SCRIPTS
+                      and node.suffix.lower() in SCRIPT_EXTENSIONS):
+                    script_nodes.append(node)
+            elif (mode == TransformationMode.DIRECTORY_WITH_SUBDIRS
+                  and node.name not in MODE_DETECTION_EXCLUDE_DIRS):
+                subdirectories.append(node.name)
+        return skill_md_node, md_nodes, script_nodes, subdirectories
+
+    def convert_files(self, skill_name: str, source: Mapping[str, bytes],
+                      executable: Iterable[str] = ()) -> ConversionOutput:
+        """Convert one skill held in memory, without touching the filesystem.
+
+        Runs the same pipeline as process_skill() - mode detection,
+        discovery, markdown merging, script path rewriting and asset
+        selection - against SkillTree.from_files(). Nothing is read from
+        input_dir or written to output_dir, and the manifest is not used.
 
         Args:
-            skill_dir: Path to skill directory
-            skill_name: Name of the skill
+            skill_name: Name of the skill (names the output file and the
+                        asset directory)
+            source: Skill files keyed by POSIX path relative to the skill
+                    root (e.g., {"SKILL.md": b"...", "scripts/run.sh": b"..."})
+            executable: Keys of source files that are executable
 
         Returns:
-            ProcessingResult with transformation statistics
+            ConversionOutput holding the command markdown and assets
+
+        Raises:
+            ValueError: If a source key is not a clean relative path
         """
-        errors = []
-        notes = []
-        files_processed = []
+        tree = SkillTree.from_files(skill_name, source, executable)
+        output, asset_nodes, _, _ = self._convert_tree(skill_name, tree)
 
-        print(f"\n{'=' * 60}")
-        print(f"Processing skill: {skill_name} (SINGLE_FILE mode)")
-        print(f"{'=' * 60}")
+        for node in asset_nodes:
+            # Scripts move from the skill root into the asset directory
+            key = f"{skill_name}/{node.rel_path}"
+            output.assets[key] = tree.contents[node.rel_path]
+            if node.is_executable():
+                output.executable.add(key)
+        output.assets = dict(sorted(output.assets.items()))
 
-        try:
-            # Step 1: Find all markdown files
-            print(f"\n[1/3] Finding markdown files...")
-            md_files = []
-            skill_md = None
-
-            for item in skill_dir.iterdir():
-                if item.is_file() and item.suffix.lower() == '.md':
-                    if item.name.upper() == 'SKILL.MD':
-                        skill_md = item
-                    else:
-                        md_files.append(item)
+        return output
 
-            print(f"  ✓ Found primary: {skill_md.name if skill_md else 'None'}")
-            print(f"  ✓ Found {len(md_files)} secondary markdown files")
+    def _convert_tree(self, skill_name: str, tree: SkillTree,
+                      mode: Optional[TransformationMode] = None) -> tuple:
+        """Run detection, discovery, merging and path rewriting on a tree.
 
-            # Step 2: Merge markdown files
-            print(f"\n[2/3] Merging markdown files...")
-            merged_content = self.markdown_merger.merge_markdown_files(skill_md, md_files)
+        Shared by convert_files(), _process_archive() and plan_skill(); reads
+        markdown through tree.read_text() and leaves asset placement to the
+        caller.
 
-            if not merged_content or len(merged_content.strip()) == 0:
-                error_msg = "Generated empty merged content"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-            else:
-                markdown_count = (1 if skill_md else 0) + len(md_files)
-                print(f"  ✓ Merged {markdown_count} markdown files ({len(merged_content)} characters)")
+        Args:
+            skill_name: Name of the skill
+            tree: SkillTree of the skill (in memory, archive or disk)
+            mode: Transformation mode, if already detected
 
-            # Track processed files
-            if skill_md:
-                try:
-                    files_processed.append(str(skill_md.relative_to(INPUT_DIR)))
-                except ValueError:
-                    # File not under INPUT_DIR (e.g., in tests), use relative to skill_dir
-                    files_processed.append(str(skill_md.relative_to(skill_dir)))
-            for md_file in md_files:
-                try:
-                    files_processed.append(str(md_file.relative_to(INPUT_DIR)))
-                except ValueError:
-                    files_processed.append(str(md_file.relative_to(skill_dir)))
+        Returns:
+            Tuple of (output, asset_nodes, script_nodes, subdirectories): a
+            ConversionOutput without assets, the file nodes to place under
+            the asset directory (at their rel_path), the relocated scripts
+            among them, and the preserved subdirectory names
+        """
+        if mode is None:
+            mode = self.mode_detector.mode_for_tree(tree)
+        skill_md_node, md_nodes, script_nodes, subdirectories = self._discover_root_files(tree, mode)
+
+        output = ConversionOutput(
+            skill_name=skill_name,
+            transformation_mode=mode.value,
+            output_file=self.generate_output_filename(skill_name),
+        )
+        output.markdown_files = [node.rel_path for node in
+                                 ([skill_md_node] if skill_md_node else []) + md_nodes]
 
-            # Step 3: Write output markdown
-            print(f"\n[3/3] Writing output markdown...")
-            output_filename = self.generate_output_filename(skill_name)
-            final_filename = self.check_naming_conflict(output_filename, OUTPUT_DIR)
+        output.content = self.markdown_merger.merge_markdown_files(
+            skill_md_node.path if skill_md_node else None,
+            [node.path for node in md_nodes],
+            reader=tree.read_text,
+        )
+        if not output.content or len(output.content.strip()) == 0:
+            output.errors.append("Generated empty merged content")
+        elif script_nodes:
+            output.content, output.path_updates_count = self.path_updater.update_paths_in_markdown(
+                output.content, skill_name, [node.name for node in script_nodes]
+            )
 
-            if output_filename != final_filename:
-                notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
-                print(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+        asset_nodes = list(self.subdirectory_preserver.iter_preserved_files(tree, subdirectories))
+        asset_nodes.extend(script_nodes)
+        output.scripts_relocated = len(script_nodes)
 
-            write_success = self.write_output_file(final_filename, merged_content)
+        return output, asset_nodes, script_nodes, subdirectories
 
-            if not write_success:
-                error_msg = f"Failed to write output file: {final_filename}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                status = "FAILED"
-            else:
-                status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
-                print(f"\n✓ Status: {status}")
-                print(f"  Output: {final_filename}")
+    def _process_archive(self, archive_path: Path, skill_name: str,
+                         tree: SkillTree) -> ProcessingResult:
+        """Process a zipped skill package without extracting it.
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status=status,
-                output_file=final_filename if write_success else None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=0,
-                transformation_mode="SINGLE_FILE",
-                markdown_files_merged=(1 if skill_md else 0) + len(md_files),
-                subdirectories_copied=0,
-                scripts_relocated=0,
-                path_updates_count=0,
-                path_update_details=[]
-            )
+        Markdown members are decompressed in memory for merging; asset
+        members (preserved subdirectories and relocated scripts) are
+        streamed from the archive straight into OUTPUT_DIR/{skill}/ by
+        extract_file(), which keeps unchanged destination files.
 
-        except Exception as e:
-            error_msg = f"Unexpected error in _process_single_file: {e}"
-            errors.append(error_msg)
-            print(f"\n  FATAL ERROR: {error_msg}")
+        Args:
+            archive_path: Path to the .zip file
+            skill_name: Name of the skill
+            tree: SkillTree.from_archive() result for archive_path
+
+        Returns:
+            ProcessingResult with transformation statistics
+        """
+        errors = []
+        notes = [f"Read from archive: {archive_path.name}"]
+        phase_metrics = {}
+        timer = PhaseTimer(phase_metrics)
 
+        console.info(f"\n{'=' * 60}")
+        console.info(f"Processing skill: {skill_name} (archive {archive_path.name})")
+        console.info(f"{'=' * 60}")
+
+        if tree.error is not None:
+            error_msg = f"Cannot read skill archive: {tree.error}"
+            console.error(f"  ERROR: {error_msg}")
             return ProcessingResult(
                 skill_name=skill_name,
                 status="FAILED",
                 output_file=None,
-                files_processed=files_processed,
-                errors=errors,
+                files_processed=[],
+                errors=[error_msg],
                 notes=notes,
                 retry_count=0,
-                transformation_mode="SINGLE_FILE"
+                phase_metrics=phase_metrics
             )
 
-    def process_skill(self, skill_dir: Path) -> ProcessingResult:
-        """Process a single skill directory using v2.0 transformation modes.
+        # Step 1: Mode detection, discovery, merge and path rewriting
+        timer.begin('merge')
+        console.info(f"\n[1/3] Merging markdown members...")
+        output, asset_nodes, _, subdirectories = self._convert_tree(skill_name, tree)
+        errors.extend(output.errors)
+        console.info(f"  ✓ Mode: {output.transformation_mode}")
+        console.info(f"  ✓ Merged {len(output.markdown_files)} markdown files ({len(output.content)} characters)")
+        if output.path_updates_count > 0:
+            notes.append(f"Updated {output.path_updates_count} script path references")
+
+        # Step 2: Stream assets out of the archive
+        timer.begin('copy_subdirs')
+        console.info(f"\n[2/3] Extracting assets...")
+        copied = skipped = 0
+
+        if asset_nodes:
+            dest_dir = self.output_dir / skill_name
+            for node in asset_nodes:
+                dest = dest_dir / node.rel_path
+                try:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    outcome = extract_file(tree, node, dest)
+                except (OSError, ValueError) as e:
+                    errors.append(f"Failed to extract {node.rel_path}: {e}")
+                    continue
+                copied += 1
+                if outcome == "skipped":
+                    skipped += 1
 
-        This is the main entry point for skill processing. It detects the
-        appropriate transformation mode and routes to specialized processors:
+            console.info(f"  ✓ Extracted {copied} files to /commands/{skill_name}/")
+            if skipped > 0:
+                console.info(f"  ✓ Skipped {skipped} unchanged files")
+        else:
+            console.info(f"  ✓ No assets to extract")
 
-        1. DIRECTORY_WITH_SUBDIRS: Skills with subdirectories (e.g., docx)
-        2. DIRECTORY_WITH_SCRIPTS: Skills with root-level scripts (e.g., root-cause-tracing)
-        3. SINGLE_FILE: Simple markdown-only skills (e.g., brainstorming)
+        # Step 3: Write output markdown
+        timer.begin('write_output')
+        console.info(f"\n[3/3] Writing output markdown...")
+        output_filename = self.generate_output_filename(skill_name)
+        final_filename = self.check_naming_conflict(output_filename, self.output_dir, skill_name)
+
+        if output_filename != final_filename:
+            notes.append(f"Naming conflict resolved: {output_filename} → {final_filename}")
+            console.info(f"  ! Conflict resolved: {output_filename} → {final_filename}")
+
+        write_success = self.write_output_file(final_filename, output.content)
+        timer.end()
+
+        # Markdown and relocated scripts count as processed, as for directories
+        files_processed = [f"{archive_path.name}/{rel_path}" for rel_path in output.markdown_files]
+        files_processed.extend(f"{archive_path.name}/{node.rel_path}" for node in asset_nodes
+                               if node.rel_path == node.name)
+
+        if not write_success:
+            errors.append(f"Failed to write output file: {final_filename}")
+            status = "FAILED"
+        else:
+            status = "SUCCESS" if not errors else "PARTIAL_SUCCESS"
+        console.info(f"\n✓ Status: {status}")
+
+        return ProcessingResult(
+            skill_name=skill_name,
+            status=status,
+            output_file=final_filename if write_success else None,
+            files_processed=files_processed,
+            errors=errors,
+            notes=notes,
+            retry_count=0,
+            transformation_mode=output.transformation_mode,
+            markdown_files_merged=len(output.markdown_files),
+            subdirectories_copied=len(subdirectories),
+            scripts_relocated=output.scripts_relocated,
+            path_updates_count=output.path_updates_count,
+            path_update_details=[],
+            phase_metrics=phase_metrics
+        )
+
+    def plan_skill(self, skill_dir: Path) -> SkillPlan:
+        """Plan the conversion of one skill without writing anything.
+
+        Runs the same stages as process_skill() - scan, manifest check, mode
+        detection, discovery, merging and path rewriting - entirely in
+        memory. Asset placement is only predicted (see plan_materialize()).
 
         Args:
-            skill_dir: Path to the skill directory to process.
+            skill_dir: Path to the skill directory or zipped skill package
 
         Returns:
-            ProcessingResult object with status, output file path,
-            files processed, errors, notes, and transformation statistics.
-
-        Error Handling:
-            - Catches all exceptions to prevent one skill from breaking batch
-            - Records errors in ProcessingResult.errors list
-            - Returns FAILED status if critical errors occur
-            - Falls back to SINGLE_FILE mode if detection is ambiguous
+            SkillPlan describing what process_skill() would do
 
         Notes:
-            - Uses ModeDetector to determine transformation mode
-            - Routes to specialized _process_* methods
-            - Maintains backward compatibility via fallback
+            - Output names are claimed in the in-memory manifest only; the
+              manifest is never saved
+            - Merged markdown is built in memory even when streaming is
+              enabled, so output sizes are exact
         """
-        skill_name = skill_dir.name
-        errors = []
-        notes = []
-
-        print(f"\n{'=' * 60}")
-        print(f"Processing skill: {skill_name}")
-        print(f"{'=' * 60}")
+        skill_name = skill_name_of(skill_dir)
+        plan = SkillPlan(skill_name=skill_name)
+        tree = None
 
         try:
-            # Step 1: Detect transformation mode (subtask 5.3)
-            print(f"\n[Mode Detection] Analyzing directory structure...")
-            mode = self.mode_detector.detect_mode(skill_dir)
+            tree = SkillTree.load(skill_dir)
+            if tree.error is not None:
+                raise tree.error
 
-            print(f"  ✓ Detected mode: {mode.value}")
-            notes.append(f"Transformation mode: {mode.value}")
+            manifest = self.get_manifest()
+            digest, _ = manifest.compute_skill_hash(skill_dir, tree)
+            plan.output_file = manifest.claim_output(skill_name,
+                                                     self.generate_output_filename(skill_name))
 
-            # Step 2: Route to appropriate processing method (subtasks 5.7, 5.8, 5.9)
-            if mode == TransformationMode.DIRECTORY_WITH_SUBDIRS:
-                print(f"  → Routing to DIRECTORY_WITH_SUBDIRS processor")
-                return self._process_with_subdirs(skill_dir, skill_name)
+            try:
+                if tree.is_archive:
+                    mode = self.mode_detector.mode_for_tree(tree)
+                else:
+                    mode = self.mode_detector.detect_mode(skill_dir, tree)
+            except Exception as e:
+                plan.errors.append(f"Mode detection failed for {skill_name}: {e}")
+                mode = TransformationMode.SINGLE_FILE
+            plan.transformation_mode = mode.value
+
+            if self._current_manifest_entry(skill_name, digest, plan.output_file) is not None:
+                plan.action = "UP_TO_DATE"
+                return plan
+
+            # Discover, merge and rewrite in memory
+            output, _, script_nodes, plan.subdirectories = self._convert_tree(skill_name, tree, mode)
+            plan.markdown_files = output.markdown_files
+            plan.scripts = [node.name for node in script_nodes]
+            plan.path_rewrites = output.path_updates_count
+            plan.errors.extend(output.errors)
+            if not output.errors:
+                plan.output_bytes = len(output.content.encode('utf-8'))
+
+            # Predict asset placement (archive members can only be copied)
+            asset_dest = self.output_dir / skill_name
+            link_mode = 'copy' if tree.is_archive else self.link_mode
+            written_asset_bytes = 0
+
+            if plan.subdirectories:
+                stats = self.subdirectory_preserver.plan_subdirectories(
+                    asset_dest, plan.subdirectories, tree, link_mode
+                )
+                plan.asset_files += stats['copied_files']
+                plan.asset_bytes += stats['copied_bytes']
+                plan.unchanged_assets += stats['skipped_files']
+                plan.linked_assets += stats['linked_files']
+                plan.excluded_files += stats['excluded_files']
+                plan.errors.extend(stats['errors'])
+                written_asset_bytes += stats['written_bytes']
+
+            for node in script_nodes:
+                outcome = plan_materialize(node.path, asset_dest / node.name, node, link_mode)
+                plan.asset_files += 1
+                plan.asset_bytes += node.size
+                if outcome == "skipped":
+                    plan.unchanged_assets += 1
+                elif outcome == "linked":
+                    plan.linked_assets += 1
+                else:
+                    written_asset_bytes += node.size
 
-            elif mode == TransformationMode.DIRECTORY_WITH_SCRIPTS:
-                print(f"  → Routing to DIRECTORY_WITH_SCRIPTS processor")
-                return self._process_with_scripts(skill_dir, skill_name)
+            if plan.subdirectories or script_nodes:
+                plan.asset_dir = skill_name
 
-            else:  # SINGLE_FILE mode (includes fallback)
-                print(f"  → Routing to SINGLE_FILE processor")
-                return self._process_single_file(skill_dir, skill_name)
+            markdown_bytes = sum(tree.root.child(name).size for name in plan.markdown_files)
+            plan.bytes_read = markdown_bytes + written_asset_bytes
+            plan.bytes_written = plan.output_bytes + written_asset_bytes
 
         except Exception as e:
-            # Fallback behavior (subtask 5.9): If mode detection fails, default to SINGLE_FILE
-            error_msg = f"Mode detection failed for {skill_name}: {e}"
-            print(f"\n  WARNING: {error_msg}")
-            print(f"  → Falling back to SINGLE_FILE mode")
+            plan.action = "FAILED"
+            plan.errors.append(f"Planning failed: {e}")
+        finally:
+            if tree is not None:
+                tree.close()
 
-            notes.append("Mode detection failed - using SINGLE_FILE fallback")
-            errors.append(error_msg)
+        return plan
 
-            # Attempt to process with SINGLE_FILE mode as fallback
-            try:
-                result = self._process_single_file(skill_dir, skill_name)
-                # Add fallback notes to result
-                result.notes.extend(notes)
-                result.errors.extend(errors)
-                return result
-            except Exception as fallback_error:
-                # If even fallback fails, return FAILED status
-                return ProcessingResult(
-                    skill_name=skill_name,
-                    status="FAILED",
-                    output_file=None,
-                    files_processed=[],
-                    errors=errors + [f"Fallback processing failed: {fallback_error}"],
-                    notes=notes,
-                    retry_count=0,
-                    transformation_mode="SINGLE_FILE"
-                )
+    def plan(self) -> ConversionPlan:
+        """Build the conversion plan for every skill (--plan dry run).
 
-    def process_skill_legacy(self, skill_dir: Path) -> ProcessingResult:
-        """Legacy processing method (pre-v2.0).
+        Discovers skills and claims output names in the same order as run(),
+        then plans each skill with plan_skill() (in a thread pool when
+        jobs > 1). Nothing is written to OUTPUT_DIR.
 
-        This method contains the original v1.0 processing logic and is kept
-        for reference and potential fallback scenarios. New code should use
-        process_skill() which routes to specialized v2.0 processors.
+        Returns:
+            ConversionPlan with one SkillPlan per skill, in sorted order
+        """
+        console.info("\n" + "=" * 60)
+        console.info("SKILL-TO-COMMAND CONVERTER (plan only)")
+        console.info("=" * 60)
+        console.info(f"Input Directory: {self.input_dir}")
+        console.info(f"Output Directory: {self.output_dir}")
+        console.info("=" * 60)
+
+        started = time.perf_counter()
+        ordered_dirs = sorted(self.discover_skills())
+
+        manifest = self.get_manifest()
+        manifest.release_missing_owners({skill_name_of(d) for d in ordered_dirs})
+        for skill_dir in ordered_dirs:
+            skill_name = skill_name_of(skill_dir)
+            manifest.claim_output(skill_name, self.generate_output_filename(skill_name))
+
+        if self.jobs > 1 and len(ordered_dirs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(ordered_dirs))) as pool:
+                skills = list(pool.map(self.plan_skill, ordered_dirs))
+        else:
+            skills = [self.plan_skill(skill_dir) for skill_dir in ordered_dirs]
 
-        Complete processing pipeline for one skill:
-        1. Discover all files in the skill directory
-        2. Read and parse file contents
-        3. Generate command markdown using template
-        4. Write output file
-        5. Return processing result with status and metadata
+        return ConversionPlan(skills=skills, elapsed_seconds=time.perf_counter() - started)
+
+    def format_plan(self, plan: ConversionPlan) -> str:
+        """Format a conversion plan for the terminal.
 
         Args:
-            skill_dir: Path to the skill directory to process.
+            plan: ConversionPlan from plan()
 
         Returns:
-            ProcessingResult object with status, output file path,
-            files processed, errors, and notes.
+            Formatted string with one block per skill and a summary
+        """
+        def kb(size: int) -> str:
+            return f"{size / 1024:,.1f} KB"
 
-        Error Handling:
-            - Catches all exceptions to prevent one skill from breaking batch
-            - Records errors in ProcessingResult.errors list
-            - Returns FAILED status if critical errors occur
-            - Returns PARTIAL_SUCCESS if some files couldn't be processed
+        lines = []
+        lines.append("=" * 60)
+        lines.append("CONVERSION PLAN (dry run - nothing was written)")
+        lines.append("=" * 60)
+        lines.append("")
 
-        Notes:
-            - Implements retry logic for transient failures
-            - Creates output directory if it doesn't exist
-            - Uses SKELETON_TEMPLATE for output format
-        """
-        skill_name = skill_dir.name
-        files_processed = []
-        errors = []
-        notes = []
-        retry_count = 0
+        for skill in plan.skills:
+            lines.append(f"[{skill.action}] {skill.skill_name} → {skill.output_file or '-'} "
+                         f"({skill.transformation_mode or 'unknown mode'})")
+
+            if skill.action == "CONVERT":
+                lines.append(f"    Merge: {len(skill.markdown_files)} markdown files "
+                             f"→ {kb(skill.output_bytes)}")
+                if skill.subdirectories:
+                    lines.append(f"    Subdirectories: {', '.join(skill.subdirectories)}")
+                if skill.scripts:
+                    lines.append(f"    Scripts: {', '.join(skill.scripts)} "
+                                 f"({skill.path_rewrites} path rewrites)")
+                if skill.asset_dir:
+                    lines.append(f"    Assets: {skill.asset_files} files, {kb(skill.asset_bytes)} "
+                                 f"→ /commands/{skill.asset_dir}/ ({skill.unchanged_assets} unchanged, "
+                                 f"{skill.linked_assets} linked, {skill.excluded_files} excluded)")
+                lines.append(f"    Estimated I/O: {kb(skill.bytes_read)} read, "
+                             f"{kb(skill.bytes_written)} written")
+
+            for error in skill.errors:
+                lines.append(f"    ERROR: {error}")
 
-        print(f"\n{'=' * 60}")
-        print(f"Processing skill: {skill_name} (LEGACY MODE)")
-        print(f"{'=' * 60}")
+        lines.append("")
+        lines.append("=" * 60)
+        lines.append("PLAN SUMMARY")
+        lines.append("=" * 60)
+        lines.append("")
+        lines.append(f"Total Skills: {len(plan.skills)}")
+        lines.append(f"To Convert: {plan.count('CONVERT')}")
+        lines.append(f"Up-To-Date (Skipped): {plan.count('UP_TO_DATE')}")
+        lines.append(f"Failed: {plan.count('FAILED')}")
+        lines.append(f"Markdown Files To Merge: {sum(len(s.markdown_files) for s in plan.skills)}")
+        lines.append(f"Output Markdown: {kb(plan.total('output_bytes'))}")
+        lines.append(f"Asset Files: {plan.total('asset_files')} ({kb(plan.total('asset_bytes'))}, "
+                     f"{plan.total('unchanged_assets')} unchanged)")
+        lines.append(f"Path Rewrites: {plan.total('path_rewrites')}")
+        lines.append(f"Estimated Read: {kb(plan.total('bytes_read'))}")
+        lines.append(f"Estimated Written: {kb(plan.total('bytes_written'))}")
+        lines.append(f"Planning Time: {plan.elapsed_seconds:.2f} s")
+        lines.append("")
 
-        try:
-            # Step 1: Discover all files in the skill directory
-            print(f"\n[1/6] Discovering files in {skill_name}...")
-            files_dict = self.discover_files(skill_dir)
+        return "\n".join(lines)
 
-            if not files_dict:
-                error_msg = f"No files discovered in {skill_name}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                return ProcessingResult(
-                    skill_name=skill_name,
-                    status="FAILED",
-                    output_file=None,
-                    files_processed=[],
-                    errors=errors,
-                    notes=notes,
-                    retry_count=0
-                )
+    def print_plan(self, plan: ConversionPlan) -> None:
+        """Print a conversion plan to stdout (after any buffered progress output)."""
+        flush_console()
+        print("\n")
+        print(self.format_plan(plan))
 
-            # Count total files discovered
-            total_files = (
-                (1 if files_dict.get('skill_md') else 0) +
-                len(files_dict.get('markdown', [])) +
-                len(files_dict.get('code', [])) +
-                len(files_dict.get('config', [])) +
-                len(files_dict.get('other', []))
-            )
-            print(f"  ✓ Discovered {total_files} files")
+    def plan_to_dict(self, plan: ConversionPlan) -> Dict[str, Any]:
+        """Convert a plan to JSON-serializable data (see write_plan_json).
 
-            # Step 2: Extract metadata from SKILL.md (if present)
-            print(f"\n[2/6] Extracting metadata...")
-            metadata = {}
+        Args:
+            plan: ConversionPlan from plan()
 
-            if files_dict.get('skill_md'):
-                skill_md_path = files_dict['skill_md']
-                content = self.read_file_with_retry(skill_md_path)
+        Returns:
+            Dictionary with run options, summary totals and one entry per skill
+        """
+        return {
+            'converter_version': CONVERTER_VERSION,
+            'input_dir': str(self.input_dir),
+            'output_dir': str(self.output_dir),
+            'options': {
+                'jobs': self.jobs,
+                'force': self.force,
+                'link_mode': self.link_mode,
+            },
+            'elapsed_seconds': plan.elapsed_seconds,
+            'summary': {
+                'total_skills': len(plan.skills),
+                'convert': plan.count('CONVERT'),
+                'up_to_date': plan.count('UP_TO_DATE'),
+                'failed': plan.count('FAILED'),
+                'output_bytes': plan.total('output_bytes'),
+                'asset_files': plan.total('asset_files'),
+                'asset_bytes': plan.total('asset_bytes'),
+                'path_rewrites': plan.total('path_rewrites'),
+                'bytes_read': plan.total('bytes_read'),
+                'bytes_written': plan.total('bytes_written'),
+            },
+            'skills': [asdict(skill) for skill in plan.skills],
+        }
 
-                if content:
-                    metadata = self.extract_yaml_frontmatter(content)
-                    files_processed.append(str(skill_md_path.relative_to(INPUT_DIR)))
-                    print(f"  ✓ Extracted metadata from SKILL.md")
-                    if metadata:
-                        print(f"    - Description: {metadata.get('description', 'N/A')[:60]}...")
-                        if metadata.get('argument-hint'):
-                            print(f"    - Argument hint: {metadata.get('argument-hint')}")
-                else:
-                    error_msg = f"Failed to read SKILL.md in {skill_name}"
-                    errors.append(error_msg)
-                    notes.append("Using fallback metadata generation")
-                    print(f"  WARNING: {error_msg}")
-            else:
-                notes.append("No SKILL.md found - using fallback metadata")
-                print(f"  WARNING: No SKILL.md found")
+    def write_plan_json(self, plan: ConversionPlan, path: Path) -> bool:
+        """Write the plan as JSON (e.g., for review before a large conversion).
 
-            # Generate fallback metadata if needed
-            if not metadata:
-                print(f"  Generating fallback metadata...")
-                metadata = self.generate_fallback_metadata(skill_name, files_dict)
-                print(f"  ✓ Generated fallback metadata")
+        Args:
+            plan: ConversionPlan from plan()
+            path: Destination file (written atomically)
 
-            # Step 3: Categorize content files
-            print(f"\n[3/6] Categorizing content files...")
-            categorized = self.categorize_content_files(files_dict)
+        Returns:
+            True if the file was written, False on error
+        """
+        return self._write_json(self.plan_to_dict(plan), path, "JSON plan")
 
-            category_counts = {
-                'reference': len(categorized.get('reference', [])),
-                'examples': len(categorized.get('examples', [])),
-                'code': len(categorized.get('code', [])),
-                'themes': len(categorized.get('themes', []))
-            }
-            print(f"  ✓ Categorized files:")
-            for category, count in category_counts.items():
-                if count > 0:
-                    print(f"    - {category}: {count} files")
 
-            # Step 4: Generate output content
-            print(f"\n[4/6] Generating output content...")
-            try:
-                output_content = self.generate_output_content(
-                    skill_name=skill_name,
-                    files_dict=files_dict,
-                    categorized=categorized,
-                    metadata=metadata
-                )
+def convert_skill(source: Mapping[str, bytes], skill_name: str = "skill",
+                  executable: Iterable[str] = ()) -> ConversionOutput:
+    """Convert one skill from in-memory file contents (library entry point).
 
-                if not output_content or len(output_content.strip()) == 0:
-                    error_msg = "Generated empty output content"
-                    errors.append(error_msg)
-                    print(f"  ERROR: {error_msg}")
-                    return ProcessingResult(
-                        skill_name=skill_name,
-                        status="FAILED",
-                        output_file=None,
-                        files_processed=files_processed,
-                        errors=errors,
-                        notes=notes,
-                        retry_count=retry_count
-                    )
+    Convenience wrapper around SkillConverter.convert_files() for callers
+    that import this module instead of running it - e.g., build tools or
+    services holding skills as archives or database rows. No files are read
+    or written.
 
-                content_size = len(output_content)
-                print(f"  ✓ Generated {content_size} characters of content")
+    Args:
+        source: Skill files keyed by POSIX path relative to the skill root
+        skill_name: Name of the skill
+        executable: Keys of source files that are executable
 
-                # Track all files that were integrated into the output
-                for file_list in [categorized.get('reference', []),
-                                 categorized.get('examples', []),
-                                 categorized.get('code', []),
-                                 categorized.get('themes', [])]:
-                    for file_path in file_list:
-                        rel_path = str(file_path.relative_to(INPUT_DIR))
-                        if rel_path not in files_processed:
-                            files_processed.append(rel_path)
+    Returns:
+        ConversionOutput holding the command markdown and assets
 
-            except Exception as e:
-                error_msg = f"Failed to generate output content: {e}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                return ProcessingResult(
-                    skill_name=skill_name,
-                    status="FAILED",
-                    output_file=None,
-                    files_processed=files_processed,
-                    errors=errors,
-                    notes=notes,
-                    retry_count=retry_count
-                )
+    Raises:
+        ValueError: If a source key is not a clean relative path
 
-            # Step 5: Generate output filename with conflict resolution
-            print(f"\n[5/6] Determining output filename...")
-            base_filename = self.generate_output_filename(skill_name)
-            final_filename = self.check_naming_conflict(base_filename, OUTPUT_DIR)
+    Example:
+        output = convert_skill({"SKILL.md": skill_md_bytes}, "my-skill")
+        for rel_path, data in output.files.items(): ...
+    """
+    return SkillConverter().convert_files(skill_name, source, executable)
 
-            if base_filename != final_filename:
-                notes.append(f"Naming conflict resolved: {base_filename} → {final_filename}")
-                print(f"  ! Conflict resolved: {base_filename} → {final_filename}")
-            else:
-                print(f"  ✓ Output filename: {final_filename}")
 
-            # Step 6: Write output file
-            print(f"\n[6/6] Writing output file...")
-            write_success = self.write_output_file(final_filename, output_content)
+# ============================================================================
+# Watch Mode
+# ============================================================================
 
-            if not write_success:
-                error_msg = f"Failed to write output file: {final_filename}"
-                errors.append(error_msg)
-                print(f"  ERROR: {error_msg}")
-                return ProcessingResult(
-                    skill_name=skill_name,
-                    status="FAILED",
-                    output_file=None,
-                    files_processed=files_processed,
-                    errors=errors,
-                    notes=notes,
-                    retry_count=retry_count
-                )
+class InotifyChangeSource:
+    """Recursive directory watcher built on Linux inotify (through ctypes).
 
-            # Determine final status
-            if errors:
-                status = "PARTIAL_SUCCESS"
-                notes.append(f"Completed with {len(errors)} error(s)")
-                print(f"\n⚠ Status: PARTIAL_SUCCESS ({len(errors)} errors)")
-            else:
-                status = "SUCCESS"
-                print(f"\n✓ Status: SUCCESS")
+    inotify watches single directories, so one watch is added per directory
+    below the root, and directories created later are added as they appear.
 
-            print(f"  Output: {final_filename}")
-            print(f"  Files processed: {len(files_processed)}")
+    Usage:
+        source = InotifyChangeSource(INPUT_DIR)
+        changed_paths = source.read_changes(timeout=1.0)
+        source.close()
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status=status,
-                output_file=final_filename,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=retry_count
-            )
+    Raises:
+        OSError: From the constructor if inotify is not available (non-Linux
+                 platform, no libc, watch limit reached, ...)
+    """
 
-        except Exception as e:
-            # Catch-all for any unexpected errors
-            error_msg = f"Unexpected error processing {skill_name}: {e}"
-            errors.append(error_msg)
-            print(f"\n  FATAL ERROR: {error_msg}")
+    name = "inotify"
 
-            return ProcessingResult(
-                skill_name=skill_name,
-                status="FAILED",
-                output_file=None,
-                files_processed=files_processed,
-                errors=errors,
-                notes=notes,
-                retry_count=retry_count
-            )
+    # Event bits from <sys/inotify.h>
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
 
-    def format_summary_section(self, report: ConversionReport) -> str:
-        """Format summary statistics section of the report.
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
 
-        Args:
-            report: ConversionReport object with aggregated statistics
+    # struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+    EVENT_HEADER_SIZE = 16
 
-        Returns:
-            Formatted string with summary statistics
+    def __init__(self, root: Path, ignore: Optional[Set[Path]] = None):
+        """Start watching root and every directory below it.
 
-        Notes:
-            - Includes total counts, success rate calculation
-            - Uses separators for visual clarity
-            - Displays all key metrics at a glance
+        Args:
+            root: Directory to watch recursively
+            ignore: Directories that are never watched (e.g., OUTPUT_DIR
+                    when it lives inside the input tree)
         """
-        lines = []
+        import ctypes
+        import ctypes.util
 
-        lines.append("=" * 60)
-        lines.append("SUMMARY STATISTICS")
-        lines.append("=" * 60)
-        lines.append("")
-        lines.append(f"Total Skills Processed: {report.total_skills}")
-        lines.append(f"Successful Conversions: {report.successful}")
-        lines.append(f"Partial Successes: {report.partial_success}")
-        lines.append(f"Failed Conversions: {report.failed}")
-        lines.append(f"Total Files Processed: {report.total_files_processed}")
-        lines.append(f"Total Errors: {report.total_errors}")
-        lines.append(f"Total Retries: {report.total_retries}")
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
 
-        # Calculate and display success rate
-        if report.total_skills > 0:
-            success_rate = ((report.successful + report.partial_success)
-                           / report.total_skills * 100)
-            lines.append(f"Success Rate: {success_rate:.1f}%")
+        self._libc = libc
+        self._ignore = {Path(p) for p in (ignore or ())}
+        self._paths: Dict[int, Path] = {}
 
-        lines.append("")
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        try:
+            self._add_tree(Path(root))
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, path: Path) -> None:
+        """Add an inotify watch for one directory."""
+        import ctypes
+
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return  # Removed before we got to it
+            raise OSError(err, f"inotify_add_watch({path}): {os.strerror(err)}")
+        self._paths[wd] = path
+
+    def _add_tree(self, path: Path) -> None:
+        """Watch path and all directories below it (skipping WALK_PRUNE_DIRS)."""
+        if path in self._ignore:
+            return
+
+        self._add_watch(path)
+        try:
+            with os.scandir(path) as entries:
+                subdirs = [Path(e.path) for e in entries
+                           if e.is_dir(follow_symlinks=False) and e.name not in WALK_PRUNE_DIRS]
+        except OSError:
+            return
 
-        return "\n".join(lines)
+        for subdir in subdirs:
+            self._add_tree(subdir)
 
-    def format_success_section(self, report: ConversionReport) -> str:
-        """Format successful conversions section of the report.
+    def read_changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Wait up to timeout seconds and return the paths that changed.
 
         Args:
-            report: ConversionReport object with all processing results
+            timeout: Maximum time to block, in seconds
 
         Returns:
-            Formatted string listing all successful conversions
-
-        Notes:
-            - Lists only SUCCESS status results
-            - Shows output file, file count, and notes for each
-            - Includes v2.0 transformation statistics (mode, merged files, etc.)
-            - Returns empty string if no successful conversions
+            Set of changed paths (empty if nothing happened), or None if the
+            kernel event queue overflowed and changes may have been lost
         """
-        successful_results = [r for r in report.results
-                             if r.status == "SUCCESS"]
+        import select
 
-        if not successful_results:
-            return ""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
 
-        lines = []
-        lines.append("=" * 60)
-        lines.append(f"SUCCESSFUL CONVERSIONS ({len(successful_results)})")
-        lines.append("=" * 60)
-        lines.append("")
+        changed: Set[Path] = set()
+        overflow = False
 
-        for i, result in enumerate(successful_results, 1):
-            lines.append(f"[{i}] {result.skill_name}")
-            lines.append(f"    Output: {result.output_file}")
-            lines.append(f"    Files Processed: {len(result.files_processed)}")
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
 
-            # Add v2.0 transformation mode (subtask 6.1)
-            if result.transformation_mode:
-                lines.append(f"    Transformation Mode: {result.transformation_mode}")
+            offset = 0
+            while offset + self.EVENT_HEADER_SIZE <= len(data):
+                wd = int.from_bytes(data[offset:offset + 4], sys.byteorder, signed=True)
+                mask = int.from_bytes(data[offset + 4:offset + 8], sys.byteorder)
+                name_len = int.from_bytes(data[offset + 12:offset + 16], sys.byteorder)
+                raw_name = data[offset + 16:offset + 16 + name_len].rstrip(b'\0')
+                offset += self.EVENT_HEADER_SIZE + name_len
 
-                # Add v2.0 transformation statistics (subtasks 6.2-6.5)
-                stats_lines = []
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
 
-                # Markdown files merged (subtask 6.2)
-                if result.markdown_files_merged > 0:
-                    stats_lines.append(f"Merged {result.markdown_files_merged} markdown file(s)")
+                if mask & self.IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
 
-                # Subdirectories copied (subtask 6.3)
-                if result.subdirectories_copied > 0:
-                    stats_lines.append(f"Copied {result.subdirectories_copied} subdirectory(ies)")
+                directory = self._paths.get(wd)
+                if directory is None:
+                    continue
 
-                # Scripts relocated (subtask 6.4)
-                if result.scripts_relocated > 0:
-                    stats_lines.append(f"Relocated {result.scripts_relocated} script(s)")
+                path = directory / os.fsdecode(raw_name) if raw_name else directory
+                if path.name in WALK_PRUNE_DIRS:
+                    continue
+                changed.add(path)
 
-                # Path updates (subtask 6.5)
-                if result.path_updates_count > 0:
-                    stats_lines.append(f"Updated {result.path_updates_count} path reference(s)")
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    try:
+                        self._add_tree(path)
+                    except OSError as e:
+                        logger.warning(f"Cannot watch new directory {path}: {e}")
 
-                if stats_lines:
-                    lines.append(f"    Statistics: {', '.join(stats_lines)}")
+        return None if overflow else changed
 
-            if result.notes:
-                lines.append("    Notes:")
-                for note in result.notes:
-                    lines.append(f"      - {note}")
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
 
-            lines.append("")
 
-        return "\n".join(lines)
+class PollingChangeSource:
+    """Portable fallback watcher that compares stat snapshots of the tree.
 
-    def format_failure_section(self, report: ConversionReport) -> str:
-        """Format failed and partial success conversions section.
+    Usage:
+        source = PollingChangeSource(INPUT_DIR, interval=0.1)
+        changed_paths = source.read_changes(timeout=1.0)
+    """
 
-        Args:
-            report: ConversionReport object with all processing results
+    name = "polling"
 
-        Returns:
-            Formatted string listing all failed/partial conversions
+    def __init__(self, root: Path, ignore: Optional[Set[Path]] = None,
+                 interval: float = 0.1):
+        """Take the initial snapshot of root.
 
-        Notes:
-            - Lists FAILED and PARTIAL_SUCCESS status results
-            - Shows detailed errors and suggestions for each
-            - Returns empty string if no failures/partial successes
+        Args:
+            root: Directory to watch recursively
+            ignore: Directories that are never scanned
+            interval: Seconds between scans
         """
-        failed_results = [r for r in report.results
-                         if r.status in ["FAILED", "PARTIAL_SUCCESS"]]
+        self.root = Path(root)
+        self.interval = interval
+        self._ignore = {Path(p) for p in (ignore or ())}
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, tuple]:
+        """Return {path: (mtime_ns, size, mode)} for everything below root."""
+        snapshot: Dict[Path, tuple] = {}
+        pending = [self.root]
+
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name in WALK_PRUNE_DIRS:
+                            continue
+                        path = Path(entry.path)
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        snapshot[path] = (st.st_mtime_ns, st.st_size, st.st_mode)
+                        if entry.is_dir(follow_symlinks=False) and path not in self._ignore:
+                            pending.append(path)
+            except OSError:
+                continue
 
-        if not failed_results:
-            return ""
+        return snapshot
 
-        lines = []
-        lines.append("=" * 60)
-        lines.append(f"FAILED / PARTIAL SUCCESS CONVERSIONS ({len(failed_results)})")
-        lines.append("=" * 60)
-        lines.append("")
+    def read_changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Sleep for one interval (at most timeout) and return changed paths.
 
-        for i, result in enumerate(failed_results, 1):
-            lines.append(f"[{result.status}] {result.skill_name}")
+        Args:
+            timeout: Maximum time to block, in seconds
 
-            if result.output_file:
-                lines.append(f"    Output: {result.output_file}")
-            else:
-                lines.append(f"    Output: N/A")
+        Returns:
+            Set of paths that were added, removed or modified since the
+            previous call (never None)
+        """
+        time.sleep(min(timeout, self.interval))
 
-            if result.files_processed:
-                lines.append(f"    Files Processed: {len(result.files_processed)}")
-                # Show first 5 files
-                for file in result.files_processed[:5]:
-                    lines.append(f"      - {file}")
-                if len(result.files_processed) > 5:
-                    lines.append(f"      ... and {len(result.files_processed) - 5} more")
+        snapshot = self._scan()
+        previous = self._snapshot
+        self._snapshot = snapshot
 
-            if result.errors:
-                lines.append("    Errors:")
-                for error in result.errors:
-                    lines.append(f"      - {error}")
+        changed = {path for path, state in snapshot.items() if previous.get(path) != state}
+        changed.update(path for path in previous if path not in snapshot)
+        return changed
 
-            if result.retry_count > 0:
-                lines.append(f"    Retry Attempts: {result.retry_count}")
+    def close(self) -> None:
+        """Nothing to release (present for interface parity)."""
+        pass
 
-            # Provide suggestions based on status
-            if result.status == "PARTIAL_SUCCESS":
-                lines.append("    Suggestion: Review output file, may need manual adjustments")
-            elif result.status == "FAILED":
-                lines.append("    Suggestion: Check directory permissions and file accessibility")
 
-            lines.append("")
+class SkillWatcher:
+    """Keeps a SkillConverter alive and reconverts skills as they are edited.
 
-        return "\n".join(lines)
+    Watches INPUT_DIR with inotify (or polling where inotify is unavailable),
+    maps each changed path to the skill directory it belongs to, waits for a
+    short quiet period so that a burst of events (an editor saving, a git
+    checkout) triggers one conversion, and then reconverts only the affected
+    skills. The converter's manifest is saved after every batch.
 
-    def print_report(self, report: ConversionReport):
-        """Print formatted conversion report to stdout.
+    Usage:
+        converter = SkillConverter()
+        converter.run()
+        SkillWatcher(converter).watch()
+    """
 
-        Args:
-            report: ConversionReport object with all results
+    def __init__(self, converter: 'SkillConverter', debounce: float = WATCH_DEBOUNCE_SECONDS,
+                 poll_interval: float = WATCH_POLL_INTERVAL, use_inotify: bool = True):
+        """Initialize the watcher.
 
-        Notes:
-            - Prints summary, successful conversions, and failures
-            - Uses clear sections with separators
-            - Provides actionable suggestions for failures
+        Args:
+            converter: Converter used for every reconversion
+            debounce: Seconds without new events before a batch is converted
+            poll_interval: Scan interval of the polling fallback
+            use_inotify: Set to False to force the polling fallback
         """
-        print("\n")
-        print(self.format_summary_section(report))
-        print(self.format_success_section(report))
-        print(self.format_failure_section(report))
+        self.converter = converter
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.batches = 0
 
-    def generate_report(self) -> ConversionReport:
-        """Generate final conversion report.
+    def _open_source(self):
+        """Create the change source, preferring inotify."""
+        ignore = {self.converter.output_dir}
 
-        Aggregates all ProcessingResult objects to create a comprehensive
-        ConversionReport with summary statistics.
+        if self.use_inotify:
+            try:
+                return InotifyChangeSource(self.converter.input_dir, ignore)
+            except (OSError, AttributeError) as e:
+                logger.info(f"inotify unavailable ({e}); falling back to polling")
 
-        Returns:
-            ConversionReport object containing:
-            - Total skill count
-            - Success/partial/failure counts
-            - Total files processed
-            - Total errors and retries
-            - List of all individual results
+        return PollingChangeSource(self.converter.input_dir, ignore, self.poll_interval)
 
-        Notes:
-            - Calculates statistics from self.results
-            - Should be called after all skills are processed
-            - Results are available for detailed inspection
+    def skill_for_path(self, path: Path) -> Optional[str]:
+        """Return the name of the skill a changed path belongs to.
+
+        Args:
+            path: Changed path below INPUT_DIR
+
+        Returns:
+            Skill directory name, or None for paths that are not inside a
+            skill (INPUT_DIR itself, excluded directories, OUTPUT_DIR)
         """
-        # Count results by status
-        successful = sum(1 for r in self.results if r.status == "SUCCESS")
-        partial = sum(1 for r in self.results if r.status == "PARTIAL_SUCCESS")
-        failed = sum(1 for r in self.results if r.status == "FAILED")
+        try:
+            relative = Path(path).relative_to(self.converter.input_dir)
+        except ValueError:
+            return None
 
-        # Sum total files and errors
-        total_files = sum(len(r.files_processed) for r in self.results)
-        total_errors = sum(len(r.errors) for r in self.results)
-        total_retries = sum(r.retry_count for r in self.results)
+        if not relative.parts:
+            return None
 
-        return ConversionReport(
-            total_skills=len(self.results),
-            successful=successful,
-            partial_success=partial,
-            failed=failed,
-            total_files_processed=total_files,
-            total_errors=total_errors,
-            total_retries=total_retries,
-            results=self.results
-        )
+        skill_name = relative.parts[0]
+        if should_exclude_dir(skill_name) or (self.converter.input_dir / skill_name) == self.converter.output_dir:
+            return None
 
-    def run(self) -> ConversionReport:
-        """Main execution method.
+        return skill_name
 
-        Orchestrates the complete conversion process:
-        1. Discover all skill directories
-        2. Process each skill directory
-        3. Generate and return final report
+    def reconvert(self, skill_names: Set[str], first_event: float) -> List[ProcessingResult]:
+        """Reconvert the given skills and save the manifest.
 
-        Returns:
-            ConversionReport object with complete results.
+        Args:
+            skill_names: Names of the skill directories that changed
+            first_event: perf_counter() time of the first event of the batch
 
-        Notes:
-            - Creates output directory if it doesn't exist
-            - Processes skills in sorted order for consistency
-            - Continues processing even if individual skills fail
+        Returns:
+            ProcessingResult for every skill that still exists
         """
-        print("\n" + "=" * 60)
-        print("SKILL-TO-COMMAND CONVERTER")
-        print("=" * 60)
-        print(f"Input Directory: {INPUT_DIR}")
-        print(f"Output Directory: {OUTPUT_DIR}")
-        print("=" * 60)
+        results = []
+        manifest = self.converter.get_manifest()
 
-        # Step 1: Ensure output directory exists
-        print("\n[Step 1/3] Checking output directory...")
-        if not self.ensure_output_directory():
-            print("ERROR: Cannot create or access output directory")
-            print("Aborting conversion process.")
-            return ConversionReport(
-                total_skills=0,
-                successful=0,
-                partial_success=0,
-                failed=0,
-                total_files_processed=0,
-                total_errors=0,
-                total_retries=0,
-                results=[]
-            )
+        # With --atomic each batch is staged and committed as a whole
+        staging = self.converter._begin_staging()
 
-        # Step 2: Discover all skill directories
-        print("\n[Step 2/3] Discovering skill directories...")
-        skill_dirs = self.discover_skills()
+        try:
+            for skill_name in sorted(skill_names):
+                skill_dir = self.converter.input_dir / skill_name
+
+                if not (skill_dir.is_dir() or is_skill_archive(skill_dir)):
+                    # Deleted or renamed away: forget it so a re-created skill
+                    # is converted from scratch (outputs are left in place)
+                    manifest.forget(skill_name_of(skill_dir))
+                    console.info(f"↻ {skill_name}: removed from {self.converter.input_dir}")
+                    continue
 
-        if not skill_dirs:
-            print("WARNING: No skill directories found")
-            print(f"  Checked directory: {INPUT_DIR}")
-            print("  Make sure the INPUT_DIR contains skill subdirectories")
-            return ConversionReport(
-                total_skills=0,
-                successful=0,
-                partial_success=0,
-                failed=0,
-                total_files_processed=0,
-                total_errors=0,
-                total_retries=0,
-                results=[]
-            )
+                result = self.converter._process_skill_safely(skill_dir)
+                results.append(result)
 
-        print(f"Found {len(skill_dirs)} skill directories")
-        print(f"Skills: {', '.join([d.name for d in skill_dirs[:5]])}")
-        if len(skill_dirs) > 5:
-            print(f"  ... and {len(skill_dirs) - 5} more")
+                latency_ms = (time.perf_counter() - first_event) * 1000
+                console.info(f"↻ {skill_name}: {result.status} → {result.output_file or '-'} "
+                             f"({latency_ms:.0f} ms after first change)")
 
-        # Step 3: Process each skill directory
-        print("\n[Step 3/3] Processing skill directories...")
-        print(f"Starting batch processing of {len(skill_dirs)} skills...")
-        print("")
+            manifest.release_missing_owners({skill_name_of(p) for p in self.converter.input_dir.iterdir()
+                                             if p.is_dir() or is_skill_archive(p)})
+            manifest.save()
+        except BaseException:
+            self.converter._end_staging(staging, commit=False)
+            raise
 
-        for skill_dir in sorted(skill_dirs):
-            try:
-                result = self.process_skill(skill_dir)
-                self.results.append(result)
-            except Exception as e:
-                # Catch any unexpected errors and continue with next skill
-                print(f"\nFATAL ERROR processing {skill_dir.name}: {e}")
-                print(f"  Skipping to next skill...")
-                # Create a FAILED result
-                self.results.append(ProcessingResult(
-                    skill_name=skill_dir.name,
-                    status="FAILED",
-                    output_file=None,
-                    files_processed=[],
-                    errors=[f"Fatal error: {e}"],
-                    notes=[],
-                    retry_count=0
-                ))
+        self.converter._end_staging(staging, commit=True)
+        self.batches += 1
+        return results
 
-        # Step 4: Generate final report
-        print("\n" + "=" * 60)
-        print("PROCESSING COMPLETE")
-        print("=" * 60)
-        print("")
+    def watch(self, max_batches: Optional[int] = None) -> None:
+        """Watch INPUT_DIR until interrupted (Ctrl+C).
 
-        report = self.generate_report()
-        self.print_report(report)
+        Args:
+            max_batches: Stop after this many reconversion batches (None =
+                         run until interrupted)
+        """
+        source = self._open_source()
+        console.info(f"\nWatching {self.converter.input_dir} ({source.name}) - press Ctrl+C to stop")
+        flush_console()
 
-        return report
+        pending: Set[str] = set()
+        first_event = 0.0
+
+        try:
+            while max_batches is None or self.batches < max_batches:
+                changes = source.read_changes(self.debounce if pending else 1.0)
+
+                if changes is None:
+                    # Event queue overflow: anything may have changed
+                    changes = set(self.converter.input_dir.iterdir())
+
+                changed_skills = {name for name in map(self.skill_for_path, changes) if name}
+                if changed_skills:
+                    if not pending:
+                        first_event = time.perf_counter()
+                    pending |= changed_skills
+                    continue
+
+                if pending:
+                    # Quiet for one debounce period: convert the batch
+                    batch, pending = pending, set()
+                    self.reconvert(batch, first_event)
+                    flush_console()
+
+        except KeyboardInterrupt:
+            console.info("\nStopped watching")
+
+        finally:
+            source.close()
 
 
 # ============================================================================
 # Main Function
 # ============================================================================
 
+def parse_args(argv: Optional[List[str]] = None) -> 'argparse.Namespace':
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert skill directories into command markdown files."
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert up to N skills concurrently (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reconvert every skill, ignoring the incremental manifest"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream merged markdown to a temporary file that is renamed into "
+             "place, keeping memory use flat for large skills"
+    )
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help="Stage all writes in a sibling directory and swap it into place "
+             "at the end, so the output tree is never left half-updated"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After converting, keep watching the input directory and "
+             "reconvert skills as they change (Ctrl+C to stop)"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report module import and optional dependency load times, then exit"
+    )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Only show warnings and errors while converting (the final "
+             "report is still printed)"
+    )
+    parser.add_argument(
+        "--log-json",
+        type=Path,
+        metavar="PATH",
+        help="Also write every progress and diagnostic message as a "
+             "JSON-lines event stream to PATH"
+    )
+    parser.add_argument(
+        "--report-json",
+        type=Path,
+        metavar="PATH",
+        help="Also write the run report, including per-phase timing and I/O, "
+             "as JSON to PATH"
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Dry run: print what would be converted, merged, copied and "
+             "rewritten (with estimated I/O) without writing anything"
+    )
+    parser.add_argument(
+        "--plan-json",
+        type=Path,
+        metavar="PATH",
+        help="Also write the --plan result as JSON to PATH (implies --plan)"
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help="How subdirectory assets and scripts are placed in the output: "
+             "copy (default), hardlink, reflink (copy-on-write clone), symlink, "
+             "or dedup (hardlinks into a content-addressed store shared by all skills)"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.plan_json:
+        args.plan = True
+    if args.plan and args.watch:
+        parser.error("--plan cannot be combined with --watch")
+
+    return args
+
+
+def format_startup_profile(parse_seconds: float = 0.0) -> str:
+    """Format the --profile-startup report.
+
+    Resolves every optional dependency (they are otherwise loaded on first
+    use) so that their import cost is shown separately from the module's.
+
+    Args:
+        parse_seconds: Time spent parsing command-line arguments
+
+    Returns:
+        Formatted multi-line string
+    """
+    for name in OPTIONAL_DEPENDENCY_HINTS:
+        _import_optional(name)
+
+    lines = []
+    lines.append("=" * 60)
+    lines.append("STARTUP PROFILE")
+    lines.append("=" * 60)
+    lines.append(f"Module import: {_IMPORT_SECONDS * 1000:.1f} ms")
+    lines.append(f"Argument parsing: {parse_seconds * 1000:.1f} ms")
+    lines.append("Optional dependencies (loaded on first use):")
+    for name in OPTIONAL_DEPENDENCY_HINTS:
+        state = "available" if _optional_modules.get(name) is not None else "not installed"
+        lines.append(f"  {name}: {_optional_import_seconds.get(name, 0.0) * 1000:.1f} ms ({state})")
+
+    return "\n".join(lines)
+
+
 def main():
     """Main entry point for the converter."""
+    parse_started = time.perf_counter()
+    args = parse_args()
+    parse_seconds = time.perf_counter() - parse_started
+
+    # CLI diagnostics (e.g., missing optional dependencies) go to stderr,
+    # progress lines to a buffered stdout handler
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     try:
-        converter = SkillConverter()
+        configure_console_output(quiet=args.quiet, log_json=args.log_json)
+    except OSError as e:
+        print(f"ERROR: Cannot open JSON log {args.log_json}: {e}")
+        sys.exit(1)
+
+    if args.profile_startup:
+        print(format_startup_profile(parse_seconds))
+        sys.exit(0)
+
+    try:
+        converter = SkillConverter(jobs=args.jobs, force=args.force,
+                                   link_mode=args.link_mode, stream=args.stream,
+                                   atomic=args.atomic)
+
+        if args.plan:
+            plan = converter.plan()
+            converter.print_plan(plan)
+            if args.plan_json:
+                converter.write_plan_json(plan, args.plan_json)
+            flush_console()
+            sys.exit(1 if plan.count("FAILED") else 0)
+
         report = converter.run()
 
+        if args.report_json:
+            converter.write_report_json(report, args.report_json)
+        flush_console()
+
+        if args.watch:
+            # Keep the same converter (and its loaded manifest) for every rebuild
+            SkillWatcher(converter).watch()
+            sys.exit(0)
+
         # Return exit code based on results
         if report.failed > 0:
             print(f"\n⚠ WARNING: {report.failed} skill(s) failed to convert")
@@ -4255,20 +8729,31 @@ def main():
         elif report.partial_success > 0:
             print(f"\n⚠ WARNING: {report.partial_success} skill(s) converted with errors")
             sys.exit(0)  # Partial success is still success
+        elif report.up_to_date > 0:
+            print(f"\n✓ SUCCESS: {report.successful} skill(s) converted, "
+                  f"{report.up_to_date} already up to date")
+            sys.exit(0)
         else:
             print(f"\n✓ SUCCESS: All {report.successful} skill(s) converted successfully")
             sys.exit(0)
 
     except KeyboardInterrupt:
+        flush_console()
         print("\n\nConversion interrupted by user")
         sys.exit(130)
 
     except Exception as e:
+        flush_console()
         print(f"\n\nFATAL ERROR: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
+# Module load time reported by --profile-startup (must stay the last statement
+# before the entry point)
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
 if __name__ == "__main__":
     main()
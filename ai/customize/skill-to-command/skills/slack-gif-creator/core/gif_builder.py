@@ -4,15 +4,543 @@ GIF Builder - Core module for assembling frames into GIFs optimized for Slack.
 
 This module provides the main interface for creating GIFs from programmatically
 generated frames, with automatic optimization for Slack's requirements.
+
+GIFBuilder keeps all frames in memory until save(). StreamingGIFBuilder encodes
+each frame to disk as it is added, for long or large animations.
 """
 
+import io
+import os
+import struct
 from pathlib import Path
-from typing import Optional
-import imageio.v3 as imageio
-from PIL import Image
+from typing import BinaryIO, Optional
+from PIL import GifImagePlugin, Image
 import numpy as np
 
 
+# Pixels kept in the reservoir sample used to train a streamed GIF's palette
+RESERVOIR_PIXELS = 65536
+
+# Frames buffered before a streamed GIF's palette is trained and encoding starts
+DEFAULT_WARMUP_FRAMES = 8
+
+# Similarity at or above which save() treats consecutive frames as duplicates
+DUPLICATE_THRESHOLD = 0.98
+
+# Side of the block-averaged thumbnail kept per frame as a cheap similarity hash
+HASH_SIZE = 16
+
+# Rows compared at a time by frame_similarity(), bounding its scratch memory
+SIMILARITY_ROWS = 32
+
+# Pixels sampled to train a palette: PALETTE_SAMPLES_PER_COLOR per palette color,
+# or one in PALETTE_PIXELS_PER_SAMPLE of the pixels offered if that is more (big
+# frames), and at most PALETTE_SAMPLE_PIXELS
+PALETTE_SAMPLE_PIXELS = 65536
+PALETTE_SAMPLES_PER_COLOR = 32
+PALETTE_PIXELS_PER_SAMPLE = 64
+
+# Most k-means passes that refine the median-cut palette (fewer once no color moves)
+KMEANS_ITERATIONS = 4
+
+# Pixels per distance matrix in nearest_colors(), bounding its scratch memory
+NEAREST_CHUNK_PIXELS = 16384
+
+# Bits per channel of the RGB -> palette index lookup table (32x32x32 cells,
+# each CELL_SIDE values wide per channel)
+LUT_BITS = 5
+CELL_SIDE = 1 << (8 - LUT_BITS)
+
+# Share of a frame's pixels in fine-table cells above which apply_palette()
+# looks up every pixel in the fine table instead of just those pixels
+FINE_LOOKUP_SHARE = 0.125
+
+# Slack size limits, for save(target_bytes=...)
+EMOJI_MAX_BYTES = 64 * 1024
+MESSAGE_MAX_BYTES = 2 * 1024 * 1024
+
+# What save(target_bytes=...) may give up to fit, from least to most visible:
+# colors (binary searched), then frames (keep every nth), then dimensions
+BUDGET_MIN_COLORS = 8
+BUDGET_FRAME_STEPS = (1, 2, 3, 4)
+BUDGET_SCALES = (1.0, 0.75, 0.5, 0.375, 0.25)
+BUDGET_MIN_SIDE = 16
+
+
+def frame_similarity(frame_a: np.ndarray, frame_b: np.ndarray) -> float:
+    """
+    Similarity of two equally sized RGB frames.
+
+    Works through SIMILARITY_ROWS rows at a time in the frames' own dtype,
+    so it never allocates a full-frame scratch array.
+
+    Args:
+        frame_a: First frame
+        frame_b: Second frame
+
+    Returns:
+        1.0 minus the mean absolute channel difference, normalized to 0.0-1.0
+    """
+    total = 0.0
+    for start in range(0, len(frame_a), SIMILARITY_ROWS):
+        rows_a = frame_a[start:start + SIMILARITY_ROWS]
+        rows_b = frame_b[start:start + SIMILARITY_ROWS]
+        # max - min is |a - b| without unsigned wraparound
+        total += float((np.maximum(rows_a, rows_b) - np.minimum(rows_a, rows_b)).sum(dtype=np.float64))
+    return 1.0 - total / (frame_a.size * 255.0)
+
+
+def frame_hash(frame: np.ndarray) -> np.ndarray:
+    """
+    Cheap similarity hash of an RGB frame: its HASH_SIZE x HASH_SIZE block averages.
+
+    Averaging can only shrink differences, so hash_similarity() of two
+    hashes is never (beyond rounding) below frame_similarity() of the frames.
+
+    Args:
+        frame: RGB frame
+
+    Returns:
+        int16 array of shape (HASH_SIZE, HASH_SIZE, 3)
+    """
+    thumbnail = Image.fromarray(frame).resize((HASH_SIZE, HASH_SIZE), Image.Resampling.BOX)
+    return np.asarray(thumbnail, dtype=np.int16)
+
+
+def hash_similarity(hash_a: np.ndarray, hash_b: np.ndarray) -> float:
+    """Similarity of two frame hashes, on the same scale as frame_similarity()."""
+    return 1.0 - np.abs(hash_a - hash_b).mean() / 255.0
+
+
+def is_near_duplicate(frame_a: np.ndarray, hash_a: np.ndarray, frame_b: np.ndarray,
+                      hash_b: np.ndarray, threshold: float) -> bool:
+    """
+    Whether two frames are at least `threshold` similar.
+
+    The hashes rule out most pairs; only frames whose hashes are close
+    enough get the full comparison.
+    """
+    # 1/255 allows for the thumbnails being rounded to whole values
+    if hash_similarity(hash_a, hash_b) < threshold - 1 / 255:
+        return False
+    return frame_similarity(frame_a, frame_b) >= threshold
+
+
+def train_palette(pixels: np.ndarray, num_colors: int,
+                  max_samples: int = PALETTE_SAMPLE_PIXELS, seed: int = 0) -> np.ndarray:
+    """
+    Train a palette from a set of RGB pixels.
+
+    Median cut on a random subsample gives the initial palette, which
+    k-means passes then refine until no color moves. The subsample grows
+    with the color count and with the number of pixels offered (see
+    PALETTE_SAMPLES_PER_COLOR), so training stays cheap next to mapping the
+    frames. If the pixels use no more than num_colors distinct colors, those
+    colors are the palette, and apply_palette() maps each of them to itself.
+
+    Args:
+        pixels: Array of shape (N, 3), dtype uint8
+        num_colors: Target number of colors (8-256)
+        max_samples: Most pixels used for training (a random subsample if N is larger)
+        seed: Random seed for the subsample
+
+    Returns:
+        Palette array of shape (K, 3), dtype uint8, with K <= num_colors
+    """
+    pixels = np.asarray(pixels, dtype=np.uint8).reshape(-1, 3)
+    samples = min(max_samples, max(num_colors * PALETTE_SAMPLES_PER_COLOR,
+                                   len(pixels) // PALETTE_PIXELS_PER_SAMPLE))
+    if len(pixels) > samples:
+        rng = np.random.default_rng(seed)
+        pixels = pixels[rng.integers(0, len(pixels), samples)]
+
+    # Few distinct colors (flat-shaded frames): use them exactly
+    packed = np.unique(pixels.astype(np.uint32) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint32))
+    if len(packed) <= num_colors:
+        return np.stack([packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF], axis=1).astype(np.uint8)
+
+    palette = _median_cut(pixels, num_colors)
+    return _refine_palette(pixels, palette, KMEANS_ITERATIONS)
+
+
+def _median_cut(pixels: np.ndarray, num_colors: int) -> np.ndarray:
+    """Split the pixels into num_colors boxes at channel medians; return box means."""
+    def split_key(box: np.ndarray) -> tuple[int, int]:
+        # Widest channel range, weighted by pixel count, and that channel
+        spread = box.max(axis=0) - box.min(axis=0)
+        channel = int(spread.argmax())
+        return int(spread[channel]) * len(box), channel
+
+    boxes = [pixels]
+    keys = [split_key(pixels)]
+
+    while len(boxes) < num_colors:
+        i = max(range(len(keys)), key=lambda j: keys[j][0])
+        score, channel = keys.pop(i)
+        if score == 0:
+            break  # Every box holds a single color
+
+        box = boxes.pop(i)
+        mid = len(box) // 2
+        order = np.argpartition(box[:, channel], mid)
+        for half in (np.take(box, order[:mid], axis=0), np.take(box, order[mid:], axis=0)):
+            boxes.append(half)
+            keys.append(split_key(half))
+
+    return np.array([box.mean(axis=0) for box in boxes]).round().astype(np.uint8)
+
+
+def _refine_palette(pixels: np.ndarray, palette: np.ndarray, iterations: int) -> np.ndarray:
+    """Run up to `iterations` k-means passes, stopping once no color moves."""
+    centroids = palette.astype(np.float64)
+
+    for _ in range(iterations):
+        labels = nearest_colors(pixels, centroids)
+        counts = np.bincount(labels, minlength=len(centroids))
+        used = counts > 0  # Colors that lost all their pixels keep their value
+        moved = centroids.copy()
+        for channel in range(3):
+            sums = np.bincount(labels, weights=pixels[:, channel], minlength=len(centroids))
+            moved[used, channel] = sums[used] / counts[used]
+        converged = np.array_equal(moved.round(), centroids.round())
+        centroids = moved
+        if converged:
+            break
+
+    return centroids.round().astype(np.uint8)
+
+
+def nearest_colors(pixels: np.ndarray, palette: np.ndarray) -> np.ndarray:
+    """
+    Exact nearest palette entry of each pixel, by squared RGB distance.
+
+    Args:
+        pixels: Array of shape (N, 3)
+        palette: Array of shape (K, 3), K <= 256
+
+    Returns:
+        uint8 array of shape (N,) with palette indices
+    """
+    colors = np.asarray(palette, dtype=np.float32)
+    # |p - c|^2 = |p|^2 - 2 p.c + |c|^2, and |p|^2 does not change the argmin
+    norms = (colors * colors).sum(axis=1)
+    weights = -2.0 * colors.T
+    pixels = np.asarray(pixels, dtype=np.float32).reshape(-1, 3)
+    labels = np.empty(len(pixels), dtype=np.uint8)
+    for start in range(0, len(pixels), NEAREST_CHUNK_PIXELS):
+        distances = pixels[start:start + NEAREST_CHUNK_PIXELS] @ weights
+        distances += norms
+        labels[start:start + len(distances)] = distances.argmin(axis=1)
+    return labels
+
+
+def lut_index(pixels: np.ndarray) -> np.ndarray:
+    """Flat lookup-table cell of each RGB pixel (any shape ending in 3)."""
+    cells = np.asarray(pixels, dtype=np.uint8) >> (8 - LUT_BITS)
+    # Shift and combine in place to avoid wide temporaries
+    index = cells[..., 0].astype(np.uint16)
+    index <<= LUT_BITS
+    index |= cells[..., 1]
+    index <<= LUT_BITS
+    index |= cells[..., 2]
+    return index
+
+
+def _cell_offset(pixels: np.ndarray) -> np.ndarray:
+    """Position of each RGB pixel inside its lookup-table cell (0-511)."""
+    low = np.asarray(pixels, dtype=np.uint8) & (CELL_SIDE - 1)
+    offset = low[..., 0].astype(np.uint32)
+    offset <<= 8 - LUT_BITS
+    offset |= low[..., 1]
+    offset <<= 8 - LUT_BITS
+    offset |= low[..., 2]
+    return offset
+
+
+def build_palette_lut(palette: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute the nearest palette entry for every RGB color.
+
+    The coarse table covers a 32x32x32 grid of cells, each mapped to the
+    palette color nearest its center. That is exact enough for a cell with
+    no palette color in it, but not for a cell holding several (black and
+    (6, 6, 6) share one), or holding a color that is not its center's
+    nearest. Those cells instead point to a row of the fine table, which
+    holds the exact nearest entry for each of the cell's 8x8x8 colors. Every
+    palette color therefore maps to itself.
+
+    Args:
+        palette: Array of shape (K, 3), dtype uint8, K <= 256
+
+    Returns:
+        (coarse, fine) for apply_palette(). coarse is a uint16 array of
+        32768 cells: a palette index, or 256 + the cell's row in fine. fine
+        is a uint8 array of shape (256 + F, 512); rows 0-255 repeat their
+        own index, so coarse values can index it directly.
+    """
+    palette = np.asarray(palette, dtype=np.uint8)
+    levels = 1 << LUT_BITS
+    centers = np.arange(levels, dtype=np.float32) * CELL_SIDE + CELL_SIDE / 2
+    green, blue = np.meshgrid(centers, centers, indexing='ij')
+    plane = np.stack([np.zeros_like(green), green, blue], axis=-1).reshape(-1, 3)
+
+    colors = palette.astype(np.float32)
+    norms = (colors * colors).sum(axis=1)
+    coarse = np.empty((levels, levels * levels), dtype=np.uint16)
+
+    # One red level at a time keeps the distance matrix small.
+    # Squared distances via |c|^2 - 2 c.p + |p|^2 (|p|^2 is constant per row)
+    for red in range(levels):
+        plane[:, 0] = centers[red]
+        coarse[red] = (norms - 2.0 * plane @ colors.T).argmin(axis=1)
+    coarse = coarse.reshape(-1)
+
+    # Cells whose center does not decide their own palette colors
+    entry_cells = lut_index(palette).astype(np.intp)
+    needs_fine = np.bincount(entry_cells, minlength=levels ** 3) > 1
+    needs_fine[entry_cells[coarse[entry_cells] != np.arange(len(palette))]] = True
+    shared = np.flatnonzero(needs_fine)
+
+    # Exact nearest entry for every color of those cells
+    offsets = np.arange(CELL_SIDE ** 3, dtype=np.uint32)
+    corner = np.stack([shared >> (2 * LUT_BITS), (shared >> LUT_BITS) & (levels - 1),
+                       shared & (levels - 1)], axis=1) * CELL_SIDE
+    inside = np.stack([offsets >> (2 * (8 - LUT_BITS)), (offsets >> (8 - LUT_BITS)) & (CELL_SIDE - 1),
+                       offsets & (CELL_SIDE - 1)], axis=1)
+    fine = np.empty((256 + len(shared), CELL_SIDE ** 3), dtype=np.uint8)
+    fine[:256] = np.arange(256, dtype=np.uint8)[:, None]
+    if len(shared):
+        fine[256:] = nearest_colors(corner[:, None, :] + inside[None, :, :], palette).reshape(len(shared), -1)
+        coarse[shared] = 256 + np.arange(len(shared))
+
+    return coarse, fine
+
+
+def apply_palette(frame: np.ndarray, lut: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Map an RGB frame to palette indices.
+
+    Pixels in coarse cells cost one table lookup. Pixels in cells that
+    build_palette_lut() resolved at full resolution cost a second lookup in
+    the fine table: only for those pixels while they are few, for the whole
+    frame once they are more than FINE_LOOKUP_SHARE of it (flat-shaded frames
+    whose background shares a cell with another palette color).
+
+    Args:
+        frame: RGB array of shape (H, W, 3)
+        lut: (coarse, fine) tables from build_palette_lut()
+
+    Returns:
+        uint8 array of shape (H, W) with palette indices
+    """
+    coarse, fine = lut
+    codes = np.take(coarse, lut_index(frame))
+    if len(fine) == 256:
+        return codes.astype(np.uint8)  # No cell needs the fine table
+
+    in_fine = codes >= 256
+    count = np.count_nonzero(in_fine)
+    if count > FINE_LOOKUP_SHARE * codes.size:
+        index = codes.astype(np.uint32)
+        index <<= 3 * (8 - LUT_BITS)
+        index |= _cell_offset(frame)
+        return np.take(fine.reshape(-1), index)
+
+    indices = codes.astype(np.uint8)
+    if count:
+        positions = np.flatnonzero(in_fine)
+        index = np.take(codes.reshape(-1), positions).astype(np.uint32)
+        index <<= 3 * (8 - LUT_BITS)
+        index |= _cell_offset(np.take(frame.reshape(-1, 3), positions, axis=0))
+        indices.reshape(-1)[positions] = np.take(fine.reshape(-1), index)
+    return indices
+
+
+class PixelReservoir:
+    """
+    Fixed-size uniform random sample of every pixel added (reservoir sampling).
+
+    Memory stays at `capacity` pixels however many frames are added, and each
+    pixel seen so far has the same chance of being in the sample.
+    """
+
+    def __init__(self, capacity: int = RESERVOIR_PIXELS, seed: int = 0):
+        """
+        Initialize an empty reservoir.
+
+        Args:
+            capacity: Maximum number of pixels kept
+            seed: Random seed (fixed, so output is reproducible)
+        """
+        self.capacity = capacity
+        self.pixels = np.empty((capacity, 3), dtype=np.uint8)
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, frame: np.ndarray):
+        """Offer every pixel of an RGB frame to the sample."""
+        pixels = frame.reshape(-1, 3)
+        start = self.seen
+
+        # Fill free slots first
+        fill = min(max(self.capacity - start, 0), len(pixels))
+        self.pixels[start:start + fill] = pixels[:fill]
+
+        # Then pixel number n replaces a random slot with probability capacity / (n + 1)
+        rest = pixels[fill:]
+        if len(rest):
+            positions = np.arange(start + fill, start + len(pixels))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.capacity
+            self.pixels[slots[keep]] = rest[keep]
+
+        self.seen += len(pixels)
+
+    def sample(self) -> np.ndarray:
+        """Return the sampled pixels, shape (min(seen, capacity), 3)."""
+        return self.pixels[:min(self.seen, self.capacity)]
+
+
+class GIFStreamWriter:
+    """
+    Writes a GIF89a file one palette-indexed frame at a time.
+
+    The header and global color table are written on construction, each
+    write_frame() call appends one LZW-compressed frame (encoded by Pillow),
+    and close() writes the trailer. Nothing but the current frame (and, when
+    diffing, the previous one) is held in memory.
+
+    With diff_frames, each frame after the first is written as the bounding
+    box of the pixels that changed since the previous frame, drawn over it
+    (disposal method 1). Unchanged pixels inside the box use a transparent
+    index reserved after the palette's colors, which LZW compresses to
+    almost nothing. Animations where a small sprite moves over a still
+    background shrink the most.
+    """
+
+    def __init__(self, fp: BinaryIO, width: int, height: int, palette: np.ndarray,
+                 loop: int = 0, diff_frames: bool = False):
+        """
+        Write the GIF header.
+
+        Args:
+            fp: Binary file object to write to
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            palette: Global palette, shape (K, 3) with K <= 256
+            loop: Number of loops (0 = infinite)
+            diff_frames: Write only the changed region of each frame
+                (transparent unchanged pixels need K <= 255)
+        """
+        self.fp = fp
+        self.frame_count = 0
+        self.duration_ms = 0  # Total of the delays actually written
+        self._requested_ms = 0.0  # Total of the durations asked for
+        self.diff_frames = diff_frames
+        self.transparency: Optional[int] = None
+        self._previous: Optional[np.ndarray] = None
+
+        palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+        if diff_frames and len(palette) < 256:
+            # Reserve the index after the last color for "unchanged"
+            self.transparency = len(palette)
+            palette = np.vstack([palette, np.zeros((1, 3), dtype=np.uint8)])
+        table = _color_table(palette)
+        bits = (len(table) // 3).bit_length() - 1
+
+        fp.write(b'GIF89a')
+        # Logical screen descriptor: global color table, 8-bit color resolution
+        fp.write(struct.pack('<HHBBB', width, height, 0x80 | 0x70 | (bits - 1), 0, 0))
+        fp.write(table)
+        # NETSCAPE2.0 application extension (loop count)
+        fp.write(b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\0')
+
+    def write_frame(self, indices: np.ndarray, duration_ms: float,
+                    palette: Optional[np.ndarray] = None):
+        """
+        Append a frame.
+
+        GIF delays are whole centiseconds. Each frame gets the rounded end
+        time minus the rounded start time, so rounding never accumulates
+        (at 15 fps, frames get 60 or 70 ms and 30 frames last exactly 2000 ms).
+
+        Args:
+            indices: uint8 array of shape (H, W) with palette indices
+            duration_ms: Display time in milliseconds
+            palette: Local palette for this frame (default: the global palette;
+                frames with a local palette are always written in full)
+        """
+        start = round(self._requested_ms / 10)
+        self._requested_ms += duration_ms
+        delay_ms = (round(self._requested_ms / 10) - start) * 10
+
+        offset = (0, 0)
+        params = {'duration': delay_ms}
+
+        if self.diff_frames and palette is None:
+            params['disposal'] = 1  # Keep this frame for the next one to draw over
+            previous, self._previous = self._previous, indices
+            if previous is not None:
+                indices, offset = self._changed_region(previous, indices)
+                if self.transparency is not None:
+                    params['transparency'] = self.transparency
+
+        height, width = indices.shape
+        frame = Image.frombytes('P', (width, height), np.ascontiguousarray(indices, dtype=np.uint8).tobytes())
+        if palette is not None:
+            frame.putpalette(_color_table(palette))
+            params['include_color_table'] = True
+
+        for chunk in GifImagePlugin.getdata(frame, offset=offset, **params):
+            self.fp.write(chunk)
+        self.frame_count += 1
+        self.duration_ms += delay_ms
+
+    def _changed_region(self, previous: np.ndarray,
+                        current: np.ndarray) -> tuple[np.ndarray, tuple[int, int]]:
+        """
+        Crop a frame to the pixels that differ from the previous one.
+
+        Returns:
+            (indices inside the bounding box, (x, y) offset of the box);
+            unchanged pixels in the box are set to the transparent index
+        """
+        changed = previous != current
+        rows = np.flatnonzero(changed.any(axis=1))
+        if not len(rows):
+            # Nothing changed: a single pixel keeps the frame's display time
+            top = bottom = left = right = 0
+            changed = np.zeros((1, 1), dtype=bool)
+            region = current[:1, :1].copy()
+        else:
+            cols = np.flatnonzero(changed.any(axis=0))
+            top, bottom = rows[0], rows[-1] + 1
+            left, right = cols[0], cols[-1] + 1
+            changed = changed[top:bottom, left:right]
+            region = current[top:bottom, left:right].copy()
+
+        if self.transparency is not None:
+            region[~changed] = self.transparency
+        return region, (int(left), int(top))
+
+    def close(self):
+        """Write the GIF trailer."""
+        self.fp.write(b';')
+
+
+def gif_duration_ms(durations: list[float]) -> int:
+    """Playing time of frames with these durations once GIFStreamWriter rounds them."""
+    # Delays carry their rounding, so only the total is rounded
+    return round(sum(durations) / 10) * 10
+
+
+def _color_table(palette: np.ndarray) -> bytes:
+    """GIF color table bytes for a palette, padded to a power of two (at least 2) entries."""
+    table = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)[:256].tobytes()
+    size = 1 << max(1, (max(len(table) // 3, 1) - 1).bit_length())
+    return table.ljust(3 * size, b'\0')
+
+
 class GIFBuilder:
     """Builder for creating optimized GIFs from frames."""
 
@@ -29,6 +557,10 @@ class GIFBuilder:
         self.height = height
         self.fps = fps
         self.frames: list[np.ndarray] = []
+        self.durations: list[float] = []  # Display time of each frame, in milliseconds
+        self.frame_hashes: list[np.ndarray] = []  # frame_hash() of each frame
+        self.palette: Optional[np.ndarray] = None
+        self.frame_palettes: Optional[list[np.ndarray]] = None
 
     def add_frame(self, frame: np.ndarray | Image.Image):
         """
@@ -37,6 +569,13 @@ class GIFBuilder:
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
         """
+        frame = self._prepare_frame(frame)
+        self.frames.append(frame)
+        self.durations.append(1000 / self.fps)
+        self.frame_hashes.append(frame_hash(frame))
+
+    def _prepare_frame(self, frame: np.ndarray | Image.Image) -> np.ndarray:
+        """Convert a frame to an RGB array of the builder's size."""
         if isinstance(frame, Image.Image):
             frame = np.array(frame.convert('RGB'))
 
@@ -46,7 +585,7 @@ class GIFBuilder:
             pil_frame = pil_frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
             frame = np.array(pil_frame)
 
-        self.frames.append(frame)
+        return frame
 
     def add_frames(self, frames: list[np.ndarray | Image.Image]):
         """Add multiple frames at once."""
@@ -62,91 +601,117 @@ class GIFBuilder:
             use_global_palette: Use a single palette for all frames (better compression)
 
         Returns:
-            List of color-optimized frames
+            List of color-optimized RGB frames (see index_frames() for the
+            palette-indexed form save() writes)
         """
-        optimized = []
+        indexed = self.index_frames(num_colors, use_global_palette)
+        palettes = self.frame_palettes or [self.palette] * len(indexed)
+
+        # Expand indices to RGB in place, into one array for all frames
+        rgb = np.empty((len(indexed), self.height, self.width, 3), dtype=np.uint8)
+        for out, palette, frame in zip(rgb, palettes, indexed):
+            np.take(palette, frame, axis=0, out=out)
+        return list(rgb)
+
+    def index_frames(self, num_colors: int = 128, use_global_palette: bool = True) -> list[np.ndarray]:
+        """
+        Reduce colors in all frames and return them as palette indices.
 
+        The palette is trained once (see train_palette) and every pixel is then
+        mapped through a 32x32x32 lookup table (see build_palette_lut), so each
+        frame costs one or two array lookups. The palette ends up in
+        self.palette, or in self.frame_palettes when each frame gets its own.
+
+        Args:
+            num_colors: Target number of colors (8-256)
+            use_global_palette: Use a single palette for all frames (better compression)
+
+        Returns:
+            List of palette-indexed frames (uint8 arrays of shape (H, W))
+        """
         if use_global_palette and len(self.frames) > 1:
-            # Create a global palette from all frames
-            # Sample frames to build palette
-            sample_size = min(5, len(self.frames))
-            sample_indices = [int(i * len(self.frames) / sample_size) for i in range(sample_size)]
-            sample_frames = [self.frames[i] for i in sample_indices]
-
-            # Combine sample frames into a single image for palette generation
-            # Flatten each frame to get all pixels, then stack them
-            all_pixels = np.vstack([f.reshape(-1, 3) for f in sample_frames])  # (total_pixels, 3)
-
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
-            combined_img = Image.fromarray(img_array, mode='RGB')
-
-            # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
-
-            # Apply global palette to all frames
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(palette=global_palette, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
-        else:
-            # Use per-frame quantization
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
+            # Generate global palette and apply it to all frames
+            self.palette = train_palette(self._sample_pixels(), num_colors)
+            self.frame_palettes = None
+            lut = build_palette_lut(self.palette)
+            return [apply_palette(frame, lut) for frame in self.frames]
+
+        # Use per-frame quantization
+        self.palette = None
+        self.frame_palettes = []
+        optimized = []
+        for frame in self.frames:
+            palette = train_palette(frame, num_colors)
+            self.frame_palettes.append(palette)
+            optimized.append(apply_palette(frame, build_palette_lut(palette)))
+
+        if len(self.frames) == 1:
+            # A single frame's palette is the global palette
+            self.palette = self.frame_palettes[0]
+            self.frame_palettes = None
 
         return optimized
 
+    def _sample_pixels(self) -> np.ndarray:
+        """Pixels of up to 5 evenly spaced frames, for training a global palette."""
+        # Sample frames to build palette
+        sample_size = min(5, len(self.frames))
+        sample_indices = [int(i * len(self.frames) / sample_size) for i in range(sample_size)]
+        sample_frames = [self.frames[i] for i in sample_indices]
+
+        # Flatten each frame to get all pixels, then stack them
+        return np.vstack([f.reshape(-1, 3) for f in sample_frames])  # (total_pixels, 3)
+
+    def _resized_frames(self, width: int, height: int) -> list[np.ndarray]:
+        """All frames resized to width x height."""
+        resized_frames = []
+        for frame in self.frames:
+            pil_frame = Image.fromarray(frame)
+            pil_frame = pil_frame.resize((width, height), Image.Resampling.LANCZOS)
+            resized_frames.append(np.array(pil_frame))
+        return resized_frames
+
     def deduplicate_frames(self, threshold: float = 0.995) -> int:
         """
-        Remove duplicate or near-duplicate consecutive frames.
+        Merge duplicate or near-duplicate consecutive frames.
+
+        A merged frame's display time is added to the frame it duplicates, so
+        the animation keeps its timing. The hashes taken by add_frame() rule
+        out most pairs before any full-frame comparison.
 
         Args:
             threshold: Similarity threshold (0.0-1.0). Higher = more strict (0.995 = very similar).
 
         Returns:
-            Number of frames removed
+            Number of frames merged away
         """
         if len(self.frames) < 2:
             return 0
 
-        deduplicated = [self.frames[0]]
+        frames, durations, hashes = [self.frames[0]], [self.durations[0]], [self.frame_hashes[0]]
         removed_count = 0
 
-        for i in range(1, len(self.frames)):
-            # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
-
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
-
-            # Keep frame if sufficiently different
-            # High threshold (0.995) means only remove truly identical frames
-            if similarity < threshold:
-                deduplicated.append(self.frames[i])
-            else:
+        for frame, duration, hash_ in zip(self.frames[1:], self.durations[1:], self.frame_hashes[1:]):
+            # Compare with previous kept frame
+            # High threshold (0.995) means only merge truly identical frames
+            if is_near_duplicate(frames[-1], hashes[-1], frame, hash_, threshold):
+                durations[-1] += duration
                 removed_count += 1
+            else:
+                frames.append(frame)
+                durations.append(duration)
+                hashes.append(hash_)
 
-        self.frames = deduplicated
+        self.frames, self.durations, self.frame_hashes = frames, durations, hashes
         return removed_count
 
+    def _step_durations(self, step: int) -> list[float]:
+        """Display times when keeping every step-th frame; each keeps the time of those it replaces."""
+        return [sum(self.durations[i:i + step]) for i in range(0, len(self.durations), step)]
+
     def save(self, output_path: str | Path, num_colors: int = 128,
-             optimize_for_emoji: bool = False, remove_duplicates: bool = True) -> dict:
+             optimize_for_emoji: bool = False, remove_duplicates: bool = True,
+             target_bytes: Optional[int] = None, diff_frames: bool = True) -> dict:
         """
         Save frames as optimized GIF for Slack.
 
@@ -155,6 +720,11 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for <64KB emoji size
             remove_duplicates: Remove duplicate consecutive frames
+            target_bytes: Byte budget, e.g. EMOJI_MAX_BYTES or MESSAGE_MAX_BYTES.
+                Instead of fixed heuristics, search color count (up to num_colors),
+                frame rate and dimensions for the best-looking GIF that fits.
+            diff_frames: Write only the region that changed since the previous
+                frame, with unchanged pixels transparent (see GIFStreamWriter)
 
         Returns:
             Dictionary with file info (path, size, dimensions, frame_count)
@@ -167,23 +737,25 @@ class GIFBuilder:
 
         # Remove duplicate frames to reduce file size
         if remove_duplicates:
-            removed = self.deduplicate_frames(threshold=0.98)
+            removed = self.deduplicate_frames(threshold=DUPLICATE_THRESHOLD)
             if removed > 0:
-                print(f"  Removed {removed} duplicate frames")
+                print(f"  Merged {removed} duplicate frames into the frames before them")
+
+        # Emoji are at most 128x128
+        if optimize_for_emoji and (self.width > 128 or self.height > 128):
+            print(f"  Resizing from {self.width}x{self.height} to 128x128 for emoji")
+            self.width = 128
+            self.height = 128
+            # Resize all frames
+            self.frames = self._resized_frames(128, 128)
+            self.frame_hashes = [frame_hash(frame) for frame in self.frames]
+
+        if target_bytes is not None:
+            return self._save_within_budget(output_path, target_bytes, num_colors,
+                                            optimize_for_emoji, diff_frames)
 
         # Optimize for emoji if requested
         if optimize_for_emoji:
-            if self.width > 128 or self.height > 128:
-                print(f"  Resizing from {self.width}x{self.height} to 128x128 for emoji")
-                self.width = 128
-                self.height = 128
-                # Resize all frames
-                resized_frames = []
-                for frame in self.frames:
-                    pil_frame = Image.fromarray(frame)
-                    pil_frame = pil_frame.resize((128, 128), Image.Resampling.LANCZOS)
-                    resized_frames.append(np.array(pil_frame))
-                self.frames = resized_frames
             num_colors = min(num_colors, 48)  # More aggressive color limit for emoji
 
             # More aggressive FPS reduction for emoji
@@ -191,21 +763,131 @@ class GIFBuilder:
                 print(f"  Reducing frames from {len(self.frames)} to ~12 for emoji size")
                 # Keep every nth frame to get close to 12 frames
                 keep_every = max(1, len(self.frames) // 12)
-                self.frames = [self.frames[i] for i in range(0, len(self.frames), keep_every)]
+                self.durations = self._step_durations(keep_every)
+                self.frames = self.frames[::keep_every]
+                self.frame_hashes = self.frame_hashes[::keep_every]
 
         # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
+        optimized_frames = self.index_frames(num_colors, use_global_palette=True)
+
+        # Save GIF (infinite loop)
+        with open(output_path, 'wb') as f:
+            writer = GIFStreamWriter(f, self.width, self.height, self.palette,
+                                     diff_frames=diff_frames)
+            for frame, duration in zip(optimized_frames, self.durations):
+                writer.write_frame(frame, duration)
+            writer.close()
+
+        return self._report(output_path, len(optimized_frames), num_colors, optimize_for_emoji,
+                            duration_ms=writer.duration_ms)
+
+    def _save_within_budget(self, output_path: Path, target_bytes: int, max_colors: int,
+                            optimize_for_emoji: bool, diff_frames: bool) -> dict:
+        """
+        Write the best-looking GIF that fits in target_bytes (see save()).
+
+        Every candidate is encoded in memory. Sizes are tried from largest to
+        smallest (BUDGET_SCALES) and, at each size, frame steps from 1 upwards
+        (BUDGET_FRAME_STEPS); the first size and step that fit at
+        BUDGET_MIN_COLORS get the largest color count that still fits, found
+        by binary search. Palettes are trained once per color count and reused
+        at every size; indexed frames are computed once per size and color
+        count and reused for every frame step.
+        """
+        min_colors = min(BUDGET_MIN_COLORS, max_colors)
+        sample = self._sample_pixels()
+        # colors -> (palette, lut)
+        palettes: dict[int, tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]] = {}
+        smallest = None  # (data, colors, step, width, height), used if nothing fits
+        tried_sizes = set()
+
+        for scale in BUDGET_SCALES:
+            width = max(BUDGET_MIN_SIDE, round(self.width * scale))
+            height = max(BUDGET_MIN_SIDE, round(self.height * scale))
+            if (width, height) in tried_sizes:
+                continue
+            tried_sizes.add((width, height))
+
+            frames = self.frames if scale == 1.0 else self._resized_frames(width, height)
+            indexed: dict[int, list[np.ndarray]] = {}  # colors -> indexed frames at this size
+
+            def encode(colors: int, step: int) -> bytes:
+                if colors not in palettes:
+                    palette = train_palette(sample, colors)
+                    palettes[colors] = (palette, build_palette_lut(palette))
+                palette, lut = palettes[colors]
+                if colors not in indexed:
+                    indexed[colors] = [apply_palette(frame, lut) for frame in frames]
+                return self._encode_gif(indexed[colors][::step], palette, width, height,
+                                        self._step_durations(step), diff_frames)
+
+            for step in BUDGET_FRAME_STEPS:
+                if step > 1 and len(frames) < 2 * step:
+                    break  # Would leave a single frame
+
+                data = encode(min_colors, step)
+                if smallest is None or len(data) < len(smallest[0]):
+                    smallest = (data, min_colors, step, width, height)
+                if len(data) > target_bytes:
+                    continue
+
+                # Binary search for the most colors that fit
+                best_colors, best_data = min_colors, data
+                low, high = min_colors, max_colors
+                data = encode(high, step)
+                if len(data) <= target_bytes:
+                    best_colors, best_data = high, data
+                else:
+                    while high - low > 1:
+                        middle = (low + high) // 2
+                        data = encode(middle, step)
+                        if len(data) <= target_bytes:
+                            low, best_colors, best_data = middle, middle, data
+                        else:
+                            high = middle
 
-        # Calculate frame duration in milliseconds
-        frame_duration = 1000 / self.fps
+                return self._write_budgeted(output_path, best_data, best_colors, step,
+                                            width, height, optimize_for_emoji, target_bytes)
 
-        # Save GIF
-        imageio.imwrite(
-            output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0  # Infinite loop
-        )
+        # Nothing fits: write the smallest candidate
+        data, colors, step, width, height = smallest
+        return self._write_budgeted(output_path, data, colors, step, width, height,
+                                    optimize_for_emoji, target_bytes)
+
+    def _write_budgeted(self, output_path: Path, data: bytes, colors: int, step: int,
+                        width: int, height: int, optimize_for_emoji: bool,
+                        target_bytes: int) -> dict:
+        """Write a GIF chosen by _save_within_budget() and report it."""
+        output_path.write_bytes(data)
+        frame_count = len(range(0, len(self.frames), step))
+        if step > 1:
+            print(f"  Keeping every {step} frames ({len(self.frames)} -> {frame_count}) to fit the budget")
+        if (width, height) != (self.width, self.height):
+            print(f"  Resizing from {self.width}x{self.height} to {width}x{height} to fit the budget")
+
+        return self._report(output_path, frame_count, colors, optimize_for_emoji,
+                            size=(width, height), fps=self.fps / step,
+                            duration_ms=gif_duration_ms(self.durations), target_bytes=target_bytes)
+
+    @staticmethod
+    def _encode_gif(frames: list[np.ndarray], palette: np.ndarray, width: int, height: int,
+                    durations: list[float], diff_frames: bool) -> bytes:
+        """Encode palette-indexed frames as an in-memory GIF."""
+        buffer = io.BytesIO()
+        writer = GIFStreamWriter(buffer, width, height, palette, diff_frames=diff_frames)
+        for frame, duration in zip(frames, durations):
+            writer.write_frame(frame, duration)
+        writer.close()
+        return buffer.getvalue()
+
+    def _report(self, output_path: Path, frame_count: int, num_colors: int,
+                optimize_for_emoji: bool, size: Optional[tuple[int, int]] = None,
+                fps: Optional[float] = None, duration_ms: Optional[float] = None,
+                target_bytes: Optional[int] = None) -> dict:
+        """Print the result of a save and return its info dictionary."""
+        width, height = size or (self.width, self.height)
+        fps = fps or self.fps
+        duration_seconds = duration_ms / 1000 if duration_ms is not None else frame_count / fps
 
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
@@ -215,10 +897,10 @@ class GIFBuilder:
             'path': str(output_path),
             'size_kb': file_size_kb,
             'size_mb': file_size_mb,
-            'dimensions': f'{self.width}x{self.height}',
-            'frame_count': len(optimized_frames),
-            'fps': self.fps,
-            'duration_seconds': len(optimized_frames) / self.fps,
+            'dimensions': f'{width}x{height}',
+            'frame_count': frame_count,
+            'fps': fps,
+            'duration_seconds': duration_seconds,
             'colors': num_colors
         }
 
@@ -226,13 +908,17 @@ class GIFBuilder:
         print(f"\n✓ GIF created successfully!")
         print(f"  Path: {output_path}")
         print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
-        print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
+        print(f"  Dimensions: {width}x{height}")
+        print(f"  Frames: {frame_count} @ {fps:g} fps")
         print(f"  Duration: {info['duration_seconds']:.1f}s")
         print(f"  Colors: {num_colors}")
 
         # Warnings
-        if optimize_for_emoji and file_size_kb > 64:
+        if target_bytes is not None:
+            if file_size_kb * 1024 > target_bytes:
+                print(f"\n⚠️  WARNING: Could not fit {target_bytes / 1024:.1f} KB even at the smallest settings")
+                print("   Try: fewer frames or a simpler design")
+        elif optimize_for_emoji and file_size_kb > 64:
             print(f"\n⚠️  WARNING: Emoji file size ({file_size_kb:.1f} KB) exceeds 64 KB limit")
             print("   Try: fewer frames, fewer colors, or simpler design")
         elif not optimize_for_emoji and file_size_kb > 2048:
@@ -243,4 +929,184 @@ class GIFBuilder:
 
     def clear(self):
         """Clear all frames (useful for creating multiple GIFs)."""
-        self.frames = []
\ No newline at end of file
+        self.frames = []
+        self.durations = []
+        self.frame_hashes = []
+
+
+class StreamingGIFBuilder(GIFBuilder):
+    """
+    GIFBuilder that encodes frames to disk as they are added.
+
+    GIFBuilder keeps every frame until save(). This variant only buffers the
+    first `warmup_frames` frames: their pixels go into a reservoir sample,
+    the global palette is trained on that sample, and from then on each
+    frame is quantized and written as soon as it is added. Peak memory is
+    about warmup_frames + 1 frames, however long the animation is.
+
+    Duplicate removal compares each frame with the previous kept frame, as
+    save() does, and adds a duplicate's display time to that frame. Each
+    frame is therefore written when the next distinct frame arrives (or on
+    close()). Emoji optimization (frame decimation) needs the whole
+    animation up front, so use GIFBuilder.save() for emoji GIFs.
+
+    Usage:
+        with StreamingGIFBuilder('out.gif', width=480, height=480, fps=20) as builder:
+            for frame in frames:
+                builder.add_frame(frame)
+        print(builder.info)
+
+    Frames are written to a temporary file next to output_path, which
+    close() renames into place; if the `with` block raises, the temporary
+    file is deleted and output_path is left as it was.
+    """
+
+    def __init__(self, output_path: str | Path, width: int = 480, height: int = 480,
+                 fps: int = 15, num_colors: int = 128, remove_duplicates: bool = True,
+                 warmup_frames: int = DEFAULT_WARMUP_FRAMES, diff_frames: bool = True):
+        """
+        Initialize streaming GIF builder.
+
+        Args:
+            output_path: Where to write the GIF
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            num_colors: Number of colors in the global palette (8-256)
+            remove_duplicates: Skip frames nearly identical to the previous one
+            warmup_frames: Frames sampled before the palette is fixed
+            diff_frames: Write only the region that changed since the previous frame
+        """
+        super().__init__(width, height, fps)
+        self.output_path = Path(output_path)
+        self.partial_path = self.output_path.with_name(f'.{self.output_path.name}.partial')
+        self.num_colors = num_colors
+        self.remove_duplicates = remove_duplicates
+        self.warmup_frames = max(1, warmup_frames)
+        self.diff_frames = diff_frames
+        self.reservoir = PixelReservoir()
+        self.lut: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self.removed_count = 0
+        self.info: Optional[dict] = None
+        self._previous: Optional[np.ndarray] = None
+        self._previous_hash: Optional[np.ndarray] = None
+        self._file: Optional[BinaryIO] = None
+        self._writer: Optional[GIFStreamWriter] = None
+
+    def add_frame(self, frame: np.ndarray | Image.Image):
+        """
+        Add a frame, encoding it right away once the palette is trained.
+
+        Args:
+            frame: Frame as numpy array or PIL Image (will be converted to RGB)
+        """
+        if self.info is not None:
+            raise ValueError("GIF already closed. Create a new builder for another GIF.")
+
+        frame = self._prepare_frame(frame)
+        duration = 1000 / self.fps
+
+        if self.remove_duplicates:
+            hash_ = frame_hash(frame)
+            if self._previous is not None and is_near_duplicate(
+                    self._previous, self._previous_hash, frame, hash_, DUPLICATE_THRESHOLD):
+                # The previous kept frame is still buffered: extend it
+                self.durations[-1] += duration
+                self.removed_count += 1
+                return
+            self._previous, self._previous_hash = frame, hash_
+
+        self.frames.append(frame)
+        self.durations.append(duration)
+        if self._writer is None:
+            self.reservoir.add(frame)
+            if len(self.frames) >= self.warmup_frames:
+                self._start_encoding()
+        else:
+            self._flush(keep=1)
+
+    def _start_encoding(self):
+        """Train the palette on the reservoir, open the file and flush buffered frames."""
+        self.palette = train_palette(self.reservoir.sample(), self.num_colors)
+        self.lut = build_palette_lut(self.palette)
+        self._file = open(self.partial_path, 'wb')
+        self._writer = GIFStreamWriter(self._file, self.width, self.height, self.palette,
+                                       diff_frames=self.diff_frames)
+
+        self._flush(keep=1)
+
+    def _flush(self, keep: int):
+        """Quantize and write all buffered frames but the last `keep`."""
+        while len(self.frames) > keep:
+            frame, duration = self.frames.pop(0), self.durations.pop(0)
+            self._writer.write_frame(apply_palette(frame, self.lut), duration)
+
+    def close(self) -> dict:
+        """
+        Finish the GIF.
+
+        Returns:
+            Dictionary with file info (path, size, dimensions, frame_count)
+        """
+        if self.info is not None:
+            return self.info
+
+        if self._writer is None:
+            if not self.frames:
+                raise ValueError("No frames to save. Add frames with add_frame() first.")
+            # Fewer frames than warmup_frames: train on what arrived
+            self._start_encoding()
+
+        self._flush(keep=0)
+        self._writer.close()
+        self._file.close()
+        os.replace(self.partial_path, self.output_path)
+        self.reservoir = None
+        self._previous = self._previous_hash = None
+
+        if self.removed_count > 0:
+            print(f"  Merged {self.removed_count} duplicate frames into the frames before them")
+
+        self.info = self._report(self.output_path, self._writer.frame_count,
+                                 self.num_colors, optimize_for_emoji=False,
+                                 duration_ms=self._writer.duration_ms)
+        return self.info
+
+    def save(self, output_path: str | Path = None, num_colors: int = None,
+             optimize_for_emoji: bool = False, remove_duplicates: bool = None,
+             target_bytes: Optional[int] = None, diff_frames: bool = None) -> dict:
+        """
+        Finish the GIF (same as close(); settings are fixed at construction).
+
+        Arguments are accepted for compatibility with GIFBuilder.save() and
+        must be left out or match the constructor's.
+
+        Raises:
+            ValueError: If called with settings that differ from the constructor's
+        """
+        if output_path is not None and Path(output_path) != self.output_path:
+            raise ValueError("A streamed GIF is written to the path given to the constructor")
+        if optimize_for_emoji or target_bytes is not None:
+            raise ValueError("Emoji and size-targeted saves need all frames; use GIFBuilder.save()")
+        for name, value, configured in (('num_colors', num_colors, self.num_colors),
+                                        ('remove_duplicates', remove_duplicates, self.remove_duplicates),
+                                        ('diff_frames', diff_frames, self.diff_frames)):
+            if value is not None and value != configured:
+                raise ValueError(f"{name} is fixed at construction ({configured}); "
+                                 f"pass {name}={value} to StreamingGIFBuilder()")
+        return self.close()
+
+    def clear(self):
+        """Not supported: a streamed GIF cannot be restarted."""
+        raise ValueError("Create a new StreamingGIFBuilder for another GIF")
+
+    def __enter__(self) -> 'StreamingGIFBuilder':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            # Drop the unfinished GIF rather than leave it truncated
+            self._file.close()
+            self.partial_path.unlink(missing_ok=True)